@@ -141,6 +141,8 @@ typedef struct PyConfig {
     int tracemalloc;
     int import_time;
     int no_debug_ranges;
+    int specialization_stats;
+    int lazy_imports;
     int show_ref_count;
     int dump_refs;
     int malloc_stats;
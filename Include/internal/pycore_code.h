@@ -23,13 +23,22 @@ typedef struct {
 typedef struct {
     uint32_t tp_version;
     uint32_t dk_version_or_hint;
-} _PyLoadAttrCache;
+} _PyAttrCache;
 
 typedef struct {
     uint32_t module_keys_version;
     uint32_t builtin_keys_version;
 } _PyLoadGlobalCache;
 
+typedef struct {
+    uint32_t func_version;
+    uint32_t tp_version;
+} _PyCallCache;
+
+typedef struct {
+    PyObject *obj;
+} _PyObjectCache;
+
 /* Add specialized versions of entries to this union.
  *
  * Do not break the invariant: sizeof(SpecializedCacheEntry) == 8
@@ -43,8 +52,10 @@ typedef struct {
 typedef union {
     _PyEntryZero zero;
     _PyAdaptiveEntry adaptive;
-    _PyLoadAttrCache load_attr;
+    _PyAttrCache attr;
     _PyLoadGlobalCache load_global;
+    _PyCallCache call;
+    _PyObjectCache obj;
 } SpecializedCacheEntry;
 
 #define INSTRUCTIONS_PER_ENTRY (sizeof(SpecializedCacheEntry)/sizeof(_Py_CODEUNIT))
@@ -294,17 +305,39 @@ cache_backoff(_PyAdaptiveEntry *entry) {
     entry->counter = ADAPTIVE_CACHE_BACKOFF;
 }
 
+/* The specialized COMPARE_OP forms are fused with the POP_JUMP_IF_FALSE or
+ * POP_JUMP_IF_TRUE that follows them.  The outcome of comparing the two
+ * operands is encoded as a single bit, and the adaptive cache entry's index
+ * holds the mask of outcomes for which the jump is taken. */
+#define COMPARE_LT 1
+#define COMPARE_EQ 2
+#define COMPARE_GT 4
+#define COMPARE_UNORDERED 8  /* At least one operand is a NaN */
+
 /* Specialization functions */
 
 int _Py_Specialize_LoadAttr(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, SpecializedCacheEntry *cache);
+int _Py_Specialize_StoreAttr(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, SpecializedCacheEntry *cache);
+int _Py_Specialize_LoadMethod(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, SpecializedCacheEntry *cache);
 int _Py_Specialize_LoadGlobal(PyObject *globals, PyObject *builtins, _Py_CODEUNIT *instr, PyObject *name, SpecializedCacheEntry *cache);
 int _Py_Specialize_BinarySubscr(PyObject *sub, PyObject *container, _Py_CODEUNIT *instr);
-
+int _Py_Specialize_BinaryAdd(PyObject *left, PyObject *right, _Py_CODEUNIT *instr);
+int _Py_Specialize_InplaceAdd(PyObject *left, PyObject *right, _Py_CODEUNIT *instr);
+int _Py_Specialize_BinaryMultiply(PyObject *left, PyObject *right, _Py_CODEUNIT *instr);
+int _Py_Specialize_CompareOp(PyObject *left, PyObject *right, _Py_CODEUNIT *instr, SpecializedCacheEntry *cache);
+int _Py_Specialize_CallFunction(PyObject *callable, int nargs, _Py_CODEUNIT *instr, SpecializedCacheEntry *cache);
+int _Py_Specialize_CallMethod(PyObject *callable, PyObject *self, int nargs, _Py_CODEUNIT *instr, SpecializedCacheEntry *cache);
+
+/* Specialization statistics.
+ *
+ * The counters are always compiled in, but are only updated when
+ * -X specialization_stats or PYTHONSPECIALIZATIONSTATS is given, so the
+ * cost when disabled is a single predictable branch.
+ * Building with SPECIALIZATION_STATS set to 1 updates them unconditionally
+ * and prints them at exit. */
 #define SPECIALIZATION_STATS 0
 #define SPECIALIZATION_STATS_DETAILED 0
 
-#if SPECIALIZATION_STATS
-
 typedef struct _stats {
     uint64_t specialization_success;
     uint64_t specialization_failure;
@@ -319,12 +352,24 @@ typedef struct _stats {
 } SpecializationStats;
 
 extern SpecializationStats _specialization_stats[256];
+extern int _Py_SpecializationStatsEnabled;
+
+#if SPECIALIZATION_STATS
 #define STAT_INC(opname, name) _specialization_stats[opname].name++
 void _Py_PrintSpecializationStats(void);
 #else
-#define STAT_INC(opname, name) ((void)0)
+#define STAT_INC(opname, name) \
+    do { \
+        if (_Py_SpecializationStatsEnabled) { \
+            _specialization_stats[opname].name++; \
+        } \
+    } while (0)
 #endif
 
+PyObject *_Py_GetSpecializationStats(void);
+void _Py_ClearSpecializationStats(void);
+PyObject *_Py_GetSpecializationState(PyCodeObject *code);
+
 
 #ifdef __cplusplus
 }
@@ -205,6 +205,12 @@ struct type_cache {
 #endif
 };
 
+/* Builtin functions recognized by identity when specializing calls */
+struct callable_cache {
+    PyObject *isinstance;
+    PyObject *len;
+};
+
 
 /* interpreter state */
 
@@ -269,6 +275,8 @@ struct _is {
 
     PyObject *builtins_copy;
     PyObject *import_func;
+    /* Called after each import, see sys.setimportprofile() */
+    PyObject *import_profile;
     // Initialized to _PyEval_EvalFrameDefault().
     _PyFrameEvalFunction eval_frame;
 
@@ -311,6 +319,7 @@ struct _is {
 
     struct ast_state ast;
     struct type_cache type_cache;
+    struct callable_cache callable_cache;
 };
 
 extern void _PyInterpreterState_ClearModules(PyInterpreterState *interp);
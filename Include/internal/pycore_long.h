@@ -34,6 +34,11 @@ static inline PyObject* _PyLong_GetZero(void)
 static inline PyObject* _PyLong_GetOne(void)
 { return __PyLong_GetSmallInt_internal(1); }
 
+// Exact int arithmetic used by the specializing interpreter.
+// Both arguments must be exact ints; no type checks are performed.
+PyObject *_PyLong_Add(PyLongObject *left, PyLongObject *right);
+PyObject *_PyLong_Multiply(PyLongObject *left, PyLongObject *right);
+
 #ifdef __cplusplus
 }
 #endif
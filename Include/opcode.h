@@ -136,19 +136,55 @@ extern "C" {
 #define DICT_MERGE              164
 #define DICT_UPDATE             165
 #define CALL_METHOD_KW          166
-#define BINARY_SUBSCR_ADAPTIVE    7
-#define BINARY_SUBSCR_LIST_INT    8
-#define BINARY_SUBSCR_TUPLE_INT  13
-#define BINARY_SUBSCR_DICT       14
-#define JUMP_ABSOLUTE_QUICK      18
-#define LOAD_ATTR_ADAPTIVE       21
-#define LOAD_ATTR_SPLIT_KEYS     36
-#define LOAD_ATTR_WITH_HINT      38
-#define LOAD_ATTR_SLOT           39
-#define LOAD_ATTR_MODULE         40
-#define LOAD_GLOBAL_ADAPTIVE     41
-#define LOAD_GLOBAL_MODULE       42
-#define LOAD_GLOBAL_BUILTIN      43
+#define BINARY_ADD_ADAPTIVE       7
+#define BINARY_ADD_INT            8
+#define BINARY_ADD_FLOAT         13
+#define BINARY_ADD_UNICODE       14
+#define BINARY_MULTIPLY_ADAPTIVE  18
+#define BINARY_MULTIPLY_INT      21
+#define BINARY_MULTIPLY_FLOAT    36
+#define BINARY_SUBSCR_ADAPTIVE   38
+#define BINARY_SUBSCR_LIST_INT   39
+#define BINARY_SUBSCR_TUPLE_INT  40
+#define BINARY_SUBSCR_DICT       41
+#define CALL_FUNCTION_ADAPTIVE   42
+#define CALL_FUNCTION_BUILTIN_O  43
+#define CALL_FUNCTION_BUILTIN_FAST  44
+#define CALL_FUNCTION_LEN        45
+#define CALL_FUNCTION_ISINSTANCE  46
+#define CALL_FUNCTION_PY_EXACT_ARGS  47
+#define CALL_FUNCTION_TYPE_PY_INIT  48
+#define CALL_METHOD_ADAPTIVE     58
+#define CALL_METHOD_BUILTIN_O    80
+#define CALL_METHOD_BUILTIN_FAST  81
+#define CALL_METHOD_DESCRIPTOR_O  87
+#define CALL_METHOD_DESCRIPTOR_FAST  88
+#define CALL_METHOD_PY_EXACT_ARGS 120
+#define COMPARE_OP_ADAPTIVE     122
+#define COMPARE_OP_INT_JUMP     123
+#define COMPARE_OP_FLOAT_JUMP   127
+#define COMPARE_OP_STR_JUMP     128
+#define INPLACE_ADD_ADAPTIVE    134
+#define INPLACE_ADD_INT         140
+#define INPLACE_ADD_FLOAT       143
+#define INPLACE_ADD_UNICODE     149
+#define JUMP_ABSOLUTE_QUICK     150
+#define LOAD_ATTR_ADAPTIVE      151
+#define LOAD_ATTR_SPLIT_KEYS    153
+#define LOAD_ATTR_WITH_HINT     154
+#define LOAD_ATTR_SLOT          158
+#define LOAD_ATTR_MODULE        159
+#define LOAD_GLOBAL_ADAPTIVE    167
+#define LOAD_GLOBAL_MODULE      168
+#define LOAD_GLOBAL_BUILTIN     169
+#define LOAD_METHOD_ADAPTIVE    170
+#define LOAD_METHOD_CACHED      171
+#define LOAD_METHOD_MODULE      172
+#define LOAD_METHOD_NO_DICT     173
+#define STORE_ATTR_ADAPTIVE     174
+#define STORE_ATTR_SPLIT_KEYS   175
+#define STORE_ATTR_SLOT         176
+#define STORE_ATTR_WITH_HINT    177
 #ifdef NEED_OPCODE_JUMP_TABLES
 static uint32_t _PyOpcode_RelativeJump[8] = {
     0U,
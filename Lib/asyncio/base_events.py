@@ -19,6 +19,7 @@
 import functools
 import heapq
 import itertools
+import operator
 import os
 import socket
 import stat
@@ -60,6 +61,18 @@
 # before cleanup of cancelled handles is performed.
 _MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
 
+# Number of slots of each level of timer wheels, as a power of two.
+_TIMER_WHEEL_BITS = 6
+_TIMER_WHEEL_SIZE = 1 << _TIMER_WHEEL_BITS
+_TIMER_WHEEL_MASK = _TIMER_WHEEL_SIZE - 1
+
+# Number of levels of timer wheels.  With the default resolution, they
+# hold timers up to 4.6 hours ahead.
+_TIMER_WHEEL_LEVELS = 4
+
+# Default resolution of timer wheels, in seconds.
+_DEFAULT_TIMER_WHEEL_RESOLUTION = 0.001
+
 
 _HAS_IPv6 = hasattr(socket, 'AF_INET6')
 
@@ -80,6 +93,18 @@ def _format_handle(handle):
         return str(handle)
 
 
+def _callback_name(callback):
+    # The name under which the profile of an event loop accounts a callback.
+    task = getattr(callback, '__self__', None)
+    if isinstance(task, tasks.Task):
+        # Steps of tasks are accounted per coroutine function.
+        coro = task.get_coro()
+        return getattr(coro, '__qualname__', None) or type(coro).__qualname__
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    return getattr(callback, '__qualname__', None) or repr(callback)
+
+
 def _format_pipe(fd):
     if fd == subprocess.PIPE:
         return '<pipe>'
@@ -191,6 +216,280 @@ def _run_until_complete_cb(fut):
     futures._get_loop(fut).stop()
 
 
+def _run_ready(ready, ntodo):
+    """Run the first *ntodo* handles of the *ready* deque.
+
+    Cancelled handles are skipped.
+    """
+    for i in range(ntodo):
+        handle = ready.popleft()
+        if not handle._cancelled:
+            handle._run()
+
+
+# Alias the pure-Python implementation for testing purposes.
+_py__run_ready = _run_ready
+
+try:
+    # _run_ready() runs every callback of the event loop, unless in
+    # debug mode.
+    from _asyncio import _run_ready
+except ImportError:
+    pass
+else:
+    # Alias the C implementation for testing purposes.
+    _c__run_ready = _run_ready
+
+
+TaskProfile = collections.namedtuple(
+    'TaskProfile', ['task', 'steps', 'run_time', 'cpu_time'])
+CallbackProfile = collections.namedtuple(
+    'CallbackProfile', ['name', 'calls', 'run_time', 'cpu_time'])
+LoopProfile = collections.namedtuple(
+    'LoopProfile', ['tasks', 'callbacks', 'polls', 'poll_time'])
+
+
+class _LoopProfiler:
+    """Time spent by an event loop running callbacks and polling for I/O."""
+
+    def __init__(self):
+        # Callback names mapped to [calls, run_time, cpu_time] lists.
+        self.callbacks = {}
+        self.polls = 0
+        self.poll_time = 0.0
+
+    def run_ready(self, loop, ntodo):
+        """Run the first *ntodo* handles of the ready queue of *loop*,
+        accounting the time spent in each of them.
+        """
+        ready = loop._ready
+        callbacks = self.callbacks
+        debug = loop._debug
+        perf_counter = time.perf_counter
+        thread_time = tasks._thread_time
+        for i in range(ntodo):
+            handle = ready.popleft()
+            if handle._cancelled:
+                continue
+            if debug:
+                loop._current_handle = handle
+            try:
+                start_time = perf_counter()
+                start_cpu_time = thread_time()
+                handle._run()
+                run_time = perf_counter() - start_time
+                cpu_time = thread_time() - start_cpu_time
+            finally:
+                loop._current_handle = None
+            name = _callback_name(handle._callback)
+            stats = callbacks.get(name)
+            if stats is None:
+                callbacks[name] = [1, run_time, cpu_time]
+            else:
+                stats[0] += 1
+                stats[1] += run_time
+                stats[2] += cpu_time
+            if debug and run_time >= loop.slow_callback_duration:
+                logger.warning('Executing %s took %.3f seconds',
+                               _format_handle(handle), run_time)
+        handle = None  # Needed to break cycles when an exception occurs.
+
+    def select(self, selector, timeout):
+        start_time = time.perf_counter()
+        try:
+            return selector.select(timeout)
+        finally:
+            self.polls += 1
+            self.poll_time += time.perf_counter() - start_time
+
+
+class _TimerWheel:
+    """Hierarchical timer wheel of TimerHandles.
+
+    Time is divided in ticks of *resolution* seconds.  Each level of the
+    wheel has _TIMER_WHEEL_SIZE slots: the slots of the first level span a
+    tick, and the slots of each following level span a whole turn of the
+    level below.  Timers are inserted in the lowest level which can hold
+    them, and moved down a level each time the wheel turns to their slot.
+    Timers beyond the last level wait apart until it wraps around.
+
+    Adding, removing and moving a timer are O(1), whatever the number of
+    timers of the wheel.
+    """
+
+    def __init__(self, resolution, now):
+        self._resolution = resolution
+        # The current tick.  Timers of earlier ticks are due, and the
+        # wheel has already been turned to it.
+        self._tick = self._to_tick(now)
+        self._levels = [[{} for i in range(_TIMER_WHEEL_SIZE)]
+                        for level in range(_TIMER_WHEEL_LEVELS)]
+        self._overflow = {}
+        # Number of timers per level, the overflow coming last.
+        self._counts = [0] * (_TIMER_WHEEL_LEVELS + 1)
+        # Maps the id() of the timers to their level and slot.
+        # TimerHandle.__eq__() and __hash__() depend on the timer state,
+        # so the timers themselves cannot be used as keys.
+        self._timers = {}
+
+    def __len__(self):
+        return len(self._timers)
+
+    def _to_tick(self, when):
+        try:
+            return int(when // self._resolution)
+        except (OverflowError, ValueError):
+            # Infinite or NaN
+            return None
+
+    def _insert(self, handle):
+        tick = self._to_tick(handle._when)
+        if tick is not None and tick < self._tick:
+            tick = self._tick
+        if tick is None:
+            level = _TIMER_WHEEL_LEVELS
+        else:
+            # The level is given by the highest bits which differ from
+            # the current tick.
+            level = ((tick ^ self._tick).bit_length() - 1) // _TIMER_WHEEL_BITS
+            if level < 0:
+                level = 0
+        if level < _TIMER_WHEEL_LEVELS:
+            index = (tick >> (level * _TIMER_WHEEL_BITS)) & _TIMER_WHEEL_MASK
+            slot = self._levels[level][index]
+        else:
+            level = _TIMER_WHEEL_LEVELS
+            slot = self._overflow
+        key = id(handle)
+        slot[key] = handle
+        self._timers[key] = (level, slot)
+        self._counts[level] += 1
+
+    def add(self, handle):
+        """Add a timer to the wheel."""
+        self._insert(handle)
+
+    def remove(self, handle):
+        """Remove a timer from the wheel."""
+        key = id(handle)
+        level, slot = self._timers.pop(key)
+        del slot[key]
+        self._counts[level] -= 1
+
+    def move(self, handle, when):
+        """Change the time of a timer of the wheel."""
+        self.remove(handle)
+        handle._when = when
+        self._insert(handle)
+
+    def clear(self):
+        """Remove all timers and return them."""
+        handles = []
+        for level in self._levels:
+            for slot in level:
+                handles.extend(slot.values())
+                slot.clear()
+        handles.extend(self._overflow.values())
+        self._overflow.clear()
+        self._timers.clear()
+        self._counts = [0] * (_TIMER_WHEEL_LEVELS + 1)
+        return handles
+
+    def _cascade(self, level, slot):
+        handles = list(slot.values())
+        slot.clear()
+        self._counts[level] -= len(handles)
+        for handle in handles:
+            self._insert(handle)
+
+    def _turn(self, tick):
+        # Move the wheel to *tick*, and the timers of the slots reached
+        # by the upper levels down to the lower levels.
+        self._tick = tick
+        for level in range(1, _TIMER_WHEEL_LEVELS):
+            if tick & ((1 << (level * _TIMER_WHEEL_BITS)) - 1):
+                return
+            index = (tick >> (level * _TIMER_WHEEL_BITS)) & _TIMER_WHEEL_MASK
+            self._cascade(level, self._levels[level][index])
+        if not tick & ((1 << (_TIMER_WHEEL_LEVELS * _TIMER_WHEEL_BITS)) - 1):
+            self._cascade(_TIMER_WHEEL_LEVELS, self._overflow)
+
+    def pop_due(self, end_time):
+        """Remove and return the timers due before *end_time*.
+
+        They are sorted by time.
+        """
+        target = self._to_tick(end_time)
+        level0 = self._levels[0]
+        counts = self._counts
+        due = []
+        while True:
+            slot = level0[self._tick & _TIMER_WHEEL_MASK]
+            if slot:
+                if self._tick < target:
+                    handles = list(slot.values())
+                else:
+                    handles = [handle for handle in slot.values()
+                               if handle._when < end_time]
+                for handle in handles:
+                    key = id(handle)
+                    del slot[key]
+                    del self._timers[key]
+                counts[0] -= len(handles)
+                due.extend(handles)
+            if self._tick >= target:
+                break
+            if not self._timers:
+                self._tick = target
+                break
+            # Skip the ticks of the empty lower levels.
+            level = 0
+            while not counts[level]:
+                level += 1
+            shift = level * _TIMER_WHEEL_BITS
+            tick = ((self._tick >> shift) + 1) << shift
+            if tick > target:
+                self._tick = target
+            else:
+                self._turn(tick)
+        due.sort(key=_get_when)
+        return due
+
+    def next_deadline(self):
+        """Return when the wheel must next be looked at, or None if empty.
+
+        This is the time of the next timer of the lowest level, or the time
+        at which the wheel turns to the next slot holding timers of the
+        upper levels.
+        """
+        if not self._timers:
+            return None
+        tick = self._tick
+        for level in range(_TIMER_WHEEL_LEVELS):
+            if not self._counts[level]:
+                continue
+            shift = level * _TIMER_WHEEL_BITS
+            start = (tick >> shift) & _TIMER_WHEEL_MASK
+            if level:
+                # The current slot of the upper levels is always empty.
+                start += 1
+            slots = self._levels[level]
+            for index in range(start, _TIMER_WHEEL_SIZE):
+                slot = slots[index]
+                if slot:
+                    if not level:
+                        return min(handle._when for handle in slot.values())
+                    base = (tick >> (shift + _TIMER_WHEEL_BITS)
+                            << (shift + _TIMER_WHEEL_BITS))
+                    return (base + (index << shift)) * self._resolution
+        shift = _TIMER_WHEEL_LEVELS * _TIMER_WHEEL_BITS
+        return (((tick >> shift) + 1) << shift) * self._resolution
+
+
+def _get_when(handle):
+    return handle._when
+
+
 if hasattr(socket, 'TCP_NODELAY'):
     def _set_nodelay(sock):
         if (sock.family in {socket.AF_INET, socket.AF_INET6} and
@@ -389,6 +688,11 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        # Timer wheel holding the scheduled timer handles instead of the
+        # _scheduled heap, if enabled by set_timer_resolution()
+        self._timer_wheel = None
+        # Buffer shared by the transports to receive data
+        self._read_buffer = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -401,6 +705,9 @@ def __init__(self):
         # exceed this duration in seconds, the slow callback/task is logged.
         self.slow_callback_duration = 0.1
         self._current_handle = None
+        # _LoopProfiler accounting the time spent by the event loop, if
+        # enabled by set_profiling()
+        self._profiler = None
         self._task_factory = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
@@ -665,6 +972,9 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            for timer in self._timer_wheel.clear():
+                timer._scheduled = False
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -728,10 +1038,55 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is not None:
+            self._timer_wheel.add(timer)
+        else:
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
+    def get_timer_resolution(self):
+        """Return the resolution of the timer wheel of the event loop.
+
+        Return None if the timers are kept in a binary heap (the default).
+        """
+        if self._timer_wheel is None:
+            return None
+        return self._timer_wheel._resolution
+
+    def set_timer_resolution(self, resolution):
+        """Set how the timers of the event loop are kept.
+
+        If *resolution* is a number of seconds, timers are kept in a
+        hierarchical timer wheel whose slots span *resolution* seconds.
+        Scheduling, cancelling and rescheduling a timer then take constant
+        time.  If *resolution* is None, timers are kept in a binary heap.
+        """
+        if resolution is not None:
+            resolution = float(resolution)
+            if not resolution > 0:
+                raise ValueError(f'resolution must be a positive number '
+                                 f'or None, got {resolution!r}')
+        if self._timer_wheel is not None:
+            timers = self._timer_wheel.clear()
+        else:
+            timers = []
+            for timer in self._scheduled:
+                if timer._cancelled:
+                    timer._scheduled = False
+                else:
+                    timers.append(timer)
+            self._scheduled = []
+            self._timer_cancelled_count = 0
+        if resolution is None:
+            self._timer_wheel = None
+            heapq.heapify(timers)
+            self._scheduled = timers
+        else:
+            self._timer_wheel = _TimerWheel(resolution, self.time())
+            for timer in timers:
+                self._timer_wheel.add(timer)
+
     def call_soon(self, callback, *args, context=None):
         """Arrange for a callback to be called as soon as possible.
 
@@ -1789,6 +2144,18 @@ def _add_callback(self, handle):
         assert not isinstance(handle, events.TimerHandle)
         self._ready.append(handle)
 
+    def _get_read_buffer(self, size):
+        """Return a writable memoryview of at least *size* bytes.
+
+        The buffer is shared by all the transports of the event loop, which
+        read data into it and pass it on to their protocol right away: as
+        callbacks run one at a time, it is then free again.
+        """
+        buffer = self._read_buffer
+        if buffer is None or len(buffer) < size:
+            buffer = self._read_buffer = memoryview(bytearray(size))
+        return buffer
+
     def _add_callback_signalsafe(self, handle):
         """Like _add_callback() but called from a signal handler."""
         self._add_callback(handle)
@@ -1797,7 +2164,29 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is not None:
+                self._timer_wheel.remove(handle)
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
+
+    def _timer_handle_rescheduled(self, handle, when):
+        """Notification that a TimerHandle has been rescheduled."""
+        self._check_closed()
+        if self._debug:
+            self._check_thread()
+        if self._timer_wheel is None:
+            # A handle cannot be found in the heap in constant time.
+            raise RuntimeError('rescheduling a TimerHandle requires a timer '
+                               'wheel, see loop.set_timer_resolution()')
+        if handle._scheduled:
+            self._timer_wheel.move(handle, when)
+        else:
+            # If the handle is still waiting in the ready queue, it is
+            # skipped there as it is scheduled again.
+            handle._when = when
+            self._timer_wheel.add(handle)
+            handle._scheduled = True
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1837,8 +2226,16 @@ def _run_once(self):
             # Compute the desired timeout.
             when = self._scheduled[0]._when
             timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
-
-        event_list = self._selector.select(timeout)
+        elif self._timer_wheel is not None:
+            when = self._timer_wheel.next_deadline()
+            if when is not None:
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
+
+        if self._profiler is None:
+            event_list = self._selector.select(timeout)
+        else:
+            event_list = self._profiler.select(self._selector, timeout)
         self._process_events(event_list)
 
         # Handle 'later' callbacks that are ready.
@@ -1849,7 +2246,16 @@ def _run_once(self):
                 break
             handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
+            handle._due = True
             self._ready.append(handle)
+        if self._timer_wheel is not None:
+            for handle in self._timer_wheel.pop_due(end_time):
+                handle._scheduled = False
+                # A handle rescheduled while it was waiting in the ready
+                # queue is still there.
+                if not handle._due:
+                    handle._due = True
+                    self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -1858,23 +2264,26 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        if self._profiler is not None:
+            self._profiler.run_ready(self, ntodo)
+            return
+        if not self._debug:
+            _run_ready(self._ready, ntodo)
+            return
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
                 continue
-            if self._debug:
-                try:
-                    self._current_handle = handle
-                    t0 = self.time()
-                    handle._run()
-                    dt = self.time() - t0
-                    if dt >= self.slow_callback_duration:
-                        logger.warning('Executing %s took %.3f seconds',
-                                       _format_handle(handle), dt)
-                finally:
-                    self._current_handle = None
-            else:
+            try:
+                self._current_handle = handle
+                t0 = self.time()
                 handle._run()
+                dt = self.time() - t0
+                if dt >= self.slow_callback_duration:
+                    logger.warning('Executing %s took %.3f seconds',
+                                   _format_handle(handle), dt)
+            finally:
+                self._current_handle = None
         handle = None  # Needed to break cycles when an exception occurs.
 
     def _set_coroutine_origin_tracking(self, enabled):
@@ -1892,6 +2301,52 @@ def _set_coroutine_origin_tracking(self, enabled):
 
         self._coroutine_origin_tracking_enabled = enabled
 
+    def get_profiling(self):
+        return self._profiler is not None
+
+    def set_profiling(self, enabled):
+        """Enable or disable the profiling of the event loop.
+
+        While enabled, the event loop accounts the wall-clock and CPU time
+        spent running each callback and each step of its tasks, and
+        polling for I/O.  get_profile() returns the heaviest of them.
+        Enabling profiling again resets the profile of the callbacks and
+        polls, but not the one of the tasks.
+        """
+        self._profiler = _LoopProfiler() if enabled else None
+        for task in tasks.all_tasks(self):
+            try:
+                task._profiling = bool(enabled)
+            except AttributeError:
+                # Not a task of the asyncio module.
+                pass
+
+    def get_profile(self, n=10):
+        """Return a LoopProfile snapshot of the profile of the event loop.
+
+        Its tasks and callbacks attributes are lists of the *n* pending
+        tasks and the *n* callbacks which took the most wall-clock time,
+        heaviest first: TaskProfile and CallbackProfile named tuples.
+        The steps of tasks are accounted both per task and as callbacks
+        named after the coroutine function of the task, so that the time
+        spent by finished tasks is still accounted.
+        """
+        profiler = self._profiler
+        if profiler is None:
+            raise RuntimeError('profiling is not enabled')
+        task_profiles = []
+        for task in tasks.all_tasks(self):
+            steps = getattr(task, '_steps', 0)
+            if steps:
+                task_profiles.append(TaskProfile(
+                    task, steps, task._run_time, task._cpu_time))
+        callback_profiles = [CallbackProfile(name, *stats)
+                             for name, stats in profiler.callbacks.items()]
+        key = operator.attrgetter('run_time')
+        return LoopProfile(heapq.nlargest(n, task_profiles, key),
+                           heapq.nlargest(n, callback_profiles, key),
+                           profiler.polls, profiler.poll_time)
+
     def get_debug(self):
         return self._debug
 
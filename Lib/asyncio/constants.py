@@ -19,6 +19,10 @@
 # that don't support sendfile, or for TLS connections.
 SENDFILE_FALLBACK_READBUFFER_SIZE = 1024 * 256
 
+# Maximum number of reads a socket transport makes each time its socket is
+# readable, so that a busy connection does not starve the other ones.
+MAX_READS_PER_EVENT = 8
+
 # The enum should be here to break circular dependencies between
 # base_events and sslproto
 class _SendfileMode(enum.Enum):
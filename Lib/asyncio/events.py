@@ -21,6 +21,29 @@
 from . import format_helpers
 
 
+def _handle_repr_info(handle):
+    # NOTE: this function is also used by the C Handle (see _asynciomodule.c)
+    info = [handle.__class__.__name__]
+    if handle._cancelled:
+        info.append('cancelled')
+    if handle._callback is not None:
+        info.append(format_helpers._format_callback_source(
+            handle._callback, handle._args))
+    if handle._source_traceback:
+        frame = handle._source_traceback[-1]
+        info.append(f'created at {frame[0]}:{frame[1]}')
+    return info
+
+
+def _timer_handle_repr_info(handle):
+    # NOTE: this function is also used by the C TimerHandle
+    # (see _asynciomodule.c)
+    info = _handle_repr_info(handle)
+    pos = 2 if handle._cancelled else 1
+    info.insert(pos, f'when={handle._when}')
+    return info
+
+
 class Handle:
     """Object returned by callback registration methods."""
 
@@ -44,16 +67,7 @@ def __init__(self, callback, args, loop, context=None):
             self._source_traceback = None
 
     def _repr_info(self):
-        info = [self.__class__.__name__]
-        if self._cancelled:
-            info.append('cancelled')
-        if self._callback is not None:
-            info.append(format_helpers._format_callback_source(
-                self._callback, self._args))
-        if self._source_traceback:
-            frame = self._source_traceback[-1]
-            info.append(f'created at {frame[0]}:{frame[1]}')
-        return info
+        return _handle_repr_info(self)
 
     def __repr__(self):
         if self._repr is not None:
@@ -98,7 +112,7 @@ def _run(self):
 class TimerHandle(Handle):
     """Object returned by timed callback registration methods."""
 
-    __slots__ = ['_scheduled', '_when']
+    __slots__ = ['_scheduled', '_due', '_when']
 
     def __init__(self, when, callback, args, loop, context=None):
         assert when is not None
@@ -107,38 +121,37 @@ def __init__(self, when, callback, args, loop, context=None):
             del self._source_traceback[-1]
         self._when = when
         self._scheduled = False
+        # Set while the handle waits in the ready queue of the loop.
+        self._due = False
 
     def _repr_info(self):
-        info = super()._repr_info()
-        pos = 2 if self._cancelled else 1
-        info.insert(pos, f'when={self._when}')
-        return info
+        return _timer_handle_repr_info(self)
 
     def __hash__(self):
         return hash(self._when)
 
     def __lt__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when < other._when
         return NotImplemented
 
     def __le__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when < other._when or self.__eq__(other)
         return NotImplemented
 
     def __gt__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when > other._when
         return NotImplemented
 
     def __ge__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when > other._when or self.__eq__(other)
         return NotImplemented
 
     def __eq__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return (self._when == other._when and
                     self._callback == other._callback and
                     self._args == other._args and
@@ -150,6 +163,14 @@ def cancel(self):
             self._loop._timer_handle_cancelled(self)
         super().cancel()
 
+    def _run(self):
+        self._due = False
+        if self._scheduled:
+            # Rescheduled while it was waiting in the ready queue: it is
+            # called at its new time.
+            return
+        super()._run()
+
     def when(self):
         """Return a scheduled callback time.
 
@@ -158,6 +179,19 @@ def when(self):
         """
         return self._when
 
+    def reschedule(self, when):
+        """Change the time at which the callback is scheduled.
+
+        The time is an absolute timestamp, using the same time
+        reference as loop.time().  If the callback has already been
+        called, it is scheduled again.  If it is due but has not been
+        called yet, it is only called at the new time.  The event loop
+        must use a timer wheel, see loop.set_timer_resolution().
+        """
+        if self._cancelled:
+            raise RuntimeError('cannot reschedule a cancelled TimerHandle')
+        self._loop._timer_handle_rescheduled(self, when)
+
 
 class AbstractServer:
     """Abstract server returned by create_server()."""
@@ -258,6 +292,10 @@ def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         raise NotImplementedError
 
+    def _timer_handle_rescheduled(self, handle, when):
+        """Notification that a TimerHandle has been rescheduled."""
+        raise NotImplementedError
+
     def call_soon(self, callback, *args):
         return self.call_later(0, callback, *args)
 
@@ -270,6 +308,12 @@ def call_at(self, when, callback, *args):
     def time(self):
         raise NotImplementedError
 
+    def get_timer_resolution(self):
+        raise NotImplementedError
+
+    def set_timer_resolution(self, resolution):
+        raise NotImplementedError
+
     def create_future(self):
         raise NotImplementedError
 
@@ -794,6 +838,8 @@ def set_child_watcher(watcher):
 
 
 # Alias pure-Python implementations for testing purposes.
+_PyHandle = Handle
+_PyTimerHandle = TimerHandle
 _py__get_running_loop = _get_running_loop
 _py__set_running_loop = _set_running_loop
 _py_get_running_loop = get_running_loop
@@ -816,3 +862,15 @@ def set_child_watcher(watcher):
     _c_get_running_loop = get_running_loop
     _c_get_event_loop = get_event_loop
     _c__get_event_loop = _get_event_loop
+
+
+try:
+    # A Handle is created and run for every callback scheduled on the
+    # event loop.
+    from _asyncio import Handle, TimerHandle
+except ImportError:
+    pass
+else:
+    # Alias C implementations for testing purposes.
+    _CHandle = Handle
+    _CTimerHandle = TimerHandle
@@ -159,7 +159,12 @@ def _call_connection_lost(self, exc):
             # just close our end.  First calling shutdown() seems to
             # cure it, but maybe using DisconnectEx() would be better.
             if hasattr(self._sock, 'shutdown'):
-                self._sock.shutdown(socket.SHUT_RDWR)
+                try:
+                    self._sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    # The socket is not connected: it is a datagram
+                    # socket or the peer already reset the connection.
+                    pass
             self._sock.close()
             self._sock = None
             server = self._server
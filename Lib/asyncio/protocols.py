@@ -91,10 +91,15 @@ class Protocol(BaseProtocol):
 
     __slots__ = ()
 
+    # If true, data_received() may be passed a memoryview of a buffer
+    # which the transport reuses once data_received() returns.
+    data_received_memoryview = False
+
     def data_received(self, data):
         """Called when some data is received.
 
-        The argument is a bytes object.
+        The argument is a bytes object, or a memoryview if
+        data_received_memoryview is true.
         """
 
     def eof_received(self):
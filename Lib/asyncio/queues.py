@@ -1,8 +1,11 @@
-__all__ = ('Queue', 'PriorityQueue', 'LifoQueue', 'QueueFull', 'QueueEmpty')
+__all__ = ('Queue', 'PriorityQueue', 'LifoQueue', 'ThreadSafeQueue',
+           'QueueFull', 'QueueEmpty')
 
 import collections
 import heapq
+import threading
 
+from . import events
 from . import locks
 from . import mixins
 
@@ -243,3 +246,273 @@ def _put(self, item):
 
     def _get(self):
         return self._queue.pop()
+
+
+class ThreadSafeQueue:
+    """A queue shared by coroutines of any event loop and by threads.
+
+    Coroutines use the get*() and put*() coroutine methods, threads use the
+    blocking *_sync() methods.  The queue is not bound to an event loop:
+    each coroutine waits in the loop running it.
+
+    Waking up coroutines from another thread goes through
+    call_soon_threadsafe().  The wakeups are coalesced: all the coroutines
+    woken up in a loop before it runs again cost a single call, hence a
+    single write to the self-pipe of the loop, however many items were put.
+    get_many(), put_many() and their *_sync() counterparts move items in
+    batches, taking the lock of the queue once.
+
+    If maxsize is less than or equal to zero, the queue size is infinite.
+    """
+
+    def __init__(self, maxsize=0):
+        self._maxsize = maxsize
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # (loop, future) pairs of the waiting coroutines.
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        # The (future, waiters) pairs woken up in each loop by the next
+        # callback scheduled with call_soon_threadsafe().
+        self._wakeups = {}
+
+    def __repr__(self):
+        return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
+
+    def __str__(self):
+        return f'<{type(self).__name__} {self._format()}>'
+
+    def __class_getitem__(cls, type):
+        return cls
+
+    def _format(self):
+        result = f'maxsize={self._maxsize!r}'
+        with self._lock:
+            if self._queue:
+                result += f' _queue={list(self._queue)!r}'
+            if self._getters:
+                result += f' _getters[{len(self._getters)}]'
+            if self._putters:
+                result += f' _putters[{len(self._putters)}]'
+        return result
+
+    def qsize(self):
+        """Number of items in the queue."""
+        return len(self._queue)
+
+    @property
+    def maxsize(self):
+        """Number of items allowed in the queue."""
+        return self._maxsize
+
+    def empty(self):
+        """Return True if the queue is empty, False otherwise."""
+        return not self._queue
+
+    def full(self):
+        """Return True if there are maxsize items in the queue."""
+        return self._free_slots() == 0
+
+    def _free_slots(self):
+        if self._maxsize <= 0:
+            return None
+        return max(self._maxsize - len(self._queue), 0)
+
+    # The following methods must be called with the lock held.
+
+    def _wakeup_next(self, waiters, count):
+        # Wake up to count coroutines of waiters.
+        running_loop = events._get_running_loop()
+        while waiters and count > 0:
+            loop, waiter = waiters.popleft()
+            if loop is running_loop:
+                if not waiter.done():
+                    waiter.set_result(None)
+                    count -= 1
+                continue
+            count -= 1
+            wakeups = self._wakeups.get(loop)
+            if wakeups is not None:
+                # A callback is already scheduled in this loop.
+                wakeups.append((waiter, waiters))
+                continue
+            try:
+                loop.call_soon_threadsafe(self._wakeup_in_loop, loop)
+            except RuntimeError:
+                # The loop is closed: its coroutines will never run.
+                count += 1
+            else:
+                self._wakeups[loop] = [(waiter, waiters)]
+
+    def _put_items(self, items):
+        # Put as many items as there are free slots, return the number put.
+        free = self._free_slots()
+        if free is None:
+            free = len(items)
+        else:
+            free = min(free, len(items))
+        if free:
+            self._queue.extend(items[:free])
+            self._not_empty.notify(free)
+            self._wakeup_next(self._getters, free)
+        return free
+
+    def _get_items(self, max_n):
+        count = min(max_n, len(self._queue))
+        popleft = self._queue.popleft
+        items = [popleft() for _ in range(count)]
+        if count:
+            self._not_full.notify(count)
+            self._wakeup_next(self._putters, count)
+        return items
+
+    def _add_waiter(self, waiters):
+        loop = events.get_running_loop()
+        entry = (loop, loop.create_future())
+        waiters.append(entry)
+        return entry
+
+    # End of the methods to call with the lock held.
+
+    def _wakeup_in_loop(self, loop):
+        with self._lock:
+            for waiter, waiters in self._wakeups.pop(loop):
+                if not waiter.done():
+                    waiter.set_result(None)
+                else:
+                    # Cancelled while its wakeup was in flight: pass it on.
+                    self._wakeup_next(waiters, 1)
+
+    async def _wait(self, entry, waiters):
+        waiter = entry[1]
+        try:
+            await waiter
+        except:
+            waiter.cancel()  # Just in case waiter is not done yet.
+            with self._lock:
+                try:
+                    waiters.remove(entry)
+                except ValueError:
+                    # The waiter was woken up: unless its wakeup is still
+                    # in flight, wake up the next in line instead.
+                    if not waiter.cancelled():
+                        self._wakeup_next(waiters, 1)
+            raise
+
+    async def put(self, item):
+        """Put an item into the queue.
+
+        If the queue is full, wait until a free slot is available before
+        adding item.
+        """
+        await self.put_many((item,))
+
+    def put_nowait(self, item):
+        """Put an item into the queue without blocking.
+
+        If no free slot is immediately available, raise QueueFull.
+        """
+        with self._lock:
+            if not self._put_items((item,)):
+                raise QueueFull
+
+    async def put_many(self, items):
+        """Put the items of an iterable into the queue, in order.
+
+        If the queue is full, wait for free slots, putting items as
+        they become available.
+        """
+        items = list(items)
+        while True:
+            with self._lock:
+                del items[:self._put_items(items)]
+                if not items:
+                    return
+                entry = self._add_waiter(self._putters)
+            await self._wait(entry, self._putters)
+
+    async def get(self):
+        """Remove and return an item from the queue.
+
+        If queue is empty, wait until an item is available.
+        """
+        return (await self.get_many(1))[0]
+
+    def get_nowait(self):
+        """Remove and return an item from the queue.
+
+        Return an item if one is immediately available, else raise QueueEmpty.
+        """
+        with self._lock:
+            if not self._queue:
+                raise QueueEmpty
+            return self._get_items(1)[0]
+
+    async def get_many(self, max_n):
+        """Remove and return a list of up to max_n items from the queue.
+
+        If queue is empty, wait until an item is available; the items
+        already in the queue are returned without waiting for more.
+        """
+        if max_n <= 0:
+            raise ValueError("'max_n' must be a positive integer")
+        while True:
+            with self._lock:
+                if self._queue:
+                    return self._get_items(max_n)
+                entry = self._add_waiter(self._getters)
+            await self._wait(entry, self._getters)
+
+    def put_sync(self, item, timeout=None):
+        """Put an item into the queue, blocking the calling thread.
+
+        If the queue is full, block until a free slot is available, or
+        raise QueueFull if none became available after timeout seconds.
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(
+                    lambda: self._put_items((item,)), timeout):
+                raise QueueFull
+
+    def put_many_sync(self, items, timeout=None):
+        """Put the items of an iterable into the queue, blocking the
+        calling thread until they are all put.
+
+        If the queue is full, put items as free slots become available,
+        or raise QueueFull if they were not all put after timeout seconds.
+        The items not put by then are not added to the queue.
+        """
+        items = list(items)
+
+        def put_items():
+            del items[:self._put_items(items)]
+            return not items
+
+        with self._not_full:
+            if not self._not_full.wait_for(put_items, timeout):
+                raise QueueFull
+
+    def get_sync(self, timeout=None):
+        """Remove and return an item from the queue, blocking the calling
+        thread.
+
+        If the queue is empty, block until an item is available, or raise
+        QueueEmpty if none became available after timeout seconds.
+        """
+        return self.get_many_sync(1, timeout)[0]
+
+    def get_many_sync(self, max_n, timeout=None):
+        """Remove and return a list of up to max_n items from the queue,
+        blocking the calling thread.
+
+        If the queue is empty, block until an item is available, or raise
+        QueueEmpty if none became available after timeout seconds.
+        """
+        if max_n <= 0:
+            raise ValueError("'max_n' must be a positive integer")
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._queue, timeout):
+                raise QueueEmpty
+            return self._get_items(max_n)
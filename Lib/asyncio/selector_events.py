@@ -9,6 +9,8 @@
 import collections
 import errno
 import functools
+import itertools
+import os
 import selectors
 import socket
 import warnings
@@ -29,6 +31,19 @@
 from .log import logger
 
 
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+if _HAS_SENDMSG:
+    try:
+        _SC_IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        # POSIX only guarantees 16 buffers per sendmsg() call.
+        _SC_IOV_MAX = 16
+    else:
+        if _SC_IOV_MAX <= 0:
+            _SC_IOV_MAX = 16
+
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -756,6 +771,9 @@ def _add_reader(self, fd, callback, *args):
 
 class _SelectorSocketTransport(_SelectorTransport):
 
+    # The data to write is kept as a deque of buffers, sent together with
+    # sendmsg() where available rather than copied into a single buffer.
+    _buffer_factory = collections.deque
     _start_tls_compatible = True
     _sendfile_compatible = constants._SendfileMode.TRY_NATIVE
 
@@ -787,6 +805,8 @@ def set_protocol(self, protocol):
             self._read_ready_cb = self._read_ready__get_buffer
         else:
             self._read_ready_cb = self._read_ready__data_received
+            self._data_received_memoryview = getattr(
+                protocol, 'data_received_memoryview', False)
 
         super().set_protocol(protocol)
 
@@ -852,27 +872,43 @@ def _read_ready__get_buffer(self):
     def _read_ready__data_received(self):
         if self._conn_lost:
             return
-        try:
-            data = self._sock.recv(self.max_size)
-        except (BlockingIOError, InterruptedError):
-            return
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(exc, 'Fatal read error on socket transport')
-            return
+        # Read into the buffer shared by the transports of the loop, rather
+        # than allocating max_size bytes for every read.
+        buf = self._loop._get_read_buffer(self.max_size)
+        protocol = self._protocol
+        for _ in range(constants.MAX_READS_PER_EVENT):
+            try:
+                nbytes = self._sock.recv_into(buf, self.max_size)
+            except (BlockingIOError, InterruptedError):
+                return
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(exc, 'Fatal read error on socket transport')
+                return
 
-        if not data:
-            self._read_ready__on_eof()
-            return
+            if not nbytes:
+                self._read_ready__on_eof()
+                return
 
-        try:
-            self._protocol.data_received(data)
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(
-                exc, 'Fatal error: protocol.data_received() call failed.')
+            if self._data_received_memoryview:
+                data = buf[:nbytes]
+            else:
+                data = bytes(buf[:nbytes])
+            try:
+                protocol.data_received(data)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(
+                    exc, 'Fatal error: protocol.data_received() call failed.')
+                return
+
+            # Keep reading only while the socket may hold more data, and
+            # the protocol still wants it.
+            if (nbytes < self.max_size or self._paused or self._closing
+                    or self._conn_lost or self._protocol is not protocol):
+                return
 
     def _read_ready__on_eof(self):
         if self._loop.get_debug():
@@ -924,23 +960,87 @@ def write(self, data):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
-                data = data[n:]
+                data = memoryview(data).cast('B')[n:]
                 if not data:
                     return
             # Not all was written; register write handler.
             self._loop._add_writer(self._sock_fd, self._write_ready)
 
         # Add it to the buffer.
-        self._buffer.extend(data)
+        self._buffer.append(self._make_buffer(data))
+        self._maybe_pause_protocol()
+
+    def writelines(self, list_of_data):
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+        if self._empty_waiter is not None:
+            raise RuntimeError('unable to writelines; sendfile is in progress')
+        buffers = []
+        for data in list_of_data:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(f'data argument must be a bytes-like object, '
+                                f'not {type(data).__name__!r}')
+            if data:
+                buffers.append(self._make_buffer(data))
+        if not buffers:
+            return
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        was_empty = not self._buffer
+        self._buffer.extend(buffers)
+        if was_empty:
+            # Optimization: try to send now.
+            self._write_ready()
+            if not self._buffer or self._conn_lost:
+                return
+            # Not all was written; register write handler.
+            self._loop._add_writer(self._sock_fd, self._write_ready)
         self._maybe_pause_protocol()
 
+    @staticmethod
+    def _make_buffer(data):
+        # Keep a reference to immutable data rather than copying it.
+        # Mutable data is copied: the caller may change it once write()
+        # returns.
+        if isinstance(data, bytes):
+            return data
+        if (isinstance(data, memoryview) and isinstance(data.obj, bytes)
+                and data.c_contiguous):
+            return data.cast('B')
+        return bytes(data)
+
+    def get_write_buffer_size(self):
+        return sum(map(len, self._buffer))
+
+    def _adjust_leftover_buffer(self, nbytes):
+        buffer = self._buffer
+        while nbytes:
+            data = buffer.popleft()
+            if len(data) > nbytes:
+                buffer.appendleft(memoryview(data)[nbytes:])
+                break
+            nbytes -= len(data)
+
     def _write_ready(self):
         assert self._buffer, 'Data should not be empty'
 
         if self._conn_lost:
             return
         try:
-            n = self._sock.send(self._buffer)
+            if _HAS_SENDMSG:
+                n = self._sock.sendmsg(
+                    itertools.islice(self._buffer, _SC_IOV_MAX))
+            else:
+                if len(self._buffer) > 1:
+                    data = b''.join(self._buffer)
+                    self._buffer.clear()
+                    self._buffer.append(data)
+                n = self._sock.send(self._buffer[0])
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
@@ -952,8 +1052,7 @@ def _write_ready(self):
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
         else:
-            if n:
-                del self._buffer[:n]
+            self._adjust_leftover_buffer(n)
             self._maybe_resume_protocol()  # May append to buffer.
             if not self._buffer:
                 self._loop._remove_writer(self._sock_fd)
@@ -261,6 +261,18 @@ def connection_lost(self, exc):
         self._stream_writer = None
         self._transport = None
 
+    @property
+    def data_received_memoryview(self):
+        # StreamReader.feed_data() copies the data into the buffer of the
+        # reader, so a view of the buffer of the transport is enough.
+        # Subclasses overriding data_received() and readers overriding
+        # feed_data() may keep the data, so they still get bytes.
+        if type(self).data_received is not StreamReaderProtocol.data_received:
+            return False
+        reader = self._stream_reader
+        return (reader is not None and
+                type(reader).feed_data is StreamReader.feed_data)
+
     def data_received(self, data):
         reader = self._stream_reader
         if reader is not None:
@@ -391,6 +403,7 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._buffer = bytearray()
         self._eof = False    # Whether we're done.
         self._waiter = None  # A future used by _wait_for_data()
+        self._readinto = None  # The unfilled part of a readexactly_into()
         self._exception = None
         self._transport = None
         self._paused = False
@@ -459,7 +472,17 @@ def feed_data(self, data):
         if not data:
             return
 
-        self._buffer.extend(data)
+        readinto = self._readinto
+        if readinto:
+            # readexactly_into() waits for data and the buffer is empty:
+            # copy the data straight into the buffer it reads into.
+            with memoryview(data) as view:
+                nbytes = min(len(readinto), len(view))
+                readinto[:nbytes] = view[:nbytes]
+                self._readinto = readinto[nbytes:]
+                self._buffer.extend(view[nbytes:])
+        else:
+            self._buffer.extend(data)
         self._wakeup_waiter()
 
         if (self._transport is not None and
@@ -475,10 +498,14 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
-    async def _wait_for_data(self, func_name):
+    async def _wait_for_data(self, func_name, readinto=None):
         """Wait until feed_data() or feed_eof() is called.
 
         If stream was paused, automatically resume it.
+
+        If `readinto` is not None, it is a memoryview that feed_data() fills
+        rather than the buffer, which must be empty.  Return the number of
+        bytes written to it.
         """
         # StreamReader uses a future to link the protocol feed_data() method
         # to a read coroutine. Running two read coroutines at the same time
@@ -498,10 +525,50 @@ async def _wait_for_data(self, func_name):
             self._transport.resume_reading()
 
         self._waiter = self._loop.create_future()
+        self._readinto = readinto
         try:
             await self._waiter
         finally:
             self._waiter = None
+            unfilled = self._readinto
+            self._readinto = None
+        if readinto is not None:
+            with unfilled:
+                return len(readinto) - len(unfilled)
+
+    def _consume(self, n):
+        """Remove the first n bytes of the buffer and return them."""
+        buffer = self._buffer
+        if n >= len(buffer):
+            data = bytes(buffer)
+            buffer.clear()
+        else:
+            # Copy the data only once: slicing the bytearray would copy it
+            # a first time.  Deleting the prefix of a bytearray does not
+            # move the rest of it.
+            with memoryview(buffer) as view:
+                data = bytes(view[:n])
+            del buffer[:n]
+        self._maybe_resume_transport()
+        return data
+
+    def _consume_view(self, n):
+        """Remove the first n bytes of the buffer and return a view of them.
+
+        Only the smaller of the data and of the rest of the buffer is
+        copied: the buffer itself is handed over if it is smaller.
+        """
+        buffer = self._buffer
+        if n * 2 < len(buffer):
+            with memoryview(buffer) as view:
+                data = bytearray(view[:n])
+            del buffer[:n]
+        else:
+            data = buffer
+            with memoryview(buffer) as view:
+                self._buffer = bytearray(view[n:])
+        self._maybe_resume_transport()
+        return memoryview(data)[:n]
 
     async def readline(self):
         """Read chunk of data from the stream until newline (b'\n') is found.
@@ -554,6 +621,23 @@ async def readuntil(self, separator=b'\n'):
         LimitOverrunError exception  will be raised, and the data
         will be left in the internal buffer, so it can be read again.
         """
+        length = await self._wait_for_separator(separator, 'readuntil')
+        return self._consume(length)
+
+    async def readuntil_view(self, separator=b'\n'):
+        """Read data from the stream until ``separator`` is found.
+
+        Same as readuntil(), but return a memoryview of the data rather
+        than a bytes object, copying as little data as possible.
+        """
+        length = await self._wait_for_separator(separator, 'readuntil_view')
+        return self._consume_view(length)
+
+    async def _wait_for_separator(self, separator, func_name):
+        """Wait until ``separator`` is in the buffer.
+
+        Return the length of the data up to the end of the separator.
+        """
         seplen = len(separator)
         if seplen == 0:
             raise ValueError('Separator should be at least one-byte string')
@@ -614,16 +698,13 @@ async def readuntil(self, separator=b'\n'):
                 raise exceptions.IncompleteReadError(chunk, None)
 
             # _wait_for_data() will resume reading if stream was paused.
-            await self._wait_for_data('readuntil')
+            await self._wait_for_data(func_name)
 
         if isep > self._limit:
             raise exceptions.LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', isep)
 
-        chunk = self._buffer[:isep + seplen]
-        del self._buffer[:isep + seplen]
-        self._maybe_resume_transport()
-        return bytes(chunk)
+        return isep + seplen
 
     async def read(self, n=-1):
         """Read up to `n` bytes from the stream.
@@ -669,11 +750,7 @@ async def read(self, n=-1):
             await self._wait_for_data('read')
 
         # This will work right even if buffer is less than n bytes
-        data = bytes(self._buffer[:n])
-        del self._buffer[:n]
-
-        self._maybe_resume_transport()
-        return data
+        return self._consume(n)
 
     async def readexactly(self, n):
         """Read exactly `n` bytes.
@@ -699,22 +776,101 @@ async def readexactly(self, n):
         if n == 0:
             return b''
 
+        await self._wait_for_size(n, 'readexactly')
+        return self._consume(n)
+
+    async def readexactly_view(self, n):
+        """Read exactly `n` bytes.
+
+        Same as readexactly(), but return a memoryview of the data rather
+        than a bytes object, copying as little data as possible: when the
+        buffer holds exactly `n` bytes, it is handed over without copy.
+        """
+        if n < 0:
+            raise ValueError('readexactly size can not be less than zero')
+
+        if self._exception is not None:
+            raise self._exception
+
+        await self._wait_for_size(n, 'readexactly_view')
+        return self._consume_view(n)
+
+    async def readexactly_into(self, buffer):
+        """Read exactly len(buffer) bytes into the writable `buffer`.
+
+        Return the number of bytes read, the size of `buffer` in bytes.
+        Data is copied from the internal buffer as it arrives, or straight
+        from the transport while the internal buffer is empty, so that the
+        stream does not have to buffer len(buffer) bytes first.
+
+        Raise an IncompleteReadError if EOF is reached before `buffer` is
+        filled.  The IncompleteReadError.partial attribute of the exception
+        will contain the partial read bytes, which are also in `buffer`.
+
+        If the call is cancelled, the bytes already written to `buffer`
+        are consumed from the stream.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as view, view.cast('B') as view:
+            if view.readonly:
+                raise TypeError('readexactly_into() argument must be '
+                                'a writable bytes-like object')
+            n = len(view)
+            pos = 0
+            while True:
+                if self._buffer:
+                    nbytes = min(len(self._buffer), n - pos)
+                    with memoryview(self._buffer) as data:
+                        view[pos:pos + nbytes] = data[:nbytes]
+                    del self._buffer[:nbytes]
+                    self._maybe_resume_transport()
+                    pos += nbytes
+                if pos == n:
+                    return n
+                if self._eof:
+                    raise exceptions.IncompleteReadError(bytes(view[:pos]), n)
+
+                with view[pos:] as readinto:
+                    pos += await self._wait_for_data('readexactly_into',
+                                                     readinto)
+
+    async def peek(self, n):
+        """Return up to `n` bytes from the stream without consuming them.
+
+        Wait until the internal buffer holds at least `n` bytes, unless EOF
+        is reached first, in which case return the data left.  The next
+        read*() call returns the same data.
+
+        Returned value is not limited with limit, configured at stream
+        creation.
+        """
+        if n < 0:
+            raise ValueError('peek size can not be less than zero')
+
+        if self._exception is not None:
+            raise self._exception
+
+        while len(self._buffer) < n and not self._eof:
+            await self._wait_for_data('peek')
+
+        with memoryview(self._buffer) as view:
+            return bytes(view[:n])
+
+    async def _wait_for_size(self, n, func_name):
+        """Wait until the buffer holds at least `n` bytes.
+
+        Raise an IncompleteReadError and clear the buffer if EOF is reached
+        first.
+        """
         while len(self._buffer) < n:
             if self._eof:
                 incomplete = bytes(self._buffer)
                 self._buffer.clear()
                 raise exceptions.IncompleteReadError(incomplete, n)
 
-            await self._wait_for_data('readexactly')
-
-        if len(self._buffer) == n:
-            data = bytes(self._buffer)
-            self._buffer.clear()
-        else:
-            data = bytes(self._buffer[:n])
-            del self._buffer[:n]
-        self._maybe_resume_transport()
-        return data
+            await self._wait_for_data(func_name)
 
     def __aiter__(self):
         return self
@@ -3,17 +3,20 @@
 __all__ = (
     'Task', 'create_task',
     'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
-    'wait', 'wait_for', 'as_completed', 'sleep',
+    'wait', 'wait_for', 'as_completed', 'bounded_map', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
     'current_task', 'all_tasks',
+    'create_eager_task_factory', 'eager_task_factory',
     '_register_task', '_unregister_task', '_enter_task', '_leave_task',
 )
 
+import collections
 import concurrent.futures
 import contextvars
 import functools
 import inspect
 import itertools
+import time
 import types
 import warnings
 import weakref
@@ -30,6 +33,10 @@
 # is not thread safe. See bpo-11866 for a longer explanation.
 _task_name_counter = itertools.count(1).__next__
 
+# Clock measuring the CPU time of the steps of tasks, when profiling them.
+# time.thread_time() is not available on every platform.
+_thread_time = getattr(time, 'thread_time', time.process_time)
+
 
 def current_task(loop=None):
     """Return a currently executed task."""
@@ -89,7 +96,14 @@ class Task(futures._PyFuture):  # Inherit Python Task implementation
     # status is still pending
     _log_destroy_pending = True
 
-    def __init__(self, coro, *, loop=None, name=None):
+    # Whether to account the time spent running the steps of the task, and
+    # the number of steps run and their wall-clock and CPU time (seconds).
+    _profiling = False
+    _steps = 0
+    _run_time = 0.0
+    _cpu_time = 0.0
+
+    def __init__(self, coro, *, loop=None, name=None, eager_start=False):
         super().__init__(loop=loop)
         if self._source_traceback:
             del self._source_traceback[-1]
@@ -108,9 +122,16 @@ def __init__(self, coro, *, loop=None, name=None):
         self._fut_waiter = None
         self._coro = coro
         self._context = contextvars.copy_context()
+        # Decide whether to profile the task before its first step, which
+        # can run right away.
+        if getattr(self._loop, '_profiler', None) is not None:
+            self._profiling = True
 
-        self._loop.call_soon(self.__step, context=self._context)
         _register_task(self)
+        if eager_start and self._loop.is_running():
+            self.__eager_start()
+        else:
+            self._loop.call_soon(self.__step, context=self._context)
 
     def __del__(self):
         if self._state == futures._PENDING and self._log_destroy_pending:
@@ -212,6 +233,24 @@ def cancel(self, msg=None):
         self._cancel_message = msg
         return True
 
+    def __eager_start(self):
+        # Run the first step of the task right away, in the context of the
+        # task, while the task creating it is suspended.
+        prev_task = _swap_current_task(self._loop, self)
+        if self._profiling:
+            start_time = time.perf_counter()
+            start_cpu_time = _thread_time()
+        else:
+            start_time = None
+        try:
+            self._context.run(self.__step_run_and_handle_result, None)
+        finally:
+            _swap_current_task(self._loop, prev_task)
+            if start_time is not None:
+                self._steps += 1
+                self._run_time += time.perf_counter() - start_time
+                self._cpu_time += _thread_time() - start_cpu_time
+
     def __step(self, exc=None):
         if self.done():
             raise exceptions.InvalidStateError(
@@ -220,10 +259,26 @@ def __step(self, exc=None):
             if not isinstance(exc, exceptions.CancelledError):
                 exc = self._make_cancelled_error()
             self._must_cancel = False
-        coro = self._coro
         self._fut_waiter = None
 
         _enter_task(self._loop, self)
+        if self._profiling:
+            start_time = time.perf_counter()
+            start_cpu_time = _thread_time()
+        else:
+            start_time = None
+        try:
+            self.__step_run_and_handle_result(exc)
+        finally:
+            _leave_task(self._loop, self)
+            if start_time is not None:
+                self._steps += 1
+                self._run_time += time.perf_counter() - start_time
+                self._cpu_time += _thread_time() - start_cpu_time
+            self = None  # Needed to break cycles when an exception occurs.
+
+    def __step_run_and_handle_result(self, exc):
+        coro = self._coro
         # Call either coro.throw(exc) or coro.send(None).
         try:
             if exc is None:
@@ -295,9 +350,6 @@ def __step(self, exc=None):
                 new_exc = RuntimeError(f'Task got bad yield: {result!r}')
                 self._loop.call_soon(
                     self.__step, new_exc, context=self._context)
-        finally:
-            _leave_task(self._loop, self)
-            self = None  # Needed to break cycles when an exception occurs.
 
     def __wakeup(self, future):
         try:
@@ -582,6 +634,91 @@ async def _wait_for_one():
         yield _wait_for_one()
 
 
+async def bounded_map(func, iterable, *, limit, ordered=True):
+    """Run func on the items of iterable, with bounded concurrency.
+
+    This is an asynchronous generator.  func must be a coroutine function,
+    and iterable is an iterable or an asynchronous iterable.  Tasks
+    running func(item) are created lazily, so that at most limit of them
+    are running or waiting for their result to be consumed at any time.
+    The results are yielded in the order of iterable if ordered is true,
+    or as soon as they are available otherwise.
+
+    The first exception raised by func (in completion order) is
+    propagated and all the running tasks are cancelled.  Running tasks are
+    also cancelled if the generator is closed before being exhausted.
+    """
+    if limit < 1:
+        raise ValueError(f'limit must be a positive integer, got {limit!r}')
+
+    loop = events.get_running_loop()
+    is_async = hasattr(iterable, '__aiter__')
+    items = aiter(iterable) if is_async else iter(iterable)
+
+    pending = set()
+    done = collections.deque()  # Completed tasks, in completion order.
+    order = collections.deque()  # Tasks not yielded yet, in input order.
+    waiter = None
+    exhausted = False
+
+    def _on_completion(task):
+        pending.discard(task)
+        done.append(task)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    try:
+        while True:
+            while not exhausted:
+                if ordered:
+                    in_flight = len(order)
+                else:
+                    in_flight = len(pending) + len(done)
+                if in_flight >= limit:
+                    break
+                try:
+                    if is_async:
+                        item = await anext(items)
+                    else:
+                        item = next(items)
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                task = loop.create_task(func(item))
+                pending.add(task)
+                if ordered:
+                    order.append(task)
+                task.add_done_callback(_on_completion)
+
+            if ordered:
+                while done:
+                    task = done.popleft()
+                    if task.cancelled() or task.exception() is not None:
+                        task.result()  # Raise the exception.
+                if order and order[0].done():
+                    yield order.popleft().result()
+                    continue
+            elif done:
+                yield done.popleft().result()
+                continue
+
+            if not pending:
+                return
+            waiter = loop.create_future()
+            try:
+                await waiter
+            finally:
+                waiter = None
+    finally:
+        for task in pending:
+            task.remove_done_callback(_on_completion)
+            task.cancel()
+        for task in done:
+            # Mark exceptions of unconsumed tasks as retrieved.
+            if not task.cancelled():
+                task.exception()
+
+
 @types.coroutine
 def __sleep0():
     """Skip one event loop run cycle.
@@ -912,6 +1049,19 @@ def _leave_task(loop, task):
     del _current_tasks[loop]
 
 
+def _swap_current_task(loop, task):
+    """Make task the current task of loop, and return the previous one.
+
+    task and the returned task may be None.
+    """
+    prev_task = _current_tasks.get(loop)
+    if task is None:
+        _current_tasks.pop(loop, None)
+    else:
+        _current_tasks[loop] = task
+    return prev_task
+
+
 def _unregister_task(task):
     """Unregister a task."""
     _all_tasks.discard(task)
@@ -921,11 +1071,12 @@ def _unregister_task(task):
 _py_unregister_task = _unregister_task
 _py_enter_task = _enter_task
 _py_leave_task = _leave_task
+_py_swap_current_task = _swap_current_task
 
 
 try:
     from _asyncio import (_register_task, _unregister_task,
-                          _enter_task, _leave_task,
+                          _enter_task, _leave_task, _swap_current_task,
                           _all_tasks, _current_tasks)
 except ImportError:
     pass
@@ -934,3 +1085,25 @@ def _unregister_task(task):
     _c_unregister_task = _unregister_task
     _c_enter_task = _enter_task
     _c_leave_task = _leave_task
+    _c_swap_current_task = _swap_current_task
+
+
+def create_eager_task_factory(custom_task_constructor):
+    """Create a task factory running the first step of tasks eagerly.
+
+    The returned factory, to be passed to loop.set_task_factory(), creates
+    tasks with custom_task_constructor(coro, loop=loop, eager_start=True).
+    Their coroutine runs right away, until its first suspension, rather
+    than being scheduled for the next iteration of the event loop.  A
+    coroutine which returns without suspending gives a task which is
+    already done.  Eager tasks are started lazily if the event loop is not
+    running.
+    """
+
+    def factory(loop, coro):
+        return custom_task_constructor(coro, loop=loop, eager_start=True)
+
+    return factory
+
+
+eager_task_factory = create_eager_task_factory(Task)
@@ -0,0 +1,470 @@
+"""Proactor event loop for Linux, using io_uring."""
+
+import _uring
+import errno
+import io
+import os
+import select
+import socket
+import time
+import weakref
+
+from . import events
+from . import exceptions
+from . import futures
+from . import proactor_events
+from .log import logger
+
+
+__all__ = (
+    'UringProactor', 'UringEventLoop', 'UringEventLoopPolicy',
+)
+
+
+# Returned by the completion callbacks of operations which were submitted
+# again to complete: the future is not done yet.
+_PENDING = object()
+
+
+def _check_result(res):
+    # Turn the negated errno value of a failed operation into an exception.
+    if res < 0:
+        raise OSError(-res, os.strerror(-res))
+    return res
+
+
+def _finish_result(fut, res):
+    return _check_result(res)
+
+
+class _UringFuture(futures.Future):
+    """Subclass of Future which represents an io_uring operation.
+
+    Cancelling it requests the cancellation of the operation.
+    """
+
+    def __init__(self, ring, key, *, loop=None):
+        super().__init__(loop=loop)
+        if self._source_traceback:
+            del self._source_traceback[-1]
+        self._ring = ring
+        self._key = key
+
+    def _repr_info(self):
+        info = super()._repr_info()
+        if self._key is not None:
+            info.insert(1, 'key=%s' % self._key)
+        return info
+
+    def _cancel_operation(self):
+        if self._key is None:
+            return
+        try:
+            self._ring.cancel(self._key)
+        except (OSError, ValueError) as exc:
+            context = {
+                'message': 'Cancelling an io_uring operation failed',
+                'exception': exc,
+                'future': self,
+            }
+            if self._source_traceback:
+                context['source_traceback'] = self._source_traceback
+            self._loop.call_exception_handler(context)
+        self._key = None
+
+    def cancel(self, msg=None):
+        self._cancel_operation()
+        return super().cancel(msg=msg)
+
+    def set_exception(self, exception):
+        super().set_exception(exception)
+        self._cancel_operation()
+
+    def set_result(self, result):
+        super().set_result(result)
+        self._key = None
+
+
+class UringProactor:
+    """Proactor implementation using io_uring.
+
+    Operations are queued in the submission queue of the ring and all
+    submitted at once by the next call to select(), which also waits for
+    their completion.
+    """
+
+    def __init__(self, entries=256):
+        self._loop = None
+        self._results = []
+        self._ring = _uring.Ring(entries)
+        self._cache = {}
+        self._stopped_serving = weakref.WeakSet()
+
+    def _check_closed(self):
+        if self._ring is None:
+            raise RuntimeError('UringProactor is closed')
+
+    def __repr__(self):
+        info = ['operation#=%s' % len(self._cache),
+                'result#=%s' % len(self._results)]
+        if self._ring is None:
+            info.append('closed')
+        return '<%s %s>' % (self.__class__.__name__, " ".join(info))
+
+    def set_loop(self, loop):
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if not self._results:
+            self._poll(timeout)
+        tmp = self._results
+        self._results = []
+        return tmp
+
+    def _result(self, value):
+        fut = self._loop.create_future()
+        fut.set_result(value)
+        return fut
+
+    def recv(self, conn, nbytes, flags=0):
+        self._check_closed()
+        buf = bytearray(nbytes)
+
+        def finish_recv(fut, res):
+            del buf[_check_result(res):]
+            return bytes(buf)
+
+        if isinstance(conn, socket.socket):
+            key = self._ring.recv(conn, buf, flags)
+        else:
+            key = self._ring.read(conn, buf)
+        return self._register(key, conn, finish_recv)
+
+    def recv_into(self, conn, buf, flags=0):
+        self._check_closed()
+        if isinstance(conn, socket.socket):
+            key = self._ring.recv(conn, buf, flags)
+        else:
+            key = self._ring.read(conn, buf)
+        return self._register(key, conn, _finish_result)
+
+    def recvfrom(self, conn, nbytes, flags=0):
+        self._check_closed()
+        return self._register_poll(conn, select.POLLIN,
+                                   lambda: conn.recvfrom(nbytes, flags))
+
+    def sendto(self, conn, buf, flags=0, addr=None):
+        self._check_closed()
+        try:
+            return self._result(conn.sendto(buf, flags, addr))
+        except (BlockingIOError, InterruptedError):
+            pass
+        return self._register_poll(conn, select.POLLOUT,
+                                   lambda: conn.sendto(buf, flags, addr))
+
+    def send(self, conn, buf, flags=0):
+        self._check_closed()
+        if not isinstance(conn, socket.socket):
+            return self._write_all(
+                conn, buf, lambda view, done: self._ring.write(conn, view))
+        if conn.type != socket.SOCK_STREAM:
+            return self._register(self._ring.send(conn, buf, flags),
+                                  conn, _finish_result)
+        return self._write_all(
+            conn, buf, lambda view, done: self._ring.send(conn, view, flags))
+
+    def read(self, file, nbytes, offset=-1):
+        self._check_closed()
+        buf = bytearray(nbytes)
+
+        def finish_read(fut, res):
+            del buf[_check_result(res):]
+            return bytes(buf)
+
+        return self._register(self._ring.read(file, buf, offset),
+                              file, finish_read)
+
+    def read_into(self, file, buf, offset=-1):
+        self._check_closed()
+        return self._register(self._ring.read(file, buf, offset),
+                              file, _finish_result)
+
+    def write(self, file, buf, offset=-1):
+        self._check_closed()
+
+        def submit(view, done):
+            if offset < 0:
+                return self._ring.write(file, view)
+            return self._ring.write(file, view, offset + done)
+
+        return self._write_all(file, buf, submit)
+
+    def accept(self, listener):
+        self._check_closed()
+
+        def finish_accept(fut, res):
+            conn = socket.socket(listener.family, listener.type,
+                                 listener.proto, fileno=_check_result(res))
+            conn.settimeout(listener.gettimeout())
+            try:
+                return conn, conn.getpeername()
+            except OSError:
+                conn.close()
+                raise
+
+        key = self._ring.accept(listener, socket.SOCK_CLOEXEC)
+        # Close the accepted socket if the future was cancelled meanwhile.
+        return self._register(key, listener, finish_accept, discard=os.close)
+
+    def connect(self, conn, address):
+        self._check_closed()
+        if conn.type == socket.SOCK_DGRAM:
+            # connect() completes immediately for UDP sockets
+            conn.connect(address)
+            return self._result(None)
+
+        err = conn.connect_ex(address)
+        if err == 0:
+            return self._result(None)
+        if err not in (errno.EINPROGRESS, errno.EAGAIN, errno.EINTR):
+            raise OSError(err, f'Connect call failed {address}')
+
+        def finish_connect(fut, res):
+            _check_result(res)
+            err = conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err != 0:
+                raise OSError(err, f'Connect call failed {address}')
+
+        return self._register(self._ring.poll(conn, select.POLLOUT),
+                              conn, finish_connect)
+
+    def sendfile(self, sock, file, offset, count):
+        self._check_closed()
+        return self._register_poll(
+            sock, select.POLLOUT,
+            lambda: os.sendfile(sock.fileno(), file.fileno(), offset, count))
+
+    def timeout(self, delay):
+        """Return a future completed with None after *delay* seconds."""
+        self._check_closed()
+
+        def finish_timeout(fut, res):
+            if res != -errno.ETIME:
+                _check_result(res)
+
+        return self._register(self._ring.timeout(delay), None,
+                              finish_timeout)
+
+    def wait_closed(self, obj):
+        """Return a future completed with b'' once the other end of obj
+        is closed."""
+        self._check_closed()
+
+        def finish_wait_closed(fut, res):
+            _check_result(res)
+            return b''
+
+        # Only POLLHUP and POLLERR are reported for an empty event mask.
+        return self._register(self._ring.poll(obj, 0), obj,
+                              finish_wait_closed)
+
+    def _write_all(self, obj, buf, submit):
+        # Submit again the data left over by short writes, until the
+        # whole buffer has been written.
+        view = memoryview(buf).cast('B')
+        done = 0
+
+        def finish_write(fut, res):
+            nonlocal done
+            done += _check_result(res)
+            if res and done < len(view):
+                return self._resubmit(fut, submit(view[done:], done),
+                                      obj, finish_write)
+            return done
+
+        return self._register(submit(view, 0), obj, finish_write)
+
+    def _register_poll(self, obj, events, func):
+        # Wait for the poll events, then try func() which is expected to
+        # raise BlockingIOError if it has to wait for the events again.
+        def finish_poll(fut, res):
+            _check_result(res)
+            try:
+                return func()
+            except (BlockingIOError, InterruptedError):
+                return self._resubmit(fut, self._ring.poll(obj, events),
+                                      obj, finish_poll)
+
+        return self._register(self._ring.poll(obj, events), obj, finish_poll)
+
+    def _register(self, key, obj, callback, discard=None):
+        # Return a future which will be set with the result of the
+        # operation when it completes.  The future's value is actually
+        # the value returned by callback().  Note that we only store obj
+        # to prevent it from being garbage collected too early.
+        f = _UringFuture(self._ring, key, loop=self._loop)
+        if f._source_traceback:
+            del f._source_traceback[-1]
+        self._cache[key] = (f, obj, callback, discard)
+        return f
+
+    def _resubmit(self, f, key, obj, callback, discard=None):
+        f._key = key
+        self._cache[key] = (f, obj, callback, discard)
+        return _PENDING
+
+    def _poll(self, timeout=None):
+        if timeout is not None and timeout < 0:
+            raise ValueError("negative timeout")
+
+        for key, res, flags in self._ring.wait(timeout):
+            try:
+                f, obj, callback, discard = self._cache.pop(key)
+            except KeyError:
+                # Completion of a cancellation request
+                continue
+            f._key = None
+
+            if obj is not None and obj in self._stopped_serving:
+                f.cancel()
+            if f.done():
+                # The future was cancelled, but the operation may have
+                # completed nonetheless.
+                if res >= 0 and discard is not None:
+                    discard(res)
+                continue
+            try:
+                value = callback(f, res)
+            except OSError as e:
+                f.set_exception(e)
+                self._results.append(f)
+            else:
+                if value is not _PENDING:
+                    f.set_result(value)
+                    self._results.append(f)
+
+    def _stop_serving(self, obj):
+        # obj is a socket.  It will be closed in
+        # BaseProactorEventLoop._stop_serving(), after its pending accept
+        # operation has been cancelled.
+        self._stopped_serving.add(obj)
+
+    def close(self):
+        if self._ring is None:
+            # already closed
+            return
+
+        # Cancel remaining registered operations.
+        for fut, obj, callback, discard in list(self._cache.values()):
+            if not fut.cancelled():
+                fut.cancel()
+
+        # Wait until all cancelled operations complete: the kernel could
+        # still write to their buffers otherwise. Display progress every
+        # second if operations are still running.
+        msg_update = 1.0
+        start_time = time.monotonic()
+        next_msg = start_time + msg_update
+        while self._cache:
+            if next_msg <= time.monotonic():
+                logger.debug('%r is running after closing for %.1f seconds',
+                             self, time.monotonic() - start_time)
+                next_msg = time.monotonic() + msg_update
+
+            # handle a few events, or timeout
+            self._poll(msg_update)
+
+        self._results = []
+
+        self._ring.close()
+        self._ring = None
+
+    def __del__(self):
+        self.close()
+
+
+class _UringWritePipeTransport(proactor_events._ProactorWritePipeTransport):
+
+    def __init__(self, loop, sock, protocol, waiter=None, extra=None):
+        # The write end of a pipe can't be read from to detect that the
+        # read end was closed: wait for it to be reported by poll instead.
+        proactor_events._ProactorBaseWritePipeTransport.__init__(
+            self, loop, sock, protocol, waiter, extra)
+        self._read_fut = self._loop._proactor.wait_closed(self._sock)
+        self._read_fut.add_done_callback(self._pipe_closed)
+
+
+class UringEventLoop(proactor_events.BaseProactorEventLoop):
+    """Linux proactor event loop using io_uring."""
+
+    def __init__(self, proactor=None):
+        if proactor is None:
+            proactor = UringProactor()
+        super().__init__(proactor)
+
+    def _make_write_pipe_transport(self, sock, protocol, waiter=None,
+                                   extra=None):
+        return _UringWritePipeTransport(self, sock, protocol, waiter, extra)
+
+    async def _sock_sendfile_native(self, sock, file, offset, count):
+        try:
+            fileno = file.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            raise exceptions.SendfileNotAvailableError("not a regular file")
+        try:
+            fsize = os.fstat(fileno).st_size
+        except OSError:
+            raise exceptions.SendfileNotAvailableError("not a regular file")
+        end_pos = min(offset + count, fsize) if count else fsize
+        total_sent = 0
+        try:
+            # The proactor sends as much as the socket accepts at once:
+            # keep track of the progress, even if a later send fails.
+            while offset < end_pos:
+                sent = await self._proactor.sendfile(sock, file, offset,
+                                                     end_pos - offset)
+                if sent == 0:
+                    break
+                offset += sent
+                total_sent += sent
+            return total_sent
+        finally:
+            if total_sent > 0:
+                file.seek(offset)
+
+    def run_forever(self):
+        try:
+            assert self._self_reading_future is None
+            self.call_soon(self._loop_self_reading)
+            super().run_forever()
+        finally:
+            if self._self_reading_future is not None:
+                self._self_reading_future.cancel()
+                self._self_reading_future = None
+
+    async def file_read(self, file, n, offset=-1):
+        """Read up to n bytes from the file at the given offset.
+
+        The data is read at the current file position if offset is -1.
+        Return the data read as bytes; it is empty at the end of the file.
+        """
+        return await self._proactor.read(file, n, offset)
+
+    async def file_readinto(self, file, buf, offset=-1):
+        """Read from the file into the buffer buf at the given offset.
+
+        Return the number of bytes read.
+        """
+        return await self._proactor.read_into(file, buf, offset)
+
+    async def file_write(self, file, data, offset=-1):
+        """Write data to the file at the given offset.
+
+        The data is written at the current file position if offset is -1.
+        Return the number of bytes written.
+        """
+        return await self._proactor.write(file, data, offset)
+
+
+class UringEventLoopPolicy(events.BaseDefaultEventLoopPolicy):
+    _loop_factory = UringEventLoop
@@ -4,10 +4,12 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import collections
+import itertools
 import logging
 import threading
 import time
 import types
+import weakref
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
@@ -569,7 +571,8 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1,
+            buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -581,6 +584,10 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before being passed to a child process. This argument is only
                 used by ProcessPoolExecutor; it is ignored by
                 ThreadPoolExecutor.
+            buffersize: If None, all the input elements are collected and
+                submitted immediately. Otherwise, the iterables are read
+                lazily and at most buffersize calls are submitted ahead of
+                the result being retrieved.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -591,10 +598,24 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if buffersize is not None:
+            if not isinstance(buffersize, int):
+                raise TypeError("buffersize must be an integer or None")
+            if buffersize < 1:
+                raise ValueError("buffersize must be None or > 0")
+
         if timeout is not None:
             end_time = timeout + time.monotonic()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        zipped_iterables = zip(*iterables)
+        if buffersize is None:
+            fs = [self.submit(fn, *args) for args in zipped_iterables]
+        else:
+            fs = collections.deque(
+                self.submit(fn, *args)
+                for args in itertools.islice(zipped_iterables, buffersize))
+            # Do not keep the executor alive while the results are pending.
+            executor_weakref = weakref.ref(self)
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
@@ -603,6 +624,13 @@ def result_iterator():
                 # reverse to keep finishing order
                 fs.reverse()
                 while fs:
+                    if buffersize is not None:
+                        # Replace the future about to be popped
+                        executor = executor_weakref()
+                        if (executor is not None
+                                and (args := next(zipped_iterables, None))):
+                            fs.appendleft(executor.submit(fn, *args))
+                        del executor
                     # Careful not to keep a reference to the popped future
                     if timeout is None:
                         yield fs.pop().result()
@@ -45,17 +45,20 @@
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
+import collections
 import os
 from concurrent.futures import _base
 import queue
 import multiprocessing as mp
 import multiprocessing.connection
+from multiprocessing.pool import _ChunkSizer
 from multiprocessing.queues import Queue
 import threading
 import weakref
 from functools import partial
 import itertools
 import sys
+import time
 from traceback import format_exception
 
 
@@ -107,6 +110,13 @@ def _python_exit():
 EXTRA_QUEUED_CALLS = 1
 
 
+# In work stealing mode, the calls are sent to the workers in batches taking
+# about this many seconds to run, based on the mean duration of the previous
+# calls, and holding at most _MAX_BATCH_SIZE calls.
+_BATCH_DURATION = 0.01
+_MAX_BATCH_SIZE = 1000
+
+
 # On Windows, WaitForMultipleObjects is used to wait for processes to finish.
 # It can wait on, at most, 63 objects. There is an overhead of two objects:
 # - the result queue reader
@@ -153,6 +163,18 @@ def __init__(self, work_id, fn, args, kwargs):
         self.args = args
         self.kwargs = kwargs
 
+class _CallBatch(object):
+    def __init__(self, seq, call_items):
+        self.seq = seq
+        self.call_items = call_items
+
+class _ResultBatch(object):
+    def __init__(self, pid, seq, results, run_time):
+        self.pid = pid
+        self.seq = seq
+        self.results = results
+        self.run_time = run_time
+
 
 class _SafeQueue(Queue):
     """Safe Queue set exception to the future object linked to a job"""
@@ -175,6 +197,19 @@ def _on_queue_feeder_error(self, e, obj):
             # with BrokenProcessPool
             if work_item is not None:
                 work_item.future.set_exception(e)
+        elif isinstance(obj, _CallBatch):
+            # Fail the calls which cannot be pickled and send the others.
+            # Failed calls are replaced by None so that the other calls
+            # keep their index in the batch.
+            call_items = []
+            for call_item in obj.call_items:
+                try:
+                    mp.reduction.ForkingPickler.dumps(call_item)
+                except Exception as exc:
+                    self._on_queue_feeder_error(exc, call_item)
+                    call_item = None
+                call_items.append(call_item)
+            self.put(_CallBatch(obj.seq, call_items))
         else:
             super()._on_queue_feeder_error(e, obj)
 
@@ -201,6 +236,20 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map with chunksize='auto'.
+
+    Returns how long it took to run the function passed to map() on the
+    chunk, and the results.
+
+    This function is run in a separate process.
+
+    """
+    start = time.monotonic()
+    results = [fn(*args) for args in chunk]
+    return time.monotonic() - start, results
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None):
     """Safely send back the given result or exception"""
     try:
@@ -252,6 +301,82 @@ def _process_worker(call_queue, result_queue, initializer, initargs):
         del call_item
 
 
+def _process_batch_worker(call_queue, result_queue, initializer, initargs,
+                          claims, claim_lock, slot):
+    """Evaluates batches of calls from call_queue and places the results in
+    result_queue.
+
+    This worker is run in a separate process, in work stealing mode.
+
+    Args:
+        call_queue: A ctx.Queue of _CallBatches that will be read and
+            evaluated by this worker only.
+        result_queue: A ctx.Queue of _ResultBatches that will written
+            to by the worker.
+        initializer: A callable initializer, or None
+        initargs: A tuple of args for the initializer
+        claims: A shared array holding, for each worker, the sequence number
+            of its current batch, the index of the next call to run and the
+            index after the last call to run.  The executor steals the calls
+            at the end of the batch by lowering the latter.
+        claim_lock: A ctx.Lock protecting the entries of claims of this
+            worker.
+        slot: The index of the entries of this worker in claims.
+    """
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            # The parent will notice that the process stopped and
+            # mark the pool broken
+            return
+    pid = os.getpid()
+    base = 3 * slot
+    while True:
+        batch = call_queue.get(block=True)
+        if batch is None:
+            # Wake up queue management thread
+            result_queue.put(pid)
+            return
+        call_items = batch.call_items
+        with claim_lock:
+            claims[base:base + 3] = [batch.seq, 0, len(call_items)]
+        results = []
+        start_time = time.perf_counter()
+        while True:
+            with claim_lock:
+                index = claims[base + 1]
+                if index >= claims[base + 2]:
+                    break
+                claims[base + 1] = index + 1
+            call_item = call_items[index]
+            if call_item is None:
+                continue
+            # Liberate the resource as soon as possible
+            call_items[index] = None
+            try:
+                r = call_item.fn(*call_item.args, **call_item.kwargs)
+            except BaseException as e:
+                exc = _ExceptionWithTraceback(e, e.__traceback__)
+                results.append(_ResultItem(call_item.work_id, exception=exc))
+            else:
+                results.append(_ResultItem(call_item.work_id, result=r))
+                del r
+            del call_item
+        run_time = time.perf_counter() - start_time
+        try:
+            result_queue.put(_ResultBatch(pid, batch.seq, results, run_time))
+        except BaseException:
+            # Send the results one by one to isolate the failing ones
+            for result in results:
+                _sendback_result(result_queue, result.work_id,
+                                 result=result.result,
+                                 exception=result.exception)
+            result_queue.put(_ResultBatch(pid, batch.seq, [], run_time))
+        del batch, call_items, results
+
+
 class _ExecutorManagerThread(threading.Thread):
     """Manages the communication between this process and the worker processes.
 
@@ -333,6 +458,12 @@ def run(self):
             if self.is_shutting_down():
                 self.flag_executor_shutting_down()
 
+                # When only cancelled futures remain in pending_work_items, the
+                # next call to wait_result_broken_or_wakeup() would hang
+                # forever. This drops them, so that the remaining work items
+                # are running or about to be.
+                self.add_call_item_to_queue()
+
                 # Since no new work items can be added, it is safe to shutdown
                 # this thread if there are no pending work items.
                 if not self.pending_work_items:
@@ -521,6 +652,161 @@ def get_n_children_alive(self):
         return sum(p.is_alive() for p in self.processes.values())
 
 
+class _BatchWorker(object):
+    """State of a worker process in work stealing mode"""
+    def __init__(self, slot, call_queue, claim_lock):
+        self.slot = slot
+        self.call_queue = call_queue
+        self.claim_lock = claim_lock
+        # Sequence number and work ids of the batch sent to the worker, if any
+        self.seq = None
+        self.work_ids = None
+
+
+class _WorkStealingManagerThread(_ExecutorManagerThread):
+    """Manages the worker processes in work stealing mode.
+
+    Instead of sharing a call queue, every worker has its own queue, through
+    which it is sent one batch of calls at a time.  The size of the batches
+    adapts to the duration of the calls, so that the manager and the queues
+    handle few messages when the calls are short.  Once there are no more
+    calls to send, the manager steals the second half of the calls not
+    started yet in the batch of the busiest worker for each idle worker.
+    """
+
+    def __init__(self, executor):
+        # A dict mapping the pids of the workers to _BatchWorkers.
+        self.workers = executor._batch_workers
+        self.claims = executor._claims
+        self.batch_seqs = itertools.count(1)
+        # Estimated run time of a call, or None before any batch was run.
+        self.call_time = None
+        super().__init__(executor)
+
+    def add_call_item_to_queue(self):
+        # Sends a batch of calls to every idle worker.  This function never
+        # blocks.
+        workers = list(self.workers.values())
+        for worker in workers:
+            if worker.seq is not None:
+                continue
+            work_ids = self.get_work_ids(len(workers))
+            if not work_ids:
+                work_ids = self.steal_work_ids()
+                if not work_ids:
+                    return
+            self.send_batch(worker, work_ids)
+
+    def batch_size(self, n_workers):
+        if self.call_time is None:
+            # The duration of the calls is not known yet
+            return 1
+        size = int(_BATCH_DURATION / max(self.call_time, 1e-6))
+        # Share the pending calls between the workers
+        size = min(size, self.work_ids_queue.qsize() // n_workers)
+        return max(1, min(size, _MAX_BATCH_SIZE))
+
+    def get_work_ids(self, n_workers):
+        work_ids = []
+        size = self.batch_size(n_workers)
+        while len(work_ids) < size:
+            try:
+                work_id = self.work_ids_queue.get(block=False)
+            except queue.Empty:
+                break
+            work_item = self.pending_work_items[work_id]
+            if work_item.future.set_running_or_notify_cancel():
+                work_ids.append(work_id)
+            else:
+                del self.pending_work_items[work_id]
+        return work_ids
+
+    def steal_work_ids(self):
+        # Takes the second half of the calls which are not running yet from
+        # the batch of the busiest worker.
+        victim = None
+        most_left = 0
+        for worker in list(self.workers.values()):
+            if worker.seq is None:
+                continue
+            base = 3 * worker.slot
+            seq, start, stop = self.claims[base:base + 3]
+            if seq == worker.seq and stop - start > most_left:
+                victim = worker
+                most_left = stop - start
+        if victim is None:
+            return None
+        base = 3 * victim.slot
+        with victim.claim_lock:
+            seq, start, stop = self.claims[base:base + 3]
+            if seq != victim.seq or start >= stop:
+                return None
+            new_stop = stop - (stop - start + 1) // 2
+            self.claims[base + 2] = new_stop
+        return [work_id for work_id in victim.work_ids[new_stop:stop]
+                if work_id in self.pending_work_items]
+
+    def send_batch(self, worker, work_ids):
+        call_items = []
+        for work_id in work_ids:
+            work_item = self.pending_work_items[work_id]
+            call_items.append(_CallItem(work_id, work_item.fn, work_item.args,
+                                        work_item.kwargs))
+        worker.seq = next(self.batch_seqs)
+        worker.work_ids = work_ids
+        worker.call_queue.put(_CallBatch(worker.seq, call_items))
+
+    def process_result_item(self, result_item):
+        if isinstance(result_item, _ResultBatch):
+            worker = self.workers.get(result_item.pid)
+            if worker is not None and worker.seq == result_item.seq:
+                worker.seq = worker.work_ids = None
+            if result_item.results:
+                call_time = result_item.run_time / len(result_item.results)
+                if self.call_time is None:
+                    self.call_time = call_time
+                else:
+                    self.call_time = 0.75 * self.call_time + 0.25 * call_time
+            for item in result_item.results:
+                super().process_result_item(item)
+        else:
+            if isinstance(result_item, int):
+                # The worker exited after reading None from its queue
+                worker = self.workers.pop(result_item, None)
+                if worker is not None:
+                    worker.call_queue.close()
+                    worker.call_queue.join_thread()
+            super().process_result_item(result_item)
+
+    def terminate_broken(self, cause):
+        # The workers are terminated and may leave batches unread in their
+        # queues: do not wait for the queues to be flushed.
+        for worker in list(self.workers.values()):
+            worker.call_queue.cancel_join_thread()
+        super().terminate_broken(cause)
+
+    def shutdown_workers(self):
+        for pid, worker in list(self.workers.items()):
+            p = self.processes.get(pid)
+            if p is not None and p.is_alive():
+                worker.call_queue.put(None)
+            else:
+                # Nobody reads the queue anymore, do not wait for its
+                # feeder thread to flush it.
+                worker.call_queue.cancel_join_thread()
+
+    def join_executor_internals(self):
+        self.shutdown_workers()
+        # Release the queues' resources as soon as possible.
+        for worker in list(self.workers.values()):
+            worker.call_queue.close()
+            worker.call_queue.join_thread()
+        with self.shutdown_lock:
+            self.thread_wakeup.close()
+        for p in self.processes.values():
+            p.join()
+
+
 _system_limits_checked = False
 _system_limited = None
 
@@ -578,7 +864,7 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *, work_stealing=False):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -589,6 +875,10 @@ def __init__(self, max_workers=None, mp_context=None,
                 object should provide SimpleQueue, Queue and Process.
             initializer: A callable used to initialize worker processes.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, every worker process gets its own queue
+                and is sent batches of calls whose size adapts to the
+                duration of the calls. The calls which have not started yet
+                are moved from busy workers to idle ones.
         """
         _check_system_limits()
 
@@ -641,6 +931,20 @@ def __init__(self, max_workers=None, mp_context=None,
         # _shutdown_lock must be locked to access _ThreadWakeup.
         self._executor_manager_thread_wakeup = _ThreadWakeup()
 
+        self._work_stealing = work_stealing
+        self._result_queue = mp_context.SimpleQueue()
+        self._work_ids = queue.Queue()
+        if work_stealing:
+            # The workers have their own call queue, created with them. They
+            # are mapped by pid to _BatchWorkers.
+            self._call_queue = None
+            self._batch_workers = {}
+            # For every worker: the sequence number of the batch it runs, the
+            # index of the next call to run and the index after the last
+            # call to run in the batch.
+            self._claims = mp_context.RawArray('q', 3 * self._max_workers)
+            return
+
         # Create communication channels for the executor
         # Make the call queue slightly larger than the number of processes to
         # prevent the worker processes from idling. But don't make it too big
@@ -655,18 +959,24 @@ def __init__(self, max_workers=None, mp_context=None,
         # tracebacks in the queue's own worker thread. But we detect killed
         # processes anyway, so silence the tracebacks.
         self._call_queue._ignore_epipe = True
-        self._result_queue = mp_context.SimpleQueue()
-        self._work_ids = queue.Queue()
 
     def _start_executor_manager_thread(self):
         if self._executor_manager_thread is None:
             # Start the processes so that their sentinels are known.
-            self._executor_manager_thread = _ExecutorManagerThread(self)
+            if self._work_stealing:
+                manager_class = _WorkStealingManagerThread
+            else:
+                manager_class = _ExecutorManagerThread
+            self._executor_manager_thread = manager_class(self)
             self._executor_manager_thread.start()
             _threads_wakeups[self._executor_manager_thread] = \
                 self._executor_manager_thread_wakeup
 
     def _adjust_process_count(self):
+        if self._work_stealing:
+            self._adjust_batch_worker_count()
+            return
+
         # if there's an idle process, we don't need to spawn a new one.
         if self._idle_worker_semaphore.acquire(blocking=False):
             return
@@ -682,6 +992,34 @@ def _adjust_process_count(self):
             p.start()
             self._processes[p.pid] = p
 
+    def _adjust_batch_worker_count(self):
+        # Idle workers are given work by the manager, so only spawn a new
+        # worker if there are more pending calls than workers.
+        process_count = len(self._processes)
+        if (process_count < self._max_workers
+                and process_count < len(self._pending_work_items)):
+            call_queue = _SafeQueue(
+                max_size=0, ctx=self._mp_context,
+                pending_work_items=self._pending_work_items,
+                shutdown_lock=self._shutdown_lock,
+                thread_wakeup=self._executor_manager_thread_wakeup)
+            call_queue._ignore_epipe = True
+            claim_lock = self._mp_context.Lock()
+            slot = process_count
+            p = self._mp_context.Process(
+                target=_process_batch_worker,
+                args=(call_queue,
+                      self._result_queue,
+                      self._initializer,
+                      self._initargs,
+                      self._claims,
+                      claim_lock,
+                      slot))
+            p.start()
+            self._processes[p.pid] = p
+            self._batch_workers[p.pid] = _BatchWorker(slot, call_queue,
+                                                      claim_lock)
+
     def submit(self, fn, /, *args, **kwargs):
         with self._shutdown_lock:
             if self._broken:
@@ -706,7 +1044,8 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1,
+            buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -717,6 +1056,13 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If set to 'auto', the size of the chunks adapts to the
+                measured duration of the calls, and the iterables are only
+                read ahead of the consumed results by a few chunks.
+            buffersize: If None, all the chunks are submitted immediately,
+                unless chunksize is 'auto'. Otherwise, the iterables are read
+                lazily and at most buffersize chunks are submitted ahead of
+                the results being retrieved.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -727,14 +1073,75 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize == 'auto':
+            if buffersize is not None:
+                if not isinstance(buffersize, int):
+                    raise TypeError("buffersize must be an integer or None")
+                if buffersize < 1:
+                    raise ValueError("buffersize must be None or > 0")
+            return self._map_auto_chunks(fn, iterables, timeout, buffersize)
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               _get_chunks(*iterables, chunksize=chunksize),
-                              timeout=timeout)
+                              timeout=timeout, buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
+    def _map_auto_chunks(self, fn, iterables, timeout, buffersize):
+        # Implements map() with chunksize='auto'.
+        if timeout is not None:
+            end_time = timeout + time.monotonic()
+
+        it = zip(*iterables)
+        sizer = _ChunkSizer()
+        # Number of chunks submitted ahead of the results consumed.
+        if buffersize is None:
+            max_pending = 2 * self._max_workers
+        else:
+            max_pending = buffersize
+        fs = collections.deque()
+
+        def submit_chunk():
+            chunk = tuple(itertools.islice(it, sizer.size))
+            if not chunk:
+                return False
+            count = len(chunk)
+            sent = time.monotonic()
+
+            def measure(future):
+                if not future.cancelled() and future.exception() is None:
+                    run_time = future.result()[0]
+                    sizer.update(count, run_time, time.monotonic() - sent)
+
+            future = self.submit(_process_timed_chunk, fn, chunk)
+            future.add_done_callback(measure)
+            fs.append(future)
+            return True
+
+        while len(fs) < max_pending and submit_chunk():
+            pass
+
+        # Yield must be hidden in closure so that the first chunks are
+        # submitted before the first iterator value is required.
+        def result_iterator():
+            try:
+                while fs:
+                    # Careful not to keep a reference to the popped future
+                    if timeout is None:
+                        results = fs.popleft().result()[1]
+                    else:
+                        results = fs.popleft().result(
+                            end_time - time.monotonic())[1]
+                    submit_chunk()
+                    results.reverse()
+                    while results:
+                        yield results.pop()
+            finally:
+                for future in fs:
+                    future.cancel()
+        return result_iterator()
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
             self._cancel_pending_futures = cancel_futures
@@ -7,6 +7,7 @@
 
 from opcode import *
 from opcode import __all__ as _opcodes_all
+from opcode import _specialized_instructions
 
 __all__ = ["code_info", "dis", "disassemble", "distb", "disco",
            "findlinestarts", "findlabels", "show_code",
@@ -26,6 +27,18 @@
 MAKE_FUNCTION = opmap['MAKE_FUNCTION']
 MAKE_FUNCTION_FLAGS = ('defaults', 'kwdefaults', 'annotations', 'closure')
 
+# Specialized instructions only exist in quickened code, so they are not
+# part of opname and opmap.  They are numbered the same way as in
+# Tools/scripts/generate_opcode_h.py: in order, using the unused opcodes.
+_all_opname = list(opname)
+_all_opmap = dict(opmap)
+_empty_slots = [op for op, name in enumerate(opname)
+                if op and name.startswith('<')]
+for _op, _name in zip(_empty_slots, _specialized_instructions):
+    _all_opname[_op] = _name
+    _all_opmap[_name] = _op
+del _empty_slots, _op, _name
+
 
 def _try_compile(source, name):
     """Attempts to compile the given source, first as an expression and
@@ -40,7 +53,7 @@ def _try_compile(source, name):
         c = compile(source, name, 'exec')
     return c
 
-def dis(x=None, *, file=None, depth=None):
+def dis(x=None, *, file=None, depth=None, adaptive=False):
     """Disassemble classes, methods, functions, and other compiled objects.
 
     With no argument, disassemble the last traceback.
@@ -48,9 +61,13 @@ def dis(x=None, *, file=None, depth=None):
     Compiled objects currently include generator objects, async generator
     objects, and coroutine objects, all of which store their code object
     in a special attribute.
+
+    If *adaptive* is true, show the instructions currently executed by the
+    specializing adaptive interpreter, their adaptive counters and their
+    inline cache entries.
     """
     if x is None:
-        distb(file=file)
+        distb(file=file, adaptive=adaptive)
         return
     # Extract functions from methods.
     if hasattr(x, '__func__'):
@@ -71,21 +88,21 @@ def dis(x=None, *, file=None, depth=None):
             if isinstance(x1, _have_code):
                 print("Disassembly of %s:" % name, file=file)
                 try:
-                    dis(x1, file=file, depth=depth)
+                    dis(x1, file=file, depth=depth, adaptive=adaptive)
                 except TypeError as msg:
                     print("Sorry:", msg, file=file)
                 print(file=file)
     elif hasattr(x, 'co_code'): # Code object
-        _disassemble_recursive(x, file=file, depth=depth)
+        _disassemble_recursive(x, file=file, depth=depth, adaptive=adaptive)
     elif isinstance(x, (bytes, bytearray)): # Raw bytecode
         _disassemble_bytes(x, file=file)
     elif isinstance(x, str):    # Source code
-        _disassemble_str(x, file=file, depth=depth)
+        _disassemble_str(x, file=file, depth=depth, adaptive=adaptive)
     else:
         raise TypeError("don't know how to disassemble %s objects" %
                         type(x).__name__)
 
-def distb(tb=None, *, file=None):
+def distb(tb=None, *, file=None, adaptive=False):
     """Disassemble a traceback (default: last traceback)."""
     if tb is None:
         try:
@@ -93,7 +110,7 @@ def distb(tb=None, *, file=None):
         except AttributeError:
             raise RuntimeError("no last traceback to disassemble") from None
         while tb.tb_next: tb = tb.tb_next
-    disassemble(tb.tb_frame.f_code, tb.tb_lasti, file=file)
+    disassemble(tb.tb_frame.f_code, tb.tb_lasti, file=file, adaptive=adaptive)
 
 # The inspect module interrogates this dictionary to build its
 # list of CO_* constants. It is also used by pretty_flags to
@@ -213,9 +230,11 @@ def show_code(co, *, file=None):
         'offset',
         'starts_line',
         'is_jump_target',
-        'positions'
+        'positions',
+        'counter',
+        'cache'
     ],
-    defaults=[None]
+    defaults=[None, None, None]
 )
 
 _Instruction.opname.__doc__ = "Human readable name for operation"
@@ -227,6 +246,8 @@ def show_code(co, *, file=None):
 _Instruction.starts_line.__doc__ = "Line started by this opcode (if any), otherwise None"
 _Instruction.is_jump_target.__doc__ = "True if other code jumps to here, otherwise False"
 _Instruction.positions.__doc__ = "dis.Positions object holding the span of source code covered by this instruction"
+_Instruction.counter.__doc__ = "Adaptive counter of a quickened instruction (if any), otherwise None"
+_Instruction.cache.__doc__ = "Dict of the inline cache entries of a specialized instruction (if any), otherwise None"
 
 _ExceptionTableEntry = collections.namedtuple("_ExceptionTableEntry",
     "start end target depth lasti")
@@ -248,6 +269,10 @@ class Instruction(_Instruction):
          is_jump_target - True if other code jumps to here, otherwise False
          positions - Optional dis.Positions object holding the span of source code
                      covered by this instruction
+         counter - adaptive counter of a quickened instruction (if any),
+                   otherwise None
+         cache - dict of the inline cache entries of a specialized
+                 instruction (if any), otherwise None
     """
 
     def _disassemble(self, lineno_width=3, mark_as_current=False, offset_width=4):
@@ -285,10 +310,19 @@ def _disassemble(self, lineno_width=3, mark_as_current=False, offset_width=4):
             # Column: Opcode argument details
             if self.argrepr:
                 fields.append('(' + self.argrepr + ')')
+        # Column: Adaptive counter
+        if self.counter is not None:
+            fields.append('[counter: %d]' % self.counter)
+        # Column: Inline cache entries
+        if self.cache is not None:
+            fields.append('[cache: %s]' % ', '.join(
+                # obj is the address of a cached object
+                ('%s=%#x' if name == 'obj' else '%s=%d') % (name, value)
+                for name, value in self.cache.items()))
         return ' '.join(fields).rstrip()
 
 
-def get_instructions(x, *, first_line=None):
+def get_instructions(x, *, first_line=None, adaptive=False):
     """Iterator for the opcodes in methods, functions or code
 
     Generates a series of Instruction named tuples giving the details of
@@ -298,6 +332,10 @@ def get_instructions(x, *, first_line=None):
     be reported for the first source line in the disassembled code.
     Otherwise, the source line information (if any) is taken directly from
     the disassembled code object.
+
+    If *adaptive* is true, the opcodes currently executed by the
+    specializing adaptive interpreter are reported instead of the original
+    ones, together with their adaptive counters and inline cache entries.
     """
     co = _get_code_object(x)
     linestarts = dict(findlinestarts(co))
@@ -308,7 +346,23 @@ def get_instructions(x, *, first_line=None):
     return _get_instructions_bytes(co.co_code,
                                    co._varname_from_oparg,
                                    co.co_names, co.co_consts,
-                                   linestarts, line_offset, co_positions=co.co_positions())
+                                   linestarts, line_offset, co_positions=co.co_positions(),
+                                   specialization_state=_get_specialization_state(co, adaptive))
+
+def _get_specialization_state(co, adaptive):
+    """Helper to get the current state of the quickened instructions
+
+       Returns a dict mapping the offset of each quickened instruction to its
+       current opcode, adaptive counter and inline cache entries, or None if
+       *adaptive* is false or the code has not been quickened.
+    """
+    if not adaptive:
+        return None
+    state = sys._getspecializationstate(co)
+    if state is None:
+        return None
+    return {offset: (op, counter, cache)
+            for offset, op, counter, cache in state}
 
 def _get_const_info(const_index, const_list):
     """Helper to get optional details about const references
@@ -366,7 +420,8 @@ def parse_exception_table(code):
 def _get_instructions_bytes(code, varname_from_oparg=None,
                             names=None, constants=None,
                             linestarts=None, line_offset=0,
-                            exception_entries=(), co_positions=None):
+                            exception_entries=(), co_positions=None,
+                            specialization_state=None):
     """Iterate over the instructions in a bytecode string.
 
     Generates a sequence of Instruction namedtuples giving the details of each
@@ -375,6 +430,7 @@ def _get_instructions_bytes(code, varname_from_oparg=None,
     arguments.
 
     """
+    specialization_state = specialization_state or {}
     co_positions = co_positions or iter(())
     get_name = None if names is None else names.__getitem__
     labels = set(findlabels(code))
@@ -425,21 +481,28 @@ def _get_instructions_bytes(code, varname_from_oparg=None,
             elif op == MAKE_FUNCTION:
                 argrepr = ', '.join(s for i, s in enumerate(MAKE_FUNCTION_FLAGS)
                                     if arg & (1<<i))
-        yield Instruction(opname[op], op,
+        name = opname[op]
+        counter = cache = None
+        if offset in specialization_state:
+            op, counter, cache = specialization_state[offset]
+            name = _all_opname[op]
+        yield Instruction(name, op,
                           arg, argval, argrepr,
-                          offset, starts_line, is_jump_target, positions)
+                          offset, starts_line, is_jump_target, positions,
+                          counter, cache)
 
-def disassemble(co, lasti=-1, *, file=None):
+def disassemble(co, lasti=-1, *, file=None, adaptive=False):
     """Disassemble a code object."""
     linestarts = dict(findlinestarts(co))
     exception_entries = parse_exception_table(co)
     _disassemble_bytes(co.co_code, lasti,
                        co._varname_from_oparg,
                        co.co_names, co.co_consts, linestarts, file=file,
-                       exception_entries=exception_entries, co_positions=co.co_positions())
+                       exception_entries=exception_entries, co_positions=co.co_positions(),
+                       specialization_state=_get_specialization_state(co, adaptive))
 
-def _disassemble_recursive(co, *, file=None, depth=None):
-    disassemble(co, file=file)
+def _disassemble_recursive(co, *, file=None, depth=None, adaptive=False):
+    disassemble(co, file=file, adaptive=adaptive)
     if depth is None or depth > 0:
         if depth is not None:
             depth = depth - 1
@@ -447,12 +510,13 @@ def _disassemble_recursive(co, *, file=None, depth=None):
             if hasattr(x, 'co_code'):
                 print(file=file)
                 print("Disassembly of %r:" % (x,), file=file)
-                _disassemble_recursive(x, file=file, depth=depth)
+                _disassemble_recursive(x, file=file, depth=depth,
+                                       adaptive=adaptive)
 
 def _disassemble_bytes(code, lasti=-1, varname_from_oparg=None,
                        names=None, constants=None, linestarts=None,
                        *, file=None, line_offset=0, exception_entries=(),
-                       co_positions=None):
+                       co_positions=None, specialization_state=None):
     # Omit the line number column entirely if we have no line number info
     show_lineno = bool(linestarts)
     if show_lineno:
@@ -471,7 +535,8 @@ def _disassemble_bytes(code, lasti=-1, varname_from_oparg=None,
     for instr in _get_instructions_bytes(code, varname_from_oparg, names,
                                          constants, linestarts,
                                          line_offset=line_offset, exception_entries=exception_entries,
-                                         co_positions=co_positions):
+                                         co_positions=co_positions,
+                                         specialization_state=specialization_state):
         new_source_line = (show_lineno and
                            instr.starts_line is not None and
                            instr.offset > 0)
@@ -543,8 +608,12 @@ class Bytecode:
     code, or a code object (as returned by compile()).
 
     Iterating over this yields the bytecode operations as Instruction instances.
+
+    If *adaptive* is true, the opcodes currently executed by the specializing
+    adaptive interpreter are reported instead of the original ones.
     """
-    def __init__(self, x, *, first_line=None, current_offset=None):
+    def __init__(self, x, *, first_line=None, current_offset=None,
+                 adaptive=False):
         self.codeobj = co = _get_code_object(x)
         if first_line is None:
             self.first_line = co.co_firstlineno
@@ -556,6 +625,7 @@ def __init__(self, x, *, first_line=None, current_offset=None):
         self._original_object = x
         self.current_offset = current_offset
         self.exception_entries = parse_exception_table(co)
+        self.adaptive = adaptive
 
     def __iter__(self):
         co = self.codeobj
@@ -564,7 +634,9 @@ def __iter__(self):
                                        co.co_names, co.co_consts,
                                        self._linestarts,
                                        line_offset=self._line_offset,
-                                       exception_entries=self.exception_entries)
+                                       exception_entries=self.exception_entries,
+                                       specialization_state=_get_specialization_state(
+                                           co, self.adaptive))
 
     def __repr__(self):
         return "{}({!r})".format(self.__class__.__name__,
@@ -597,7 +669,9 @@ def dis(self):
                                file=output,
                                lasti=offset,
                                exception_entries=self.exception_entries,
-                               co_positions=co.co_positions())
+                               co_positions=co.co_positions(),
+                               specialization_state=_get_specialization_state(
+                                   co, self.adaptive))
             return output.getvalue()
 
 
@@ -1490,9 +1490,14 @@ class FileFinder:
 
     Interactions with the file system are cached for performance, being
     refreshed when the directory the finder is handling has been modified.
+    If the revalidate attribute is false, the modification time of the
+    directory is not checked and the cache is only refreshed after
+    invalidate_caches() has been called.
 
     """
 
+    revalidate = True
+
     def __init__(self, path, *loader_details):
         """Initialize with the path to search on and a variable number of
         2-tuples containing the loader and the file suffixes the loader
@@ -1542,13 +1547,14 @@ def find_spec(self, fullname, target=None):
         """
         is_namespace = False
         tail_module = fullname.rpartition('.')[2]
-        try:
-            mtime = _path_stat(self.path or _os.getcwd()).st_mtime
-        except OSError:
-            mtime = -1
-        if mtime != self._path_mtime:
-            self._fill_cache()
-            self._path_mtime = mtime
+        if self.revalidate or self._path_mtime == -1:
+            try:
+                mtime = _path_stat(self.path or _os.getcwd()).st_mtime
+            except OSError:
+                mtime = -1
+            if mtime != self._path_mtime:
+                self._fill_cache()
+                self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
             cache = self._relaxed_path_cache
@@ -0,0 +1,383 @@
+"""Index files of the top-level modules found in directories of sys.path.
+
+An index file records, for each top-level module and package of a
+directory, the file it is loaded from and the kind of loader it needs.
+Once installed on sys.meta_path, IndexFinder resolves top-level imports
+from the merged index files of sys.path with a single dictionary lookup,
+instead of searching each entry of sys.path in turn.
+
+An index file can also hold the compiled code of the modules of the
+directory, including the submodules of its packages.  IndexFinder then
+loads these modules from the memory-mapped index file, without reading or
+validating their bytecode files, as long as their files have kept the
+modification time and size they had when the index was written.  The code
+objects are still unmarshalled each time a module is imported.
+
+Index files are built with ``python -m importlib.index``.
+"""
+from ._bootstrap_external import ExtensionFileLoader
+from ._bootstrap_external import FileFinder
+from ._bootstrap_external import PathFinder
+from ._bootstrap_external import SourceFileLoader
+from ._bootstrap_external import SourcelessFileLoader
+from ._bootstrap_external import _get_supported_file_loaders
+from ._bootstrap_external import _relax_case
+from ._bootstrap_external import spec_from_file_location
+
+import _imp
+import marshal
+import mmap
+import os
+import sys
+
+__all__ = ['INDEX_FILENAME', 'IndexFinder', 'install', 'read_index',
+           'uninstall', 'write_index']
+
+
+INDEX_FILENAME = '__importindex__'
+
+# Increment when the layout of index files changes.
+_INDEX_VERSION = 2
+
+_LOADER_KINDS = {
+    ExtensionFileLoader: 'extension',
+    SourceFileLoader: 'source',
+    SourcelessFileLoader: 'bytecode',
+}
+_KIND_LOADERS = {kind: loader for loader, kind in _LOADER_KINDS.items()}
+
+
+def _iter_specs(directory, submodules, prefix=''):
+    # Yield the specs of the modules of directory, and of the submodules of
+    # its packages if submodules is true, the same way as the default path
+    # entry finder finds them.
+    finder = FileFinder(directory, *_get_supported_file_loaders())
+    names = {entry.partition('.')[0] for entry in os.listdir(directory)}
+    names.discard('__init__')
+    for name in sorted(names):
+        if not name.isidentifier():
+            continue
+        spec = finder.find_spec(prefix + name)
+        if spec is None or spec.loader is None:
+            continue
+        if type(spec.loader) not in _LOADER_KINDS:
+            continue
+        yield spec
+        if submodules and spec.submodule_search_locations:
+            yield from _iter_specs(spec.submodule_search_locations[0],
+                                   submodules, f'{spec.name}.')
+
+
+def write_index(directory, code=False):
+    """Write the index file of the top-level modules found in *directory*.
+
+    The modules are looked up the same way as by the default path entry
+    finder, so the index gives the same results as a search of *directory*.
+    Namespace packages are not indexed.  If *code* is true, the submodules of
+    the packages are indexed too, and the code of the modules loaded from
+    source or bytecode files is stored in the index file.  Return the path
+    of the index file.
+    """
+    modules = {}
+    codes = {}
+    blobs = []
+    offset = 0
+    for spec in _iter_specs(directory, code):
+        kind = _LOADER_KINDS[type(spec.loader)]
+        filename = os.path.relpath(spec.origin, directory)
+        is_package = spec.submodule_search_locations is not None
+        modules[spec.name] = (filename, kind, is_package)
+        if code and kind != 'extension':
+            # The code is only used as long as the file keeps the same
+            # modification time and size.
+            st = os.stat(spec.origin)
+            data = marshal.dumps(spec.loader.get_code(spec.name))
+            codes[spec.name] = (offset, len(data), st.st_mtime_ns, st.st_size)
+            blobs.append(data)
+            offset += len(data)
+    index = {
+        'version': _INDEX_VERSION,
+        'cache_tag': sys.implementation.cache_tag,
+        'modules': modules,
+        'code': codes,
+    }
+    # The code follows the index.  The index file is renamed over the old
+    # one, which may still be memory-mapped, and touched afterwards so that
+    # its modification time ends up later than the one of the directory.
+    index_path = os.path.join(directory, INDEX_FILENAME)
+    tmp_path = f'{index_path}.{os.getpid()}'
+    try:
+        with open(tmp_path, 'wb') as file:
+            marshal.dump(index, file)
+            for data in blobs:
+                file.write(data)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    os.utime(index_path)
+    return index_path
+
+
+def _read_index(directory):
+    # Return the index of directory, the modification time of its index
+    # file and the memory-mapped index file if it holds code, or None.
+    index_path = os.path.join(directory, INDEX_FILENAME)
+    try:
+        with open(index_path, 'rb') as file:
+            index_mtime = os.fstat(file.fileno()).st_mtime_ns
+            directory_mtime = os.stat(directory).st_mtime_ns
+            if directory_mtime > index_mtime:
+                return None
+            index = marshal.load(file)
+            if (not isinstance(index, dict)
+                    or index.get('version') != _INDEX_VERSION
+                    or index.get('cache_tag') != sys.implementation.cache_tag):
+                return None
+            code_map = None
+            if index['code']:
+                # The offsets of the code are relative to the end of the
+                # index.
+                data_start = file.tell()
+                code_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                index['code'] = {
+                    name: (data_start + offset, size, mtime, file_size)
+                    for name, (offset, size, mtime, file_size)
+                    in index['code'].items()}
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return index, index_mtime, code_map
+
+
+def read_index(directory):
+    """Return the modules recorded in the index file of *directory*.
+
+    The result maps module names to ``(filename, kind, is_package)``
+    tuples, where *filename* is relative to *directory* and *kind* is one
+    of ``'extension'``, ``'source'`` and ``'bytecode'``.  Return None if
+    there is no index file, or if it is outdated or unreadable.  An index
+    file is outdated once *directory* has been modified after it was written.
+    """
+    result = _read_index(directory)
+    if result is None:
+        return None
+    index, _, code_map = result
+    if code_map is not None:
+        code_map.close()
+    return index['modules']
+
+
+class _IndexedCodeMixin:
+
+    # Loader getting the code of its module from the memory-mapped index
+    # file rather than from the bytecode file.
+
+    def __init__(self, fullname, path, code):
+        super().__init__(fullname, path)
+        self._code = code
+
+    def get_code(self, fullname):
+        if fullname != self.name:
+            return super().get_code(fullname)
+        code_map, offset, size = self._code
+        with memoryview(code_map) as view:
+            code = marshal.loads(view[offset:offset + size])
+        _imp._fix_co_filename(code, self.path)
+        return code
+
+
+class _IndexedSourceFileLoader(_IndexedCodeMixin, SourceFileLoader):
+    pass
+
+
+class _IndexedSourcelessFileLoader(_IndexedCodeMixin, SourcelessFileLoader):
+    pass
+
+
+_CODE_LOADERS = {
+    'source': _IndexedSourceFileLoader,
+    'bytecode': _IndexedSourcelessFileLoader,
+}
+
+
+class IndexFinder:
+
+    """Meta path finder for top-level modules of indexed sys.path entries.
+
+    Index files are read the first time a module is looked up, and again
+    after sys.path has changed or invalidate_caches() has been called.  A
+    module is only found through the index files if every entry of sys.path
+    before the one providing it is either indexed or missing; other modules
+    are left to the finders that follow on sys.meta_path.  Submodules are
+    found in the index files holding code, as long as the directory of
+    their package has not been modified since the index was written.
+
+    """
+
+    def __init__(self):
+        self._path = None
+        self._modules = {}
+
+    def invalidate_caches(self):
+        """Forget the index files read so far."""
+        self._path = None
+        self._modules = {}
+
+    def _read_indexes(self):
+        modules = {}
+        for entry in sys.path:
+            if not isinstance(entry, str) or not entry:
+                break
+            directory = os.path.abspath(entry)
+            result = _read_index(directory)
+            if result is None:
+                if os.path.lexists(directory):
+                    # Modules of entries past this one may be shadowed.
+                    break
+                continue
+            index, index_mtime, code_map = result
+            codes = index['code']
+            # Whether the directories of the submodules were not modified
+            # after the index file was written
+            fresh = {}
+            for name, (filename, kind, is_package) in index['modules'].items():
+                if '.' in name:
+                    parent = modules.get(name.partition('.')[0])
+                    if parent is None or parent[0] != directory:
+                        continue
+                    # The directory the submodule is found in
+                    location = os.path.dirname(filename)
+                    if is_package:
+                        location = os.path.dirname(location)
+                    location = os.path.join(directory, location)
+                    if location not in fresh:
+                        try:
+                            mtime = os.stat(location).st_mtime_ns
+                        except OSError:
+                            mtime = None
+                        fresh[location] = (mtime is not None
+                                           and mtime <= index_mtime)
+                    if not fresh[location]:
+                        continue
+                elif name in modules:
+                    continue
+                code = codes.get(name)
+                if code is not None:
+                    offset, size, mtime, file_size = code
+                    code = ((code_map, offset, size), mtime, file_size)
+                modules[name] = (directory, filename, kind, is_package, code)
+        self._path = list(sys.path)
+        self._modules = modules
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Try to find a spec for the module *fullname*."""
+        if _relax_case():
+            return None
+        if self._path != sys.path:
+            self._read_indexes()
+        try:
+            (directory, filename, kind, is_package,
+             code) = self._modules[fullname]
+        except KeyError:
+            return None
+        origin = os.path.join(directory, filename)
+        if '.' in fullname:
+            # Only look up the submodules of the packages found here
+            location = os.path.dirname(origin)
+            if is_package:
+                location = os.path.dirname(location)
+            if not path or path[0] != location:
+                return None
+        elif path is not None:
+            return None
+        try:
+            st = os.stat(origin)
+        except OSError:
+            return None
+        if code is not None and code[1:] == (st.st_mtime_ns, st.st_size):
+            loader = _CODE_LOADERS[kind](fullname, origin, code[0])
+        else:
+            loader = _KIND_LOADERS[kind](fullname, origin)
+        if is_package:
+            smsl = [os.path.dirname(origin)]
+        else:
+            smsl = None
+        return spec_from_file_location(fullname, origin, loader=loader,
+                                       submodule_search_locations=smsl)
+
+    def __repr__(self):
+        return 'IndexFinder()'
+
+
+def install():
+    """Insert an IndexFinder on sys.meta_path, before the path based finder.
+
+    Return the finder.  Nothing is changed if one is already installed.
+    """
+    for finder in sys.meta_path:
+        if isinstance(finder, IndexFinder):
+            return finder
+    finder = IndexFinder()
+    for position, meta_finder in enumerate(sys.meta_path):
+        if meta_finder is PathFinder or isinstance(meta_finder, PathFinder):
+            break
+    else:
+        position = len(sys.meta_path)
+    sys.meta_path.insert(position, finder)
+    return finder
+
+
+def uninstall():
+    """Remove the IndexFinder instances from sys.meta_path."""
+    sys.meta_path[:] = [finder for finder in sys.meta_path
+                        if not isinstance(finder, IndexFinder)]
+
+
+def main(args=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m importlib.index',
+        description='Write the import index files of directories.')
+    parser.add_argument('directories', metavar='directory', nargs='*',
+                        help='the directories to index (default: the '
+                             'directories of sys.path, except the first one)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='do not print the path of the index files')
+    parser.add_argument('--code', action='store_true',
+                        help='also store the code of the modules and '
+                             'submodules in the index files')
+    parser.add_argument('--remove', action='store_true',
+                        help='remove the index files instead of writing them')
+    args = parser.parse_args(args)
+    directories = args.directories
+    if not directories:
+        directories = [entry for entry in sys.path[1:]
+                       if entry and os.path.isdir(entry)]
+    status = 0
+    for directory in directories:
+        try:
+            if args.remove:
+                index_path = os.path.join(directory, INDEX_FILENAME)
+                os.unlink(index_path)
+            else:
+                index_path = write_index(directory, args.code)
+        except FileNotFoundError:
+            if args.remove:
+                continue
+            print(f"{directory}: no such directory", file=sys.stderr)
+            status = 1
+        except OSError as err:
+            print(f"{directory}: {err}", file=sys.stderr)
+            status = 1
+        else:
+            if not args.quiet:
+                print(index_path)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,6 +5,9 @@
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
 from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import PathFinder
+from ._bootstrap_external import SourceFileLoader
+from ._bootstrap_external import SourcelessFileLoader
 from ._bootstrap_external import _RAW_MAGIC_NUMBER
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
@@ -265,10 +268,44 @@ def __delattr__(self, attr):
         delattr(self, attr)
 
 
+# The attributes set by the import system before the module is executed,
+# and __warningregistry__, only set by warnings while the module runs.
+_LAZY_IMPORT_ATTRS = frozenset({'__name__', '__file__', '__cached__',
+                                '__path__', '__loader__', '__package__',
+                                '__spec__', '__warningregistry__'})
+
+
+class _LazyImportModule(_LazyModule):
+
+    """A lazy module of the lazy import mode, whose attributes set by the
+    import system are looked up without triggering the load."""
+
+    def __getattribute__(self, attr):
+        """Return the import attribute or trigger the load of the module."""
+        # Code iterating over sys.modules to read these attributes, such as
+        # hasattr(module, '__path__'), must not import other modules while
+        # iterating.
+        if attr in _LAZY_IMPORT_ATTRS:
+            attrs = types.ModuleType.__getattribute__(self, '__dict__')
+            try:
+                return attrs[attr]
+            except KeyError:
+                raise AttributeError(f"module {attrs.get('__name__')!r} "
+                                     f"has no attribute {attr!r}") from None
+        return super().__getattribute__(attr)
+
+    def __delattr__(self, attr):
+        """Trigger the load and then perform the deletion."""
+        _LazyModule.__getattribute__(self, attr)
+        delattr(self, attr)
+
+
 class LazyLoader(Loader):
 
     """A loader that creates a module which defers loading until attribute access."""
 
+    _module_type = _LazyModule
+
     @staticmethod
     def __check_eager_loader(loader):
         if not hasattr(loader, 'exec_module'):
@@ -284,6 +321,13 @@ def __init__(self, loader):
         self.__check_eager_loader(loader)
         self.loader = loader
 
+    def __getattr__(self, attr):
+        # Give access to the other methods of the eager loader, such as
+        # get_code() used by runpy.
+        if attr == 'loader':
+            raise AttributeError(attr)
+        return getattr(self.loader, attr)
+
     def create_module(self, spec):
         return self.loader.create_module(spec)
 
@@ -299,4 +343,79 @@ def exec_module(self, module):
         loader_state['__dict__'] = module.__dict__.copy()
         loader_state['__class__'] = module.__class__
         module.__spec__.loader_state = loader_state
-        module.__class__ = _LazyModule
+        module.__class__ = self._module_type
+
+
+# Modules which are only imported for their side effects.
+_LAZY_IMPORTS_DENIED = ('sitecustomize', 'usercustomize')
+
+
+def _match_module(name, names):
+    """Return True if module *name* or one of its packages is in *names*."""
+    while True:
+        if name in names:
+            return True
+        name, dot, _ = name.rpartition('.')
+        if not dot:
+            return False
+
+
+class _LazyImportLoader(LazyLoader):
+
+    """LazyLoader creating the modules of the lazy import mode."""
+
+    _module_type = _LazyImportModule
+
+
+class _LazyPathFinder(PathFinder):
+
+    """Path based finder which makes the source and bytecode modules it
+    finds load lazily, as set up by enable_lazy_imports()."""
+
+    def __init__(self, allow=None, deny=()):
+        self.allow = None if allow is None else frozenset(allow)
+        self.deny = frozenset(deny).union(_LAZY_IMPORTS_DENIED)
+
+    def find_spec(self, fullname, path=None, target=None):
+        parent = sys.modules.get(fullname.rpartition('.')[0])
+        if type(parent) is _LazyImportModule:
+            # Reading __path__ does not load the parent package, but
+            # importing a submodule must.  Its code can change __path__.
+            path = _LazyModule.__getattribute__(parent, '__path__')
+        spec = super().find_spec(fullname, path, target)
+        if (spec is not None
+                and type(spec.loader) in (SourceFileLoader, SourcelessFileLoader)
+                and (self.allow is None or _match_module(fullname, self.allow))
+                and not _match_module(fullname, self.deny)):
+            spec.loader = _LazyImportLoader(spec.loader)
+        return spec
+
+    def __repr__(self):
+        return f'<lazy path finder allow={self.allow!r} deny={self.deny!r}>'
+
+
+def enable_lazy_imports(*, allow=None, deny=()):
+    """Make the modules imported from now on load lazily.
+
+    The modules found by the path based finder in source or bytecode files
+    are loaded with LazyLoader: their code is only executed when one of their
+    attributes is first accessed.  If *allow* is not None, only the modules
+    named in *allow* and the modules of the packages named in *allow* are
+    loaded lazily.  The modules named in *deny*, and the modules of the
+    packages named in *deny*, are always loaded eagerly.  The attributes set
+    by the import system, such as __name__, __file__ and __path__, can be read
+    without triggering the load.
+    """
+    finder = _LazyPathFinder(allow, deny)
+    for i, meta_finder in enumerate(sys.meta_path):
+        if meta_finder is PathFinder or isinstance(meta_finder, _LazyPathFinder):
+            sys.meta_path[i] = finder
+            return
+    raise ValueError('the path based finder is not on sys.meta_path')
+
+
+def disable_lazy_imports():
+    """Load the modules imported from now on eagerly again."""
+    for i, meta_finder in enumerate(sys.meta_path):
+        if isinstance(meta_finder, _LazyPathFinder):
+            sys.meta_path[i] = PathFinder
@@ -41,6 +41,10 @@
 BUFSIZE = 8192
 # A very generous timeout when it comes to local connections...
 CONNECTION_TIMEOUT = 20.
+# Out-of-band pickle buffers of at least this size are sent in frames of
+# their own, rather than being copied into the pickle data
+OOB_BUFFER_THRESHOLD = 64 * 1024
+_HAVE_VECTORED_IO = hasattr(os, 'writev') and hasattr(os, 'readv')
 
 _mmap_counter = itertools.count()
 
@@ -56,6 +60,15 @@
     families += ['AF_PIPE']
 
 
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16
+else:
+    if _IOV_MAX <= 0:
+        _IOV_MAX = 16
+
+
 def _init_timeout(timeout=CONNECTION_TIMEOUT):
     return time.monotonic() + timeout
 
@@ -118,6 +131,10 @@ def address_type(address):
 
 class _ConnectionBase:
     _handle = None
+    # True if large out-of-band pickle buffers are sent separately.  Only
+    # enabled for the connections made by Pipe(), whose both ends support
+    # this framing.
+    _oob_buffers = False
 
     def __init__(self, handle, readable=True, writable=True):
         handle = handle.__index__()
@@ -208,7 +225,29 @@ def send(self, obj):
         """Send a (picklable) object"""
         self._check_closed()
         self._check_writable()
-        self._send_bytes(_ForkingPickler.dumps(obj))
+        self._send_pickled(*self._dumps(obj))
+
+    def _dumps(self, obj):
+        # Return the pickle data of obj and the buffers to send out-of-band
+        if self._oob_buffers:
+            return _ForkingPickler.dumps_with_buffers(obj,
+                                                      OOB_BUFFER_THRESHOLD)
+        return _ForkingPickler.dumps(obj), []
+
+    def _send_pickled(self, data, buffers):
+        if buffers:
+            self._send_bytes_with_buffers(data, buffers)
+        else:
+            self._send_bytes(data)
+
+    def _recv_pickled(self):
+        # Return the pickle data and the out-of-band buffers of a message
+        buffers = []
+        if self._oob_buffers:
+            buf = self._recv_bytes(buffers=buffers)
+        else:
+            buf = self._recv_bytes()
+        return buf.getbuffer(), buffers
 
     def recv_bytes(self, maxlength=None):
         """
@@ -252,8 +291,8 @@ def recv(self):
         """Receive a (picklable) object"""
         self._check_closed()
         self._check_readable()
-        buf = self._recv_bytes()
-        return _ForkingPickler.loads(buf.getbuffer())
+        data, buffers = self._recv_pickled()
+        return _ForkingPickler.loads(data, buffers=buffers)
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -415,9 +454,56 @@ def _send_bytes(self, buf):
                 # to avoid "broken pipe" errors if the other end closed the pipe.
                 self._send(header + buf)
 
-    def _recv_bytes(self, maxsize=None):
+    def _sendv(self, bufs):
+        # Write the buffers with as few system calls as possible
+        bufs = [memoryview(buf).cast('B') for buf in bufs]
+        i = 0
+        while i < len(bufs):
+            n = os.writev(self._handle, bufs[i:i + _IOV_MAX])
+            while n >= len(bufs[i]):
+                n -= len(bufs[i])
+                i += 1
+                if i == len(bufs):
+                    assert n == 0
+                    return
+            bufs[i] = bufs[i][n:]
+
+    def _recv_into(self, buf):
+        # Fill the buffer, without an intermediate copy
+        handle = self._handle
+        m = memoryview(buf).cast('B')
+        while m:
+            n = os.readv(handle, [m])
+            if n == 0:
+                raise OSError("got end of file during message")
+            m = m[n:]
+
+    def _send_bytes_with_buffers(self, data, buffers):
+        # Send a message made of a -2 marker, the number of buffers, the
+        # pickle data and each buffer, with their lengths
+        bufs = [struct.pack("!iQQ", -2, len(buffers), len(data)), data]
+        for buf in buffers:
+            bufs.append(struct.pack("!Q", len(buf)))
+            bufs.append(buf)
+        self._sendv(bufs)
+
+    def _recv_bytes(self, maxsize=None, buffers=None):
         buf = self._recv(4)
         size, = struct.unpack("!i", buf.getvalue())
+        if size == -2:
+            count, size = struct.unpack("!QQ", self._recv(16).getvalue())
+            data = self._recv(size)
+            for i in range(count):
+                size, = struct.unpack("!Q", self._recv(8).getvalue())
+                buf = bytearray(size)
+                self._recv_into(buf)
+                if buffers is not None:
+                    buffers.append(buf)
+            if buffers is None:
+                # A message sent by send() with out-of-band buffers, read
+                # entirely so that the next message can still be received
+                self._bad_message_length()
+            return data
         if size == -1:
             buf = self._recv(8)
             size, = struct.unpack("!Q", buf.getvalue())
@@ -533,6 +619,7 @@ def Pipe(duplex=True):
             c1 = Connection(fd1, writable=False)
             c2 = Connection(fd2, readable=False)
 
+        c1._oob_buffers = c2._oob_buffers = _HAVE_VECTORED_IO
         return c1, c2
 
 else:
@@ -971,8 +1058,11 @@ def rebuild_pipe_connection(dh, readable, writable):
 else:
     def reduce_connection(conn):
         df = reduction.DupFd(conn.fileno())
-        return rebuild_connection, (df, conn.readable, conn.writable)
-    def rebuild_connection(df, readable, writable):
+        return rebuild_connection, (df, conn.readable, conn.writable,
+                                    conn._oob_buffers)
+    def rebuild_connection(df, readable, writable, oob_buffers=False):
         fd = df.detach()
-        return Connection(fd, readable, writable)
+        conn = Connection(fd, readable, writable)
+        conn._oob_buffers = oob_buffers
+        return conn
     reduction.register(Connection, reduce_connection)
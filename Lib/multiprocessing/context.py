@@ -112,6 +112,11 @@ def SimpleQueue(self):
         from .queues import SimpleQueue
         return SimpleQueue(ctx=self.get_context())
 
+    def SharedMemoryQueue(self, maxsize=0, capacity=2**20):
+        '''Returns a queue object using a ring buffer in shared memory'''
+        from .queues import SharedMemoryQueue
+        return SharedMemoryQueue(maxsize, capacity, ctx=self.get_context())
+
     def Pool(self, processes=None, initializer=None, initargs=(),
              maxtasksperchild=None):
         '''Returns a process pool object'''
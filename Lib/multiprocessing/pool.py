@@ -14,6 +14,7 @@
 #
 
 import collections
+import functools
 import itertools
 import os
 import queue
@@ -50,6 +51,175 @@ def mapstar(args):
 def starmapstar(args):
     return list(itertools.starmap(args[0], args[1]))
 
+def timedchunk(mapper, args):
+    start = time.monotonic()
+    result = mapper(args)
+    return time.monotonic() - start, result
+
+#
+# Support for `chunksize='auto'`
+#
+
+class _ChunkSizer(object):
+    '''
+    Chooses the size of the chunks of a map with `chunksize='auto'`.
+
+    The first chunk holds one item.  Then the chunks grow or shrink so that
+    running a chunk takes about `target_duration` seconds, and at least
+    `overhead_ratio` times the overhead of sending a chunk to a worker and
+    getting its results back.
+    '''
+    target_duration = 0.02
+    overhead_ratio = 10
+    max_size = 10000
+
+    def __init__(self):
+        self.size = 1
+        self._item_time = None
+        self._overhead = None
+
+    def update(self, count, run_time, latency):
+        '''
+        Record that a chunk of `count` items ran for `run_time` seconds in a
+        worker, and that its results came back `latency` seconds after it
+        was sent.
+        '''
+        item_time = run_time / count
+        if self._item_time is None:
+            self._item_time = item_time
+        else:
+            self._item_time = 0.75 * self._item_time + 0.25 * item_time
+        # The latency also includes the time spent waiting for a worker,
+        # the smallest one is closest to the actual overhead.
+        overhead = max(latency - run_time, 0.0)
+        if self._overhead is None or overhead < self._overhead:
+            self._overhead = overhead
+        duration = max(self.target_duration,
+                       self.overhead_ratio * self._overhead)
+        size = int(duration / max(self._item_time, 1e-9))
+        # Grow progressively, the first measures are the least reliable
+        self.size = max(1, min(size, 2 * self.size, self.max_size))
+
+
+class _AutoChunks(object):
+    '''
+    Generates the tasks of a map with `chunksize='auto'`.
+
+    The items of `iterable` are read lazily, and at most `max_pending`
+    chunks are sent to the workers before their results are consumed.  It
+    replaces `result` in the cache of the pool to measure the chunks before
+    passing their results on.  If `per_item` is true, `result` is a
+    `MapResult` with chunks of one item, and the results of every chunk are
+    set as those of as many items, which consumes them.  Otherwise `result`
+    is an `IMapIterator` whose results are consumed through `iter_results()`.
+
+    The task handler thread must not wait for the results to be consumed,
+    which would hold up the other tasks of the pool: `tasks()` returns once
+    `max_pending` chunks are pending, and the rest of the tasks are put in
+    the task queue again when a chunk is consumed, or when the pool is
+    closed.
+    '''
+    def __init__(self, result, func, iterable, max_pending, mapper=mapstar,
+                 per_item=False):
+        self._result = result
+        self._pool = result._pool
+        self._func = func
+        self._iterable = iterable
+        self._iterator = None
+        self._max_pending = max_pending
+        self._mapper = functools.partial(timedchunk, mapper)
+        self._per_item = per_item
+        self._sizer = _ChunkSizer()
+        self._lock = threading.Lock()
+        # Maps the index of the chunks sent to their first item index,
+        # length and send time.
+        self._chunks = {}
+        # Number of chunks sent whose results are not consumed yet
+        self._pending = 0
+        # Index of the next chunk and of its first item
+        self._index = 0
+        self._start = 0
+        # Whether tasks() returned before the end of the iterable
+        self._paused = False
+        result._cache[result._job] = self
+
+    def tasks(self):
+        '''
+        Generate the tasks of the next chunks, until `max_pending` of them
+        are pending or the end of the iterable.  Run by the task handler.
+        '''
+        job = self._result._job
+        while True:
+            with self._lock:
+                if (self._pending >= self._max_pending and
+                        self._pool._state == RUN):
+                    self._paused = True
+                    return
+                index = self._index
+            try:
+                if self._iterator is None:
+                    self._iterator = iter(self._iterable)
+                chunk = tuple(itertools.islice(self._iterator,
+                                               self._sizer.size))
+            except Exception as e:
+                self._set_length(index + 1)
+                yield (job, index, _helper_reraises_exception, (e,), {})
+                return
+            if not chunk:
+                self._set_length(index)
+                return
+            with self._lock:
+                self._chunks[index] = (self._start, len(chunk),
+                                       time.monotonic())
+                self._pending += 1
+                self._index += 1
+            self._start += len(chunk)
+            yield (job, index, self._mapper, ((self._func, chunk),), {})
+
+    def _set_length(self, length):
+        if not self._per_item:
+            self._result._set_length(length)
+
+    def resume(self, release=False):
+        '''
+        Put the rest of the tasks in the task queue if `tasks()` returned
+        early, after releasing a pending chunk if `release` is true.
+        '''
+        with self._lock:
+            if release:
+                self._pending -= 1
+            if self._paused and (self._pending < self._max_pending or
+                                 self._pool._state != RUN):
+                self._paused = False
+                self._pool._taskqueue.put((self.tasks(), None))
+
+    def iter_results(self):
+        '''
+        Iterate over the results of the items, releasing the chunks as they
+        are consumed.
+        '''
+        for chunk in self._result:
+            self.resume(release=True)
+            yield from chunk
+
+    def _set(self, i, obj):
+        with self._lock:
+            start, count, sent = self._chunks.pop(i, (None, None, None))
+        if start is not None and self._per_item:
+            self.resume(release=True)
+        success, value = obj
+        if start is None:
+            # The iterable raised an exception
+            self._result._set(i, obj)
+            return
+        if success:
+            run_time, value = value
+            self._sizer.update(count, run_time, time.monotonic() - sent)
+        if self._per_item:
+            self._result._set(start, (success, value), count)
+        else:
+            self._result._set(i, (success, value))
+
 #
 # Hack to embed stringification of remote traceback in local traceback
 #
@@ -403,6 +573,12 @@ def imap(self, func, iterable, chunksize=1):
                     result._set_length
                 ))
             return result
+        elif chunksize == 'auto':
+            result = IMapIterator(self)
+            task_batches = _AutoChunks(result, func, iterable,
+                                       2 * self._processes)
+            self._taskqueue.put((task_batches.tasks(), None))
+            return task_batches.iter_results()
         else:
             if chunksize < 1:
                 raise ValueError(
@@ -432,6 +608,12 @@ def imap_unordered(self, func, iterable, chunksize=1):
                     result._set_length
                 ))
             return result
+        elif chunksize == 'auto':
+            result = IMapUnorderedIterator(self)
+            task_batches = _AutoChunks(result, func, iterable,
+                                       2 * self._processes)
+            self._taskqueue.put((task_batches.tasks(), None))
+            return task_batches.iter_results()
         else:
             if chunksize < 1:
                 raise ValueError(
@@ -481,6 +663,16 @@ def _map_async(self, func, iterable, mapper, chunksize=None, callback=None,
         if len(iterable) == 0:
             chunksize = 0
 
+        if chunksize == 'auto':
+            # Set the results one by one, as the chunks vary in size
+            result = MapResult(self, 1, len(iterable), callback,
+                               error_callback=error_callback)
+            task_batches = _AutoChunks(result, func, iterable,
+                                       2 * self._processes, mapper=mapper,
+                                       per_item=True)
+            self._taskqueue.put((task_batches.tasks(), None))
+            return result
+
         task_batches = Pool._get_tasks(func, iterable, chunksize)
         result = MapResult(self, chunksize, len(iterable), callback,
                            error_callback=error_callback)
@@ -647,6 +839,11 @@ def close(self):
             self._state = CLOSE
             self._worker_handler._state = CLOSE
             self._change_notifier.put(None)
+            # The maps with chunksize='auto' waiting for their results to be
+            # consumed send the rest of their tasks
+            for result in list(self._cache.values()):
+                if isinstance(result, _AutoChunks):
+                    result.resume()
 
     def terminate(self):
         util.debug('terminating pool')
@@ -803,11 +1000,12 @@ def __init__(self, pool, chunksize, length, callback, error_callback):
         else:
             self._number_left = length//chunksize + bool(length % chunksize)
 
-    def _set(self, i, success_result):
-        self._number_left -= 1
+    def _set(self, i, success_result, count=1):
+        # _AutoChunks sets `count` consecutive chunks of one item at once
+        self._number_left -= count
         success, result = success_result
         if success and self._success:
-            self._value[i*self._chunksize:(i+1)*self._chunksize] = result
+            self._value[i*self._chunksize:(i+count)*self._chunksize] = result
             if self._number_left == 0:
                 if self._callback:
                     self._callback(self._value)
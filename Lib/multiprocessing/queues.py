@@ -7,12 +7,13 @@
 # Licensed to PSF under a Contributor Agreement.
 #
 
-__all__ = ['Queue', 'SimpleQueue', 'JoinableQueue']
+__all__ = ['Queue', 'SimpleQueue', 'JoinableQueue', 'SharedMemoryQueue']
 
 import sys
 import os
 import threading
 import collections
+import struct
 import time
 import types
 import weakref
@@ -79,8 +80,9 @@ def _reset(self, after_fork=False):
         self._joincancelled = False
         self._closed = False
         self._close = None
-        self._send_bytes = self._writer.send_bytes
-        self._recv_bytes = self._reader.recv_bytes
+        self._dumps = self._writer._dumps
+        self._send_pickled = self._writer._send_pickled
+        self._recv_pickled = self._reader._recv_pickled
         self._poll = self._reader.poll
 
     def put(self, obj, block=True, timeout=None):
@@ -100,7 +102,7 @@ def get(self, block=True, timeout=None):
             raise ValueError(f"Queue {self!r} is closed")
         if block and timeout is None:
             with self._rlock:
-                res = self._recv_bytes()
+                res = self._recv_pickled()
             self._sem.release()
         else:
             if block:
@@ -114,12 +116,13 @@ def get(self, block=True, timeout=None):
                         raise Empty
                 elif not self._poll():
                     raise Empty
-                res = self._recv_bytes()
+                res = self._recv_pickled()
                 self._sem.release()
             finally:
                 self._rlock.release()
         # unserialize the data after having released the lock
-        return _ForkingPickler.loads(res)
+        data, buffers = res
+        return _ForkingPickler.loads(data, buffers=buffers)
 
     def qsize(self):
         # Raises NotImplementedError on Mac OSX because of broken sem_getvalue()
@@ -168,9 +171,9 @@ def _start_thread(self):
         self._buffer.clear()
         self._thread = threading.Thread(
             target=Queue._feed,
-            args=(self._buffer, self._notempty, self._send_bytes,
-                  self._wlock, self._writer.close, self._ignore_epipe,
-                  self._on_queue_feeder_error, self._sem),
+            args=(self._buffer, self._notempty, self._dumps,
+                  self._send_pickled, self._wlock, self._writer.close,
+                  self._ignore_epipe, self._on_queue_feeder_error, self._sem),
             name='QueueFeederThread'
         )
         self._thread.daemon = True
@@ -211,8 +214,8 @@ def _finalize_close(buffer, notempty):
             notempty.notify()
 
     @staticmethod
-    def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
-              onerror, queue_sem):
+    def _feed(buffer, notempty, dumps, send_pickled, writelock, close,
+              ignore_epipe, onerror, queue_sem):
         debug('starting thread to feed data to pipe')
         nacquire = notempty.acquire
         nrelease = notempty.release
@@ -242,13 +245,13 @@ def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
                             return
 
                         # serialize the data before acquiring the lock
-                        obj = _ForkingPickler.dumps(obj)
+                        obj = dumps(obj)
                         if wacquire is None:
-                            send_bytes(obj)
+                            send_pickled(*obj)
                         else:
                             wacquire()
                             try:
-                                send_bytes(obj)
+                                send_pickled(*obj)
                             finally:
                                 wrelease()
                 except IndexError:
@@ -363,18 +366,293 @@ def __setstate__(self, state):
 
     def get(self):
         with self._rlock:
-            res = self._reader.recv_bytes()
+            data, buffers = self._reader._recv_pickled()
         # unserialize the data after having released the lock
-        return _ForkingPickler.loads(res)
+        return _ForkingPickler.loads(data, buffers=buffers)
 
     def put(self, obj):
         # serialize the data before acquiring the lock
-        obj = _ForkingPickler.dumps(obj)
+        data, buffers = self._writer._dumps(obj)
         if self._wlock is None:
             # writes to a message oriented win32 pipe are atomic
-            self._writer.send_bytes(obj)
+            self._writer._send_pickled(data, buffers)
         else:
             with self._wlock:
-                self._writer.send_bytes(obj)
+                self._writer._send_pickled(data, buffers)
+
+    __class_getitem__ = classmethod(types.GenericAlias)
+
+#
+# Queue type using a ring buffer in shared memory
+#
+# The shared memory block starts with a header holding the read and write
+# positions, the number of items and the number of producers waiting for
+# room, followed by the ring itself.  An item is stored as a frame made of
+# the number n of out-of-band buffers, the length of the pickle data and
+# the lengths of the n buffers (as unsigned 64-bit integers), followed by
+# the pickle data and the buffers.
+#
+# The header is only accessed with the lock held.  Consumers wait for items
+# on a semaphore released once per item put, and producers wait for room on
+# a semaphore released by get() for each waiting producer.  As with
+# Condition.notify_all(), get() then waits until each woken producer has
+# acknowledged its wakeup on a third semaphore, so that a producer going back
+# to sleep cannot take the wakeup of another one.
+#
+
+_SHMQ_HEADER_SIZE = 64
+# read position, write position, count, waiting producers
+_SHMQ_STATE = struct.Struct('<4Q')
+_SHMQ_FRAME = struct.Struct('<2Q')  # number of buffers, pickle data length
+
+class _PickleChunks(list):
+    # File object collecting the bytes objects written by a pickler, so that
+    # they can be copied straight into the ring
+    write = list.append
+
+class SharedMemoryQueue(object):
+
+    def __init__(self, maxsize=0, capacity=2**20, *, ctx):
+        if maxsize <= 0:
+            # Can raise ImportError (see issues #3770 and #23400)
+            from .synchronize import SEM_VALUE_MAX as maxsize
+        if capacity <= 0:
+            raise ValueError("'capacity' must be a positive integer")
+        from .shared_memory import SharedMemory
+        self._maxsize = maxsize
+        self._capacity = capacity
+        self._shm = SharedMemory(create=True,
+                                 size=_SHMQ_HEADER_SIZE + capacity)
+        self._lock = ctx.Lock()
+        self._items = ctx.Semaphore(0)
+        self._room = ctx.Semaphore(0)
+        self._woken = ctx.Semaphore(0)
+        self._picklers = []
+        self._closed = False
+        # Only the creator of the queue destroys the shared memory block
+        self._close = Finalize(
+            self, SharedMemoryQueue._finalize_close, [self._shm],
+            exitpriority=10
+            )
+
+    def __getstate__(self):
+        context.assert_spawning(self)
+        return (self._maxsize, self._capacity, self._shm.name, self._lock,
+                self._items, self._room, self._woken)
+
+    def __setstate__(self, state):
+        (self._maxsize, self._capacity, name, self._lock,
+         self._items, self._room, self._woken) = state
+        from .shared_memory import SharedMemory
+        self._shm = SharedMemory(name)
+        self._picklers = []
+        self._closed = False
+        self._close = None
+
+    # No view of the shared memory is kept alive between two operations,
+    # so that the block can be closed whenever the queue is collected.
+
+    def _write(self, buf, pos, data):
+        # Copy data into the ring at position pos, wrapping around
+        start = pos % self._capacity
+        end = start + len(data)
+        if end <= self._capacity:
+            buf[_SHMQ_HEADER_SIZE + start:_SHMQ_HEADER_SIZE + end] = data
+        else:
+            n = self._capacity - start
+            data = memoryview(data)
+            buf[_SHMQ_HEADER_SIZE + start:
+                _SHMQ_HEADER_SIZE + self._capacity] = data[:n]
+            buf[_SHMQ_HEADER_SIZE:
+                _SHMQ_HEADER_SIZE + end - self._capacity] = data[n:]
+
+    def _read(self, buf, pos, size):
+        # Copy size bytes from the ring at position pos, wrapping around
+        start = pos % self._capacity
+        end = start + size
+        if end <= self._capacity:
+            return bytearray(buf[_SHMQ_HEADER_SIZE + start:
+                                 _SHMQ_HEADER_SIZE + end])
+        data = bytearray(buf[_SHMQ_HEADER_SIZE + start:
+                             _SHMQ_HEADER_SIZE + self._capacity])
+        data += buf[_SHMQ_HEADER_SIZE:
+                    _SHMQ_HEADER_SIZE + end - self._capacity]
+        return data
+
+    @staticmethod
+    def _new_pickler():
+        chunks = _PickleChunks()
+        buffers = []
+        def buffer_callback(pickle_buffer):
+            try:
+                buffers.append(pickle_buffer.raw())
+            except BufferError:
+                return True     # not contiguous: serialize in-band
+        pickler = _ForkingPickler(chunks, 5, buffer_callback=buffer_callback)
+        return pickler, chunks, buffers
+
+    def put(self, obj, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        # Picklers are reused, each thread taking one from the free list
+        try:
+            pickler = self._picklers.pop()
+        except IndexError:
+            pickler = self._new_pickler()
+        try:
+            self._put(obj, block, timeout, *pickler)
+        finally:
+            pickler[0].clear_memo()
+            pickler[1].clear()
+            pickler[2].clear()
+            self._picklers.append(pickler)
+
+    def _put(self, obj, block, timeout, pickler, chunks, buffers):
+        # Serialize the data before acquiring the lock.  The bytes objects
+        # written by the pickler and the out-of-band buffers are copied
+        # straight into the ring.
+        pickler.dump(obj)
+        nbytes = sum(map(len, chunks))
+        lengths = [len(b) for b in buffers]
+        size = _SHMQ_FRAME.size + 8 * len(lengths) + nbytes + sum(lengths)
+        if size > self._capacity:
+            raise ValueError(
+                f"object too large for the queue ({size} > "
+                f"{self._capacity} bytes)")
+
+        if block and timeout is not None:
+            deadline = time.monotonic() + timeout
+        self._lock.acquire()
+        try:
+            buf = self._shm.buf
+            head, tail, count, waiting = _SHMQ_STATE.unpack_from(buf)
+            while (count >= self._maxsize or
+                   tail - head + size > self._capacity):
+                if not block:
+                    raise Full
+                # Wait for get() to free some room.  The wakeup is
+                # acknowledged even after a timeout, get() discards the
+                # unused wakeups.
+                _SHMQ_STATE.pack_into(buf, 0, head, tail, count, waiting + 1)
+                self._lock.release()
+                try:
+                    if timeout is not None:
+                        timeout = deadline - time.monotonic()
+                    woken = self._room.acquire(True, timeout)
+                finally:
+                    self._woken.release()
+                    self._lock.acquire()
+                if not woken:
+                    raise Full
+                head, tail, count, waiting = _SHMQ_STATE.unpack_from(buf)
+            start = tail % self._capacity
+            if start + size <= self._capacity:
+                # Fast path: the frame does not wrap around
+                offset = _SHMQ_HEADER_SIZE + start
+                _SHMQ_FRAME.pack_into(buf, offset, len(lengths), nbytes)
+                offset += _SHMQ_FRAME.size
+                if lengths:
+                    struct.pack_into(f'<{len(lengths)}Q', buf, offset,
+                                     *lengths)
+                    offset += 8 * len(lengths)
+                for chunk in (*chunks, *buffers):
+                    end = offset + len(chunk)
+                    buf[offset:end] = chunk
+                    offset = end
+            else:
+                pos = tail
+                header = struct.pack(f'<{len(lengths) + 2}Q',
+                                     len(lengths), nbytes, *lengths)
+                for chunk in (header, *chunks, *buffers):
+                    self._write(buf, pos, chunk)
+                    pos += len(chunk)
+            _SHMQ_STATE.pack_into(buf, 0, head, tail + size, count + 1,
+                                  waiting)
+        finally:
+            self._lock.release()
+        self._items.release()
+
+    def get(self, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        if not self._items.acquire(block, timeout):
+            raise Empty
+        self._lock.acquire()
+        try:
+            buf = self._shm.buf
+            head, tail, count, waiting = _SHMQ_STATE.unpack_from(buf)
+            start = head % self._capacity
+            if start + _SHMQ_FRAME.size <= self._capacity:
+                nbuffers, nbytes = _SHMQ_FRAME.unpack_from(
+                    buf, _SHMQ_HEADER_SIZE + start)
+            else:
+                nbuffers, nbytes = _SHMQ_FRAME.unpack(
+                    self._read(buf, head, _SHMQ_FRAME.size))
+            pos = head + _SHMQ_FRAME.size
+            lengths = ()
+            if nbuffers:
+                size = 8 * nbuffers
+                lengths = struct.unpack(f'<{nbuffers}Q',
+                                        self._read(buf, pos, size))
+                pos += size
+            data = self._read(buf, pos, nbytes)
+            pos += nbytes
+            buffers = []
+            for length in lengths:
+                buffers.append(self._read(buf, pos, length))
+                pos += length
+            _SHMQ_STATE.pack_into(buf, 0, pos, tail, count - 1, 0)
+            if waiting:
+                self._notify_all(waiting)
+        finally:
+            self._lock.release()
+        # unserialize the data after having released the lock
+        return _ForkingPickler.loads(data, buffers=buffers)
+
+    def _notify_all(self, waiting):
+        # Wake up all the waiting producers, the room freed may be enough
+        # for some of them only.  Called with the lock held.
+
+        # to take account of the producers which timed out
+        while waiting and self._woken.acquire(False):
+            waiting -= 1
+        for i in range(waiting):
+            self._room.release()
+        # wait for the producers to wake up
+        for i in range(waiting):
+            self._woken.acquire()
+        # rezero the semaphore in case some timeouts just happened
+        while self._room.acquire(False):
+            pass
+
+    def qsize(self):
+        return _SHMQ_STATE.unpack_from(self._shm.buf)[2]
+
+    def empty(self):
+        return not self.qsize()
+
+    def full(self):
+        return self.qsize() >= self._maxsize
+
+    def get_nowait(self):
+        return self.get(False)
+
+    def put_nowait(self, obj):
+        return self.put(obj, False)
+
+    def close(self):
+        self._closed = True
+        close = self._close
+        if close:
+            self._close = None
+            close()
+        else:
+            self._shm.close()
+
+    @staticmethod
+    def _finalize_close(shm):
+        debug('destroying shared memory of queue')
+        shm.close()
+        shm.unlink()
 
     __class_getitem__ = classmethod(types.GenericAlias)
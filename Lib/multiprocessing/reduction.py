@@ -35,8 +35,8 @@ class ForkingPickler(pickle.Pickler):
     _extra_reducers = {}
     _copyreg_dispatch_table = copyreg.dispatch_table
 
-    def __init__(self, *args):
-        super().__init__(*args)
+    def __init__(self, *args, **kwds):
+        super().__init__(*args, **kwds)
         self.dispatch_table = self._copyreg_dispatch_table.copy()
         self.dispatch_table.update(self._extra_reducers)
 
@@ -46,11 +46,27 @@ def register(cls, type, reduce):
         cls._extra_reducers[type] = reduce
 
     @classmethod
-    def dumps(cls, obj, protocol=None):
+    def dumps(cls, obj, protocol=None, *, buffer_callback=None):
         buf = io.BytesIO()
-        cls(buf, protocol).dump(obj)
+        cls(buf, protocol, buffer_callback=buffer_callback).dump(obj)
         return buf.getbuffer()
 
+    @classmethod
+    def dumps_with_buffers(cls, obj, min_size=0):
+        '''Pickle obj with protocol 5, keeping the contiguous buffers of at
+        least min_size bytes out-of-band.  Return the pickle data and the
+        list of the out-of-band buffers, as memoryviews.'''
+        buffers = []
+        def buffer_callback(pickle_buffer):
+            try:
+                buf = pickle_buffer.raw()
+            except BufferError:
+                return True     # not contiguous: serialize in-band
+            if buf.nbytes < min_size:
+                return True
+            buffers.append(buf)
+        return cls.dumps(obj, 5, buffer_callback=buffer_callback), buffers
+
     loads = pickle.loads
 
 register = ForkingPickler.register
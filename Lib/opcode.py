@@ -220,10 +220,38 @@ def jabs_op(name, op):
 del def_op, name_op, jrel_op, jabs_op
 
 _specialized_instructions = [
+    "BINARY_ADD_ADAPTIVE",
+    "BINARY_ADD_INT",
+    "BINARY_ADD_FLOAT",
+    "BINARY_ADD_UNICODE",
+    "BINARY_MULTIPLY_ADAPTIVE",
+    "BINARY_MULTIPLY_INT",
+    "BINARY_MULTIPLY_FLOAT",
     "BINARY_SUBSCR_ADAPTIVE",
     "BINARY_SUBSCR_LIST_INT",
     "BINARY_SUBSCR_TUPLE_INT",
     "BINARY_SUBSCR_DICT",
+    "CALL_FUNCTION_ADAPTIVE",
+    "CALL_FUNCTION_BUILTIN_O",
+    "CALL_FUNCTION_BUILTIN_FAST",
+    "CALL_FUNCTION_LEN",
+    "CALL_FUNCTION_ISINSTANCE",
+    "CALL_FUNCTION_PY_EXACT_ARGS",
+    "CALL_FUNCTION_TYPE_PY_INIT",
+    "CALL_METHOD_ADAPTIVE",
+    "CALL_METHOD_BUILTIN_O",
+    "CALL_METHOD_BUILTIN_FAST",
+    "CALL_METHOD_DESCRIPTOR_O",
+    "CALL_METHOD_DESCRIPTOR_FAST",
+    "CALL_METHOD_PY_EXACT_ARGS",
+    "COMPARE_OP_ADAPTIVE",
+    "COMPARE_OP_INT_JUMP",
+    "COMPARE_OP_FLOAT_JUMP",
+    "COMPARE_OP_STR_JUMP",
+    "INPLACE_ADD_ADAPTIVE",
+    "INPLACE_ADD_INT",
+    "INPLACE_ADD_FLOAT",
+    "INPLACE_ADD_UNICODE",
     "JUMP_ABSOLUTE_QUICK",
     "LOAD_ATTR_ADAPTIVE",
     "LOAD_ATTR_SPLIT_KEYS",
@@ -233,4 +261,12 @@ def jabs_op(name, op):
     "LOAD_GLOBAL_ADAPTIVE",
     "LOAD_GLOBAL_MODULE",
     "LOAD_GLOBAL_BUILTIN",
+    "LOAD_METHOD_ADAPTIVE",
+    "LOAD_METHOD_CACHED",
+    "LOAD_METHOD_MODULE",
+    "LOAD_METHOD_NO_DICT",
+    "STORE_ATTR_ADAPTIVE",
+    "STORE_ATTR_SPLIT_KEYS",
+    "STORE_ATTR_SLOT",
+    "STORE_ATTR_WITH_HINT",
 ]
@@ -62,6 +62,8 @@ def test_set_invalid(self):
             'tracemalloc',
             'import_time',
             'no_debug_ranges',
+            'specialization_stats',
+            'lazy_imports',
             'show_ref_count',
             'dump_refs',
             'malloc_stats',
@@ -1224,6 +1224,142 @@ def test_closed_queue_put_get_exceptions(self):
                 q.put('foo')
             with self.assertRaisesRegex(ValueError, 'is closed'):
                 q.get()
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedMemoryQueue(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @classmethod
+    def _test_echo(cls, inq, outq):
+        for obj in iter(inq.get, None):
+            outq.put(obj)
+
+    def test_put_get_processes(self):
+        inq = self.SharedMemoryQueue(capacity=4096)
+        outq = self.SharedMemoryQueue(capacity=4096)
+        self.addCleanup(inq.close)
+        self.addCleanup(outq.close)
+        proc = self.Process(target=self._test_echo, args=(inq, outq))
+        proc.daemon = True
+        proc.start()
+        objs = [i for i in range(200)]
+        objs += [bytearray(b'x' * 1000), {'a': [1, 2]}, 'text' * 100]
+        for obj in objs:
+            inq.put(obj)
+            self.assertEqual(outq.get(timeout=support.SHORT_TIMEOUT), obj)
+        inq.put(None)
+        proc.join()
+
+    def test_wrap_around(self):
+        q = self.SharedMemoryQueue(capacity=1000)
+        self.addCleanup(q.close)
+        for i in range(50):
+            data = bytearray([i]) * (i * 7 % 300)
+            # The PickleBuffer is sent out-of-band
+            q.put([data, pickle.PickleBuffer(data)])
+            q.put(str(i))
+            self.assertEqual(q.qsize(), 2)
+            result = q.get()
+            self.assertIsInstance(result[1], bytearray)
+            self.assertEqual(result, [data, data])
+            self.assertEqual(q.get(), str(i))
+            self.assertTrue(q.empty())
+
+    def test_full_empty(self):
+        q = self.SharedMemoryQueue(maxsize=2, capacity=1000)
+        self.addCleanup(q.close)
+        self.assertTrue(q.empty())
+        self.assertRaises(pyqueue.Empty, q.get, False)
+        self.assertRaises(pyqueue.Empty, q.get_nowait)
+        get = TimingWrapper(q.get)
+        self.assertRaises(pyqueue.Empty, get, True, TIMEOUT1)
+        self.assertTimingAlmostEqual(get.elapsed, TIMEOUT1)
+
+        q.put(1)
+        q.put_nowait(2)
+        self.assertTrue(q.full())
+        self.assertRaises(pyqueue.Full, q.put, 3, False)
+        put = TimingWrapper(q.put)
+        self.assertRaises(pyqueue.Full, put, 3, True, TIMEOUT1)
+        self.assertTimingAlmostEqual(put.elapsed, TIMEOUT1)
+        self.assertEqual(q.get(), 1)
+        self.assertFalse(q.full())
+
+        # Not enough room in the ring
+        q.put(bytearray(700))
+        self.assertRaises(pyqueue.Full, q.put, bytearray(700), False)
+        self.assertEqual(q.get(), 2)
+        self.assertEqual(q.get(), bytearray(700))
+        q.put(bytearray(700))
+
+    def test_too_large(self):
+        q = self.SharedMemoryQueue(capacity=100)
+        self.addCleanup(q.close)
+        with self.assertRaisesRegex(ValueError, 'too large'):
+            q.put(b'x' * 100)
+        with self.assertRaises(ValueError):
+            self.SharedMemoryQueue(capacity=0)
+
+    @classmethod
+    def _test_blocking_put(cls, q):
+        for i in range(20):
+            q.put(bytearray([i]) * 300)
+
+    def test_blocking(self):
+        q = self.SharedMemoryQueue(capacity=1000)
+        self.addCleanup(q.close)
+        proc = self.Process(target=self._test_blocking_put, args=(q,))
+        proc.daemon = True
+        proc.start()
+        for i in range(20):
+            self.assertEqual(q.get(timeout=support.SHORT_TIMEOUT),
+                             bytearray([i]) * 300)
+        proc.join()
+
+    def _wait_for_producers(self, q, n):
+        state = multiprocessing.queues._SHMQ_STATE
+        deadline = time.monotonic() + support.SHORT_TIMEOUT
+        while state.unpack_from(q._shm.buf)[3] < n:
+            if time.monotonic() > deadline:
+                self.fail(f"{n} producers are not waiting")
+            time.sleep(0.01)
+
+    def test_blocking_producers(self):
+        # A get() freeing room for a small item but not for a large one
+        # must wake up the producer of the small item
+        q = self.SharedMemoryQueue(capacity=1000)
+        self.addCleanup(q.close)
+        q.put(bytearray(b'a' * 400))
+        q.put(bytearray(b'b' * 400))
+        large = threading.Thread(target=q.put, args=(bytearray(900),),
+                                 daemon=True)
+        large.start()
+        self._wait_for_producers(q, 1)
+        small = threading.Thread(target=q.put, args=(bytearray(300),),
+                                 daemon=True)
+        small.start()
+        self._wait_for_producers(q, 2)
+
+        self.assertEqual(q.get(), bytearray(b'a' * 400))
+        small.join(support.SHORT_TIMEOUT)
+        self.assertFalse(small.is_alive())
+        self.assertTrue(large.is_alive())
+        self.assertEqual(q.get(), bytearray(b'b' * 400))
+        self.assertEqual(q.get(), bytearray(300))
+        large.join(support.SHORT_TIMEOUT)
+        self.assertFalse(large.is_alive())
+        self.assertEqual(q.get(), bytearray(900))
+
+    def test_closed(self):
+        q = self.SharedMemoryQueue()
+        q.close()
+        with self.assertRaisesRegex(ValueError, 'is closed'):
+            q.put('foo')
+        with self.assertRaisesRegex(ValueError, 'is closed'):
+            q.get()
+        q.close()
+
 #
 #
 #
@@ -2418,6 +2554,20 @@ def test_map_chunksize(self):
         except multiprocessing.TimeoutError:
             self.fail("pool.map_async with chunksize stalled on null list")
 
+    def test_map_auto_chunksize(self):
+        pmap = self.pool.map
+        self.assertEqual(pmap(sqr, list(range(1000)), chunksize='auto'),
+                         list(map(sqr, list(range(1000)))))
+        self.assertEqual(pmap(sqr, [], chunksize='auto'), [])
+        tuples = list(zip(range(1000), range(999, -1, -1)))
+        self.assertEqual(self.pool.starmap(mul, tuples, chunksize='auto'),
+                         list(itertools.starmap(mul, tuples)))
+        res = self.pool.map_async(sqr, range(1000), chunksize='auto')
+        self.assertEqual(res.get(timeout=TIMEOUT2),
+                         list(map(sqr, list(range(1000)))))
+        with self.assertRaises(ValueError):
+            pmap(int, ['1'] * 100 + ['x'] + ['1'] * 100, chunksize='auto')
+
     def test_map_handle_iterable_exception(self):
         if self.TYPE == 'manager':
             self.skipTest('test not appropriate for {}'.format(self.TYPE))
@@ -2470,6 +2620,75 @@ def test_imap(self):
             self.assertEqual(next(it), i*i)
         self.assertRaises(StopIteration, it.__next__)
 
+    def test_imap_auto_chunksize(self):
+        it = self.pool.imap(sqr, iter(range(1000)), chunksize='auto')
+        self.assertEqual(list(it), list(map(sqr, list(range(1000)))))
+
+        it = self.pool.imap_unordered(sqr, iter(range(1000)),
+                                      chunksize='auto')
+        self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
+
+        it = self.pool.imap(sqr, iter([]), chunksize='auto')
+        self.assertRaises(StopIteration, it.__next__)
+
+        if self.TYPE != 'manager':
+            # SayWhenError seen at start of problematic chunk's results
+            it = self.pool.imap(sqr, exception_throwing_generator(100, 50),
+                                chunksize='auto')
+            results = []
+            with self.assertRaises(SayWhenError):
+                for x in it:
+                    results.append(x)
+            self.assertLessEqual(len(results), 50)
+            self.assertEqual(results, list(map(sqr, range(len(results)))))
+
+    def test_imap_auto_chunksize_slow_consumer(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        read = 0
+        def items(n):
+            nonlocal read
+            for i in range(n):
+                read += 1
+                yield i
+
+        def wait_read():
+            # Wait until the iterable is no longer read
+            deadline = time.monotonic() + support.SHORT_TIMEOUT
+            while True:
+                before = read
+                time.sleep(0.2)
+                if read == before:
+                    return read
+                if time.monotonic() > deadline:
+                    self.fail('the iterable is read ahead of the results')
+
+        # Only a few chunks are sent before their results are consumed,
+        # without holding up the other tasks of the pool
+        it = self.pool.imap(sqr, items(10**6), chunksize='auto')
+        self.assertEqual(next(it), 0)
+        self.assertLess(wait_read(), 10**6)
+        for i in range(1, 20):
+            self.assertEqual(self.pool.apply(sqr, (next(it),)), i**4)
+        self.assertLess(wait_read(), 10**6)
+
+        # Closing the pool sends the rest of the chunks
+        p = self.Pool(2)
+        try:
+            read = 0
+            it = p.imap_unordered(sqr, items(10000), chunksize='auto')
+            results = [next(it)]
+            self.assertLess(wait_read(), 10000)
+            p.close()
+            p.join()
+            self.assertEqual(read, 10000)
+            results.extend(it)
+            self.assertEqual(sorted(results), list(map(sqr, range(10000))))
+        finally:
+            p.terminate()
+            p.join()
+
     def test_imap_handle_iterable_exception(self):
         if self.TYPE == 'manager':
             self.skipTest('test not appropriate for {}'.format(self.TYPE))
@@ -3113,6 +3332,59 @@ def test_connection(self):
 
         p.join()
 
+    @classmethod
+    def _echo_objects(cls, conn):
+        for obj in iter(conn.recv, None):
+            conn.send(obj)
+        conn.close()
+
+    def test_send_out_of_band_buffers(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        conn, child_conn = self.Pipe()
+        p = self.Process(target=self._echo_objects, args=(child_conn,))
+        p.daemon = True
+        p.start()
+        child_conn.close()
+
+        big = bytearray(range(256)) * (4 * 1024 * 16)     # 16Mb
+        PickleBuffer = pickle.PickleBuffer
+        obj = [bytearray(b'x' * 100), PickleBuffer(big), 'text',
+               PickleBuffer(bytearray(100)), PickleBuffer(big[:100_000])]
+        conn.send(obj)
+        result = conn.recv()
+        self.assertEqual(result, [b'x' * 100, big, 'text', bytes(100),
+                                  big[:100_000]])
+        self.assertIsInstance(result[1], bytearray)
+
+        obj = [PickleBuffer(bytearray([i % 256]) * i)
+               for i in range(70_000, 70_000 + 200)]
+        conn.send(obj)
+        result = conn.recv()
+        self.assertEqual(result, [bytearray([i % 256]) * i
+                                  for i in range(70_000, 70_000 + 200)])
+
+        conn.send(None)
+        conn.close()
+        p.join()
+
+        a, b = self.Pipe()
+        with a, b, test.support.swap_attr(multiprocessing.connection,
+                                          'OOB_BUFFER_THRESHOLD', 0):
+            a.send([PickleBuffer(bytearray(b'abc')), PickleBuffer(b'')])
+            self.assertEqual(b.recv(), [b'abc', b''])
+            # A message with buffers cannot be received with recv_bytes()
+            if a._oob_buffers:
+                a.send(PickleBuffer(bytearray(b'abc')))
+                a.send_bytes(b'next')
+                self.assertRaisesRegex(OSError, 'bad message length',
+                                       b.recv_bytes)
+                # but it is still read entirely
+                fd = os.dup(b.fileno())
+                with multiprocessing.connection.Connection(fd) as c:
+                    self.assertEqual(c.recv_bytes(), b'next')
+
     def test_duplex_false(self):
         reader, writer = self.Pipe(duplex=False)
         self.assertEqual(writer.send(1), None)
@@ -3371,6 +3643,20 @@ def test_issue16955(self):
             c.close()
             l.close()
 
+    def test_no_out_of_band_buffers(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        # The other end of the connection may not support sending pickle
+        # buffers separately
+        data = bytearray(b'x' * 100_000)
+        for fam in self.connection.families:
+            l = self.connection.Listener(family=fam)
+            with l, self.connection.Client(l.address) as c, l.accept() as a:
+                self.assertFalse(a._oob_buffers)
+                self.assertFalse(c._oob_buffers)
+                c.send(data)
+                self.assertEqual(pickle.loads(a.recv_bytes()), data)
+
 class _TestPoll(BaseTestCase):
 
     ALLOWED_TYPES = ('processes', 'threads')
@@ -5366,6 +5652,46 @@ def is_alive(self):
             any(process.is_alive() for process in forked_processes))
 
 
+class TestChunkSizer(unittest.TestCase):
+
+    def test_grow(self):
+        sizer = multiprocessing.pool._ChunkSizer()
+        self.assertEqual(sizer.size, 1)
+        sizes = []
+        for i in range(20):
+            sizer.update(sizer.size, sizer.size * 1e-6, sizer.size * 1e-6)
+            sizes.append(sizer.size)
+        # The chunks double until running them takes the target duration
+        self.assertEqual(sizes[:5], [2, 4, 8, 16, 32])
+        self.assertEqual(sizes[-1], min(sizer.max_size,
+                                        int(sizer.target_duration / 1e-6)))
+
+    def test_slow_calls(self):
+        sizer = multiprocessing.pool._ChunkSizer()
+        for i in range(10):
+            sizer.update(sizer.size, sizer.size * 1.0, sizer.size * 1.0)
+            self.assertEqual(sizer.size, 1)
+
+    def test_overhead(self):
+        # The chunks run for much longer than the overhead of a chunk
+        sizer = multiprocessing.pool._ChunkSizer()
+        for i in range(20):
+            run_time = sizer.size * 1e-3
+            sizer.update(sizer.size, run_time, run_time + 0.05)
+        self.assertAlmostEqual(sizer.size, sizer.overhead_ratio * 0.05 / 1e-3,
+                               delta=1)
+
+    def test_shrink(self):
+        sizer = multiprocessing.pool._ChunkSizer()
+        for i in range(20):
+            sizer.update(sizer.size, sizer.size * 1e-5, sizer.size * 1e-5)
+        large = sizer.size
+        for i in range(20):
+            sizer.update(sizer.size, sizer.size * 1e-2, sizer.size * 1e-2)
+        self.assertLess(sizer.size, large)
+        self.assertEqual(sizer.size, 2)
+
+
 @hashlib_helper.requires_hashdigest('md5')
 class TestSyncManagerTypes(unittest.TestCase):
     """Test all the types which can be shared between a parent and a
@@ -5648,6 +5974,7 @@ class ProcessesMixin(BaseMixin):
     Pipe = staticmethod(multiprocessing.Pipe)
     Queue = staticmethod(multiprocessing.Queue)
     JoinableQueue = staticmethod(multiprocessing.JoinableQueue)
+    SharedMemoryQueue = staticmethod(multiprocessing.SharedMemoryQueue)
     Lock = staticmethod(multiprocessing.Lock)
     RLock = staticmethod(multiprocessing.RLock)
     Semaphore = staticmethod(multiprocessing.Semaphore)
@@ -80,6 +80,22 @@ def import_module(name, deprecated=False, *, required_on=()):
             raise unittest.SkipTest(str(msg))
 
 
+def _load_lazy_modules(name):
+    """Helper function to load a module and its submodules if they are
+    imported lazily (-X lazy_imports)"""
+    # loading a module can import more submodules
+    loaded = set()
+    while True:
+        modnames = [modname for modname in sys.modules
+                    if (modname == name or modname.startswith(name + '.'))
+                    and modname not in loaded]
+        if not modnames:
+            break
+        for modname in modnames:
+            getattr(sys.modules[modname], '__dict__', None)
+            loaded.add(modname)
+
+
 def _save_and_remove_module(name, orig_modules):
     """Helper function to save and remove a module from sys.modules
 
@@ -88,7 +104,11 @@ def _save_and_remove_module(name, orig_modules):
     # try to import the module and raise an error if it can't be imported
     if name not in sys.modules:
         __import__(name)
+        # load the module if it is imported lazily (-X lazy_imports)
+        sys.modules[name].__dict__
         del sys.modules[name]
+    # the modules must not import the modules which replace them later
+    _load_lazy_modules(name)
     for modname in list(sys.modules):
         if modname == name or modname.startswith(name + '.'):
             orig_modules[modname] = sys.modules[modname]
@@ -149,6 +169,8 @@ def import_fresh_module(name, fresh=(), blocked=(), deprecated=False):
                 if not _save_and_block_module(blocked_name, orig_modules):
                     names_to_remove.append(blocked_name)
             fresh_module = importlib.import_module(name)
+            # load the modules while sys.modules is still modified
+            _load_lazy_modules(name)
         except ImportError:
             fresh_module = None
         finally:
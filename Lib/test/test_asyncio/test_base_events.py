@@ -371,6 +371,103 @@ def test__run_once(self):
         self.assertEqual([h2], self.loop._scheduled)
         self.assertTrue(self.loop._process_events.called)
 
+    def test_timer_resolution(self):
+        self.assertIsNone(self.loop.get_timer_resolution())
+        self.loop.set_timer_resolution(0.01)
+        self.assertEqual(self.loop.get_timer_resolution(), 0.01)
+        self.loop.set_timer_resolution(None)
+        self.assertIsNone(self.loop.get_timer_resolution())
+        for resolution in (0, -1, float('nan')):
+            with self.assertRaises(ValueError):
+                self.loop.set_timer_resolution(resolution)
+
+    def test_set_timer_resolution_moves_timers(self):
+        h1 = self.loop.call_later(10, lambda: None)
+        h2 = self.loop.call_later(20, lambda: None)
+        h2.cancel()
+        self.loop.set_timer_resolution(0.01)
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        self.assertTrue(h1._scheduled)
+        self.assertFalse(h2._scheduled)
+        h3 = self.loop.call_later(5, lambda: None)
+        self.loop.set_timer_resolution(None)
+        self.assertEqual(self.loop._scheduled, [h3, h1])
+
+    def test_timer_wheel(self):
+        calls = []
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_resolution(0.001)
+        self.loop.call_later(-1, calls.append, 'a')
+        self.loop.call_later(-2, calls.append, 'b')
+        h = self.loop.call_later(-3, calls.append, 'c')
+        self.loop.call_later(3600, calls.append, 'd')
+        h.cancel()
+        self.assertEqual(len(self.loop._timer_wheel), 3)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, ['b', 'a'])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+        self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(0 < t <= 3600, t)
+
+    def test_reschedule(self):
+        calls = []
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_resolution(0.001)
+        h1 = self.loop.call_later(3600, calls.append, 1)
+        h2 = self.loop.call_later(3600, calls.append, 2)
+        h3 = self.loop.call_later(-1, calls.append, 3)
+        h3.reschedule(self.loop.time() + 3600)
+        h1.reschedule(self.loop.time() - 1)
+        self.assertEqual(h1.when(), h1._when)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [1])
+        self.assertFalse(h1._scheduled)
+
+        # A handle which has been run is scheduled again.
+        h1.reschedule(self.loop.time() - 1)
+        self.assertTrue(h1._scheduled)
+        h2.reschedule(self.loop.time() - 2)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [1, 2, 1])
+
+        # A handle which is due but has not been run yet is only called
+        # at its new time.
+        def reschedule_h5():
+            calls.append(4)
+            h5.reschedule(self.loop.time() + 3600)
+        h4 = self.loop.call_later(-2, reschedule_h5)
+        h5 = self.loop.call_later(-1, calls.append, 5)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [1, 2, 1, 4])
+        self.assertTrue(h5._scheduled)
+        h5.reschedule(self.loop.time() - 1)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [1, 2, 1, 4, 5])
+
+        # It is called once if its new time has come too.
+        def reschedule_h7():
+            calls.append(6)
+            h7.reschedule(self.loop.time() - 1)
+        h6 = self.loop.call_later(-2, reschedule_h7)
+        h7 = self.loop.call_later(-1, calls.append, 7)
+        test_utils.run_briefly(self.loop)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [1, 2, 1, 4, 5, 6, 7])
+
+        h3.cancel()
+        with self.assertRaisesRegex(RuntimeError, 'cancelled'):
+            h3.reschedule(self.loop.time())
+
+    def test_reschedule_heap(self):
+        h = self.loop.call_later(3600, lambda: None)
+        with self.assertRaisesRegex(RuntimeError, 'timer wheel'):
+            h.reschedule(self.loop.time())
+        self.assertEqual(h.when(), h._when)
+        self.assertIs(self.loop._scheduled[0], h)
+
     def test_set_debug(self):
         self.loop.set_debug(True)
         self.assertTrue(self.loop.get_debug())
@@ -994,6 +1091,81 @@ def test_asyncgen_finalization_by_gc_in_other_thread(self):
             self.assertTrue(status['finalized'])
 
 
+class TimerWheelTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = mock.Mock()
+        self.loop.get_debug.return_value = False
+
+    def handle(self, when):
+        return asyncio.TimerHandle(when, lambda: None, (), self.loop)
+
+    def test_pop_due(self):
+        wheel = base_events._TimerWheel(0.001, 100.0)
+        whens = [100.0, 100.0005, 100.002, 100.01, 100.5, 101, 104.2,
+                 200, 5000, 100000, 50000000, float('inf'), 99]
+        handles = [self.handle(when) for when in whens]
+        for handle in reversed(handles):
+            wheel.add(handle)
+        self.assertEqual(len(wheel), len(handles))
+        self.assertEqual(wheel.pop_due(99.5), [handles[-1]])
+        self.assertEqual(wheel.pop_due(100.0), [])
+        due = wheel.pop_due(100.0007)
+        self.assertEqual(due, handles[:2])
+        self.assertEqual(wheel.pop_due(100.0007), [])
+        self.assertEqual(wheel.pop_due(150), handles[2:7])
+        self.assertEqual(wheel.pop_due(10**6), handles[7:10])
+        self.assertEqual(wheel.pop_due(10**9), handles[10:11])
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.clear(), [handles[11]])
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_deadline())
+
+    def test_order(self):
+        wheel = base_events._TimerWheel(0.01, 0)
+        whens = [(i * 7919) % 10007 / 100 for i in range(2000)]
+        handles = [self.handle(when) for when in whens]
+        for handle in handles:
+            wheel.add(handle)
+        due = []
+        now = 0
+        while len(wheel):
+            deadline = wheel.next_deadline()
+            self.assertGreaterEqual(deadline, now - 0.01)
+            now = max(now, deadline)
+            due.extend(wheel.pop_due(now + 1e-9))
+        self.assertEqual([h.when() for h in due], sorted(whens))
+
+    def test_next_deadline(self):
+        wheel = base_events._TimerWheel(0.001, 0)
+        self.assertIsNone(wheel.next_deadline())
+        wheel.add(self.handle(0.0105))
+        self.assertEqual(wheel.next_deadline(), 0.0105)
+        wheel.add(self.handle(0.0005))
+        self.assertEqual(wheel.next_deadline(), 0.0005)
+        wheel = base_events._TimerWheel(0.001, 0)
+        # The first slot of level 1 is reached after 64 ticks.
+        wheel.add(self.handle(0.1))
+        self.assertEqual(wheel.next_deadline(), 0.064)
+        self.assertEqual(wheel.pop_due(0.064), [])
+        self.assertEqual(wheel.next_deadline(), 0.1)
+
+    def test_remove_and_move(self):
+        wheel = base_events._TimerWheel(0.001, 0)
+        h1 = self.handle(1)
+        h2 = self.handle(2)
+        wheel.add(h1)
+        wheel.add(h2)
+        wheel.remove(h1)
+        wheel.move(h2, 0.5)
+        self.assertEqual(h2.when(), 0.5)
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.pop_due(3), [h2])
+        with self.assertRaises(KeyError):
+            wheel.remove(h1)
+
+
 class MyProto(asyncio.Protocol):
     done = None
 
@@ -1932,6 +2104,82 @@ async def stop_loop_coro(loop):
                          "^Executing <Task.*stop_loop_coro.*> "
                          "took .* seconds$")
 
+    @mock.patch('asyncio.base_events.logger')
+    def test_log_slow_callbacks_profiling(self, m_logger):
+        self.loop.set_debug(True)
+        self.loop.set_profiling(True)
+        self.loop.slow_callback_duration = 0.0
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        fmt, *args = m_logger.warning.call_args[0]
+        self.assertRegex(fmt % tuple(args),
+                         "^Executing <Handle.*stop.*> took .* seconds$")
+
+    def test_profiling(self):
+        def busy(duration):
+            end = time.perf_counter() + duration
+            while time.perf_counter() < end:
+                pass
+
+        async def light():
+            await asyncio.sleep(0)
+
+        async def heavy():
+            for i in range(3):
+                busy(0.01)
+                await asyncio.sleep(0)
+
+        self.assertFalse(self.loop.get_profiling())
+        with self.assertRaises(RuntimeError):
+            self.loop.get_profile()
+        pending = self.loop.create_task(asyncio.sleep(3600))
+        self.loop.set_profiling(True)
+        self.assertTrue(self.loop.get_profiling())
+        self.assertTrue(pending._profiling)
+
+        async def main():
+            tasks = [self.loop.create_task(heavy()),
+                     self.loop.create_task(light())]
+            self.loop.call_soon(busy, 0.02)
+            # Let the tasks run their first step and busy() run.
+            await asyncio.sleep(0)
+            profile = self.loop.get_profile(2)
+            await asyncio.gather(*tasks)
+            return tasks, profile
+
+        (heavy_task, light_task), profile = self.loop.run_until_complete(
+            main())
+        self.assertEqual(len(profile.tasks), 2)
+        task_profile = profile.tasks[0]
+        self.assertIs(task_profile.task, heavy_task)
+        self.assertEqual(task_profile.steps, 1)
+        self.assertGreaterEqual(task_profile.run_time, 0.01)
+        self.assertGreater(task_profile.cpu_time, 0)
+        self.assertEqual(profile.callbacks[0].name, busy.__qualname__)
+        self.assertEqual(profile.callbacks[0].calls, 1)
+        self.assertGreaterEqual(profile.callbacks[0].run_time, 0.02)
+        self.assertGreater(profile.polls, 0)
+        self.assertGreater(profile.poll_time, 0)
+
+        # Finished tasks are still accounted under their coroutine.
+        self.assertEqual(heavy_task._steps, 4)
+        profile = self.loop.get_profile()
+        self.assertNotIn(heavy_task, [p.task for p in profile.tasks])
+        callbacks = {p.name: p for p in profile.callbacks}
+        self.assertEqual(
+            callbacks[heavy.__qualname__].calls, 4)
+        self.assertGreaterEqual(
+            callbacks[heavy.__qualname__].run_time, 0.03)
+        self.assertEqual(callbacks[light.__qualname__].calls, 2)
+
+        self.loop.set_profiling(False)
+        self.assertFalse(pending._profiling)
+        self.assertEqual(pending._steps, 1)
+        pending.cancel()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(pending.cancelled())
+        self.assertEqual(pending._steps, 1)
+
 
 class RunningLoopTests(unittest.TestCase):
 
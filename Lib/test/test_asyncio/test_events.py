@@ -27,10 +27,15 @@
     import tty
 
 import asyncio
+from asyncio import base_events
 from asyncio import coroutines
 from asyncio import events
 from asyncio import proactor_events
 from asyncio import selector_events
+try:
+    from asyncio import uring_events
+except ImportError:
+    uring_events = None
 from test.test_asyncio import utils as test_utils
 from test import support
 from test.support import socket_helper
@@ -2101,12 +2106,84 @@ class SelectEventLoopTests(UnixEventLoopTestsMixin,
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
 
+    if uring_events is not None:
+        @test_utils.requires_uring
+        class UringEventLoopTests(EventLoopTestsMixin,
+                                  test_utils.TestCase):
+
+            def create_event_loop(self):
+                return uring_events.UringEventLoop()
+
+            def test_reader_callback(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_reader()")
+
+            def test_reader_callback_cancel(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_reader()")
+
+            def test_writer_callback(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_writer()")
+
+            def test_writer_callback_cancel(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_writer()")
+
+            def test_remove_fds_after_closing(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_reader()")
+
+            def test_add_signal_handler(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_signal_handler()")
+
+            def test_read_pty_output(self):
+                raise unittest.SkipTest("UringEventLoop does not support PTYs")
+
+            def test_write_pty(self):
+                raise unittest.SkipTest("UringEventLoop does not support PTYs")
+
+            def test_bidirectional_pty(self):
+                raise unittest.SkipTest("UringEventLoop does not support PTYs")
+
+            def test_write_pipe(self):
+                raise unittest.SkipTest("UringEventLoop only submits writes "
+                                        "when the loop runs")
+
+            def test_unclosed_pipe_transport(self):
+                raise unittest.SkipTest("UringEventLoop uses proactor "
+                                        "pipe transports")
+
+            def test_signal_handling_while_selecting(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_signal_handler()")
+
+            def test_signal_handling_args(self):
+                raise unittest.SkipTest("UringEventLoop does not have add_signal_handler()")
+
+            def test_create_unix_connection(self):
+                raise unittest.SkipTest("UringEventLoop does not support Unix sockets")
+
+            def test_create_ssl_unix_connection(self):
+                raise unittest.SkipTest("UringEventLoop does not support Unix sockets")
+
+            def test_create_unix_server(self):
+                raise unittest.SkipTest("UringEventLoop does not support Unix sockets")
+
+            def test_create_unix_server_path_socket_error(self):
+                raise unittest.SkipTest("UringEventLoop does not support Unix sockets")
+
+            def test_create_unix_server_ssl(self):
+                raise unittest.SkipTest("UringEventLoop does not support Unix sockets")
+
+            def test_create_unix_server_ssl_verified(self):
+                raise unittest.SkipTest("UringEventLoop does not support Unix sockets")
+
+            def test_create_unix_server_ssl_verify_failed(self):
+                raise unittest.SkipTest("UringEventLoop does not support Unix sockets")
+
 
 def noop(*args, **kwargs):
     pass
 
 
-class HandleTests(test_utils.TestCase):
+class HandleTestsMixin:
+
+    Handle = None
 
     def setUp(self):
         super().setUp()
@@ -2118,7 +2195,7 @@ def callback(*args):
             return args
 
         args = ()
-        h = asyncio.Handle(callback, args, self.loop)
+        h = self.Handle(callback, args, self.loop)
         self.assertIs(h._callback, callback)
         self.assertIs(h._args, args)
         self.assertFalse(h.cancelled())
@@ -2133,7 +2210,7 @@ def callback():
         self.loop = mock.Mock()
         self.loop.call_exception_handler = mock.Mock()
 
-        h = asyncio.Handle(callback, (), self.loop)
+        h = self.Handle(callback, (), self.loop)
         h._run()
 
         self.loop.call_exception_handler.assert_called_with({
@@ -2145,14 +2222,14 @@ def callback():
 
     def test_handle_weakref(self):
         wd = weakref.WeakValueDictionary()
-        h = asyncio.Handle(lambda: None, (), self.loop)
+        h = self.Handle(lambda: None, (), self.loop)
         wd['h'] = h  # Would fail without __weakref__ slot.
 
     def test_handle_repr(self):
         self.loop.get_debug.return_value = False
 
         # simple function
-        h = asyncio.Handle(noop, (1, 2), self.loop)
+        h = self.Handle(noop, (1, 2), self.loop)
         filename, lineno = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<Handle noop(1, 2) at %s:%s>'
@@ -2165,33 +2242,33 @@ def test_handle_repr(self):
 
         # decorated function
         cb = types.coroutine(noop)
-        h = asyncio.Handle(cb, (), self.loop)
+        h = self.Handle(cb, (), self.loop)
         self.assertEqual(repr(h),
                         '<Handle noop() at %s:%s>'
                         % (filename, lineno))
 
         # partial function
         cb = functools.partial(noop, 1, 2)
-        h = asyncio.Handle(cb, (3,), self.loop)
+        h = self.Handle(cb, (3,), self.loop)
         regex = (r'^<Handle noop\(1, 2\)\(3\) at %s:%s>$'
                  % (re.escape(filename), lineno))
         self.assertRegex(repr(h), regex)
 
         # partial function with keyword args
         cb = functools.partial(noop, x=1)
-        h = asyncio.Handle(cb, (2, 3), self.loop)
+        h = self.Handle(cb, (2, 3), self.loop)
         regex = (r'^<Handle noop\(x=1\)\(2, 3\) at %s:%s>$'
                  % (re.escape(filename), lineno))
         self.assertRegex(repr(h), regex)
 
         # partial method
         if sys.version_info >= (3, 4):
-            method = HandleTests.test_handle_repr
+            method = HandleTestsMixin.test_handle_repr
             cb = functools.partialmethod(method)
             filename, lineno = test_utils.get_function_source(method)
-            h = asyncio.Handle(cb, (), self.loop)
+            h = self.Handle(cb, (), self.loop)
 
-            cb_regex = r'<function HandleTests.test_handle_repr .*>'
+            cb_regex = r'<function HandleTestsMixin.test_handle_repr .*>'
             cb_regex = (r'functools.partialmethod\(%s, , \)\(\)' % cb_regex)
             regex = (r'^<Handle %s at %s:%s>$'
                      % (cb_regex, re.escape(filename), lineno))
@@ -2203,7 +2280,7 @@ def test_handle_repr_debug(self):
         # simple function
         create_filename = __file__
         create_lineno = sys._getframe().f_lineno + 1
-        h = asyncio.Handle(noop, (1, 2), self.loop)
+        h = self.Handle(noop, (1, 2), self.loop)
         filename, lineno = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<Handle noop(1, 2) at %s:%s created at %s:%s>'
@@ -2286,7 +2363,10 @@ def test_coroutine_like_object_debug_formatting(self):
         self.assertEqual(coroutines._format_coroutine(coro), 'AAA()')
 
 
-class TimerTests(unittest.TestCase):
+class TimerTestsMixin:
+
+    Handle = None
+    TimerHandle = None
 
     def setUp(self):
         super().setUp()
@@ -2294,23 +2374,42 @@ def setUp(self):
 
     def test_hash(self):
         when = time.monotonic()
-        h = asyncio.TimerHandle(when, lambda: False, (),
-                                mock.Mock())
+        h = self.TimerHandle(when, lambda: False, (),
+                             mock.Mock())
         self.assertEqual(hash(h), hash(when))
 
     def test_when(self):
         when = time.monotonic()
-        h = asyncio.TimerHandle(when, lambda: False, (),
-                                mock.Mock())
+        h = self.TimerHandle(when, lambda: False, (),
+                             mock.Mock())
         self.assertEqual(when, h.when())
 
+    def test_reschedule(self):
+        when = time.monotonic()
+        h = self.TimerHandle(when, lambda: False, (), self.loop)
+        self.assertIsNone(h.reschedule(when + 10))
+        self.loop._timer_handle_rescheduled.assert_called_once_with(
+            h, when + 10)
+
+        h.cancel()
+        with self.assertRaisesRegex(RuntimeError, 'cancelled'):
+            h.reschedule(when)
+        self.assertEqual(self.loop._timer_handle_rescheduled.call_count, 1)
+
+    def test_run_clears_due(self):
+        h = self.TimerHandle(time.monotonic(), lambda: None, (), self.loop)
+        self.assertFalse(h._due)
+        h._due = True
+        h._run()
+        self.assertFalse(h._due)
+
     def test_timer(self):
         def callback(*args):
             return args
 
         args = (1, 2, 3)
         when = time.monotonic()
-        h = asyncio.TimerHandle(when, callback, args, mock.Mock())
+        h = self.TimerHandle(when, callback, args, mock.Mock())
         self.assertIs(h._callback, callback)
         self.assertIs(h._args, args)
         self.assertFalse(h.cancelled())
@@ -2323,14 +2422,14 @@ def callback(*args):
 
         # when cannot be None
         self.assertRaises(AssertionError,
-                          asyncio.TimerHandle, None, callback, args,
+                          self.TimerHandle, None, callback, args,
                           self.loop)
 
     def test_timer_repr(self):
         self.loop.get_debug.return_value = False
 
         # simple function
-        h = asyncio.TimerHandle(123, noop, (), self.loop)
+        h = self.TimerHandle(123, noop, (), self.loop)
         src = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<TimerHandle when=123 noop() at %s:%s>' % src)
@@ -2346,7 +2445,7 @@ def test_timer_repr_debug(self):
         # simple function
         create_filename = __file__
         create_lineno = sys._getframe().f_lineno + 1
-        h = asyncio.TimerHandle(123, noop, (), self.loop)
+        h = self.TimerHandle(123, noop, (), self.loop)
         filename, lineno = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<TimerHandle when=123 noop() '
@@ -2367,8 +2466,8 @@ def callback(*args):
 
         when = time.monotonic()
 
-        h1 = asyncio.TimerHandle(when, callback, (), self.loop)
-        h2 = asyncio.TimerHandle(when, callback, (), self.loop)
+        h1 = self.TimerHandle(when, callback, (), self.loop)
+        h2 = self.TimerHandle(when, callback, (), self.loop)
         # TODO: Use assertLess etc.
         self.assertFalse(h1 < h2)
         self.assertFalse(h2 < h1)
@@ -2384,8 +2483,8 @@ def callback(*args):
         h2.cancel()
         self.assertFalse(h1 == h2)
 
-        h1 = asyncio.TimerHandle(when, callback, (), self.loop)
-        h2 = asyncio.TimerHandle(when + 10.0, callback, (), self.loop)
+        h1 = self.TimerHandle(when, callback, (), self.loop)
+        h2 = self.TimerHandle(when + 10.0, callback, (), self.loop)
         self.assertTrue(h1 < h2)
         self.assertFalse(h2 < h1)
         self.assertTrue(h1 <= h2)
@@ -2397,7 +2496,7 @@ def callback(*args):
         self.assertFalse(h1 == h2)
         self.assertTrue(h1 != h2)
 
-        h3 = asyncio.Handle(callback, (), self.loop)
+        h3 = self.Handle(callback, (), self.loop)
         self.assertIs(NotImplemented, h1.__eq__(h3))
         self.assertIs(NotImplemented, h1.__ne__(h3))
 
@@ -2424,6 +2523,104 @@ def callback(*args):
         self.assertTrue(h1 >= SMALLEST)
 
 
+class PyHandleTests(HandleTestsMixin, test_utils.TestCase):
+
+    Handle = events._PyHandle
+
+
+@unittest.skipUnless(hasattr(events, '_CHandle'),
+                     'requires the C _asyncio module')
+class CHandleTests(HandleTestsMixin, test_utils.TestCase):
+
+    Handle = getattr(events, '_CHandle', None)
+
+
+class PyTimerTests(TimerTestsMixin, unittest.TestCase):
+
+    Handle = events._PyHandle
+    TimerHandle = events._PyTimerHandle
+
+
+@unittest.skipUnless(hasattr(events, '_CTimerHandle'),
+                     'requires the C _asyncio module')
+class CTimerTests(TimerTestsMixin, unittest.TestCase):
+
+    Handle = getattr(events, '_CHandle', None)
+    TimerHandle = getattr(events, '_CTimerHandle', None)
+
+
+class RunReadyTestsMixin:
+
+    Handle = None
+    run_ready = None
+
+    def setUp(self):
+        super().setUp()
+        self.loop = mock.Mock()
+        self.loop.get_debug.return_value = False
+
+    def test_run_ready(self):
+        calls = []
+        ready = collections.deque()
+        ready.append(self.Handle(calls.append, (1,), self.loop))
+        cancelled = self.Handle(calls.append, (2,), self.loop)
+        cancelled.cancel()
+        ready.append(cancelled)
+        ready.append(self.Handle(calls.append, (3,), self.loop))
+        ready.append(self.Handle(calls.append, (4,), self.loop))
+        self.run_ready(ready, 3)
+        self.assertEqual(calls, [1, 3])
+        self.assertEqual(len(ready), 1)
+
+    def test_run_ready_appended(self):
+        # Callbacks scheduled while running are left for the next iteration.
+        calls = []
+        ready = collections.deque()
+
+        def callback(arg):
+            calls.append(arg)
+            ready.append(self.Handle(calls.append, (arg + 1,), self.loop))
+
+        ready.append(self.Handle(callback, (1,), self.loop))
+        self.run_ready(ready, len(ready))
+        self.assertEqual(calls, [1])
+        self.assertEqual(len(ready), 1)
+
+    def test_run_ready_exception(self):
+        def callback():
+            raise ValueError
+
+        ready = collections.deque([self.Handle(callback, (), self.loop)])
+        self.run_ready(ready, 1)
+        self.loop.call_exception_handler.assert_called_once()
+
+    def test_run_ready_subclass(self):
+        calls = []
+
+        class MyHandle(self.Handle):
+            def _run(self):
+                calls.append('run')
+                super()._run()
+
+        ready = collections.deque([MyHandle(calls.append, (1,), self.loop)])
+        self.run_ready(ready, 1)
+        self.assertEqual(calls, ['run', 1])
+
+
+class PyRunReadyTests(RunReadyTestsMixin, unittest.TestCase):
+
+    Handle = events._PyHandle
+    run_ready = staticmethod(base_events._py__run_ready)
+
+
+@unittest.skipUnless(hasattr(base_events, '_c__run_ready'),
+                     'requires the C _asyncio module')
+class CRunReadyTests(RunReadyTestsMixin, unittest.TestCase):
+
+    Handle = getattr(events, '_CHandle', None)
+    run_ready = staticmethod(getattr(base_events, '_c__run_ready', None))
+
+
 class AbstractEventLoopTests(unittest.TestCase):
 
     def test_not_implemented(self):
@@ -2451,6 +2648,10 @@ def test_not_implemented(self):
             NotImplementedError, loop.call_soon, None)
         self.assertRaises(
             NotImplementedError, loop.time)
+        self.assertRaises(
+            NotImplementedError, loop.get_timer_resolution)
+        self.assertRaises(
+            NotImplementedError, loop.set_timer_resolution, f)
         self.assertRaises(
             NotImplementedError, loop.call_soon_threadsafe, None)
         self.assertRaises(
@@ -1,9 +1,11 @@
 """Tests for queues.py"""
 
+import threading
 import unittest
 from unittest import mock
 
 import asyncio
+from test import support
 from test.test_asyncio import utils as test_utils
 
 
@@ -673,5 +675,153 @@ class PriorityQueueJoinTests(_QueueJoinTestMixin, _QueueTestBase):
     q_class = asyncio.PriorityQueue
 
 
+class ThreadSafeQueueTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def test_nowait(self):
+        q = asyncio.ThreadSafeQueue(maxsize=2)
+        self.assertTrue(q.empty())
+        self.assertEqual(q.maxsize, 2)
+        q.put_nowait(1)
+        q.put_nowait(2)
+        self.assertTrue(q.full())
+        self.assertEqual(q.qsize(), 2)
+        self.assertRaises(asyncio.QueueFull, q.put_nowait, 3)
+        self.assertIn('maxsize=2 _queue=[1, 2]', repr(q))
+        self.assertEqual(q.get_nowait(), 1)
+        self.assertEqual(q.get_nowait(), 2)
+        self.assertRaises(asyncio.QueueEmpty, q.get_nowait)
+        self.assertFalse(asyncio.ThreadSafeQueue().full())
+
+    def test_get_many_put_many(self):
+        q = asyncio.ThreadSafeQueue(maxsize=3)
+
+        async def consume():
+            batches = []
+            while sum(map(len, batches)) < 10:
+                batches.append(await q.get_many(2))
+            return batches
+
+        async def main():
+            consumer = asyncio.create_task(consume())
+            await q.put_many(range(10))
+            return await consumer
+
+        batches = self.loop.run_until_complete(main())
+        self.assertTrue(all(1 <= len(batch) <= 2 for batch in batches))
+        self.assertEqual(sum(batches, []), list(range(10)))
+        self.assertTrue(q.empty())
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(q.get_many(0))
+
+    def test_coalesced_wakeups(self):
+        q = asyncio.ThreadSafeQueue()
+        tasks = [self.loop.create_task(q.get()) for _ in range(2)]
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(len(q._getters), 2)
+
+        # The loop is not running in this thread: the queue wakes up the
+        # getters with call_soon_threadsafe(), once for all of them.
+        with mock.patch.object(self.loop, 'call_soon_threadsafe',
+                               wraps=self.loop.call_soon_threadsafe) as m:
+            q.put_sync('a')
+            q.put_sync('b')
+            q.put_many_sync('cd')
+        self.assertEqual(m.call_count, 1)
+        results = self.loop.run_until_complete(asyncio.gather(*tasks))
+        self.assertEqual(results, ['a', 'b'])
+        self.assertEqual(q.get_many_sync(10), ['c', 'd'])
+
+    def test_cancelled_getter_passes_wakeup(self):
+        q = asyncio.ThreadSafeQueue()
+        t1 = self.loop.create_task(q.get())
+        t2 = self.loop.create_task(q.get())
+        test_utils.run_briefly(self.loop)
+        q.put_sync('a')
+        t1.cancel()
+        self.assertEqual(self.loop.run_until_complete(t2), 'a')
+        self.assertTrue(t1.cancelled())
+        self.assertFalse(q._getters)
+        self.assertFalse(q._wakeups)
+
+    def test_cancelled_putter(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        q.put_nowait(0)
+        t1 = self.loop.create_task(q.put(1))
+        t2 = self.loop.create_task(q.put(2))
+        test_utils.run_briefly(self.loop)
+        t1.cancel()
+        self.assertEqual(q.get_sync(), 0)
+        self.loop.run_until_complete(t2)
+        self.assertTrue(t1.cancelled())
+        self.assertEqual(q.get_nowait(), 2)
+
+    def test_sync_timeout(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        with self.assertRaises(asyncio.QueueEmpty):
+            q.get_sync(timeout=0.01)
+        q.put_sync(1, timeout=0)
+        with self.assertRaises(asyncio.QueueFull):
+            q.put_sync(2, timeout=0.01)
+        self.assertEqual(q.get_many_sync(5, timeout=0), [1])
+
+        q = asyncio.ThreadSafeQueue(maxsize=2)
+        with self.assertRaises(asyncio.QueueFull):
+            q.put_many_sync(range(5), timeout=0.01)
+        self.assertEqual(q.get_many_sync(5, timeout=0), [0, 1])
+        q.put_many_sync('ab', timeout=0)
+        self.assertEqual(q.get_many_sync(5), ['a', 'b'])
+
+    def test_threads(self):
+        q = asyncio.ThreadSafeQueue(maxsize=10)
+        results = asyncio.ThreadSafeQueue()
+
+        def produce():
+            q.put_many_sync(range(50))
+            for i in range(50, 100):
+                q.put_sync(i)
+
+        def consume():
+            items = []
+            while len(items) < 100:
+                items += q.get_many_sync(7, timeout=support.SHORT_TIMEOUT)
+            results.put_sync(items)
+
+        async def relay(loop_q):
+            # Forward the items from a coroutine of another loop.
+            for _ in range(100):
+                await loop_q.put(await q.get())
+
+        relay_q = asyncio.ThreadSafeQueue(maxsize=5)
+        threads = [threading.Thread(target=produce),
+                   threading.Thread(target=asyncio.run,
+                                    args=(relay(relay_q),))]
+        for thread in threads:
+            thread.start()
+
+        async def main():
+            items = []
+            while len(items) < 100:
+                items += await relay_q.get_many(10)
+            return items
+
+        try:
+            items = self.loop.run_until_complete(main())
+        finally:
+            for thread in threads:
+                thread.join()
+        self.assertEqual(items, list(range(100)))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        q.put_many_sync(range(100))
+        consumer.join()
+        self.assertEqual(results.get_sync(timeout=0), list(range(100)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import collections
 import selectors
 import socket
 import unittest
@@ -10,6 +11,8 @@
     ssl = None
 
 import asyncio
+from asyncio import constants
+from asyncio import selector_events
 from asyncio.selector_events import BaseSelectorEventLoop
 from asyncio.selector_events import _SelectorTransport
 from asyncio.selector_events import _SelectorSocketTransport
@@ -39,6 +42,10 @@ def list_to_buffer(l=()):
     return bytearray().join(l)
 
 
+requires_sendmsg = unittest.skipUnless(selector_events._HAS_SENDMSG,
+                                       'requires socket.sendmsg()')
+
+
 def close_transport(transport):
     # Don't call transport.close() because the event loop and the selector
     # are mocked
@@ -509,6 +516,18 @@ def setUp(self):
         self.sock = mock.Mock(socket.socket)
         self.sock_fd = self.sock.fileno.return_value = 7
 
+    def set_recv_data(self, *chunks):
+        chunks = list(chunks)
+
+        def recv_into(buf, nbytes=0):
+            if not chunks:
+                raise BlockingIOError
+            data = chunks.pop(0)
+            buf[:len(data)] = data
+            return len(data)
+
+        self.sock.recv_into.side_effect = recv_into
+
     def socket_transport(self, waiter=None):
         transport = _SelectorSocketTransport(self.loop, self.sock,
                                              self.protocol, waiter=waiter)
@@ -563,7 +582,7 @@ def test_read_eof_received_error(self):
 
         self.protocol.eof_received.side_effect = LookupError()
 
-        self.sock.recv.return_value = b''
+        self.sock.recv_into.return_value = 0
         transport._read_ready()
 
         self.protocol.eof_received.assert_called_with()
@@ -576,7 +595,7 @@ def test_data_received_error(self):
         self.loop.call_exception_handler = mock.Mock()
         self.protocol.data_received.side_effect = LookupError()
 
-        self.sock.recv.return_value = b'data'
+        self.set_recv_data(b'data')
         transport._read_ready()
 
         self.assertTrue(transport._fatal_error.called)
@@ -585,16 +604,78 @@ def test_data_received_error(self):
     def test_read_ready(self):
         transport = self.socket_transport()
 
-        self.sock.recv.return_value = b'data'
+        self.set_recv_data(b'data')
         transport._read_ready()
 
         self.protocol.data_received.assert_called_with(b'data')
 
+    def test_read_ready_bytes(self):
+        transport = self.socket_transport()
+
+        self.set_recv_data(b'data')
+        transport._read_ready()
+
+        data = self.protocol.data_received.call_args[0][0]
+        self.assertIs(type(data), bytes)
+
+    def test_read_ready_memoryview(self):
+        received = []
+
+        class Protocol(asyncio.Protocol):
+            data_received_memoryview = True
+
+            def data_received(self, data):
+                received.append(data)
+
+        self.protocol = Protocol()
+        transport = self.socket_transport()
+
+        self.set_recv_data(b'data')
+        transport._read_ready()
+
+        self.assertEqual(len(received), 1)
+        self.assertIsInstance(received[0], memoryview)
+        self.assertEqual(received[0], b'data')
+
+    def test_read_ready_shared_buffer(self):
+        transport = self.socket_transport()
+        self.set_recv_data(b'data')
+        transport._read_ready()
+        buf = self.sock.recv_into.call_args[0][0]
+        self.assertIs(buf, self.loop._get_read_buffer(transport.max_size))
+
+    def test_read_ready_drain(self):
+        transport = self.socket_transport()
+        transport.max_size = 4
+
+        self.set_recv_data(b'data', b'more', b'end')
+        transport._read_ready()
+        self.assertEqual(self.protocol.data_received.call_args_list,
+                         [mock.call(b'data'), mock.call(b'more'),
+                          mock.call(b'end')])
+
+        # Reads are bounded.
+        self.protocol.data_received.reset_mock()
+        self.set_recv_data(*[b'data'] * (constants.MAX_READS_PER_EVENT + 1))
+        transport._read_ready()
+        self.assertEqual(self.protocol.data_received.call_count,
+                         constants.MAX_READS_PER_EVENT)
+
+    def test_read_ready_drain_paused(self):
+        transport = self.socket_transport()
+        transport.max_size = 4
+        self.protocol.data_received.side_effect = (
+            lambda data: transport.pause_reading())
+
+        self.set_recv_data(b'data', b'more')
+        transport._read_ready()
+        self.protocol.data_received.assert_called_once_with(b'data')
+
     def test_read_ready_eof(self):
         transport = self.socket_transport()
         transport.close = mock.Mock()
 
-        self.sock.recv.return_value = b''
+        self.sock.recv_into.return_value = 0
         transport._read_ready()
 
         self.protocol.eof_received.assert_called_with()
@@ -604,7 +685,7 @@ def test_read_ready_eof_keep_open(self):
         transport = self.socket_transport()
         transport.close = mock.Mock()
 
-        self.sock.recv.return_value = b''
+        self.sock.recv_into.return_value = 0
         self.protocol.eof_received.return_value = True
         transport._read_ready()
 
@@ -613,7 +694,7 @@ def test_read_ready_eof_keep_open(self):
 
     @mock.patch('logging.exception')
     def test_read_ready_tryagain(self, m_exc):
-        self.sock.recv.side_effect = BlockingIOError
+        self.sock.recv_into.side_effect = BlockingIOError
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
@@ -623,7 +704,7 @@ def test_read_ready_tryagain(self, m_exc):
 
     @mock.patch('logging.exception')
     def test_read_ready_tryagain_interrupted(self, m_exc):
-        self.sock.recv.side_effect = InterruptedError
+        self.sock.recv_into.side_effect = InterruptedError
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
@@ -633,7 +714,7 @@ def test_read_ready_tryagain_interrupted(self, m_exc):
 
     @mock.patch('logging.exception')
     def test_read_ready_conn_reset(self, m_exc):
-        err = self.sock.recv.side_effect = ConnectionResetError()
+        err = self.sock.recv_into.side_effect = ConnectionResetError()
 
         transport = self.socket_transport()
         transport._force_close = mock.Mock()
@@ -643,7 +724,7 @@ def test_read_ready_conn_reset(self, m_exc):
 
     @mock.patch('logging.exception')
     def test_read_ready_err(self, m_exc):
-        err = self.sock.recv.side_effect = OSError()
+        err = self.sock.recv_into.side_effect = OSError()
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
@@ -680,17 +761,17 @@ def test_write_memoryview(self):
 
     def test_write_no_data(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(collections.deque([b'data']), transport._buffer)
 
     def test_write_buffer(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data1')
+        transport._buffer.append(b'data1')
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+        self.assertEqual(collections.deque([b'data1', b'data2']),
                          transport._buffer)
 
     def test_write_partial(self):
@@ -701,7 +782,7 @@ def test_write_partial(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(collections.deque([b'ta']), transport._buffer)
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -711,7 +792,7 @@ def test_write_partial_bytearray(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(collections.deque([b'ta']), transport._buffer)
         self.assertEqual(data, bytearray(b'data'))  # Hasn't been mutated.
 
     def test_write_partial_memoryview(self):
@@ -722,7 +803,7 @@ def test_write_partial_memoryview(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(collections.deque([b'ta']), transport._buffer)
 
     def test_write_partial_none(self):
         data = b'data'
@@ -733,7 +814,7 @@ def test_write_partial_none(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(collections.deque([b'data']), transport._buffer)
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -743,7 +824,7 @@ def test_write_tryagain(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(collections.deque([b'data']), transport._buffer)
 
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -781,25 +862,26 @@ def test_write_closing(self):
 
     def test_write_ready(self):
         data = b'data'
-        self.sock.send.return_value = len(data)
+        self.sock.sendmsg.return_value = len(data)
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
-        self.assertTrue(self.sock.send.called)
+        self.assertTrue(self.sock.sendmsg.called)
         self.assertFalse(self.loop.writers)
 
+    @requires_sendmsg
     def test_write_ready_closing(self):
         data = b'data'
-        self.sock.send.return_value = len(data)
+        self.sock.sendmsg.return_value = len(data)
 
         transport = self.socket_transport()
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
-        self.assertTrue(self.sock.send.called)
+        self.assertTrue(self.sock.sendmsg.called)
         self.assertFalse(self.loop.writers)
         self.sock.close.assert_called_with()
         self.protocol.connection_lost.assert_called_with(None)
@@ -809,45 +891,50 @@ def test_write_ready_no_data(self):
         # This is an internal error.
         self.assertRaises(AssertionError, transport._write_ready)
 
+    @requires_sendmsg
     def test_write_ready_partial(self):
         data = b'data'
-        self.sock.send.return_value = 2
+        self.sock.sendmsg.return_value = 2
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(collections.deque([b'ta']), transport._buffer)
 
+    @requires_sendmsg
     def test_write_ready_partial_none(self):
         data = b'data'
-        self.sock.send.return_value = 0
+        self.sock.sendmsg.return_value = 0
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(collections.deque([b'data']), transport._buffer)
 
+    @requires_sendmsg
     def test_write_ready_tryagain(self):
-        self.sock.send.side_effect = BlockingIOError
+        self.sock.sendmsg.side_effect = BlockingIOError
 
         transport = self.socket_transport()
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._buffer = collections.deque([b'data1', b'data2'])
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(collections.deque([b'data1', b'data2']),
+                         transport._buffer)
 
+    @requires_sendmsg
     def test_write_ready_exception(self):
-        err = self.sock.send.side_effect = OSError()
+        err = self.sock.sendmsg.side_effect = OSError()
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport._write_ready()
         transport._fatal_error.assert_called_with(
                                    err,
@@ -862,20 +949,102 @@ def test_write_eof(self):
         self.assertEqual(self.sock.shutdown.call_count, 1)
         tr.close()
 
+    @requires_sendmsg
     def test_write_eof_buffer(self):
         tr = self.socket_transport()
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(tr._buffer, collections.deque([b'data']))
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
-        self.sock.send.side_effect = lambda _: 4
+        self.sock.sendmsg.side_effect = lambda _: 4
         tr._write_ready()
-        self.assertTrue(self.sock.send.called)
+        self.assertTrue(self.sock.sendmsg.called)
         self.sock.shutdown.assert_called_with(socket.SHUT_WR)
         tr.close()
 
+    def record_sendmsg(self, nbytes):
+        buffers = []
+
+        def sendmsg(iterable):
+            buffers.extend(iterable)
+            return nbytes
+
+        self.sock.sendmsg.side_effect = sendmsg
+        return buffers
+
+    @requires_sendmsg
+    def test_write_ready_sendmsg(self):
+        buffers = self.record_sendmsg(6)
+
+        transport = self.socket_transport()
+        transport._buffer.extend([b'data1', b'data2', b'data3'])
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertEqual(buffers, [b'data1', b'data2', b'data3'])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(collections.deque([b'ata2', b'data3']),
+                         transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 9)
+
+    @mock.patch('asyncio.selector_events._HAS_SENDMSG', False)
+    def test_write_ready_no_sendmsg(self):
+        self.sock.send.return_value = 6
+
+        transport = self.socket_transport()
+        transport._buffer.extend([b'data1', b'data2', b'data3'])
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.sock.send.assert_called_with(b'data1data2data3')
+        self.assertEqual(collections.deque([b'ata2data3']),
+                         transport._buffer)
+
+    def test_write_buffer_reference(self):
+        self.sock.send.return_value = 0
+        transport = self.socket_transport()
+        data = b'data'
+        transport.write(data)
+        transport.write(data)
+        self.assertIs(transport._buffer[1], data)
+        # Mutable data is copied.
+        data = bytearray(b'data')
+        transport.write(data)
+        data[:] = b'xxxx'
+        self.assertEqual(transport._buffer[2], b'data')
+
+    @requires_sendmsg
+    def test_writelines(self):
+        buffers = self.record_sendmsg(9)
+        transport = self.socket_transport()
+        transport.writelines([b'data', b'', bytearray(b'line'), b's'])
+        self.assertEqual(buffers, [b'data', b'line', b's'])
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    @requires_sendmsg
+    def test_writelines_partial(self):
+        self.sock.sendmsg.return_value = 5
+        transport = self.socket_transport()
+        transport.writelines([b'data', b'lines'])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(collections.deque([b'ines']), transport._buffer)
+
+        # Data is appended to the buffer while the socket is not writable.
+        transport.writelines([b'more'])
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.assertEqual(collections.deque([b'ines', b'more']),
+                         transport._buffer)
+
+    def test_writelines_errors(self):
+        transport = self.socket_transport()
+        with self.assertRaises(TypeError):
+            transport.writelines([b'data', 'str'])
+        self.assertFalse(transport._buffer)
+        transport.write_eof()
+        with self.assertRaises(RuntimeError):
+            transport.writelines([b'data'])
+
     def test_write_eof_after_close(self):
         tr = self.socket_transport()
         tr.close()
@@ -949,10 +1118,10 @@ def test_proto_type_switch(self):
         self.protocol = test_utils.make_test_protocol(asyncio.Protocol)
         transport = self.socket_transport()
 
-        self.sock.recv.return_value = b'data'
+        self.sock.recv_into.return_value = 4
         transport._read_ready()
 
-        self.protocol.data_received.assert_called_with(b'data')
+        self.protocol.data_received.assert_called_with(bytes(4))
 
         # switch protocol to a BufferedProtocol
 
@@ -8,6 +8,10 @@
 import unittest
 from asyncio import base_events
 from asyncio import constants
+try:
+    from asyncio import uring_events
+except ImportError:
+    uring_events = None
 from unittest import mock
 from test import support
 from test.support import os_helper
@@ -561,3 +565,11 @@ class SelectEventLoopTests(SendfileTestsBase,
 
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
+
+    if uring_events is not None:
+        @test_utils.requires_uring
+        class UringEventLoopTests(SendfileTestsBase,
+                                  test_utils.TestCase):
+
+            def create_event_loop(self):
+                return uring_events.UringEventLoop()
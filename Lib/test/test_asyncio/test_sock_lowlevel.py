@@ -5,6 +5,10 @@
 import unittest
 
 from asyncio import proactor_events
+try:
+    from asyncio import uring_events
+except ImportError:
+    uring_events = None
 from itertools import cycle, islice
 from test.test_asyncio import utils as test_utils
 from test import support
@@ -508,3 +512,11 @@ class SelectEventLoopTests(BaseSockTestsMixin,
 
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
+
+    if uring_events is not None:
+        @test_utils.requires_uring
+        class UringEventLoopTests(BaseSockTestsMixin,
+                                  test_utils.TestCase):
+
+            def create_event_loop(self):
+                return uring_events.UringEventLoop()
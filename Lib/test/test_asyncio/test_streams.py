@@ -1,5 +1,6 @@
 """Tests for streams.py."""
 
+import array
 import gc
 import os
 import queue
@@ -533,6 +534,201 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readexactly_view(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\nline2\n')
+
+        data = self.loop.run_until_complete(stream.readexactly_view(2))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'li', data)
+        self.assertEqual(b'ne1\nline2\n', stream._buffer)
+
+        # The buffer is handed over when the data is the larger part.
+        buffer = stream._buffer
+        data = self.loop.run_until_complete(stream.readexactly_view(8))
+        self.assertIs(data.obj, buffer)
+        self.assertEqual(b'ne1\nline', data)
+        self.assertEqual(b'2\n', stream._buffer)
+
+        read_task = self.loop.create_task(stream.readexactly_view(4))
+        self.loop.call_soon(stream.feed_data, b'ab')
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'2\nab', data)
+        self.assertEqual(b'', stream._buffer)
+
+        stream.feed_data(b'x')
+        stream.feed_eof()
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readexactly_view(2))
+        self.assertEqual(cm.exception.partial, b'x')
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readuntil_view(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readuntil_view(b'AAA'))
+
+        def cb():
+            stream.feed_data(b'QWEaa')
+            stream.feed_data(b'XYaa')
+            stream.feed_data(b'AAAtail')
+        self.loop.call_soon(cb)
+
+        data = self.loop.run_until_complete(read_task)
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'QWEaaXYaaAAA', data)
+        self.assertEqual(b'tail', stream._buffer)
+
+        stream.feed_eof()
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readuntil_view(b'AAA'))
+        self.assertEqual(cm.exception.partial, b'tail')
+
+    def test_readexactly_into(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'chunk1')
+        buffer = bytearray(16)
+        read_task = self.loop.create_task(stream.readexactly_into(buffer))
+
+        def cb():
+            stream.feed_data(b'chunk2')
+            stream.feed_data(b'chunk3chunk4')
+        self.loop.call_soon(cb)
+
+        self.assertEqual(self.loop.run_until_complete(read_task), 16)
+        self.assertEqual(b'chunk1chunk2chun', buffer)
+        self.assertEqual(b'k3chunk4', stream._buffer)
+        self.assertIsNone(stream._readinto)
+        # The buffer is not exported anymore.
+        buffer.clear()
+
+        buffer = array.array('H', [0, 0])
+        n = self.loop.run_until_complete(stream.readexactly_into(buffer))
+        self.assertEqual(n, 4)
+        self.assertEqual(b'k3ch', buffer.tobytes())
+        self.assertEqual(b'unk4', stream._buffer)
+
+        n = self.loop.run_until_complete(stream.readexactly_into(bytearray()))
+        self.assertEqual(n, 0)
+
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readexactly_into(b'xyz'))
+        self.assertEqual(b'unk4', stream._buffer)
+
+    def test_readexactly_into_limit(self):
+        # Data is not buffered by the stream while readexactly_into() waits.
+        stream = asyncio.StreamReader(limit=3, loop=self.loop)
+        transport = mock.Mock()
+        stream.set_transport(transport)
+        buffer = bytearray(20)
+        read_task = self.loop.create_task(stream.readexactly_into(buffer))
+
+        def cb():
+            stream.feed_data(b'0123456789')
+            stream.feed_data(b'0123456789ab')
+        self.loop.call_soon(cb)
+
+        self.loop.run_until_complete(read_task)
+        self.assertEqual(b'01234567890123456789', buffer)
+        self.assertEqual(b'ab', stream._buffer)
+        self.assertFalse(transport.pause_reading.called)
+
+    def test_readexactly_into_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buffer = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buffer))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(cm.exception.expected, len(buffer))
+        self.assertEqual(buffer[:len(self.DATA)], self.DATA)
+
+    def test_readexactly_into_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(
+            stream.readexactly_into(bytearray(10)))
+        self.loop.call_soon(stream.set_exception, ValueError())
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(read_task)
+        self.assertIsNone(stream._readinto)
+
+    def test_peek(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'chunk1')
+
+        data = self.loop.run_until_complete(stream.peek(3))
+        self.assertEqual(b'chu', data)
+        self.assertEqual(b'chunk1', stream._buffer)
+
+        read_task = self.loop.create_task(stream.peek(10))
+        self.loop.call_soon(stream.feed_data, b'chunk2')
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'chunk1chun', data)
+        self.assertEqual(b'chunk1chunk2', stream._buffer)
+
+        self.assertEqual(b'', self.loop.run_until_complete(stream.peek(0)))
+        with self.assertRaisesRegex(ValueError, 'less than zero'):
+            self.loop.run_until_complete(stream.peek(-1))
+
+        stream.feed_eof()
+        data = self.loop.run_until_complete(stream.peek(100))
+        self.assertEqual(b'chunk1chunk2', data)
+        data = self.loop.run_until_complete(stream.read())
+        self.assertEqual(b'chunk1chunk2', data)
+
+    def test_streamreaderprotocol_data_received_memoryview(self):
+        class Protocol(asyncio.StreamReaderProtocol):
+            def data_received(self, data):
+                super().data_received(data)
+
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        self.assertTrue(protocol.data_received_memoryview)
+        protocol.data_received(memoryview(b'data'))
+        self.assertEqual(b'data', stream._buffer)
+        self.assertFalse(Protocol(stream, loop=self.loop)
+                         .data_received_memoryview)
+
+    def test_streamreaderprotocol_data_received_memoryview_reader(self):
+        # A reader keeping the data passed to feed_data() must not get a
+        # view of the shared read buffer of the transport.
+        class Reader(asyncio.StreamReader):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.chunks = []
+
+            def feed_data(self, data):
+                self.chunks.append(data)
+                super().feed_data(data)
+
+        reader = Reader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(reader, loop=self.loop)
+        self.assertFalse(protocol.data_received_memoryview)
+
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(wsock.close)
+
+        async def client():
+            transport, _ = await self.loop.connect_accepted_socket(
+                lambda: protocol, rsock)
+            wsock.sendall(b'first')
+            await reader.readexactly(5)
+            wsock.sendall(b'SECOND')
+            await reader.readexactly(6)
+            transport.close()
+
+        self.loop.run_until_complete(client())
+        self.assertEqual(b'firstSECOND', b''.join(reader.chunks))
+        self.assertEqual([b'first', b'SECOND'], reader.chunks)
+
+        protocol = asyncio.StreamReaderProtocol(None, loop=self.loop)
+        self.assertFalse(protocol.data_received_memoryview)
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
@@ -2470,6 +2470,150 @@ def test_get_coro(self):
         finally:
             loop.close()
 
+    def test_profiling(self):
+        async def coro():
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        loop = asyncio.new_event_loop()
+        try:
+            task = self.new_task(loop, coro())
+            other = self.new_task(loop, coro())
+            self.assertFalse(task._profiling)
+            task._profiling = True
+            self.assertTrue(task._profiling)
+            loop.run_until_complete(asyncio.gather(task, other))
+            self.assertEqual(task._steps, 4)
+            self.assertGreater(task._run_time, 0)
+            self.assertGreaterEqual(task._cpu_time, 0)
+            self.assertEqual(other._steps, 0)
+            self.assertEqual(other._run_time, 0)
+        finally:
+            loop.close()
+
+    def test_eager_start(self):
+        events = []
+
+        async def coro(x):
+            events.append(('coro', x))
+            return x
+
+        async def main():
+            task = self.new_task(loop, coro(1))
+            eager = self.Task(coro(2), loop=loop, eager_start=True)
+            events.append('created')
+            self.assertFalse(task.done())
+            self.assertTrue(eager.done())
+            self.assertEqual(eager.result(), 2)
+            self.assertIs(asyncio.current_task(), main_task)
+            self.assertEqual(await task, 1)
+
+        loop = asyncio.new_event_loop()
+        try:
+            main_task = self.new_task(loop, main())
+            loop.run_until_complete(main_task)
+        finally:
+            loop.close()
+        self.assertEqual(events, [('coro', 2), 'created', ('coro', 1)])
+
+    def test_eager_start_suspend(self):
+        cvar = contextvars.ContextVar('cvar', default='nope')
+
+        current = []
+
+        async def sub():
+            current.append(asyncio.current_task())
+            cvar.set('sub')
+            await asyncio.sleep(0)
+            current.append(asyncio.current_task())
+            return cvar.get()
+
+        async def main():
+            cvar.set('main')
+            task = self.Task(sub(), loop=loop, eager_start=True)
+            self.assertFalse(task.done())
+            self.assertEqual(current, [task])
+            self.assertEqual(cvar.get(), 'main')
+            self.assertIs(asyncio.current_task(), main_task)
+            self.assertEqual(await task, 'sub')
+            self.assertEqual(current, [task, task])
+
+        loop = asyncio.new_event_loop()
+        try:
+            main_task = self.new_task(loop, main())
+            loop.run_until_complete(main_task)
+        finally:
+            loop.close()
+
+    def test_eager_start_exception(self):
+        async def coro():
+            raise ZeroDivisionError
+
+        async def main():
+            task = self.Task(coro(), loop=loop, eager_start=True)
+            self.assertTrue(task.done())
+            with self.assertRaises(ZeroDivisionError):
+                task.result()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.new_task(loop, main()))
+        finally:
+            loop.close()
+
+    def test_eager_start_loop_not_running(self):
+        loop = asyncio.new_event_loop()
+        try:
+            task = self.Task(coroutine_function(), loop=loop,
+                             eager_start=True)
+            self.assertFalse(task.done())
+            self.assertIsNone(loop.run_until_complete(task))
+        finally:
+            loop.close()
+
+    def test_eager_task_factory(self):
+        async def coro():
+            return asyncio.current_task()
+
+        async def main():
+            task = loop.create_task(coro(), name='eager')
+            self.assertTrue(task.done())
+            self.assertIsInstance(task, self.Task)
+            self.assertIs(task.result(), task)
+            self.assertEqual(task.get_name(), 'eager')
+
+        loop = asyncio.new_event_loop()
+        loop.set_task_factory(asyncio.create_eager_task_factory(self.Task))
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+    def test_eager_start_profiling(self):
+        async def coro(n):
+            for _ in range(n):
+                await asyncio.sleep(0)
+
+        async def main():
+            done = loop.create_task(coro(0))
+            self.assertTrue(done.done())
+            self.assertTrue(done._profiling)
+            self.assertEqual(done._steps, 1)
+            self.assertGreater(done._run_time, 0)
+            task = loop.create_task(coro(2))
+            self.assertTrue(task._profiling)
+            self.assertEqual(task._steps, 1)
+            await task
+            self.assertEqual(task._steps, 3)
+
+        loop = asyncio.new_event_loop()
+        loop.set_task_factory(asyncio.create_eager_task_factory(self.Task))
+        loop.set_profiling(True)
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+
 
 def add_subclass_tests(cls):
     BaseTask = cls.Task
@@ -2701,6 +2845,7 @@ class BaseTaskIntrospectionTests:
     _unregister_task = None
     _enter_task = None
     _leave_task = None
+    _swap_current_task = None
 
     def test__register_task_1(self):
         class TaskLike:
@@ -2793,6 +2938,18 @@ def test__leave_task_failure2(self):
             self._leave_task(loop, task)
         self.assertIsNone(asyncio.current_task(loop))
 
+    def test__swap_current_task(self):
+        task1 = mock.Mock()
+        task2 = mock.Mock()
+        loop = mock.Mock()
+        self.assertIsNone(self._swap_current_task(loop, task1))
+        self.assertIs(asyncio.current_task(loop), task1)
+        self.assertIs(self._swap_current_task(loop, task2), task1)
+        self.assertIs(asyncio.current_task(loop), task2)
+        self.assertIs(self._swap_current_task(loop, None), task2)
+        self.assertIsNone(asyncio.current_task(loop))
+        self.assertIsNone(self._swap_current_task(loop, None))
+
     def test__unregister_task(self):
         task = mock.Mock()
         loop = mock.Mock()
@@ -2813,6 +2970,7 @@ class PyIntrospectionTests(test_utils.TestCase, BaseTaskIntrospectionTests):
     _unregister_task = staticmethod(tasks._py_unregister_task)
     _enter_task = staticmethod(tasks._py_enter_task)
     _leave_task = staticmethod(tasks._py_leave_task)
+    _swap_current_task = staticmethod(tasks._py_swap_current_task)
 
 
 @unittest.skipUnless(hasattr(tasks, '_c_register_task'),
@@ -2823,8 +2981,10 @@ class CIntrospectionTests(test_utils.TestCase, BaseTaskIntrospectionTests):
         _unregister_task = staticmethod(tasks._c_unregister_task)
         _enter_task = staticmethod(tasks._c_enter_task)
         _leave_task = staticmethod(tasks._c_leave_task)
+        _swap_current_task = staticmethod(tasks._c_swap_current_task)
     else:
         _register_task = _unregister_task = _enter_task = _leave_task = None
+        _swap_current_task = None
 
 
 class BaseCurrentLoopTests:
@@ -3301,6 +3461,106 @@ def task_factory(loop, coro):
         self.assertEqual(context['exception'], exc_context.exception)
 
 
+class BoundedMapTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.running = 0
+        self.max_running = 0
+
+    async def work(self, x):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            # Later items complete first
+            for _ in range(10 - x):
+                await asyncio.sleep(0)
+            if x < 0:
+                raise ValueError(x)
+            return x * 10
+        finally:
+            self.running -= 1
+
+    async def collect(self, *args, **kwargs):
+        return [x async for x in asyncio.bounded_map(*args, **kwargs)]
+
+    def test_ordered(self):
+        result = self.loop.run_until_complete(
+            self.collect(self.work, range(10), limit=3))
+        self.assertEqual(result, [x * 10 for x in range(10)])
+        self.assertEqual(self.max_running, 3)
+
+    def test_unordered(self):
+        result = self.loop.run_until_complete(
+            self.collect(self.work, range(10), limit=3, ordered=False))
+        self.assertEqual(sorted(result), [x * 10 for x in range(10)])
+        self.assertNotEqual(result, sorted(result))
+        self.assertEqual(self.max_running, 3)
+
+    def test_async_iterable(self):
+        async def gen():
+            for x in range(5):
+                await asyncio.sleep(0)
+                yield x
+
+        result = self.loop.run_until_complete(
+            self.collect(self.work, gen(), limit=2))
+        self.assertEqual(result, [0, 10, 20, 30, 40])
+        self.assertEqual(self.max_running, 2)
+
+    def test_lazy(self):
+        consumed = []
+
+        def items():
+            for x in range(100):
+                consumed.append(x)
+                yield x
+
+        async def main():
+            agen = asyncio.bounded_map(self.work, items(), limit=4)
+            self.assertEqual(await anext(agen), 0)
+            await agen.aclose()
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(consumed, list(range(4)))
+        self.assertEqual(self.running, 0)
+        self.assertEqual(asyncio.all_tasks(self.loop), set())
+
+    def test_empty(self):
+        result = self.loop.run_until_complete(
+            self.collect(self.work, [], limit=3))
+        self.assertEqual(result, [])
+
+    def test_error_cancels_running(self):
+        cancelled = []
+
+        async def work(x):
+            if x == 2:
+                raise ValueError(x)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+
+        for ordered in (True, False):
+            cancelled.clear()
+            with self.subTest(ordered=ordered):
+                with self.assertRaises(ValueError):
+                    self.loop.run_until_complete(
+                        self.collect(work, range(10), limit=4,
+                                     ordered=ordered))
+                test_utils.run_briefly(self.loop)
+                self.assertEqual(sorted(cancelled), [0, 1, 3])
+
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(
+                self.collect(self.work, range(10), limit=0))
+
+
 class SleepTests(test_utils.TestCase):
     def setUp(self):
         super().setUp()
@@ -0,0 +1,301 @@
+import errno
+import io
+import os
+import socket
+import sys
+import time
+import unittest
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('Linux only')
+
+from test.support import import_helper
+from test.support import os_helper
+
+_uring = import_helper.import_module('_uring')
+
+import asyncio
+from asyncio import uring_events
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class RingTests(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.ring = _uring.Ring(8)
+        except OSError as exc:
+            self.skipTest(f'io_uring is not available: {exc}')
+        self.addCleanup(self.ring.close)
+
+    def wait_all(self, count, timeout=5.0):
+        completions = []
+        deadline = time.monotonic() + timeout
+        while len(completions) < count and time.monotonic() < deadline:
+            completions.extend(self.ring.wait(timeout))
+        self.assertEqual(len(completions), count)
+        return {key: res for key, res, flags in completions}
+
+    def test_recv_send(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        buf = bytearray(10)
+        recv_key = self.ring.recv(a, buf)
+        send_key = self.ring.send(b.fileno(), b'hello')
+        self.assertNotEqual(recv_key, send_key)
+        self.assertEqual(self.ring.pending, 2)
+        results = self.wait_all(2)
+        self.assertEqual(results, {recv_key: 5, send_key: 5})
+        self.assertEqual(buf[:5], b'hello')
+        self.assertEqual(self.ring.pending, 0)
+
+    def test_read_write(self):
+        fd = os.open(os_helper.TESTFN, os.O_RDWR | os.O_CREAT | os.O_TRUNC)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.addCleanup(os.close, fd)
+        key = self.ring.write(fd, b'abcdef', 0)
+        self.assertEqual(self.wait_all(1), {key: 6})
+        buf = bytearray(3)
+        key = self.ring.read(fd, buf, 2)
+        self.assertEqual(self.wait_all(1), {key: 3})
+        self.assertEqual(buf, b'cde')
+        # At the current file position
+        self.assertEqual(os.lseek(fd, 1, os.SEEK_SET), 1)
+        key = self.ring.read(fd, buf)
+        self.assertEqual(self.wait_all(1), {key: 3})
+        self.assertEqual(buf, b'bcd')
+        self.assertEqual(os.lseek(fd, 0, os.SEEK_CUR), 4)
+
+    def test_accept(self):
+        with socket.create_server(('127.0.0.1', 0)) as listener:
+            key = self.ring.accept(listener, socket.SOCK_CLOEXEC)
+            with socket.create_connection(listener.getsockname()) as client:
+                fd = self.wait_all(1)[key]
+                self.assertGreaterEqual(fd, 0)
+                with socket.socket(fileno=fd) as conn:
+                    self.assertEqual(conn.getpeername(),
+                                     client.getsockname())
+
+    def test_poll(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        key = self.ring.poll(a, 1)  # POLLIN
+        self.assertEqual(self.ring.wait(0), [])
+        b.send(b'x')
+        self.assertEqual(self.wait_all(1), {key: 1})
+
+    def test_timeout(self):
+        key = self.ring.timeout(0.01)
+        self.assertEqual(self.wait_all(1), {key: -errno.ETIME})
+        with self.assertRaises(ValueError):
+            self.ring.timeout(-1)
+
+    def test_wait_timeout(self):
+        t0 = time.monotonic()
+        self.assertEqual(self.ring.wait(0.05), [])
+        self.assertGreaterEqual(time.monotonic() - t0, 0.04)
+        self.assertEqual(self.ring.wait(0), [])
+        with self.assertRaises(ValueError):
+            self.ring.wait(-1)
+
+    def test_cancel(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        key = self.ring.recv(a, bytearray(10))
+        self.assertEqual(self.ring.wait(0), [])
+        cancel_key = self.ring.cancel(key)
+        results = self.wait_all(2)
+        self.assertEqual(results, {key: -errno.ECANCELED, cancel_key: 0})
+
+    def test_full_submission_queue(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        keys = [self.ring.poll(a, 1) for i in range(20)]
+        self.assertEqual(self.ring.pending, 20)
+        b.send(b'x')
+        self.assertEqual(set(self.wait_all(20)), set(keys))
+
+    def test_buffer_errors(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        with self.assertRaises(BufferError):
+            self.ring.recv(a, b'read-only')
+        with self.assertRaises(TypeError):
+            self.ring.send(a, 'str')
+        self.assertEqual(self.ring.pending, 0)
+
+    def test_close(self):
+        self.assertFalse(self.ring.closed)
+        self.ring.close()
+        self.assertTrue(self.ring.closed)
+        self.ring.close()
+        with self.assertRaises(ValueError):
+            self.ring.fileno()
+        with self.assertRaises(ValueError):
+            self.ring.timeout(1)
+        with self.assertRaises(ValueError):
+            self.ring.wait(0)
+
+
+@test_utils.requires_uring
+class UringProactorTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = uring_events.UringEventLoop()
+        self.set_event_loop(self.loop)
+
+    def test_close(self):
+        a, b = socket.socketpair()
+        trans = self.loop._make_socket_transport(a, asyncio.Protocol())
+        f = asyncio.ensure_future(self.loop.sock_recv(b, 100), loop=self.loop)
+        trans.close()
+        self.loop.run_until_complete(f)
+        self.assertEqual(f.result(), b'')
+        b.close()
+
+    def test_close_pending_operations(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        proactor = self.loop._proactor
+        f = proactor.recv(a, 100)
+        self.assertEqual(len(proactor._cache), 1)
+        proactor.close()
+        self.assertTrue(f.cancelled())
+        self.assertEqual(proactor._cache, {})
+
+    def test_cancel(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+
+        async def recv():
+            await self.loop.sock_recv(a, 100)
+
+        task = self.loop.create_task(recv())
+        test_utils.run_briefly(self.loop)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(task)
+        # The cancelled operation did not consume the data
+        b.send(b'data')
+        data = self.loop.run_until_complete(self.loop.sock_recv(a, 100))
+        self.assertEqual(data, b'data')
+
+    def test_file_read_write(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        data = b'0123456789' * 100_000
+
+        async def main():
+            with open(os_helper.TESTFN, 'w+b', buffering=0) as file:
+                n = await self.loop.file_write(file, data)
+                self.assertEqual(n, len(data))
+                self.assertEqual(file.tell(), len(data))
+                n = await self.loop.file_write(file, b'ABC', 2)
+                self.assertEqual(n, 3)
+                self.assertEqual(await self.loop.file_read(file, 6, 0),
+                                 b'01ABC5')
+                file.seek(len(data) - 4)
+                self.assertEqual(await self.loop.file_read(file, 10),
+                                 b'6789')
+                self.assertEqual(await self.loop.file_read(file, 10), b'')
+                buf = bytearray(5)
+                self.assertEqual(await self.loop.file_readinto(file, buf, 8),
+                                 5)
+                self.assertEqual(buf, b'89012')
+
+        self.loop.run_until_complete(main())
+
+    def test_file_read_error(self):
+        async def main():
+            with open(os_helper.TESTFN, 'wb') as file:
+                with self.assertRaises(OSError) as cm:
+                    await self.loop.file_read(file, 10, 0)
+                self.assertEqual(cm.exception.errno, errno.EBADF)
+
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.loop.run_until_complete(main())
+
+    def test_timeout(self):
+        t0 = self.loop.time()
+        fut = self.loop._proactor.timeout(0.05)
+        self.assertIsNone(self.loop.run_until_complete(fut))
+        self.assertGreaterEqual(self.loop.time() - t0, 0.04)
+
+    def test_write_pipe(self):
+        rpipe, wpipe = os.pipe()
+        self.addCleanup(os.close, rpipe)
+        pipeobj = io.open(wpipe, 'wb', 1024)
+        proto = asyncio.Protocol()
+        transport, _ = self.loop.run_until_complete(
+            self.loop.connect_write_pipe(lambda: proto, pipeobj))
+        transport.write(b'1234')
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(os.read(rpipe, 100), b'1234')
+        transport.close()
+        test_utils.run_briefly(self.loop)
+
+    def test_write_pipe_closed(self):
+        rpipe, wpipe = os.pipe()
+        pipeobj = io.open(wpipe, 'wb', 1024)
+        lost = self.loop.create_future()
+
+        class Proto(asyncio.Protocol):
+            def connection_lost(self, exc):
+                lost.set_result(exc)
+
+        transport, _ = self.loop.run_until_complete(
+            self.loop.connect_write_pipe(Proto, pipeobj))
+        os.close(rpipe)
+        self.assertIsNone(self.loop.run_until_complete(lost))
+        self.assertTrue(transport.is_closing())
+
+    def test_streams(self):
+        async def handle(reader, writer):
+            data = await reader.readline()
+            writer.write(data.upper() * 10_000)
+            await writer.drain()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            async with server:
+                addr = server.sockets[0].getsockname()
+                reader, writer = await asyncio.open_connection(*addr)
+                writer.write(b'hello\n')
+                data = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+            return data
+
+        data = self.loop.run_until_complete(main())
+        self.assertEqual(data, b'HELLO\n' * 10_000)
+
+
+@test_utils.requires_uring
+class UringEventLoopPolicyTests(unittest.TestCase):
+
+    def test_policy(self):
+        asyncio.set_event_loop_policy(uring_events.UringEventLoopPolicy())
+        try:
+            loop = asyncio.new_event_loop()
+            try:
+                self.assertIsInstance(loop, uring_events.UringEventLoop)
+            finally:
+                loop.close()
+        finally:
+            asyncio.set_event_loop_policy(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
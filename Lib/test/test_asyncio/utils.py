@@ -3,6 +3,7 @@
 import asyncio
 import collections
 import contextlib
+import functools
 import io
 import logging
 import os
@@ -287,6 +288,9 @@ def make_test_protocol(base):
         if name.startswith('__') and name.endswith('__'):
             # skip magic names
             continue
+        if not callable(getattr(base, name)):
+            # skip attributes, like Protocol.data_received_memoryview
+            continue
         dct[name] = MockCallback(return_value=None)
     return type('TestProtocol', (base,) + base.__bases__, dct)()
 
@@ -570,6 +574,31 @@ def disable_logger():
         logger.setLevel(old_level)
 
 
+@functools.cache
+def _uring_unavailable():
+    # Return the reason why io_uring cannot be used, or None.  The kernel
+    # may refuse io_uring_setup() even when _uring is built, for instance
+    # in containers filtering system calls.
+    try:
+        import _uring
+    except ImportError:
+        return 'the _uring module is not available'
+    try:
+        ring = _uring.Ring(1)
+    except OSError as exc:
+        return f'io_uring is not available: {exc}'
+    ring.close()
+    return None
+
+
+def requires_uring(test):
+    """Skip the decorated test or test class if io_uring is not usable."""
+    reason = _uring_unavailable()
+    if reason is not None:
+        return unittest.skip(reason)(test)
+    return test
+
+
 def mock_nonblocking_socket(proto=socket.IPPROTO_TCP, type=socket.SOCK_STREAM,
                             family=socket.AF_INET):
     """Create a mock of a non-blocking socket."""
@@ -19,7 +19,7 @@
 import time
 import unittest
 import weakref
-from pickle import PicklingError
+from pickle import PickleBuffer, PicklingError
 
 from concurrent import futures
 from concurrent.futures._base import (
@@ -99,6 +99,17 @@ def make_dummy_object(_):
     return MyObject()
 
 
+def upper_buffer(data):
+    return PickleBuffer(data.upper())
+
+def init_semaphore(sem):
+    global SEMAPHORE
+    SEMAPHORE = sem
+
+def acquire_semaphore():
+    SEMAPHORE.acquire()
+
+
 class BaseTestCase(unittest.TestCase):
     def setUp(self):
         self._thread_key = threading_helper.threading_setup()
@@ -194,11 +205,16 @@ def get_context(self):
         return super().get_context()
 
 
+class ProcessPoolWorkStealingMixin(ProcessPoolSpawnMixin):
+    executor_kwargs = {'work_stealing': True}
+
+
 def create_executor_tests(mixin, bases=(BaseTestCase,),
                           executor_mixins=(ThreadPoolMixin,
                                            ProcessPoolForkMixin,
                                            ProcessPoolForkserverMixin,
-                                           ProcessPoolSpawnMixin)):
+                                           ProcessPoolSpawnMixin,
+                                           ProcessPoolWorkStealingMixin)):
     def strip_mixin(name):
         if name.endswith(('Mixin', 'Tests')):
             return name[:-5]
@@ -505,6 +521,8 @@ def test_processes_terminate(self):
         def acquire_lock(lock):
             lock.acquire()
 
+        if self.executor_kwargs.get('work_stealing'):
+            self.skipTest("workers are only spawned for pending calls")
         mp_context = get_context()
         sem = mp_context.Semaphore(0)
         for _ in range(3):
@@ -572,7 +590,8 @@ def test_shutdown_no_wait(self):
 create_executor_tests(ProcessPoolShutdownTest,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
-                                       ProcessPoolSpawnMixin))
+                                       ProcessPoolSpawnMixin,
+                                       ProcessPoolWorkStealingMixin))
 
 
 class WaitTests:
@@ -697,7 +716,8 @@ def future_func():
 create_executor_tests(WaitTests,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
-                                       ProcessPoolSpawnMixin))
+                                       ProcessPoolSpawnMixin,
+                                       ProcessPoolWorkStealingMixin))
 
 
 class AsCompletedTests:
@@ -829,6 +849,54 @@ def test_map_timeout(self):
 
         self.assertEqual([None, None], results)
 
+    def test_map_buffersize_validation(self):
+        for buffersize in ("foo", 2.0):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    TypeError, "buffersize must be an integer or None"):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+        for buffersize in (0, -1):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    ValueError, r"buffersize must be None or > 0"):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(str, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), ["0", "1", "2", "3"])
+        res = self.executor.map(pow, ints, ints, buffersize=2)
+        self.assertListEqual(list(res), [1, 1, 4, 27])
+        self.assertListEqual(
+            list(self.executor.map(str, [], buffersize=2)), [])
+
+    def test_map_buffersize_reads_lazily(self):
+        consumed = []
+        def ints():
+            for i in itertools.count():
+                consumed.append(i)
+                yield i
+
+        res = self.executor.map(mul, ints(), itertools.repeat(2),
+                                buffersize=3)
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(next(res), 0)
+        self.assertEqual(consumed, [0, 1, 2, 3])
+        self.assertEqual(list(itertools.islice(res, 100)),
+                         [i * 2 for i in range(1, 101)])
+        self.assertEqual(len(consumed), 104)
+        res.close()
+
+    def test_map_buffersize_exception(self):
+        res = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5],
+                                buffersize=2)
+        self.assertEqual(next(res), (0, 1))
+        self.assertEqual(next(res), (0, 1))
+        self.assertRaises(ZeroDivisionError, next, res)
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -942,6 +1010,39 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_auto_chunksize(self):
+        ref = list(map(pow, range(1000), itertools.repeat(2)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), itertools.repeat(2),
+                                   chunksize='auto')),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, [], [], chunksize='auto')), [])
+        # The iterables are read lazily
+        results = self.executor.map(pow, itertools.count(), itertools.repeat(2),
+                                    chunksize='auto')
+        self.assertEqual(list(itertools.islice(results, 1000)), ref)
+        results.close()
+
+        # The exception is raised in place of the results of its chunk
+        results = []
+        with self.assertRaises(ZeroDivisionError):
+            for r in self.executor.map(divmod, [1] * 101, [1] * 100 + [0],
+                                       chunksize='auto'):
+                results.append(r)
+        self.assertLessEqual(len(results), 100)
+        self.assertEqual(results, [(1, 0)] * len(results))
+
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), itertools.repeat(2),
+                                   chunksize='auto', buffersize=1)),
+            ref)
+
+        results = self.executor.map(time.sleep, [0, 0, 6], timeout=3,
+                                    chunksize='auto')
+        self.assertEqual(list(itertools.islice(results, 2)), [None, None])
+        self.assertRaises(futures.TimeoutError, next, results)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -987,6 +1088,46 @@ def test_ressources_gced_in_workers(self):
         mgr.shutdown()
         mgr.join()
 
+    def test_pickle_buffers(self):
+        # Large out-of-band buffers are sent in frames of their own
+        data = bytearray(b'abcd') * 1_000_000
+        future = self.executor.submit(upper_buffer, PickleBuffer(data))
+        result = future.result()
+        self.assertIsInstance(result, bytearray)
+        self.assertEqual(result, data.upper())
+
+    def test_work_stealing_small_calls(self):
+        executor = self.executor_type(4, mp_context=self.get_context(),
+                                      work_stealing=True)
+        try:
+            n = 5000
+            self.assertEqual(list(executor.map(mul, range(n), range(n))),
+                             [x * x for x in range(n)])
+            self.assertLessEqual(len(executor._processes), 4)
+        finally:
+            executor.shutdown()
+
+    def test_work_stealing(self):
+        # The calls queued behind a blocked call are run by the other worker
+        sem = self.get_context().Semaphore(0)
+        executor = self.executor_type(2, mp_context=self.get_context(),
+                                      initializer=init_semaphore,
+                                      initargs=(sem,), work_stealing=True)
+        try:
+            # Measure the duration of the calls to send them in batches
+            list(executor.map(mul, range(100), range(100)))
+            blocked = executor.submit(acquire_semaphore)
+            fs = [executor.submit(mul, i, 2) for i in range(1000)]
+            done, not_done = futures.wait(fs, timeout=support.SHORT_TIMEOUT)
+            self.assertEqual(not_done, set())
+            self.assertEqual([f.result() for f in fs],
+                             [i * 2 for i in range(1000)])
+            self.assertFalse(blocked.done())
+            sem.release()
+            self.assertIsNone(blocked.result(timeout=support.SHORT_TIMEOUT))
+        finally:
+            executor.shutdown()
+
     def test_saturation(self):
         executor = self.executor_type(4)
         mp_context = get_context()
@@ -1021,7 +1162,8 @@ def test_idle_process_reuse_multiple(self):
 create_executor_tests(ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
-                                       ProcessPoolSpawnMixin))
+                                       ProcessPoolSpawnMixin,
+                                       ProcessPoolWorkStealingMixin))
 
 def _crash(delay=None):
     """Induces a segfault."""
@@ -1235,7 +1377,8 @@ def test_shutdown_deadlock_pickle(self):
 create_executor_tests(ExecutorDeadlockTest,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
-                                       ProcessPoolSpawnMixin))
+                                       ProcessPoolSpawnMixin,
+                                       ProcessPoolWorkStealingMixin))
 
 
 class FutureTests(BaseTestCase):
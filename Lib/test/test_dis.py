@@ -9,6 +9,7 @@
 import re
 import types
 import contextlib
+import textwrap
 
 def get_tb():
     def _error():
@@ -687,6 +688,39 @@ def check(expected, **kwargs):
         check(dis_nested_2, depth=None)
         check(dis_nested_2)
 
+    def test_disassemble_adaptive(self):
+        # Compile a new code object, so that it has not been quickened yet
+        ns = {}
+        exec("def add(a, b):\n    return a + b", ns)
+        add = ns['add']
+
+        # Code that has not been quickened is shown unchanged
+        self.assertEqual(self.get_disassembly(add, adaptive=True),
+                         self.get_disassembly(add))
+        for _ in range(100):
+            add(1, 2)
+        got = self.get_disassembly(add, adaptive=True)
+        self.assertIn('BINARY_ADD_INT', got)
+        self.assertRegex(got, r'\[counter: \d+\]')
+        self.assertNotIn('[cache:', got)
+        self.assertNotIn('BINARY_ADD_INT', self.get_disassembly(add))
+
+        ns = {}
+        exec(textwrap.dedent('''\
+            class C:
+                def __init__(self):
+                    self.x = 1
+            def get(o):
+                return o.x
+            '''), ns)
+        get = ns['get']
+        for _ in range(100):
+            get(ns['C']())
+        got = self.get_disassembly(get, adaptive=True)
+        self.assertRegex(got, r'LOAD_ATTR_\w+ .*\[counter: \d+\] '
+                              r'\[cache: original_oparg=0, index=\d+, '
+                              r'tp_version=\d+, dk_version_or_hint=\d+\]')
+
 
 class DisWithFileTests(DisTests):
 
@@ -1208,6 +1242,49 @@ def test_jumpy(self):
         self.assertInstructionsEqual(list(actual), expected_opinfo_jumpy)
 
     @requires_debug_ranges()
+    def test_adaptive(self):
+        # Compile a new code object, so that it has not been quickened yet
+        ns = {}
+        exec(textwrap.dedent('''\
+            def loop(n):
+                total = 0
+                for i in range(n):
+                    total += i
+                return total
+            '''), ns)
+        loop = ns['loop']
+
+        self.assertInstructionsEqual(
+            list(dis.get_instructions(loop, adaptive=True)),
+            list(dis.get_instructions(loop)))
+        for _ in range(100):
+            loop(10)
+        instructions = list(dis.get_instructions(loop))
+        adaptive = list(dis.get_instructions(loop, adaptive=True))
+        self.assertEqual(len(adaptive), len(instructions))
+        for instr, adaptive_instr in zip(instructions, adaptive):
+            self.assertIsNone(instr.counter)
+            self.assertEqual(adaptive_instr.offset, instr.offset)
+            self.assertEqual(adaptive_instr.argval, instr.argval)
+            self.assertEqual(dis._all_opmap[adaptive_instr.opname],
+                             adaptive_instr.opcode)
+            if instr.opname == 'INPLACE_ADD':
+                self.assertEqual(adaptive_instr.opname, 'INPLACE_ADD_INT')
+                self.assertIsInstance(adaptive_instr.counter, int)
+                self.assertIsNone(adaptive_instr.cache)
+            elif instr.opname == 'JUMP_ABSOLUTE':
+                self.assertEqual(adaptive_instr.opname, 'JUMP_ABSOLUTE_QUICK')
+                self.assertIsNone(adaptive_instr.counter)
+            elif instr.opname == 'LOAD_GLOBAL':
+                self.assertEqual(adaptive_instr.opname,
+                                 'LOAD_GLOBAL_BUILTIN')
+                self.assertIsInstance(adaptive_instr.counter, int)
+                self.assertEqual(adaptive_instr.cache['original_oparg'],
+                                 instr.arg)
+                self.assertIn('builtin_keys_version', adaptive_instr.cache)
+            elif instr.opname in ('LOAD_FAST', 'STORE_FAST', 'RETURN_VALUE'):
+                self.assertEqual(adaptive_instr, instr)
+
     def test_co_positions(self):
         code = compile('f(\n  x, y, z\n)', '<test>', 'exec')
         positions = [
@@ -1294,6 +1371,18 @@ def test_disassembled(self):
         actual = dis.Bytecode(_f).dis()
         self.assertEqual(actual, dis_f)
 
+    def test_adaptive(self):
+        def mul(a, b):
+            return a * b
+
+        for _ in range(100):
+            mul(2.0, 3.0)
+        b = dis.Bytecode(mul, adaptive=True)
+        self.assertIn('BINARY_MULTIPLY_FLOAT',
+                      [instr.opname for instr in b])
+        self.assertIn('BINARY_MULTIPLY_FLOAT', b.dis())
+        self.assertNotIn('BINARY_MULTIPLY_FLOAT', dis.Bytecode(mul).dis())
+
     def test_from_traceback(self):
         tb = get_tb()
         b = dis.Bytecode.from_traceback(tb)
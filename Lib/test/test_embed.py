@@ -370,6 +370,8 @@ class InitConfigTests(EmbeddingTestsMixin, unittest.TestCase):
         'tracemalloc': 0,
         'import_time': 0,
         'no_debug_ranges': 0,
+        'specialization_stats': 0,
+        'lazy_imports': 0,
         'show_ref_count': 0,
         'dump_refs': 0,
         'malloc_stats': 0,
@@ -800,6 +802,8 @@ def test_init_from_config(self):
             'tracemalloc': 2,
             'import_time': 1,
             'no_debug_ranges': 1,
+            'specialization_stats': 1,
+            'lazy_imports': 1,
             'show_ref_count': 1,
             'malloc_stats': 1,
 
@@ -861,6 +865,8 @@ def test_init_compat_env(self):
             'tracemalloc': 2,
             'import_time': 1,
             'no_debug_ranges': 1,
+            'specialization_stats': 1,
+            'lazy_imports': 1,
             'malloc_stats': 1,
             'inspect': 1,
             'optimization_level': 2,
@@ -891,6 +897,8 @@ def test_init_python_env(self):
             'tracemalloc': 2,
             'import_time': 1,
             'no_debug_ranges': 1,
+            'specialization_stats': 1,
+            'lazy_imports': 1,
             'malloc_stats': 1,
             'inspect': 1,
             'optimization_level': 2,
@@ -143,6 +143,25 @@ def test_invalidate_caches(self):
         finder.invalidate_caches()
         self.assertEqual(finder._path_mtime, -1)
 
+    def test_no_revalidate(self):
+        # With revalidate false, the directory contents are only read again
+        # after invalidate_caches().
+        with util.create_modules('mod') as mapping:
+            finder = self.get_finder(mapping['.root'])
+            finder.revalidate = False
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+            self.assertEqual(self._find(finder, 'new_mod'), self.NOT_FOUND)
+            new_mod = os.path.join(mapping['.root'], 'new_mod.py')
+            with open(new_mod, 'w', encoding='utf-8') as file:
+                file.write("# test file for importlib")
+            # Make sure the directory mtime would have invalidated the cache.
+            finder._path_mtime = 0
+            self.assertEqual(self._find(finder, 'new_mod'), self.NOT_FOUND)
+            finder.invalidate_caches()
+            self.assertIsNotNone(self._find(finder, 'new_mod',
+                                            loader_only=True))
+            os.unlink(new_mod)
+
     # Regression test for http://bugs.python.org/issue14846
     def test_dir_removal_handling(self):
         mod = 'mod'
@@ -0,0 +1,215 @@
+from importlib import index
+from importlib import machinery
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+from . import util
+
+
+class IndexFileTests(unittest.TestCase):
+
+    def test_write_and_read(self):
+        with util.create_modules('mod', 'pkg.__init__', 'pkg.sub') as mapping:
+            root = mapping['.root']
+            os.mkdir(os.path.join(root, 'namespace'))
+            index_path = index.write_index(root)
+            self.assertEqual(index_path,
+                             os.path.join(root, index.INDEX_FILENAME))
+            modules = index.read_index(root)
+        self.assertEqual(modules, {
+            'mod': ('mod.py', 'source', False),
+            'pkg': (os.path.join('pkg', '__init__.py'), 'source', True),
+        })
+
+    def test_write_code(self):
+        with util.create_modules('mod', 'pkg.__init__', 'pkg.sub',
+                                 'pkg.subpkg.__init__',
+                                 'pkg.subpkg.mod') as mapping:
+            root = mapping['.root']
+            index.write_index(root, code=True)
+            modules = index.read_index(root)
+        self.assertEqual(modules, {
+            'mod': ('mod.py', 'source', False),
+            'pkg': (os.path.join('pkg', '__init__.py'), 'source', True),
+            'pkg.sub': (os.path.join('pkg', 'sub.py'), 'source', False),
+            'pkg.subpkg': (os.path.join('pkg', 'subpkg', '__init__.py'),
+                           'source', True),
+            'pkg.subpkg.mod': (os.path.join('pkg', 'subpkg', 'mod.py'),
+                               'source', False),
+        })
+
+    def test_bytecode(self):
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            os.rename(mapping['mod'], os.path.join(root, 'mod.pyc'))
+            index.write_index(root)
+            self.assertEqual(index.read_index(root),
+                             {'mod': ('mod.pyc', 'bytecode', False)})
+
+    def test_missing(self):
+        with util.create_modules('mod') as mapping:
+            self.assertIsNone(index.read_index(mapping['.root']))
+
+    def test_outdated(self):
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            index_path = index.write_index(root)
+            mtime = os.stat(index_path).st_mtime_ns
+            os.utime(root, ns=(mtime + 10**9, mtime + 10**9))
+            self.assertIsNone(index.read_index(root))
+
+    def test_invalid(self):
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            with open(os.path.join(root, index.INDEX_FILENAME), 'wb') as file:
+                file.write(b'\x00garbage')
+            self.assertIsNone(index.read_index(root))
+
+
+class IndexFinderTests(unittest.TestCase):
+
+    def test_find_spec(self):
+        with util.create_modules('mod', 'pkg.__init__') as mapping:
+            root = mapping['.root']
+            index.write_index(root)
+            finder = index.IndexFinder()
+            spec = finder.find_spec('mod')
+            self.assertEqual(spec.origin, mapping['mod'])
+            self.assertIsInstance(spec.loader, machinery.SourceFileLoader)
+            self.assertIsNone(spec.submodule_search_locations)
+            spec = finder.find_spec('pkg')
+            self.assertEqual(spec.origin, mapping['pkg.__init__'])
+            self.assertEqual(spec.submodule_search_locations,
+                             [os.path.dirname(mapping['pkg.__init__'])])
+            self.assertIsNone(finder.find_spec('nonexistent'))
+            # Only top-level modules are looked up.
+            self.assertIsNone(finder.find_spec('mod', [root]))
+
+    def test_code(self):
+        with util.create_modules('mod', 'pkg.__init__',
+                                 'pkg.sub') as mapping:
+            index.write_index(mapping['.root'], code=True)
+            # The code is taken from the index file as long as the file
+            # keeps the same modification time and size.
+            st = os.stat(mapping['mod'])
+            with open(mapping['mod'], 'w', encoding='utf-8') as file:
+                file.write("attr = 'new'")
+            os.utime(mapping['mod'], ns=(st.st_atime_ns, st.st_mtime_ns))
+            sys.meta_path[:] = [index.IndexFinder(), machinery.PathFinder]
+            import mod
+            import pkg.sub
+            loader = mod.__loader__
+            self.assertEqual(loader.get_source('mod'), "attr = 'new'")
+        self.assertEqual(mod.attr, 'mod')
+        self.assertIsInstance(loader, machinery.SourceFileLoader)
+        self.assertEqual(loader.get_code('mod').co_filename, mapping['mod'])
+        self.assertEqual(pkg.sub.attr, 'pkg.sub')
+        self.assertEqual(pkg.sub.__spec__.origin, mapping['pkg.sub'])
+        self.assertIs(type(pkg.sub.__loader__), type(mod.__loader__))
+
+    def test_code_modified(self):
+        with util.create_modules('mod') as mapping:
+            index.write_index(mapping['.root'], code=True)
+            with open(mapping['mod'], 'w', encoding='utf-8') as file:
+                file.write("attr = 'modified'")
+            finder = index.IndexFinder()
+            spec = finder.find_spec('mod')
+            self.assertIs(type(spec.loader), machinery.SourceFileLoader)
+
+    def test_submodules(self):
+        with util.create_modules('pkg.__init__', 'pkg.sub') as mapping:
+            root = mapping['.root']
+            pkg_dir = os.path.dirname(mapping['pkg.__init__'])
+            finder = index.IndexFinder()
+            index.write_index(root)
+            # Only index files with code hold submodules.
+            self.assertIsNone(finder.find_spec('pkg.sub', [pkg_dir]))
+            index.write_index(root, code=True)
+            finder.invalidate_caches()
+            spec = finder.find_spec('pkg.sub', [pkg_dir])
+            self.assertEqual(spec.origin, mapping['pkg.sub'])
+            self.assertIsNone(finder.find_spec('pkg.sub'))
+            self.assertIsNone(finder.find_spec('pkg.sub', [root]))
+            # The package directory was modified after the index was written.
+            index_path = os.path.join(root, index.INDEX_FILENAME)
+            mtime = os.stat(index_path).st_mtime_ns
+            os.utime(pkg_dir, ns=(mtime + 10**9, mtime + 10**9))
+            finder.invalidate_caches()
+            self.assertIsNone(finder.find_spec('pkg.sub', [pkg_dir]))
+            self.assertIsNotNone(finder.find_spec('pkg'))
+
+    def test_removed_module(self):
+        with util.create_modules('mod') as mapping:
+            index.write_index(mapping['.root'])
+            finder = index.IndexFinder()
+            os.unlink(mapping['mod'])
+            self.assertIsNone(finder.find_spec('mod'))
+
+    def test_unindexed_entry_first(self):
+        with util.create_modules('mod') as mapping, \
+             tempfile.TemporaryDirectory() as unindexed:
+            index.write_index(mapping['.root'])
+            missing = os.path.join(unindexed, 'missing')
+            finder = index.IndexFinder()
+            sys.path.insert(0, missing)
+            self.assertIsNotNone(finder.find_spec('mod'))
+            # The unindexed directory might shadow the module.
+            sys.path.insert(0, unindexed)
+            self.assertIsNone(finder.find_spec('mod'))
+
+    def test_invalidate_caches(self):
+        with util.create_modules('mod') as mapping:
+            finder = index.IndexFinder()
+            self.assertIsNone(finder.find_spec('mod'))
+            index.write_index(mapping['.root'])
+            self.assertIsNone(finder.find_spec('mod'))
+            finder.invalidate_caches()
+            self.assertIsNotNone(finder.find_spec('mod'))
+
+    def test_install(self):
+        with util.create_modules('mod') as mapping:
+            sys.meta_path[:] = [machinery.PathFinder]
+            finder = index.install()
+            self.assertEqual(sys.meta_path, [finder, machinery.PathFinder])
+            self.assertIs(index.install(), finder)
+            index.write_index(mapping['.root'])
+            import mod
+            self.assertEqual(mod.__spec__.origin, mapping['mod'])
+            index.uninstall()
+            self.assertEqual(sys.meta_path, [machinery.PathFinder])
+
+
+class CommandLineTests(unittest.TestCase):
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, 'mod.py'), 'w',
+                      encoding='utf-8') as file:
+                file.write('attr = 42')
+            index_path = os.path.join(root, index.INDEX_FILENAME)
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                self.assertEqual(index.main([root]), 0)
+            self.assertEqual(stdout.getvalue(), index_path + '\n')
+            self.assertTrue(os.path.exists(index_path))
+            self.assertEqual(index.main(['-q', '--code', root]), 0)
+            self.assertEqual(index.read_index(root),
+                             {'mod': ('mod.py', 'source', False)})
+            self.assertEqual(index.main(['-q', '--remove', root]), 0)
+            self.assertFalse(os.path.exists(index_path))
+
+    def test_main_missing_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            missing = os.path.join(directory, 'missing')
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(index.main([missing]), 1)
+            self.assertIn('no such directory', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,13 @@
 import importlib
 from importlib import abc
+from importlib import machinery
 from importlib import util
+import os
 import sys
+import textwrap
 import types
 import unittest
+from test.support import script_helper
 
 from . import util as test_util
 
@@ -51,6 +55,9 @@ def exec_module(self, module):
         exec(self.source_code, module.__dict__)
         self.loaded = module
 
+    def get_source(self, name):
+        return self.source_code
+
 
 class LazyLoaderTests(unittest.TestCase):
 
@@ -140,6 +147,147 @@ def test_module_already_in_sys(self):
             # Force the load; just care that no exception is raised.
             module.__name__
 
+    def test_reimport(self):
+        # Importing the module again should not trigger the load.
+        importer = TestingImporter()
+        with test_util.uncache(importer.module_name):
+            with test_util.import_state(meta_path=[importer]):
+                module = __import__(importer.module_name)
+                self.assertIs(__import__(importer.module_name), module)
+        self.assertIsNone(importer.loaded)
+        module.attr
+        self.assertIs(importer.loaded, module)
+
+    def test_other_loader_methods(self):
+        # The other methods of the eager loader are made available.
+        importer = TestingImporter()
+        loader = util.LazyLoader(importer)
+        self.assertEqual(loader.get_source(importer.module_name),
+                         importer.source_code)
+        with self.assertRaises(AttributeError):
+            loader.get_code
+
+
+class LazyImportsTests(unittest.TestCase):
+
+    def setUp(self):
+        modules = test_util.create_modules('lazy_mod', 'lazy_pkg.__init__',
+                                           'lazy_pkg.sub')
+        self.root = modules.__enter__()['.root']
+        self.addCleanup(modules.__exit__, None, None, None)
+        path_hook = machinery.FileFinder.path_hook(
+            (machinery.SourceFileLoader, machinery.SOURCE_SUFFIXES))
+        state = test_util.import_state(meta_path=[machinery.PathFinder],
+                                       path_hooks=[path_hook],
+                                       path=[self.root])
+        state.__enter__()
+        self.addCleanup(state.__exit__, None, None, None)
+
+    def test_enable(self):
+        util.enable_lazy_imports()
+        import lazy_mod
+        self.assertIs(type(lazy_mod), util._LazyImportModule)
+        self.assertEqual(lazy_mod.attr, 'lazy_mod')
+        self.assertIs(type(lazy_mod), types.ModuleType)
+        util.disable_lazy_imports()
+        self.assertEqual(sys.meta_path, [machinery.PathFinder])
+        import lazy_pkg
+        self.assertIs(type(lazy_pkg), types.ModuleType)
+
+    def test_allow(self):
+        util.enable_lazy_imports(allow=['lazy_pkg.sub'])
+        import lazy_mod
+        import lazy_pkg
+        self.assertIs(type(lazy_mod), types.ModuleType)
+        self.assertIs(type(lazy_pkg), types.ModuleType)
+        import lazy_pkg.sub
+        self.assertIs(type(lazy_pkg.sub), util._LazyImportModule)
+
+    def test_deny(self):
+        util.enable_lazy_imports(deny=['lazy_pkg'])
+        import lazy_mod
+        import lazy_pkg.sub
+        self.assertIs(type(lazy_mod), util._LazyImportModule)
+        self.assertIs(type(lazy_pkg), types.ModuleType)
+        self.assertIs(type(lazy_pkg.sub), types.ModuleType)
+
+    def test_from_import(self):
+        util.enable_lazy_imports()
+        from lazy_mod import attr
+        self.assertEqual(attr, 'lazy_mod')
+        from lazy_pkg import sub
+        self.assertEqual(sub.attr, 'lazy_pkg.sub')
+
+    def test_enable_twice(self):
+        util.enable_lazy_imports(deny=['lazy_mod'])
+        util.enable_lazy_imports()
+        self.assertEqual(len(sys.meta_path), 1)
+        import lazy_mod
+        self.assertIs(type(lazy_mod), util._LazyImportModule)
+
+    def test_import_attributes(self):
+        # The attributes set by the import system are read without loading
+        # the module, so that sys.modules can be iterated over.
+        util.enable_lazy_imports()
+        import lazy_mod
+        import lazy_pkg
+        for module in sys.modules.values():
+            if hasattr(module, '__path__'):
+                for index, path in enumerate(module.__path__):
+                    module.__path__[index] = os.path.abspath(path)
+            if getattr(module, '__file__', None):
+                module.__file__ = os.path.abspath(module.__file__)
+            for attr in ('__cached__', '__name__', '__loader__',
+                         '__package__', '__spec__'):
+                getattr(module, attr, None)
+        self.assertIs(type(lazy_mod), util._LazyImportModule)
+        self.assertIs(type(lazy_pkg), util._LazyImportModule)
+        self.assertFalse(hasattr(lazy_mod, '__path__'))
+        self.assertEqual(lazy_pkg.__path__, [os.path.join(self.root,
+                                                          'lazy_pkg')])
+        self.assertEqual(lazy_mod.__file__,
+                         os.path.join(self.root, 'lazy_mod.py'))
+        self.assertIsInstance(lazy_mod.__loader__, machinery.SourceFileLoader)
+        self.assertIs(type(lazy_mod), util._LazyImportModule)
+        # Importing a submodule loads the package.
+        import lazy_pkg.sub
+        self.assertIs(type(lazy_pkg), types.ModuleType)
+        self.assertIs(type(lazy_pkg.sub), util._LazyImportModule)
+        self.assertEqual(lazy_mod.attr, 'lazy_mod')
+        del lazy_mod.__file__
+        self.assertFalse(hasattr(lazy_mod, '__file__'))
+
+    def test_no_path_finder(self):
+        sys.meta_path = []
+        with self.assertRaises(ValueError):
+            util.enable_lazy_imports()
+
+
+class LazyImportsCommandLineTests(unittest.TestCase):
+
+    def test_iterate_modules(self):
+        code = textwrap.dedent("""
+            import json, email.message, colorsys
+            for module in sys.modules.values():
+                for attr in ('__file__', '__path__', '__cached__',
+                             '__name__', '__loader__', '__package__'):
+                    getattr(module, attr, None)
+            print(type(colorsys).__name__)
+            """)
+        res = script_helper.assert_python_ok('-X', 'lazy_imports', '-c',
+                                             'import sys\n' + code)
+        self.assertEqual(res.out.rstrip(), b'_LazyImportModule')
+
+    def test_command_line(self):
+        code = 'import colorsys; print(type(colorsys).__name__)'
+        res = script_helper.assert_python_ok('-X', 'lazy_imports', '-c', code)
+        self.assertEqual(res.out.rstrip(), b'_LazyImportModule')
+        res = script_helper.assert_python_ok('-c', code,
+                                             PYTHONLAZYIMPORTS='1')
+        self.assertEqual(res.out.rstrip(), b'_LazyImportModule')
+        res = script_helper.assert_python_ok('-c', code)
+        self.assertEqual(res.out.rstrip(), b'module')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,3 +21,484 @@ def f(o):
         Descriptor.__set__ = lambda *args: None
 
         self.assertEqual(f(o), 2)
+
+
+class TestLoadGlobalCache(unittest.TestCase):
+    def test_global_popped_after_optimization(self):
+        import types
+        mod = types.ModuleType("mod")
+        mod.x = 1
+        exec("def f():\n    return x\n", mod.__dict__)
+
+        for i in range(1025):
+            self.assertEqual(mod.f(), 1)
+
+        self.assertEqual(mod.__dict__.pop("x"), 1)
+        self.assertRaises(NameError, mod.f)
+
+
+class TestCallCache(unittest.TestCase):
+    def test_function_code_replaced_after_optimization(self):
+        def f(a, b):
+            return a + b
+
+        def g(a, b):
+            return f(a, b)
+
+        for i in range(1025):
+            self.assertEqual(g(i, 1), i + 1)
+
+        f.__code__ = (lambda a, b: a * b).__code__
+        self.assertEqual(g(3, 4), 12)
+
+        f.__code__ = (lambda a: a).__code__
+        self.assertRaises(TypeError, g, 3, 4)
+
+    def test_builtin_shadowed_after_optimization(self):
+        ns = {}
+        exec("def f(x):\n    return len(x), isinstance(x, list)", ns)
+        f = ns["f"]
+        for i in range(1025):
+            self.assertEqual(f([1, 2]), (2, True))
+
+        ns["len"] = lambda x: -1
+        ns["isinstance"] = lambda x, cls: None
+        self.assertEqual(f([1, 2]), (-1, None))
+
+    def test_builtin_errors(self):
+        def f(x):
+            return len(x)
+
+        def g(x):
+            return abs(x)
+
+        for i in range(1025):
+            self.assertEqual(f([i]), 1)
+            self.assertEqual(g(-i), i)
+        self.assertRaises(TypeError, f, 1)
+        self.assertRaises(TypeError, g, "")
+
+    def test_init_changed_after_optimization(self):
+        class C:
+            def __init__(self, x):
+                self.x = x
+
+        def f(x):
+            return C(x)
+
+        for i in range(1025):
+            self.assertEqual(f(i).x, i)
+
+        def init(self, x):
+            self.x = -x
+        C.__init__ = init
+        self.assertEqual(f(1).x, -1)
+
+        C.__init__ = lambda self, x: x
+        with self.assertRaisesRegex(TypeError, "should return None"):
+            f(1)
+
+        del C.__init__
+        self.assertRaises(TypeError, f, 1)
+
+    def test_init_raises(self):
+        class C:
+            def __init__(self, x):
+                if x < 0:
+                    raise ValueError(x)
+
+        def f(x):
+            return C(x)
+
+        for i in range(1025):
+            self.assertIsInstance(f(i), C)
+        self.assertRaises(ValueError, f, -1)
+
+    def test_method_descriptor_on_subclass(self):
+        class L(list):
+            pass
+
+        def f(seq, x):
+            seq.append(x)
+            seq.extend((x, x))
+            return seq
+
+        for i in range(1025):
+            self.assertEqual(f([], i), [i, i, i])
+        self.assertEqual(f(L(), 1), [1, 1, 1])
+
+    def test_method_becomes_instance_attribute(self):
+        class C:
+            def m(self, x):
+                return ("method", x)
+
+        def f(o, x):
+            return o.m(x)
+
+        o = C()
+        for i in range(1025):
+            self.assertEqual(f(o, i), ("method", i))
+
+        o.m = lambda x: ("attribute", x)
+        self.assertEqual(f(o, 1), ("attribute", 1))
+        o.m = len
+        self.assertEqual(f(o, [1, 2]), 2)
+        del o.m
+        self.assertEqual(f(o, 1), ("method", 1))
+
+
+class TestStoreAttrCache(unittest.TestCase):
+    def test_split_keys_order(self):
+        class C:
+            def __init__(self, a, b):
+                self.a = a
+                self.b = b
+
+        def f(o, x):
+            o.b = x
+            o.a = x
+            return o
+
+        for i in range(1025):
+            o = f(C(0, 0), i)
+            self.assertEqual((o.a, o.b), (i, i))
+
+        o = C(1, 2)
+        del o.a
+        f(o, 3)
+        self.assertEqual(vars(o), {"b": 3, "a": 3})
+
+    def test_descriptor_added_after_optimization(self):
+        class C:
+            pass
+
+        def f(o, x):
+            o.x = x
+
+        o = C()
+        o.x = 0
+        for i in range(1025):
+            f(o, i)
+        self.assertEqual(o.x, 1024)
+
+        stored = []
+        C.x = property(lambda self: None, lambda self, v: stored.append(v))
+        f(o, 1)
+        self.assertEqual(stored, [1])
+
+    def test_slots(self):
+        class C:
+            __slots__ = ("x",)
+
+        def f(o, x):
+            o.x = x
+
+        o = C()
+        for i in range(1025):
+            f(o, i)
+        self.assertEqual(o.x, 1024)
+
+        class D:
+            __slots__ = ("y", "x")
+        d = D()
+        f(d, 1)
+        self.assertEqual(d.x, 1)
+        self.assertRaises(AttributeError, getattr, d, "y")
+
+    def test_setattr_added_after_optimization(self):
+        class C:
+            pass
+
+        def f(o, x):
+            o.x = x
+
+        o = C()
+        o.x = 0
+        for i in range(1025):
+            f(o, i)
+
+        calls = []
+        C.__setattr__ = lambda self, name, value: calls.append((name, value))
+        f(o, 5)
+        self.assertEqual(calls, [("x", 5)])
+        self.assertEqual(o.x, 1024)
+
+
+    def test_dict_subclass_split_keys(self):
+        class C:
+            pass
+
+        class D(dict):
+            pass
+
+        def f(o, x):
+            o.x = x
+
+        o = C()
+        o.x = 0
+        for i in range(1025):
+            f(o, i)
+        self.assertEqual(o.x, 1024)
+
+        o = C()
+        o.__dict__ = D(x=0)
+        f(o, 1)
+        self.assertEqual(o.x, 1)
+        self.assertIs(type(vars(o)), D)
+
+    def test_dict_subclass_with_hint(self):
+        class C:
+            pass
+
+        class D(dict):
+            pass
+
+        def f(o, x):
+            o.x = x
+
+        o = C()
+        o.__dict__ = {"y": 0, "x": 0}
+        for i in range(1025):
+            f(o, i)
+        self.assertEqual(o.x, 1024)
+
+        o = C()
+        o.__dict__ = D(y=0, x=0)
+        f(o, 1)
+        self.assertEqual(o.x, 1)
+        self.assertIs(type(vars(o)), D)
+
+
+class TestLoadMethodCache(unittest.TestCase):
+    def test_method_shadowed_after_optimization(self):
+        class C:
+            def m(self):
+                return "method"
+
+        def f(o):
+            return o.m()
+
+        o = C()
+        o.x = 1
+        for i in range(1025):
+            self.assertEqual(f(o), "method")
+
+        o.m = lambda: "instance"
+        self.assertEqual(f(o), "instance")
+
+    def test_method_replaced_after_optimization(self):
+        class C:
+            def m(self):
+                return "old"
+
+        def f(o):
+            return o.m()
+
+        o = C()
+        for i in range(1025):
+            self.assertEqual(f(o), "old")
+
+        C.m = lambda self: "new"
+        self.assertEqual(f(o), "new")
+
+    def test_builtin_method(self):
+        def f(s):
+            return s.upper()
+
+        for i in range(1025):
+            self.assertEqual(f("a"), "A")
+
+        class S(str):
+            def upper(self):
+                return "overridden"
+        self.assertEqual(f(S("a")), "overridden")
+
+    def test_module_function(self):
+        import types
+        mod = types.ModuleType("mod")
+        mod.g = lambda: 1
+
+        def f():
+            return mod.g()
+
+        for i in range(1025):
+            self.assertEqual(f(), 1)
+
+        mod.g = lambda: 2
+        self.assertEqual(f(), 2)
+        del mod.g
+        self.assertRaises(AttributeError, f)
+
+
+class TestArithmeticCache(unittest.TestCase):
+    def test_add_type_changed_after_optimization(self):
+        def f(a, b):
+            return a + b
+
+        for i in range(1025):
+            self.assertEqual(f(i, 1), i + 1)
+
+        self.assertEqual(f(2**100, 2**100), 2**101)
+        self.assertEqual(f(1.5, 2.0), 3.5)
+        self.assertEqual(f("a", "b"), "ab")
+        self.assertEqual(f([1], [2]), [1, 2])
+        self.assertEqual(f(1, 2.5), 3.5)
+        self.assertEqual(f(True, True), 2)
+        self.assertRaises(TypeError, f, 1, "a")
+
+    def test_float_add_and_multiply(self):
+        def f(a, b):
+            return a + b, a * b
+
+        for i in range(1025):
+            self.assertEqual(f(1.5, 2.0), (3.5, 3.0))
+
+        self.assertEqual(f(3, 4), (7, 12))
+        inf = float("inf")
+        self.assertEqual(f(inf, 2.0), (inf, inf))
+
+    def test_int_multiply(self):
+        def f(a, b):
+            return a * b
+
+        for i in range(1025):
+            self.assertEqual(f(i, -3), i * -3)
+
+        self.assertEqual(f(2**40, 2**40), 2**80)
+        self.assertEqual(f(-7, 2**70), -7 * 2**70)
+        self.assertEqual(f("ab", 2), "abab")
+        self.assertEqual(f(2, "ab"), "abab")
+
+    def test_str_append(self):
+        def f(n):
+            s = ""
+            for i in range(n):
+                s += "x"
+                s = s + "y"
+            return s
+
+        for i in range(10):
+            self.assertEqual(f(200), "xy" * 200)
+
+        # The left operand must not be modified in place while it is
+        # still referenced elsewhere.
+        def g(parts):
+            s = parts[0]
+            for i in range(1025):
+                s += "x"
+            return s
+
+        parts = ["a"]
+        self.assertEqual(g(parts), "a" + "x" * 1025)
+        self.assertEqual(parts, ["a"])
+
+    def test_inplace_add_list(self):
+        def f(acc, item):
+            acc += item
+            return acc
+
+        for i in range(1025):
+            self.assertEqual(f(i, 1), i + 1)
+
+        lst = [1]
+        self.assertIs(f(lst, [2]), lst)
+        self.assertEqual(lst, [1, 2])
+
+
+class TestCompareOpCache(unittest.TestCase):
+    def test_int_compare(self):
+        def f(a, b):
+            res = []
+            if a < b: res.append("<")
+            if a <= b: res.append("<=")
+            if a == b: res.append("==")
+            if a != b: res.append("!=")
+            if a > b: res.append(">")
+            if a >= b: res.append(">=")
+            if not a < b: res.append("not <")
+            return res
+
+        expected = {
+            -1: ["<", "<=", "!="],
+            0: ["<=", "==", ">=", "not <"],
+            1: ["!=", ">", ">=", "not <"],
+        }
+        for i in range(1025):
+            a = i % 3 - 1
+            self.assertEqual(f(a, 0), expected[a])
+        self.assertEqual(f(-2**100, 0), expected[-1])
+
+    def test_float_compare_nan(self):
+        def f(a, b):
+            if a == b:
+                return "eq"
+            if a != b:
+                return "ne"
+            return "neither"
+
+        for i in range(1025):
+            self.assertEqual(f(1.0, 1.0), "eq")
+            self.assertEqual(f(1.0, 2.0), "ne")
+
+        nan = float("nan")
+        self.assertEqual(f(nan, nan), "ne")
+        self.assertEqual(f(nan, 1.0), "ne")
+
+        def g(a, b):
+            return [a < b, a <= b, a > b, a >= b, a == b, a != b]
+
+        def h(a, b):
+            res = []
+            for cmp in range(6):
+                if cmp == 0 and a < b: res.append(0)
+                if cmp == 1 and a <= b: res.append(1)
+                if cmp == 2 and a > b: res.append(2)
+                if cmp == 3 and a >= b: res.append(3)
+                if cmp == 4 and a == b: res.append(4)
+                if cmp == 5 and a != b: res.append(5)
+            return res
+
+        for i in range(1025):
+            h(1.0, 2.0)
+        for a, b in [(nan, 1.0), (1.0, nan), (2.0, 1.0), (-0.0, 0.0)]:
+            expected = [i for i, r in enumerate(g(a, b)) if r]
+            self.assertEqual(h(a, b), expected)
+
+    def test_compare_type_changed_after_optimization(self):
+        def f(a, b):
+            if a < b:
+                return True
+            return False
+
+        for i in range(1025):
+            self.assertTrue(f(1, 2))
+
+        self.assertTrue(f(1, 2**100))
+        self.assertFalse(f(2**100, 1))
+        self.assertTrue(f(1.0, 2))
+        self.assertTrue(f("a", "b"))
+        self.assertRaises(TypeError, f, 1, "a")
+
+        class C:
+            def __lt__(self, other):
+                return 0
+        self.assertFalse(f(C(), C()))
+
+    def test_str_equality(self):
+        def f(a, b):
+            if a == b:
+                return True
+            return False
+
+        for i in range(1025):
+            self.assertTrue(f("spam", "spam"))
+            self.assertFalse(f("spam", "eggs"))
+
+        class S(str):
+            def __eq__(self, other):
+                return True
+        self.assertTrue(f(S("spam"), "eggs"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -921,6 +921,178 @@ def __del__(self):
         self.assertEqual(stdout.rstrip(), b"")
         self.assertEqual(stderr.rstrip(), b"")
 
+    def test_specialization_stats(self):
+        code = """if 1:
+            import sys
+            def f(n):
+                total = 0
+                for i in range(n):
+                    total += i
+                return total
+            sys._clearspecializationstats()
+            for _ in range(100):
+                f(100)
+            stats = sys._getspecializationstats()
+            print(stats['inplace_add']['hit'] > 0)
+            print(stats['inplace_add']['specialization_success'] > 0)
+            sys._clearspecializationstats()
+            print(sys._getspecializationstats()['inplace_add']['hit'])
+            """
+        expected = [b'True', b'True', b'0']
+        rc, out, err = assert_python_ok('-X', 'specialization_stats', '-c', code)
+        self.assertEqual(out.split(), expected)
+        rc, out, err = assert_python_ok('-c', code,
+                                        PYTHONSPECIALIZATIONSTATS='1')
+        self.assertEqual(out.split(), expected)
+
+    def test_specialization_stats_disabled(self):
+        code = "import sys; print(sys._getspecializationstats())"
+        rc, out, err = assert_python_ok('-c', code)
+        self.assertEqual(out.rstrip(), b'None')
+
+    def test_getspecializationstate(self):
+        import dis
+
+        def f(a, b):
+            return a + b
+
+        code = f.__code__
+        self.assertIsNone(sys._getspecializationstate(code))
+        for _ in range(100):
+            f(1, 2)
+        state = sys._getspecializationstate(code)
+        self.assertEqual(len(state), 1)
+        offset, opcode, counter, cache = state[0]
+        self.assertEqual(code.co_code[offset], dis.opmap['BINARY_ADD'])
+        self.assertNotEqual(opcode, dis.opmap['BINARY_ADD'])
+        self.assertIsInstance(counter, int)
+        self.assertIsNone(cache)
+        self.assertRaises(TypeError, sys._getspecializationstate, f)
+
+    def test_getspecializationstate_cache(self):
+        import dis
+
+        class C:
+            def __init__(self):
+                self.x = 1
+
+        ns = {}
+        exec("def f(o):\n    return o.x", ns)
+        code = ns['f'].__code__
+        for _ in range(100):
+            ns['f'](C())
+        [(offset, opcode, counter, cache)] = [
+            entry for entry in sys._getspecializationstate(code)
+            if code.co_code[entry[0]] == dis.opmap['LOAD_ATTR']]
+        self.assertNotEqual(opcode, dis.opmap['LOAD_ATTR'])
+        self.assertEqual(cache['original_oparg'], code.co_code[offset + 1])
+        self.assertEqual(set(cache), {'original_oparg', 'index',
+                                      'tp_version', 'dk_version_or_hint'})
+        self.assertNotEqual(cache['tp_version'], 0)
+
+    def test_importprofile(self):
+        code = """if 1:
+            import sys
+            records = []
+            sys.setimportprofile(records.append)
+            print(sys.getimportprofile() == records.append)
+            import json
+            try:
+                import nonexistent_module
+            except ImportError:
+                pass
+            sys.setimportprofile(None)
+            print(sys.getimportprofile())
+            import colorsys
+            for record in records:
+                print(record)
+            """
+        rc, out, err = assert_python_ok('-S', '-c', code)
+        lines = out.decode().splitlines()
+        self.assertEqual(lines[:2], ['True', 'None'])
+        records = {record['module']: record for record in map(eval, lines[2:])}
+        self.assertNotIn('colorsys', records)
+
+        record = records['json']
+        self.assertEqual(record['parents'], ())
+        self.assertEqual(record['loader'], 'SourceFileLoader')
+        self.assertTrue(record['origin'].endswith('__init__.py'))
+        self.assertGreater(record['size'], 0)
+        self.assertTrue(record['success'])
+        self.assertGreaterEqual(record['cumulative_us'], record['self_us'])
+        self.assertEqual(records['json.decoder']['parents'], ('json',))
+
+        record = records['nonexistent_module']
+        self.assertFalse(record['success'])
+        self.assertIsNone(record['loader'])
+        self.assertIsNone(record['origin'])
+        self.assertIsNone(record['size'])
+
+    def test_importprofile_self_time(self):
+        # The time spent by the profile function is not accounted to the
+        # parent import
+        code = """if 1:
+            import sys, time
+            records = []
+            def profile(record):
+                if record['module'] == 'json.decoder':
+                    time.sleep(1.0)
+                records.append(record)
+            sys.setimportprofile(profile)
+            import json
+            sys.setimportprofile(None)
+            for record in records:
+                print(record)
+            """
+        rc, out, err = assert_python_ok('-S', '-c', code)
+        records = {record['module']: record
+                   for record in map(eval, out.decode().splitlines())}
+        record = records['json']
+        self.assertLess(record['self_us'], 1_000_000)
+        self.assertGreaterEqual(record['cumulative_us'], 1_000_000)
+
+    def test_importprofile_errors(self):
+        code = """if 1:
+            import sys
+            def profile(record):
+                raise ValueError(record['module'])
+            sys.setimportprofile(profile)
+            import colorsys
+            print(colorsys.__name__)
+            """
+        rc, out, err = assert_python_ok('-S', '-c', code)
+        self.assertEqual(out.rstrip(), b'colorsys')
+        self.assertIn(b'ValueError: colorsys', err)
+        self.assertRaises(TypeError, sys.setimportprofile, 42)
+
+    def test_importtime_formats(self):
+        import csv
+        import json
+        code = "import colorsys"
+        rc, out, err = assert_python_ok('-S', '-X', 'importtime=json',
+                                        '-c', code)
+        records = [json.loads(line) for line in err.decode().splitlines()]
+        record = records[-1]
+        self.assertEqual(record['module'], 'colorsys')
+        self.assertEqual(record['parents'], [])
+        self.assertEqual(record['loader'], 'SourceFileLoader')
+        self.assertTrue(record['success'])
+
+        rc, out, err = assert_python_ok('-S', '-c', code,
+                                        PYTHONPROFILEIMPORTTIME='csv')
+        rows = list(csv.DictReader(err.decode().splitlines()))
+        row = rows[-1]
+        self.assertEqual(row['module'], 'colorsys')
+        self.assertEqual(row['parents'], '')
+        self.assertEqual(row['loader'], 'SourceFileLoader')
+        self.assertEqual(row['success'], '1')
+        self.assertGreaterEqual(int(row['cumulative_us']),
+                                int(row['self_us']))
+
+        rc, out, err = assert_python_failure('-X', 'importtime=xml',
+                                             '-c', 'pass')
+        self.assertIn(b'-X importtime=FORMAT', err)
+
     @unittest.skipUnless(hasattr(sys, 'getandroidapilevel'),
                          'need sys.getandroidapilevel()')
     def test_getandroidapilevel(self):
@@ -1,6 +1,11 @@
 #include "Python.h"
 #include "pycore_pyerrors.h"      // _PyErr_ClearExcState()
+#include "structmember.h"         // PyMemberDef
 #include <stddef.h>               // offsetof()
+#include <time.h>                 // clock_gettime()
+#ifdef MS_WINDOWS
+#  include <windows.h>            // GetThreadTimes()
+#endif
 
 
 /*[clinic input]
@@ -28,6 +33,10 @@ static PyObject *asyncio_iscoroutine_func;
 static PyObject *asyncio_task_get_stack_func;
 static PyObject *asyncio_task_print_stack_func;
 static PyObject *asyncio_task_repr_info_func;
+static PyObject *asyncio_handle_repr_info_func;
+static PyObject *asyncio_timer_handle_repr_info_func;
+static PyObject *asyncio_extract_stack_func;
+static PyObject *asyncio_format_callback_source_func;
 static PyObject *asyncio_InvalidStateError;
 static PyObject *asyncio_CancelledError;
 static PyObject *context_kwname;
@@ -85,6 +94,11 @@ typedef struct {
     PyObject *task_context;
     int task_must_cancel;
     int task_log_destroy_pending;
+    /* Accounting of the steps run while profiling the task. */
+    int task_profiling;
+    Py_ssize_t task_steps;
+    double task_run_time;
+    double task_cpu_time;
 } TaskObj;
 
 typedef struct {
@@ -93,6 +107,25 @@ typedef struct {
     PyObject *sw_arg;
 } TaskStepMethWrapper;
 
+typedef struct {
+    PyObject_HEAD
+    PyObject *h_callback;
+    PyObject *h_args;
+    PyObject *h_loop;
+    PyObject *h_context;
+    PyObject *h_source_traceback;
+    PyObject *h_repr;
+    PyObject *h_weakreflist;
+    char h_cancelled;
+} HandleObj;
+
+typedef struct {
+    HandleObj th_base;
+    PyObject *th_when;
+    char th_scheduled;
+    char th_due;
+} TimerHandleObj;
+
 typedef struct {
     PyObject_HEAD
     PyObject *rl_loop;
@@ -105,13 +138,18 @@ typedef struct {
 static PyTypeObject FutureType;
 static PyTypeObject TaskType;
 static PyTypeObject PyRunningLoopHolder_Type;
+static PyTypeObject HandleType;
+static PyTypeObject TimerHandleType;
 
 
 #define Future_CheckExact(obj) Py_IS_TYPE(obj, &FutureType)
 #define Task_CheckExact(obj) Py_IS_TYPE(obj, &TaskType)
+#define Handle_CheckExact(obj) Py_IS_TYPE(obj, &HandleType)
+#define TimerHandle_CheckExact(obj) Py_IS_TYPE(obj, &TimerHandleType)
 
 #define Future_Check(obj) PyObject_TypeCheck(obj, &FutureType)
 #define Task_Check(obj) PyObject_TypeCheck(obj, &TaskType)
+#define TimerHandle_Check(obj) PyObject_TypeCheck(obj, &TimerHandleType)
 
 #include "clinic/_asynciomodule.c.h"
 
@@ -2000,8 +2038,43 @@ leave_task(PyObject *loop, PyObject *task)
     return _PyDict_DelItem_KnownHash(current_tasks, loop, hash);
 }
 
+static PyObject *
+swap_current_task(PyObject *loop, PyObject *task)
+{
+    /* Make task the current task of loop and return a new reference to the
+       previous one.  task and the previous task may be None. */
+    PyObject *prev_task;
+    Py_hash_t hash;
+    hash = PyObject_Hash(loop);
+    if (hash == -1) {
+        return NULL;
+    }
+    prev_task = _PyDict_GetItem_KnownHash(current_tasks, loop, hash);
+    if (prev_task == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        prev_task = Py_None;
+    }
+    Py_INCREF(prev_task);
+    int res = 0;
+    if (task != Py_None) {
+        res = _PyDict_SetItem_KnownHash(current_tasks, loop, task, hash);
+    }
+    else if (prev_task != Py_None) {
+        res = _PyDict_DelItem_KnownHash(current_tasks, loop, hash);
+    }
+    if (res < 0) {
+        Py_DECREF(prev_task);
+        return NULL;
+    }
+    return prev_task;
+}
+
 /* ----- Task */
 
+static int task_eager_start(TaskObj *task);
+
 /*[clinic input]
 _asyncio.Task.__init__
 
@@ -2009,14 +2082,15 @@ _asyncio.Task.__init__
     *
     loop: object = None
     name: object = None
+    eager_start: bool = False
 
 A coroutine wrapped in a Future.
 [clinic start generated code]*/
 
 static int
 _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
-                            PyObject *name)
-/*[clinic end generated code: output=88b12b83d570df50 input=352a3137fe60091d]*/
+                            PyObject *name, int eager_start)
+/*[clinic end generated code: output=0e505cba3b853ad5 input=f29f6d18104e54f4]*/
 {
     if (future_init((FutureObj*)self, loop)) {
         return -1;
@@ -2057,10 +2131,39 @@ _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
         return -1;
     }
 
-    if (task_call_step_soon(self, NULL)) {
+    /* Decide whether to profile the task before its first step, which can
+       run right away. */
+    _Py_IDENTIFIER(_profiler);
+    PyObject *profiler;
+    if (_PyObject_LookupAttrId(self->task_loop, &PyId__profiler,
+                               &profiler) < 0) {
         return -1;
     }
-    return register_task((PyObject*)self);
+    if (profiler != NULL) {
+        self->task_profiling = (profiler != Py_None);
+        Py_DECREF(profiler);
+    }
+
+    if (register_task((PyObject*)self) < 0) {
+        return -1;
+    }
+    if (eager_start) {
+        _Py_IDENTIFIER(is_running);
+        PyObject *res = _PyObject_CallMethodIdNoArgs(self->task_loop,
+                                                     &PyId_is_running);
+        if (res == NULL) {
+            return -1;
+        }
+        int is_running = PyObject_IsTrue(res);
+        Py_DECREF(res);
+        if (is_running < 0) {
+            return -1;
+        }
+        if (is_running) {
+            return task_eager_start(self);
+        }
+    }
+    return task_call_step_soon(self, NULL);
 }
 
 static int
@@ -2111,6 +2214,32 @@ TaskObj_set_log_destroy_pending(TaskObj *task, PyObject *val, void *Py_UNUSED(ig
     return 0;
 }
 
+static PyObject *
+TaskObj_get_profiling(TaskObj *task, void *Py_UNUSED(ignored))
+{
+    if (task->task_profiling) {
+        Py_RETURN_TRUE;
+    }
+    else {
+        Py_RETURN_FALSE;
+    }
+}
+
+static int
+TaskObj_set_profiling(TaskObj *task, PyObject *val, void *Py_UNUSED(ignored))
+{
+    if (val == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete attribute");
+        return -1;
+    }
+    int is_true = PyObject_IsTrue(val);
+    if (is_true < 0) {
+        return -1;
+    }
+    task->task_profiling = is_true;
+    return 0;
+}
+
 static PyObject *
 TaskObj_get_must_cancel(TaskObj *task, void *Py_UNUSED(ignored))
 {
@@ -2483,6 +2612,15 @@ static PyGetSetDef TaskType_getsetlist[] = {
     {"_must_cancel", (getter)TaskObj_get_must_cancel, NULL, NULL},
     {"_coro", (getter)TaskObj_get_coro, NULL, NULL},
     {"_fut_waiter", (getter)TaskObj_get_fut_waiter, NULL, NULL},
+    {"_profiling", (getter)TaskObj_get_profiling,
+                   (setter)TaskObj_set_profiling, NULL},
+    {NULL} /* Sentinel */
+};
+
+static PyMemberDef TaskType_members[] = {
+    {"_steps", T_PYSSIZET, offsetof(TaskObj, task_steps), READONLY},
+    {"_run_time", T_DOUBLE, offsetof(TaskObj, task_run_time), READONLY},
+    {"_cpu_time", T_DOUBLE, offsetof(TaskObj, task_cpu_time), READONLY},
     {NULL} /* Sentinel */
 };
 
@@ -2502,6 +2640,7 @@ static PyTypeObject TaskType = {
     .tp_iter = (getiterfunc)future_new_iter,
     .tp_methods = TaskType_methods,
     .tp_getset = TaskType_getsetlist,
+    .tp_members = TaskType_members,
     .tp_dictoffset = offsetof(TaskObj, dict),
     .tp_init = (initproc)_asyncio_Task___init__,
     .tp_new = PyType_GenericNew,
@@ -2941,17 +3080,62 @@ task_step_impl(TaskObj *task, PyObject *exc)
     return NULL;
 }
 
+/* Return the CPU time of the current thread in seconds. */
+static double
+thread_cpu_time(void)
+{
+#if defined(MS_WINDOWS)
+    FILETIME creation_time, exit_time, kernel_time, user_time;
+    ULARGE_INTEGER ktime, utime;
+
+    if (!GetThreadTimes(GetCurrentThread(), &creation_time, &exit_time,
+                        &kernel_time, &user_time)) {
+        return 0.0;
+    }
+    ktime.u.LowPart = kernel_time.dwLowDateTime;
+    ktime.u.HighPart = kernel_time.dwHighDateTime;
+    utime.u.LowPart = user_time.dwLowDateTime;
+    utime.u.HighPart = user_time.dwHighDateTime;
+    /* ktime and utime have a resolution of 100 nanoseconds */
+    return (double)(ktime.QuadPart + utime.QuadPart) * 1e-7;
+#elif defined(HAVE_CLOCK_GETTIME) && defined(CLOCK_THREAD_CPUTIME_ID)
+    struct timespec ts;
+
+    if (clock_gettime(CLOCK_THREAD_CPUTIME_ID, &ts) != 0) {
+        return 0.0;
+    }
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+#else
+    return (double)clock() / CLOCKS_PER_SEC;
+#endif
+}
+
 static PyObject *
 task_step(TaskObj *task, PyObject *exc)
 {
     PyObject *res;
+    int profiling = task->task_profiling;
+    _PyTime_t start_time = 0;
+    double start_cpu_time = 0.0;
 
     if (enter_task(task->task_loop, (PyObject*)task) < 0) {
         return NULL;
     }
 
+    if (profiling) {
+        start_time = _PyTime_GetPerfCounter();
+        start_cpu_time = thread_cpu_time();
+    }
+
     res = task_step_impl(task, exc);
 
+    if (profiling) {
+        task->task_steps++;
+        task->task_run_time += _PyTime_AsSecondsDouble(
+            _PyTime_GetPerfCounter() - start_time);
+        task->task_cpu_time += thread_cpu_time() - start_cpu_time;
+    }
+
     if (res == NULL) {
         PyObject *et, *ev, *tb;
         PyErr_Fetch(&et, &ev, &tb);
@@ -2970,6 +3154,68 @@ task_step(TaskObj *task, PyObject *exc)
     }
 }
 
+static int
+task_eager_start(TaskObj *task)
+{
+    /* Run the first step of the task right away, in the context of the
+       task, while the task creating it is suspended. */
+    PyObject *prev_task = swap_current_task(task->task_loop,
+                                            (PyObject *)task);
+    if (prev_task == NULL) {
+        return -1;
+    }
+
+    int retval = 0;
+    if (PyContext_Enter(task->task_context) < 0) {
+        retval = -1;
+    }
+    else {
+        int profiling = task->task_profiling;
+        _PyTime_t start_time = 0;
+        double start_cpu_time = 0.0;
+        if (profiling) {
+            start_time = _PyTime_GetPerfCounter();
+            start_cpu_time = thread_cpu_time();
+        }
+
+        PyObject *res = task_step_impl(task, NULL);
+
+        if (profiling) {
+            task->task_steps++;
+            task->task_run_time += _PyTime_AsSecondsDouble(
+                _PyTime_GetPerfCounter() - start_time);
+            task->task_cpu_time += thread_cpu_time() - start_cpu_time;
+        }
+        if (res == NULL) {
+            retval = -1;
+        }
+        else {
+            Py_DECREF(res);
+        }
+
+        PyObject *et, *ev, *tb;
+        PyErr_Fetch(&et, &ev, &tb);
+        if (PyContext_Exit(task->task_context) < 0) {
+            retval = -1;
+        }
+        _PyErr_ChainExceptions(et, ev, tb);
+    }
+
+    PyObject *et, *ev, *tb;
+    PyErr_Fetch(&et, &ev, &tb);
+    PyObject *cur_task = swap_current_task(task->task_loop, prev_task);
+    Py_DECREF(prev_task);
+    if (cur_task == NULL) {
+        retval = -1;
+    }
+    else {
+        assert(cur_task == (PyObject *)task);
+        Py_DECREF(cur_task);
+    }
+    _PyErr_ChainExceptions(et, ev, tb);
+    return retval;
+}
+
 static PyObject *
 task_wakeup(TaskObj *task, PyObject *o)
 {
@@ -3214,6 +3460,27 @@ _asyncio__leave_task_impl(PyObject *module, PyObject *loop, PyObject *task)
 }
 
 
+/*[clinic input]
+_asyncio._swap_current_task
+
+    loop: object
+    task: object
+    /
+
+Make task the current task of loop, and return the previous one.
+
+task and the returned task may be None.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__swap_current_task_impl(PyObject *module, PyObject *loop,
+                                 PyObject *task)
+/*[clinic end generated code: output=9f88de958df74c7e input=47c068c98fd07d90]*/
+{
+    return swap_current_task(loop, task);
+}
+
+
 /*********************** PyRunningLoopHolder ********************/
 
 
@@ -3255,6 +3522,735 @@ static PyTypeObject PyRunningLoopHolder_Type = {
 };
 
 
+/*********************** Handle **************************/
+
+/*[clinic input]
+class _asyncio.Handle "HandleObj *" "&HandleType"
+class _asyncio.TimerHandle "TimerHandleObj *" "&TimerHandleType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=6d21dd13050cb891]*/
+
+static int
+handle_init(HandleObj *self, PyObject *callback, PyObject *args,
+            PyObject *loop, PyObject *context)
+{
+    _Py_IDENTIFIER(get_debug);
+
+    if (context == Py_None) {
+        context = PyContext_CopyCurrent();
+        if (context == NULL) {
+            return -1;
+        }
+    }
+    else {
+        Py_INCREF(context);
+    }
+    Py_XSETREF(self->h_context, context);
+    Py_INCREF(loop);
+    Py_XSETREF(self->h_loop, loop);
+    Py_INCREF(callback);
+    Py_XSETREF(self->h_callback, callback);
+    Py_INCREF(args);
+    Py_XSETREF(self->h_args, args);
+    self->h_cancelled = 0;
+    Py_CLEAR(self->h_repr);
+    Py_CLEAR(self->h_source_traceback);
+
+    PyObject *res = _PyObject_CallMethodIdNoArgs(loop, &PyId_get_debug);
+    if (res == NULL) {
+        return -1;
+    }
+    int is_true = PyObject_IsTrue(res);
+    Py_DECREF(res);
+    if (is_true < 0) {
+        return -1;
+    }
+    if (is_true && !_Py_IsFinalizing()) {
+        /* The frame calling Handle() is the one which scheduled the
+           callback, there is no Python frame for this function. */
+        PyObject *frame = (PyObject *)PyEval_GetFrame();
+        self->h_source_traceback = PyObject_CallOneArg(
+            asyncio_extract_stack_func, frame != NULL ? frame : Py_None);
+        if (self->h_source_traceback == NULL) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/*[clinic input]
+_asyncio.Handle.__init__
+
+    callback: object
+    args: object
+    loop: object
+    context: object = None
+
+Object returned by callback registration methods.
+[clinic start generated code]*/
+
+static int
+_asyncio_Handle___init___impl(HandleObj *self, PyObject *callback,
+                              PyObject *args, PyObject *loop,
+                              PyObject *context)
+/*[clinic end generated code: output=40a28e55725495e2 input=c0d847a7bc9e878f]*/
+{
+    return handle_init(self, callback, args, loop, context);
+}
+
+static int
+HandleObj_clear(HandleObj *self)
+{
+    Py_CLEAR(self->h_callback);
+    Py_CLEAR(self->h_args);
+    Py_CLEAR(self->h_loop);
+    Py_CLEAR(self->h_context);
+    Py_CLEAR(self->h_source_traceback);
+    Py_CLEAR(self->h_repr);
+    return 0;
+}
+
+static int
+HandleObj_traverse(HandleObj *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->h_callback);
+    Py_VISIT(self->h_args);
+    Py_VISIT(self->h_loop);
+    Py_VISIT(self->h_context);
+    Py_VISIT(self->h_source_traceback);
+    Py_VISIT(self->h_repr);
+    return 0;
+}
+
+static void
+HandleObj_dealloc(PyObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    if (((HandleObj *)self)->h_weakreflist != NULL) {
+        PyObject_ClearWeakRefs(self);
+    }
+    (void)HandleObj_clear((HandleObj *)self);
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject *
+HandleObj_repr(HandleObj *self)
+{
+    _Py_IDENTIFIER(_repr_info);
+
+    if (self->h_repr != NULL && self->h_repr != Py_None) {
+        Py_INCREF(self->h_repr);
+        return self->h_repr;
+    }
+
+    PyObject *rinfo = _PyObject_CallMethodIdNoArgs((PyObject*)self,
+                                                   &PyId__repr_info);
+    if (rinfo == NULL) {
+        return NULL;
+    }
+
+    PyObject *sep = PyUnicode_FromString(" ");
+    if (sep == NULL) {
+        Py_DECREF(rinfo);
+        return NULL;
+    }
+    PyObject *rinfo_s = PyUnicode_Join(sep, rinfo);
+    Py_DECREF(sep);
+    Py_DECREF(rinfo);
+    if (rinfo_s == NULL) {
+        return NULL;
+    }
+
+    PyObject *rstr = PyUnicode_FromFormat("<%U>", rinfo_s);
+    Py_DECREF(rinfo_s);
+    return rstr;
+}
+
+/*[clinic input]
+_asyncio.Handle._repr_info
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_Handle__repr_info_impl(HandleObj *self)
+/*[clinic end generated code: output=7838b12075048d03 input=dba1c0a083077d57]*/
+{
+    return PyObject_CallOneArg(asyncio_handle_repr_info_func,
+                               (PyObject *)self);
+}
+
+static int
+handle_cancel(HandleObj *self)
+{
+    _Py_IDENTIFIER(get_debug);
+
+    if (self->h_cancelled) {
+        return 0;
+    }
+    self->h_cancelled = 1;
+
+    if (self->h_loop != NULL) {
+        PyObject *res = _PyObject_CallMethodIdNoArgs(self->h_loop,
+                                                     &PyId_get_debug);
+        if (res == NULL) {
+            return -1;
+        }
+        int is_true = PyObject_IsTrue(res);
+        Py_DECREF(res);
+        if (is_true < 0) {
+            return -1;
+        }
+        if (is_true) {
+            /* Keep a representation in debug mode to keep callback and
+               parameters. For example, to log the warning
+               "Executing <Handle...> took 2.5 second" */
+            PyObject *repr = PyObject_Repr((PyObject *)self);
+            if (repr == NULL) {
+                return -1;
+            }
+            Py_XSETREF(self->h_repr, repr);
+        }
+    }
+    Py_INCREF(Py_None);
+    Py_XSETREF(self->h_callback, Py_None);
+    Py_INCREF(Py_None);
+    Py_XSETREF(self->h_args, Py_None);
+    return 0;
+}
+
+/*[clinic input]
+_asyncio.Handle.cancel
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_Handle_cancel_impl(HandleObj *self)
+/*[clinic end generated code: output=ddb39234782aab82 input=eaa3eb93236f622f]*/
+{
+    if (handle_cancel(self) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_asyncio.Handle.cancelled
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_Handle_cancelled_impl(HandleObj *self)
+/*[clinic end generated code: output=0f4ad57f569e9f24 input=14a55098bea1b40a]*/
+{
+    return PyBool_FromLong(self->h_cancelled);
+}
+
+/* Report the exception raised by the callback of a handle to the
+   exception handler of its loop, as the exception being handled. */
+static int
+handle_report_exception(HandleObj *self)
+{
+    _Py_IDENTIFIER(call_exception_handler);
+    PyObject *et, *ev, *tb;
+    PyObject *context = NULL, *cb = NULL, *message = NULL, *res;
+    int ret = -1;
+
+    PyErr_Fetch(&et, &ev, &tb);
+    PyErr_NormalizeException(&et, &ev, &tb);
+    if (tb != NULL) {
+        PyException_SetTraceback(ev, tb);
+    }
+
+    /* Handle the exception while calling the exception handler,
+       like in an except clause. */
+    PyObject *saved_type, *saved_value, *saved_tb;
+    PyErr_GetExcInfo(&saved_type, &saved_value, &saved_tb);
+    Py_INCREF(ev);
+    PyErr_SetExcInfo(et, ev, tb);
+
+    PyObject *callback = self->h_callback ? self->h_callback : Py_None;
+    PyObject *args = self->h_args ? self->h_args : Py_None;
+    cb = PyObject_CallFunctionObjArgs(asyncio_format_callback_source_func,
+                                      callback, args, NULL);
+    if (cb == NULL) {
+        goto exit;
+    }
+    message = PyUnicode_FromFormat("Exception in callback %S", cb);
+    if (message == NULL) {
+        goto exit;
+    }
+    context = Py_BuildValue("{sOsOsO}",
+                            "message", message,
+                            "exception", ev,
+                            "handle", (PyObject *)self);
+    if (context == NULL) {
+        goto exit;
+    }
+    if (self->h_source_traceback != NULL) {
+        int is_true = PyObject_IsTrue(self->h_source_traceback);
+        if (is_true < 0) {
+            goto exit;
+        }
+        if (is_true && PyDict_SetItemString(context, "source_traceback",
+                                            self->h_source_traceback) < 0) {
+            goto exit;
+        }
+    }
+    if (self->h_loop == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "Handle object is not initialized.");
+        goto exit;
+    }
+    res = _PyObject_CallMethodIdOneArg(self->h_loop, &PyId_call_exception_handler,
+                                       context);
+    if (res == NULL) {
+        goto exit;
+    }
+    Py_DECREF(res);
+    ret = 0;
+
+exit:
+    PyErr_SetExcInfo(saved_type, saved_value, saved_tb);
+    Py_XDECREF(cb);
+    Py_XDECREF(message);
+    Py_XDECREF(context);
+    Py_DECREF(ev);
+    return ret;
+}
+
+static int
+handle_run(HandleObj *self)
+{
+    PyObject *res = NULL;
+
+    if (TimerHandle_Check(self)) {
+        /* The handle is no longer waiting in the ready queue. */
+        ((TimerHandleObj *)self)->th_due = 0;
+        if (((TimerHandleObj *)self)->th_scheduled) {
+            /* Rescheduled while it was waiting in the ready queue: it is
+               called at its new time. */
+            return 0;
+        }
+    }
+    if (self->h_context == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "Handle object is not initialized.");
+    }
+    else if (PyContext_Enter(self->h_context) == 0) {
+        PyObject *callback = self->h_callback ? self->h_callback : Py_None;
+        PyObject *args = self->h_args ? self->h_args : Py_None;
+        if (PyTuple_CheckExact(args)) {
+            res = PyObject_Call(callback, args, NULL);
+        }
+        else {
+            args = PySequence_Tuple(args);
+            if (args != NULL) {
+                res = PyObject_Call(callback, args, NULL);
+                Py_DECREF(args);
+            }
+        }
+        if (PyContext_Exit(self->h_context) < 0) {
+            Py_CLEAR(res);
+        }
+    }
+
+    if (res != NULL) {
+        Py_DECREF(res);
+        return 0;
+    }
+    if (PyErr_ExceptionMatches(PyExc_SystemExit) ||
+        PyErr_ExceptionMatches(PyExc_KeyboardInterrupt))
+    {
+        return -1;
+    }
+    return handle_report_exception(self);
+}
+
+/*[clinic input]
+_asyncio.Handle._run
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_Handle__run_impl(HandleObj *self)
+/*[clinic end generated code: output=1b186b710881500a input=94fc71ae0ddc7106]*/
+{
+    if (handle_run(self) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef HandleType_methods[] = {
+    _ASYNCIO_HANDLE_CANCEL_METHODDEF
+    _ASYNCIO_HANDLE_CANCELLED_METHODDEF
+    _ASYNCIO_HANDLE__RUN_METHODDEF
+    _ASYNCIO_HANDLE__REPR_INFO_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyMemberDef HandleType_members[] = {
+    {"_callback", T_OBJECT, offsetof(HandleObj, h_callback), 0},
+    {"_args", T_OBJECT, offsetof(HandleObj, h_args), 0},
+    {"_loop", T_OBJECT, offsetof(HandleObj, h_loop), 0},
+    {"_context", T_OBJECT, offsetof(HandleObj, h_context), 0},
+    {"_source_traceback", T_OBJECT, offsetof(HandleObj, h_source_traceback), 0},
+    {"_repr", T_OBJECT, offsetof(HandleObj, h_repr), 0},
+    {"_cancelled", T_BOOL, offsetof(HandleObj, h_cancelled), 0},
+    {NULL}  /* Sentinel */
+};
+
+static PyTypeObject HandleType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_asyncio.Handle",
+    sizeof(HandleObj),                       /* tp_basicsize */
+    .tp_dealloc = HandleObj_dealloc,
+    .tp_repr = (reprfunc)HandleObj_repr,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    .tp_doc = _asyncio_Handle___init____doc__,
+    .tp_traverse = (traverseproc)HandleObj_traverse,
+    .tp_clear = (inquiry)HandleObj_clear,
+    .tp_weaklistoffset = offsetof(HandleObj, h_weakreflist),
+    .tp_methods = HandleType_methods,
+    .tp_members = HandleType_members,
+    .tp_init = (initproc)_asyncio_Handle___init__,
+    .tp_new = PyType_GenericNew,
+};
+
+
+/*********************** TimerHandle **************************/
+
+/*[clinic input]
+_asyncio.TimerHandle.__init__
+
+    when: object
+    callback: object
+    args: object
+    loop: object
+    context: object = None
+
+Object returned by timed callback registration methods.
+[clinic start generated code]*/
+
+static int
+_asyncio_TimerHandle___init___impl(TimerHandleObj *self, PyObject *when,
+                                   PyObject *callback, PyObject *args,
+                                   PyObject *loop, PyObject *context)
+/*[clinic end generated code: output=0d98475472bfab93 input=ec6d223ba9888cec]*/
+{
+    if (when == Py_None) {
+        PyErr_SetString(PyExc_AssertionError, "when cannot be None");
+        return -1;
+    }
+    if (handle_init((HandleObj *)self, callback, args, loop, context) < 0) {
+        return -1;
+    }
+    Py_INCREF(when);
+    Py_XSETREF(self->th_when, when);
+    self->th_scheduled = 0;
+    self->th_due = 0;
+    return 0;
+}
+
+static int
+TimerHandleObj_clear(TimerHandleObj *self)
+{
+    Py_CLEAR(self->th_when);
+    return HandleObj_clear((HandleObj *)self);
+}
+
+static int
+TimerHandleObj_traverse(TimerHandleObj *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->th_when);
+    return HandleObj_traverse((HandleObj *)self, visit, arg);
+}
+
+static void
+TimerHandleObj_dealloc(PyObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    if (((HandleObj *)self)->h_weakreflist != NULL) {
+        PyObject_ClearWeakRefs(self);
+    }
+    (void)TimerHandleObj_clear((TimerHandleObj *)self);
+    Py_TYPE(self)->tp_free(self);
+}
+
+static Py_hash_t
+TimerHandleObj_hash(TimerHandleObj *self)
+{
+    return PyObject_Hash(self->th_when ? self->th_when : Py_None);
+}
+
+/* Compare the times of two timer handles, the hot path of the heap of
+   scheduled timer handles. */
+static int
+timer_handle_when_compare(TimerHandleObj *self, TimerHandleObj *other, int op)
+{
+    PyObject *when = self->th_when ? self->th_when : Py_None;
+    PyObject *other_when = other->th_when ? other->th_when : Py_None;
+    if (PyFloat_CheckExact(when) && PyFloat_CheckExact(other_when)) {
+        double a = PyFloat_AS_DOUBLE(when);
+        double b = PyFloat_AS_DOUBLE(other_when);
+        switch (op) {
+        case Py_LT:
+            return a < b;
+        case Py_GT:
+            return a > b;
+        case Py_EQ:
+            return a == b;
+        default:
+            Py_UNREACHABLE();
+        }
+    }
+    return PyObject_RichCompareBool(when, other_when, op);
+}
+
+static int
+timer_handle_equal(TimerHandleObj *self, TimerHandleObj *other)
+{
+    HandleObj *a = (HandleObj *)self;
+    HandleObj *b = (HandleObj *)other;
+    int res = timer_handle_when_compare(self, other, Py_EQ);
+    if (res <= 0) {
+        return res;
+    }
+    res = PyObject_RichCompareBool(a->h_callback ? a->h_callback : Py_None,
+                                   b->h_callback ? b->h_callback : Py_None,
+                                   Py_EQ);
+    if (res <= 0) {
+        return res;
+    }
+    res = PyObject_RichCompareBool(a->h_args ? a->h_args : Py_None,
+                                   b->h_args ? b->h_args : Py_None,
+                                   Py_EQ);
+    if (res <= 0) {
+        return res;
+    }
+    return a->h_cancelled == b->h_cancelled;
+}
+
+static PyObject *
+TimerHandleObj_richcompare(TimerHandleObj *self, PyObject *other, int op)
+{
+    if (!TimerHandle_Check(other)) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    TimerHandleObj *o = (TimerHandleObj *)other;
+    int res;
+    switch (op) {
+    case Py_LT:
+    case Py_GT:
+        res = timer_handle_when_compare(self, o, op);
+        break;
+    case Py_LE:
+    case Py_GE:
+        res = timer_handle_when_compare(self, o, op == Py_LE ? Py_LT : Py_GT);
+        if (res == 0) {
+            res = timer_handle_equal(self, o);
+        }
+        break;
+    case Py_EQ:
+        res = timer_handle_equal(self, o);
+        break;
+    case Py_NE:
+        res = timer_handle_equal(self, o);
+        if (res >= 0) {
+            res = !res;
+        }
+        break;
+    default:
+        Py_UNREACHABLE();
+    }
+    if (res < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(res);
+}
+
+/*[clinic input]
+_asyncio.TimerHandle._repr_info
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerHandle__repr_info_impl(TimerHandleObj *self)
+/*[clinic end generated code: output=40e332eea82788b7 input=0ea1c37005c8bd50]*/
+{
+    return PyObject_CallOneArg(asyncio_timer_handle_repr_info_func,
+                               (PyObject *)self);
+}
+
+/*[clinic input]
+_asyncio.TimerHandle.cancel
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerHandle_cancel_impl(TimerHandleObj *self)
+/*[clinic end generated code: output=315df6426e6662ff input=529996fd507bb125]*/
+{
+    _Py_IDENTIFIER(_timer_handle_cancelled);
+    HandleObj *handle = (HandleObj *)self;
+
+    if (!handle->h_cancelled && handle->h_loop != NULL) {
+        PyObject *res = _PyObject_CallMethodIdOneArg(
+            handle->h_loop, &PyId__timer_handle_cancelled, (PyObject *)self);
+        if (res == NULL) {
+            return NULL;
+        }
+        Py_DECREF(res);
+    }
+    if (handle_cancel(handle) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_asyncio.TimerHandle.when
+
+Return a scheduled callback time.
+
+The time is an absolute timestamp, using the same time
+reference as loop.time().
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerHandle_when_impl(TimerHandleObj *self)
+/*[clinic end generated code: output=cab0e5577e51b3af input=de801fd191075931]*/
+{
+    PyObject *when = self->th_when ? self->th_when : Py_None;
+    Py_INCREF(when);
+    return when;
+}
+
+/*[clinic input]
+_asyncio.TimerHandle.reschedule
+
+    when: object
+
+Change the time at which the callback is scheduled.
+
+The time is an absolute timestamp, using the same time
+reference as loop.time().  If the callback has already been
+called, it is scheduled again.  If it is due but has not been
+called yet, it is only called at the new time.  The event loop
+must use a timer wheel, see loop.set_timer_resolution().
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerHandle_reschedule_impl(TimerHandleObj *self, PyObject *when)
+/*[clinic end generated code: output=80f4a994190dd442 input=f394784b77bbf3f2]*/
+{
+    _Py_IDENTIFIER(_timer_handle_rescheduled);
+    HandleObj *handle = (HandleObj *)self;
+
+    if (handle->h_cancelled) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "cannot reschedule a cancelled TimerHandle");
+        return NULL;
+    }
+    if (handle->h_loop == NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "TimerHandle object is not initialized.");
+        return NULL;
+    }
+    PyObject *res = _PyObject_CallMethodIdObjArgs(
+        handle->h_loop, &PyId__timer_handle_rescheduled,
+        (PyObject *)self, when, NULL);
+    if (res == NULL) {
+        return NULL;
+    }
+    Py_DECREF(res);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef TimerHandleType_methods[] = {
+    _ASYNCIO_TIMERHANDLE_CANCEL_METHODDEF
+    _ASYNCIO_TIMERHANDLE_WHEN_METHODDEF
+    _ASYNCIO_TIMERHANDLE_RESCHEDULE_METHODDEF
+    _ASYNCIO_TIMERHANDLE__REPR_INFO_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyMemberDef TimerHandleType_members[] = {
+    {"_when", T_OBJECT, offsetof(TimerHandleObj, th_when), 0},
+    {"_scheduled", T_BOOL, offsetof(TimerHandleObj, th_scheduled), 0},
+    {"_due", T_BOOL, offsetof(TimerHandleObj, th_due), 0},
+    {NULL}  /* Sentinel */
+};
+
+static PyTypeObject TimerHandleType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_asyncio.TimerHandle",
+    sizeof(TimerHandleObj),                  /* tp_basicsize */
+    .tp_base = &HandleType,
+    .tp_dealloc = TimerHandleObj_dealloc,
+    .tp_hash = (hashfunc)TimerHandleObj_hash,
+    .tp_richcompare = (richcmpfunc)TimerHandleObj_richcompare,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    .tp_doc = _asyncio_TimerHandle___init____doc__,
+    .tp_traverse = (traverseproc)TimerHandleObj_traverse,
+    .tp_clear = (inquiry)TimerHandleObj_clear,
+    .tp_methods = TimerHandleType_methods,
+    .tp_members = TimerHandleType_members,
+    .tp_init = (initproc)_asyncio_TimerHandle___init__,
+    .tp_new = PyType_GenericNew,
+};
+
+
+/*[clinic input]
+_asyncio._run_ready
+
+    ready: object
+    ntodo: Py_ssize_t
+    /
+
+Run the first ntodo handles of the ready deque.
+
+Cancelled handles are skipped.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__run_ready_impl(PyObject *module, PyObject *ready, Py_ssize_t ntodo)
+/*[clinic end generated code: output=07b364c488de9d1f input=d9d24bb2dac8b972]*/
+{
+    _Py_IDENTIFIER(popleft);
+    _Py_IDENTIFIER(_cancelled);
+    _Py_IDENTIFIER(_run);
+
+    for (Py_ssize_t i = 0; i < ntodo; i++) {
+        PyObject *handle = _PyObject_CallMethodIdNoArgs(ready, &PyId_popleft);
+        if (handle == NULL) {
+            return NULL;
+        }
+        int res;
+        if (Handle_CheckExact(handle) || TimerHandle_CheckExact(handle)) {
+            res = 0;
+            if (!((HandleObj *)handle)->h_cancelled) {
+                res = handle_run((HandleObj *)handle);
+            }
+        }
+        else {
+            PyObject *cancelled = _PyObject_GetAttrId(handle, &PyId__cancelled);
+            if (cancelled == NULL) {
+                Py_DECREF(handle);
+                return NULL;
+            }
+            res = PyObject_IsTrue(cancelled);
+            Py_DECREF(cancelled);
+            if (res == 0) {
+                PyObject *r = _PyObject_CallMethodIdNoArgs(handle, &PyId__run);
+                res = r == NULL ? -1 : 0;
+                Py_XDECREF(r);
+            }
+            else if (res > 0) {
+                res = 0;
+            }
+        }
+        Py_DECREF(handle);
+        if (res < 0) {
+            return NULL;
+        }
+    }
+    Py_RETURN_NONE;
+}
+
+
 /*********************** Module **************************/
 
 
@@ -3289,6 +4285,10 @@ module_free(void *m)
     Py_CLEAR(asyncio_task_get_stack_func);
     Py_CLEAR(asyncio_task_print_stack_func);
     Py_CLEAR(asyncio_task_repr_info_func);
+    Py_CLEAR(asyncio_handle_repr_info_func);
+    Py_CLEAR(asyncio_timer_handle_repr_info_func);
+    Py_CLEAR(asyncio_extract_stack_func);
+    Py_CLEAR(asyncio_format_callback_source_func);
     Py_CLEAR(asyncio_InvalidStateError);
     Py_CLEAR(asyncio_CancelledError);
 
@@ -3313,6 +4313,14 @@ module_init(void)
         goto fail;
     }
     if (module_initialized != 0) {
+        if (all_tasks == NULL) {
+            /* Imported again by one of the modules imported below, which
+               are only executed now if they are loaded lazily. */
+            PyErr_SetString(PyExc_ImportError,
+                            "cannot import _asyncio while it is being "
+                            "initialized");
+            return -1;
+        }
         return 0;
     }
     else {
@@ -3350,6 +4358,12 @@ module_init(void)
 
     WITH_MOD("asyncio.events")
     GET_MOD_ATTR(asyncio_get_event_loop_policy, "get_event_loop_policy")
+    GET_MOD_ATTR(asyncio_handle_repr_info_func, "_handle_repr_info")
+    GET_MOD_ATTR(asyncio_timer_handle_repr_info_func, "_timer_handle_repr_info")
+
+    WITH_MOD("asyncio.format_helpers")
+    GET_MOD_ATTR(asyncio_extract_stack_func, "extract_stack")
+    GET_MOD_ATTR(asyncio_format_callback_source_func, "_format_callback_source")
 
     WITH_MOD("asyncio.base_futures")
     GET_MOD_ATTR(asyncio_future_repr_info_func, "_future_repr_info")
@@ -3402,6 +4416,8 @@ static PyMethodDef asyncio_methods[] = {
     _ASYNCIO__UNREGISTER_TASK_METHODDEF
     _ASYNCIO__ENTER_TASK_METHODDEF
     _ASYNCIO__LEAVE_TASK_METHODDEF
+    _ASYNCIO__SWAP_CURRENT_TASK_METHODDEF
+    _ASYNCIO__RUN_READY_METHODDEF
     {NULL, NULL}
 };
 
@@ -3450,6 +4466,16 @@ PyInit__asyncio(void)
         return NULL;
     }
 
+    if (PyModule_AddType(m, &HandleType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
+    if (PyModule_AddType(m, &TimerHandleType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
     Py_INCREF(all_tasks);
     if (PyModule_AddObject(m, "_all_tasks", all_tasks) < 0) {
         Py_DECREF(all_tasks);
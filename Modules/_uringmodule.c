@@ -0,0 +1,895 @@
+/* Interface to the Linux io_uring(7) completion queues.
+ *
+ * This module is used by asyncio.uring_events; it only exposes what the
+ * UringProactor needs: submitting operations identified by an integer key
+ * and waiting for their completions.
+ */
+
+#include "Python.h"
+
+#include <linux/io_uring.h>
+#include <endian.h>
+#include <stddef.h>               // offsetof()
+#include <sys/mman.h>             // mmap()
+#include <sys/syscall.h>          // __NR_io_uring_setup
+#include <unistd.h>               // syscall()
+
+typedef struct {
+    PyTypeObject *RingType;
+} uring_state;
+
+static inline uring_state *
+get_uring_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (uring_state *)state;
+}
+
+static struct PyModuleDef uringmodule;
+#define get_uring_state_by_type(type) \
+    (get_uring_state(_PyType_GetModuleByDef(type, &uringmodule)))
+
+/* The key 0 is never returned by the submission methods: it identifies
+   the timeouts added by Ring.wait() on kernels lacking IORING_FEAT_EXT_ARG. */
+#define WAIT_TIMEOUT_KEY 0
+
+typedef struct {
+    PyObject_HEAD
+    int fd;
+    unsigned int features;
+    /* Set while io_uring_enter() runs without the GIL */
+    int waiting;
+
+    /* Submission queue */
+    void *sq_ring;
+    size_t sq_ring_size;
+    unsigned *sq_head;
+    unsigned *sq_tail;
+    unsigned *sq_array;
+    unsigned sq_mask;
+    unsigned sq_entries;
+    unsigned sq_local_tail;
+    unsigned sq_pending;
+    struct io_uring_sqe *sqes;
+    size_t sqes_size;
+
+    /* Completion queue */
+    void *cq_ring;
+    size_t cq_ring_size;
+    unsigned *cq_head;
+    unsigned *cq_tail;
+    unsigned cq_mask;
+    struct io_uring_cqe *cqes;
+
+    unsigned long long next_key;
+    /* key => object kept alive until the operation completes */
+    PyObject *ops;
+    struct __kernel_timespec wait_ts;
+} RingObject;
+
+/*[clinic input]
+module _uring
+class _uring.Ring "RingObject *" "get_uring_state_by_type(type)->RingType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=42236a9afbf99420]*/
+
+static int
+ring_enter(RingObject *self, unsigned to_submit, unsigned min_complete,
+           unsigned flags, void *arg, size_t argsz)
+{
+    return (int)syscall(__NR_io_uring_enter, self->fd, to_submit,
+                        min_complete, flags, arg, argsz);
+}
+
+static int
+ring_check(RingObject *self)
+{
+    if (self->fd < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "I/O operation on closed ring object");
+        return -1;
+    }
+    if (self->waiting) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "ring object is being waited on by another thread");
+        return -1;
+    }
+    return 0;
+}
+
+/* Return the next free submission queue entry, zeroed, or NULL with an
+   exception set.  If the submission queue is full, it is submitted first. */
+static struct io_uring_sqe *
+ring_get_sqe(RingObject *self)
+{
+    unsigned head = __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE);
+    if (self->sq_local_tail - head >= self->sq_entries) {
+        int ret = ring_enter(self, self->sq_pending, 0, 0, NULL, 0);
+        if (ret < 0) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+        self->sq_pending -= ret;
+        head = __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE);
+        if (self->sq_local_tail - head >= self->sq_entries) {
+            PyErr_SetString(PyExc_BlockingIOError,
+                            "the submission queue is full");
+            return NULL;
+        }
+    }
+    struct io_uring_sqe *sqe =
+        &self->sqes[self->sq_local_tail & self->sq_mask];
+    memset(sqe, 0, sizeof(*sqe));
+    return sqe;
+}
+
+/* Record the operation prepared in *sqe* and queue it for submission.
+   *keep* (if not NULL) is kept alive until the operation completes.
+   Return the key of the operation. */
+static PyObject *
+ring_queue_sqe(RingObject *self, struct io_uring_sqe *sqe, PyObject *keep)
+{
+    unsigned long long key = self->next_key;
+    PyObject *key_obj = PyLong_FromUnsignedLongLong(key);
+    if (key_obj == NULL) {
+        return NULL;
+    }
+    if (PyDict_SetItem(self->ops, key_obj, keep ? keep : Py_None) < 0) {
+        Py_DECREF(key_obj);
+        return NULL;
+    }
+    self->next_key++;
+    sqe->user_data = key;
+    unsigned index = self->sq_local_tail & self->sq_mask;
+    self->sq_array[index] = index;
+    self->sq_local_tail++;
+    __atomic_store_n(self->sq_tail, self->sq_local_tail, __ATOMIC_RELEASE);
+    self->sq_pending++;
+    return key_obj;
+}
+
+/* Return a memoryview of *obj* holding its buffer until the operation
+   completes, and set *buf* and *len* to the buffer memory. */
+static PyObject *
+ring_get_buffer(PyObject *obj, int writable, void **buf, unsigned *len)
+{
+    Py_buffer view;
+    PyObject *mv = PyMemoryView_FromObject(obj);
+    if (mv == NULL) {
+        return NULL;
+    }
+    if (PyObject_GetBuffer(mv, &view,
+                           writable ? PyBUF_WRITABLE : PyBUF_SIMPLE) < 0) {
+        Py_DECREF(mv);
+        return NULL;
+    }
+    *buf = view.buf;
+    *len = (unsigned)Py_MIN((size_t)view.len, (size_t)UINT_MAX);
+    PyBuffer_Release(&view);
+    return mv;
+}
+
+static PyObject *
+ring_prep_buffer(RingObject *self, int opcode, int fd, PyObject *buffer,
+                 int writable, unsigned long long offset, int flags)
+{
+    void *buf;
+    unsigned len;
+    struct io_uring_sqe *sqe;
+    PyObject *key;
+
+    if (ring_check(self) < 0) {
+        return NULL;
+    }
+    PyObject *mv = ring_get_buffer(buffer, writable, &buf, &len);
+    if (mv == NULL) {
+        return NULL;
+    }
+    sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        Py_DECREF(mv);
+        return NULL;
+    }
+    sqe->opcode = opcode;
+    sqe->fd = fd;
+    sqe->addr = (unsigned long long)(uintptr_t)buf;
+    sqe->len = len;
+    sqe->off = offset;
+    sqe->msg_flags = flags;
+    key = ring_queue_sqe(self, sqe, mv);
+    Py_DECREF(mv);
+    return key;
+}
+
+static int
+ring_timeout_converter(PyObject *obj, struct __kernel_timespec *ts)
+{
+    _PyTime_t t;
+    struct timespec tmp;
+
+    if (_PyTime_FromSecondsObject(&t, obj, _PyTime_ROUND_TIMEOUT) < 0) {
+        return 0;
+    }
+    if (t < 0) {
+        PyErr_SetString(PyExc_ValueError, "timeout must be non-negative");
+        return 0;
+    }
+    if (_PyTime_AsTimespec(t, &tmp) < 0) {
+        return 0;
+    }
+    ts->tv_sec = tmp.tv_sec;
+    ts->tv_nsec = tmp.tv_nsec;
+    return 1;
+}
+
+static void
+ring_unmap(RingObject *self)
+{
+    if (self->sqes != NULL) {
+        munmap(self->sqes, self->sqes_size);
+        self->sqes = NULL;
+    }
+    if (self->cq_ring != NULL && self->cq_ring != self->sq_ring) {
+        munmap(self->cq_ring, self->cq_ring_size);
+    }
+    self->cq_ring = NULL;
+    if (self->sq_ring != NULL) {
+        munmap(self->sq_ring, self->sq_ring_size);
+        self->sq_ring = NULL;
+    }
+}
+
+static void
+ring_internal_close(RingObject *self)
+{
+    if (self->fd >= 0) {
+        ring_unmap(self);
+        close(self->fd);
+        self->fd = -1;
+        if (self->ops != NULL && PyDict_GET_SIZE(self->ops) != 0) {
+            /* The kernel may still write to the buffers of the pending
+               operations while the ring is being torn down: leak them. */
+            self->ops = NULL;
+        }
+    }
+    Py_CLEAR(self->ops);
+}
+
+/*[clinic input]
+@classmethod
+_uring.Ring.__new__
+
+    entries: unsigned_int(bitwise=True) = 256
+        Requested size of the submission queue.
+
+Create an io_uring instance.
+
+The size of the submission queue is rounded up to the next power of two,
+and clamped to the limit of the kernel.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_impl(PyTypeObject *type, unsigned int entries)
+/*[clinic end generated code: output=ec37bfaec3b9f3e6 input=8114945cf40de918]*/
+{
+    struct io_uring_params params;
+    RingObject *self;
+
+    if (entries == 0) {
+        PyErr_SetString(PyExc_ValueError, "entries must be positive");
+        return NULL;
+    }
+    self = (RingObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->fd = -1;
+    self->next_key = WAIT_TIMEOUT_KEY + 1;
+    self->ops = PyDict_New();
+    if (self->ops == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    memset(&params, 0, sizeof(params));
+    params.flags = IORING_SETUP_CLAMP;
+    /* The file descriptor is created with O_CLOEXEC */
+    Py_BEGIN_ALLOW_THREADS
+    self->fd = (int)syscall(__NR_io_uring_setup, entries, &params);
+    Py_END_ALLOW_THREADS
+    if (self->fd < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->features = params.features;
+
+    self->sq_ring_size = params.sq_off.array +
+                         params.sq_entries * sizeof(unsigned);
+    self->cq_ring_size = params.cq_off.cqes +
+                         params.cq_entries * sizeof(struct io_uring_cqe);
+    if (params.features & IORING_FEAT_SINGLE_MMAP) {
+        self->sq_ring_size = self->cq_ring_size =
+            Py_MAX(self->sq_ring_size, self->cq_ring_size);
+    }
+    self->sq_ring = mmap(NULL, self->sq_ring_size, PROT_READ | PROT_WRITE,
+                         MAP_SHARED | MAP_POPULATE, self->fd,
+                         IORING_OFF_SQ_RING);
+    if (self->sq_ring == MAP_FAILED) {
+        self->sq_ring = NULL;
+        goto error;
+    }
+    if (params.features & IORING_FEAT_SINGLE_MMAP) {
+        self->cq_ring = self->sq_ring;
+    }
+    else {
+        self->cq_ring = mmap(NULL, self->cq_ring_size,
+                             PROT_READ | PROT_WRITE,
+                             MAP_SHARED | MAP_POPULATE, self->fd,
+                             IORING_OFF_CQ_RING);
+        if (self->cq_ring == MAP_FAILED) {
+            self->cq_ring = NULL;
+            goto error;
+        }
+    }
+    self->sqes_size = params.sq_entries * sizeof(struct io_uring_sqe);
+    self->sqes = mmap(NULL, self->sqes_size, PROT_READ | PROT_WRITE,
+                      MAP_SHARED | MAP_POPULATE, self->fd, IORING_OFF_SQES);
+    if (self->sqes == MAP_FAILED) {
+        self->sqes = NULL;
+        goto error;
+    }
+
+    char *sq = (char *)self->sq_ring;
+    self->sq_head = (unsigned *)(sq + params.sq_off.head);
+    self->sq_tail = (unsigned *)(sq + params.sq_off.tail);
+    self->sq_array = (unsigned *)(sq + params.sq_off.array);
+    self->sq_mask = *(unsigned *)(sq + params.sq_off.ring_mask);
+    self->sq_entries = *(unsigned *)(sq + params.sq_off.ring_entries);
+    self->sq_local_tail = *self->sq_tail;
+
+    char *cq = (char *)self->cq_ring;
+    self->cq_head = (unsigned *)(cq + params.cq_off.head);
+    self->cq_tail = (unsigned *)(cq + params.cq_off.tail);
+    self->cq_mask = *(unsigned *)(cq + params.cq_off.ring_mask);
+    self->cqes = (struct io_uring_cqe *)(cq + params.cq_off.cqes);
+
+    return (PyObject *)self;
+
+error:
+    PyErr_SetFromErrno(PyExc_OSError);
+    Py_DECREF(self);
+    return NULL;
+}
+
+static void
+ring_dealloc(RingObject *self)
+{
+    PyTypeObject *tp = Py_TYPE(self);
+    ring_internal_close(self);
+    tp->tp_free(self);
+    Py_DECREF(tp);
+}
+
+/*[clinic input]
+_uring.Ring.close
+
+Close the ring.
+
+Operations still in progress are cancelled by the kernel.  The buffers
+they use are not released, since they could still be written to.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_close_impl(RingObject *self)
+/*[clinic end generated code: output=447415269da3419f input=d9ea876734cee36f]*/
+{
+    if (self->waiting) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "ring object is being waited on by another thread");
+        return NULL;
+    }
+    ring_internal_close(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_uring.Ring.fileno
+
+Return the file descriptor of the ring.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_fileno_impl(RingObject *self)
+/*[clinic end generated code: output=773263c5ad53ca3d input=1d3b281a9c69238b]*/
+{
+    if (self->fd < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "I/O operation on closed ring object");
+        return NULL;
+    }
+    return PyLong_FromLong(self->fd);
+}
+
+/*[clinic input]
+_uring.Ring.recv
+
+    fd: fildes
+    buffer: object
+    flags: int = 0
+    /
+
+Receive data from the socket fd into the writable buffer.
+
+Return the key of the operation.  Its result is the number of bytes
+received.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_recv_impl(RingObject *self, int fd, PyObject *buffer, int flags)
+/*[clinic end generated code: output=3996a7c690b04f1e input=33722c77bfd5400c]*/
+{
+    return ring_prep_buffer(self, IORING_OP_RECV, fd, buffer, 1, 0, flags);
+}
+
+/*[clinic input]
+_uring.Ring.send
+
+    fd: fildes
+    buffer: object
+    flags: int = 0
+    /
+
+Send data from the buffer to the socket fd.
+
+Return the key of the operation.  Its result is the number of bytes sent.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_send_impl(RingObject *self, int fd, PyObject *buffer, int flags)
+/*[clinic end generated code: output=e87a1f408bb0170f input=425020f4d1aa9cb2]*/
+{
+    return ring_prep_buffer(self, IORING_OP_SEND, fd, buffer, 0, 0, flags);
+}
+
+/*[clinic input]
+_uring.Ring.read
+
+    fd: fildes
+    buffer: object
+    offset: long_long = -1
+    /
+
+Read from the file descriptor fd into the writable buffer.
+
+The data is read at the given offset, or at the current file position
+if offset is -1.  Return the key of the operation.  Its result is the
+number of bytes read.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_read_impl(RingObject *self, int fd, PyObject *buffer,
+                      long long offset)
+/*[clinic end generated code: output=3e432c2f53cfef7c input=6da2f058c0aed3b9]*/
+{
+    return ring_prep_buffer(self, IORING_OP_READ, fd, buffer, 1,
+                            (unsigned long long)offset, 0);
+}
+
+/*[clinic input]
+_uring.Ring.write
+
+    fd: fildes
+    buffer: object
+    offset: long_long = -1
+    /
+
+Write the buffer to the file descriptor fd.
+
+The data is written at the given offset, or at the current file
+position if offset is -1.  Return the key of the operation.  Its result
+is the number of bytes written.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_write_impl(RingObject *self, int fd, PyObject *buffer,
+                       long long offset)
+/*[clinic end generated code: output=7e3bcd57b56bae09 input=bea8d056614375a6]*/
+{
+    return ring_prep_buffer(self, IORING_OP_WRITE, fd, buffer, 0,
+                            (unsigned long long)offset, 0);
+}
+
+/*[clinic input]
+_uring.Ring.accept
+
+    fd: fildes
+    flags: int = 0
+    /
+
+Accept a connection on the listening socket fd.
+
+flags is a combination of SOCK_NONBLOCK and SOCK_CLOEXEC.  Return the
+key of the operation.  Its result is the file descriptor of the accepted
+socket.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_accept_impl(RingObject *self, int fd, int flags)
+/*[clinic end generated code: output=a3c369f202fa044b input=11645bfa8f051637]*/
+{
+    struct io_uring_sqe *sqe;
+
+    if (ring_check(self) < 0) {
+        return NULL;
+    }
+    sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ACCEPT;
+    sqe->fd = fd;
+    sqe->accept_flags = flags;
+    return ring_queue_sqe(self, sqe, NULL);
+}
+
+/*[clinic input]
+_uring.Ring.poll
+
+    fd: fildes
+    events: unsigned_int(bitwise=True)
+    /
+
+Wait for the poll events to be signalled on the file descriptor fd.
+
+Return the key of the operation.  Its result is the mask of the events
+signalled.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_poll_impl(RingObject *self, int fd, unsigned int events)
+/*[clinic end generated code: output=f93f4107dd05e549 input=6557d61d43dc9727]*/
+{
+    struct io_uring_sqe *sqe;
+
+    if (ring_check(self) < 0) {
+        return NULL;
+    }
+    sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_POLL_ADD;
+    sqe->fd = fd;
+#if __BYTE_ORDER == __BIG_ENDIAN
+    events = (events << 16) | (events >> 16);
+#endif
+    sqe->poll32_events = events;
+    return ring_queue_sqe(self, sqe, NULL);
+}
+
+/*[clinic input]
+_uring.Ring.timeout
+
+    seconds: object
+    /
+
+Complete after the given number of seconds.
+
+Return the key of the operation.  Its result is -ETIME when the timeout
+expires.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_timeout(RingObject *self, PyObject *seconds)
+/*[clinic end generated code: output=f66f82e87436985e input=0daf3e5eefd3a948]*/
+{
+    struct __kernel_timespec ts;
+    struct io_uring_sqe *sqe;
+    PyObject *ts_obj, *key;
+
+    if (ring_check(self) < 0) {
+        return NULL;
+    }
+    if (!ring_timeout_converter(seconds, &ts)) {
+        return NULL;
+    }
+    /* The timespec must remain valid until the operation is submitted */
+    ts_obj = PyBytes_FromStringAndSize((const char *)&ts, sizeof(ts));
+    if (ts_obj == NULL) {
+        return NULL;
+    }
+    sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        Py_DECREF(ts_obj);
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_TIMEOUT;
+    sqe->fd = -1;
+    sqe->addr = (unsigned long long)(uintptr_t)PyBytes_AS_STRING(ts_obj);
+    sqe->len = 1;
+    key = ring_queue_sqe(self, sqe, ts_obj);
+    Py_DECREF(ts_obj);
+    return key;
+}
+
+/*[clinic input]
+_uring.Ring.cancel
+
+    key: unsigned_long_long(bitwise=True)
+    /
+
+Request the cancellation of the operation identified by key.
+
+The cancelled operation completes with -ECANCELED if it was cancelled
+in time.  Return the key of the cancellation request.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_cancel_impl(RingObject *self, unsigned long long key)
+/*[clinic end generated code: output=c480747815f72408 input=809a271dd66634dd]*/
+{
+    struct io_uring_sqe *sqe;
+
+    if (ring_check(self) < 0) {
+        return NULL;
+    }
+    sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ASYNC_CANCEL;
+    sqe->fd = -1;
+    sqe->addr = key;
+    return ring_queue_sqe(self, sqe, NULL);
+}
+
+/*[clinic input]
+_uring.Ring.wait
+
+    timeout: object = None
+        The maximum number of seconds to wait, or None to wait until
+        an operation completes.
+
+Submit the queued operations and wait for their completion.
+
+Return a list of (key, result, flags) tuples of the operations which
+completed.  A negative result is the negated errno value of the error
+the operation failed with.  The list is empty if the timeout expired.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_wait_impl(RingObject *self, PyObject *timeout)
+/*[clinic end generated code: output=b86115b821984c32 input=e5bc16a82a68119c]*/
+{
+    struct __kernel_timespec ts = {0, 0};
+    unsigned min_complete = 0, flags = 0;
+    void *arg = NULL;
+    size_t argsz = 0;
+#ifdef IORING_ENTER_EXT_ARG
+    struct io_uring_getevents_arg ext_arg;
+#endif
+    PyObject *result, *key, *item;
+    unsigned head, tail;
+    int ret;
+
+    if (ring_check(self) < 0) {
+        return NULL;
+    }
+    if (timeout != Py_None && !ring_timeout_converter(timeout, &ts)) {
+        return NULL;
+    }
+
+    head = *self->cq_head;
+    tail = __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE);
+    if (head == tail && (timeout == Py_None || ts.tv_sec || ts.tv_nsec)) {
+        min_complete = 1;
+        flags = IORING_ENTER_GETEVENTS;
+        if (timeout != Py_None) {
+#ifdef IORING_ENTER_EXT_ARG
+            if (self->features & IORING_FEAT_EXT_ARG) {
+                memset(&ext_arg, 0, sizeof(ext_arg));
+                ext_arg.ts = (unsigned long long)(uintptr_t)&ts;
+                flags |= IORING_ENTER_EXT_ARG;
+                arg = &ext_arg;
+                argsz = sizeof(ext_arg);
+            }
+            else
+#endif
+            {
+                struct io_uring_sqe *sqe = ring_get_sqe(self);
+                if (sqe == NULL) {
+                    return NULL;
+                }
+                self->wait_ts = ts;
+                sqe->opcode = IORING_OP_TIMEOUT;
+                sqe->fd = -1;
+                sqe->addr = (unsigned long long)(uintptr_t)&self->wait_ts;
+                sqe->len = 1;
+                sqe->user_data = WAIT_TIMEOUT_KEY;
+                unsigned index = self->sq_local_tail & self->sq_mask;
+                self->sq_array[index] = index;
+                self->sq_local_tail++;
+                __atomic_store_n(self->sq_tail, self->sq_local_tail,
+                                 __ATOMIC_RELEASE);
+                self->sq_pending++;
+            }
+        }
+    }
+
+    if (min_complete || self->sq_pending) {
+        self->waiting = 1;
+        Py_BEGIN_ALLOW_THREADS
+        ret = ring_enter(self, self->sq_pending, min_complete, flags,
+                         arg, argsz);
+        Py_END_ALLOW_THREADS
+        self->waiting = 0;
+        if (ret >= 0) {
+            self->sq_pending -= ret;
+        }
+        else if (errno == EINTR) {
+            if (PyErr_CheckSignals() < 0) {
+                return NULL;
+            }
+        }
+        else if (errno != ETIME && errno != EAGAIN && errno != EBUSY) {
+            /* On EAGAIN and EBUSY, the completion queue must be
+               reaped before more operations can be submitted */
+            return PyErr_SetFromErrno(PyExc_OSError);
+        }
+    }
+
+    result = PyList_New(0);
+    if (result == NULL) {
+        return NULL;
+    }
+    head = *self->cq_head;
+    tail = __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE);
+    for (unsigned i = head; i != tail; i++) {
+        struct io_uring_cqe *cqe = &self->cqes[i & self->cq_mask];
+        if (cqe->user_data == WAIT_TIMEOUT_KEY) {
+            continue;
+        }
+        item = Py_BuildValue("(KiI)", (unsigned long long)cqe->user_data,
+                             cqe->res, cqe->flags);
+        if (item == NULL || PyList_Append(result, item) < 0) {
+            /* Leave the completions in the queue for the next call */
+            Py_XDECREF(item);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+    __atomic_store_n(self->cq_head, tail, __ATOMIC_RELEASE);
+
+    /* Release the objects used by the completed operations */
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(result); i++) {
+        key = PyTuple_GET_ITEM(PyList_GET_ITEM(result, i), 0);
+        if (PyDict_DelItem(self->ops, key) < 0) {
+            PyErr_Clear();
+        }
+    }
+    return result;
+}
+
+static PyObject *
+ring_get_closed(RingObject *self, void *Py_UNUSED(ignored))
+{
+    return PyBool_FromLong(self->fd < 0);
+}
+
+static PyObject *
+ring_get_pending(RingObject *self, void *Py_UNUSED(ignored))
+{
+    return PyLong_FromSsize_t(self->ops ? PyDict_GET_SIZE(self->ops) : 0);
+}
+
+#include "clinic/_uringmodule.c.h"
+
+static PyMethodDef ring_methods[] = {
+    _URING_RING_ACCEPT_METHODDEF
+    _URING_RING_CANCEL_METHODDEF
+    _URING_RING_CLOSE_METHODDEF
+    _URING_RING_FILENO_METHODDEF
+    _URING_RING_POLL_METHODDEF
+    _URING_RING_READ_METHODDEF
+    _URING_RING_RECV_METHODDEF
+    _URING_RING_SEND_METHODDEF
+    _URING_RING_TIMEOUT_METHODDEF
+    _URING_RING_WAIT_METHODDEF
+    _URING_RING_WRITE_METHODDEF
+    {NULL, NULL}
+};
+
+static PyGetSetDef ring_getsetlist[] = {
+    {"closed", (getter)ring_get_closed, NULL,
+     "True if the ring is closed"},
+    {"pending", (getter)ring_get_pending, NULL,
+     "Number of operations which did not complete yet"},
+    {NULL}
+};
+
+static PyType_Slot ring_slots[] = {
+    {Py_tp_dealloc, ring_dealloc},
+    {Py_tp_doc, (void *)_uring_Ring__doc__},
+    {Py_tp_methods, ring_methods},
+    {Py_tp_getset, ring_getsetlist},
+    {Py_tp_new, _uring_Ring},
+    {0, NULL},
+};
+
+static PyType_Spec ring_spec = {
+    .name = "_uring.Ring",
+    .basicsize = sizeof(RingObject),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = ring_slots,
+};
+
+
+/* Initialization function */
+
+PyDoc_STRVAR(uring_module_doc,
+"Interface to the Linux io_uring completion queues.\n\
+This module is an implementation detail of asyncio.uring_events, please\n\
+do not use it directly.");
+
+static int
+uringmodule_exec(PyObject *module)
+{
+    uring_state *state = get_uring_state(module);
+
+    state->RingType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &ring_spec, NULL);
+    if (state->RingType == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, state->RingType) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static int
+uring_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    uring_state *state = get_uring_state(module);
+    Py_VISIT(state->RingType);
+    return 0;
+}
+
+static int
+uring_clear(PyObject *module)
+{
+    uring_state *state = get_uring_state(module);
+    Py_CLEAR(state->RingType);
+    return 0;
+}
+
+static void
+uring_free(void *module)
+{
+    uring_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot uringmodule_slots[] = {
+    {Py_mod_exec, uringmodule_exec},
+    {0, NULL}
+};
+
+static struct PyModuleDef uringmodule = {
+    .m_base = PyModuleDef_HEAD_INIT,
+    .m_name = "_uring",
+    .m_doc = uring_module_doc,
+    .m_size = sizeof(uring_state),
+    .m_slots = uringmodule_slots,
+    .m_traverse = uring_traverse,
+    .m_clear = uring_clear,
+    .m_free = uring_free,
+};
+
+PyMODINIT_FUNC
+PyInit__uring(void)
+{
+    return PyModuleDef_Init(&uringmodule);
+}
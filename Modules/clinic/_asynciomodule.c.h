@@ -310,28 +310,29 @@ _asyncio_Future__repr_info(FutureObj *self, PyObject *Py_UNUSED(ignored))
 }
 
 PyDoc_STRVAR(_asyncio_Task___init____doc__,
-"Task(coro, *, loop=None, name=None)\n"
+"Task(coro, *, loop=None, name=None, eager_start=False)\n"
 "--\n"
 "\n"
 "A coroutine wrapped in a Future.");
 
 static int
 _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
-                            PyObject *name);
+                            PyObject *name, int eager_start);
 
 static int
 _asyncio_Task___init__(PyObject *self, PyObject *args, PyObject *kwargs)
 {
     int return_value = -1;
-    static const char * const _keywords[] = {"coro", "loop", "name", NULL};
+    static const char * const _keywords[] = {"coro", "loop", "name", "eager_start", NULL};
     static _PyArg_Parser _parser = {NULL, _keywords, "Task", 0};
-    PyObject *argsbuf[3];
+    PyObject *argsbuf[4];
     PyObject * const *fastargs;
     Py_ssize_t nargs = PyTuple_GET_SIZE(args);
     Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 1;
     PyObject *coro;
     PyObject *loop = Py_None;
     PyObject *name = Py_None;
+    int eager_start = 0;
 
     fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 1, 1, 0, argsbuf);
     if (!fastargs) {
@@ -347,9 +348,18 @@ _asyncio_Task___init__(PyObject *self, PyObject *args, PyObject *kwargs)
             goto skip_optional_kwonly;
         }
     }
-    name = fastargs[2];
+    if (fastargs[2]) {
+        name = fastargs[2];
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    eager_start = PyObject_IsTrue(fastargs[3]);
+    if (eager_start < 0) {
+        goto exit;
+    }
 skip_optional_kwonly:
-    return_value = _asyncio_Task___init___impl((TaskObj *)self, coro, loop, name);
+    return_value = _asyncio_Task___init___impl((TaskObj *)self, coro, loop, name, eager_start);
 
 exit:
     return return_value;
@@ -871,4 +881,331 @@ _asyncio__leave_task(PyObject *module, PyObject *const *args, Py_ssize_t nargs,
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=0d127162ac92e0c0 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_asyncio__swap_current_task__doc__,
+"_swap_current_task($module, loop, task, /)\n"
+"--\n"
+"\n"
+"Make task the current task of loop, and return the previous one.\n"
+"\n"
+"task and the returned task may be None.");
+
+#define _ASYNCIO__SWAP_CURRENT_TASK_METHODDEF    \
+    {"_swap_current_task", (PyCFunction)(void(*)(void))_asyncio__swap_current_task, METH_FASTCALL, _asyncio__swap_current_task__doc__},
+
+static PyObject *
+_asyncio__swap_current_task_impl(PyObject *module, PyObject *loop,
+                                 PyObject *task);
+
+static PyObject *
+_asyncio__swap_current_task(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *loop;
+    PyObject *task;
+
+    if (!_PyArg_CheckPositional("_swap_current_task", nargs, 2, 2)) {
+        goto exit;
+    }
+    loop = args[0];
+    task = args[1];
+    return_value = _asyncio__swap_current_task_impl(module, loop, task);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio_Handle___init____doc__,
+"Handle(callback, args, loop, context=None)\n"
+"--\n"
+"\n"
+"Object returned by callback registration methods.");
+
+static int
+_asyncio_Handle___init___impl(HandleObj *self, PyObject *callback,
+                              PyObject *args, PyObject *loop,
+                              PyObject *context);
+
+static int
+_asyncio_Handle___init__(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    static const char * const _keywords[] = {"callback", "args", "loop", "context", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "Handle", 0};
+    PyObject *argsbuf[4];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 3;
+    PyObject *callback;
+    PyObject *__clinic_args;
+    PyObject *loop;
+    PyObject *context = Py_None;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 3, 4, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    callback = fastargs[0];
+    __clinic_args = fastargs[1];
+    loop = fastargs[2];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    context = fastargs[3];
+skip_optional_pos:
+    return_value = _asyncio_Handle___init___impl((HandleObj *)self, callback, __clinic_args, loop, context);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio_Handle__repr_info__doc__,
+"_repr_info($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_HANDLE__REPR_INFO_METHODDEF    \
+    {"_repr_info", (PyCFunction)_asyncio_Handle__repr_info, METH_NOARGS, _asyncio_Handle__repr_info__doc__},
+
+static PyObject *
+_asyncio_Handle__repr_info_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle__repr_info(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle__repr_info_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_Handle_cancel__doc__,
+"cancel($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_HANDLE_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_asyncio_Handle_cancel, METH_NOARGS, _asyncio_Handle_cancel__doc__},
+
+static PyObject *
+_asyncio_Handle_cancel_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle_cancel(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle_cancel_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_Handle_cancelled__doc__,
+"cancelled($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_HANDLE_CANCELLED_METHODDEF    \
+    {"cancelled", (PyCFunction)_asyncio_Handle_cancelled, METH_NOARGS, _asyncio_Handle_cancelled__doc__},
+
+static PyObject *
+_asyncio_Handle_cancelled_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle_cancelled(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle_cancelled_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_Handle__run__doc__,
+"_run($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_HANDLE__RUN_METHODDEF    \
+    {"_run", (PyCFunction)_asyncio_Handle__run, METH_NOARGS, _asyncio_Handle__run__doc__},
+
+static PyObject *
+_asyncio_Handle__run_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle__run(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle__run_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle___init____doc__,
+"TimerHandle(when, callback, args, loop, context=None)\n"
+"--\n"
+"\n"
+"Object returned by timed callback registration methods.");
+
+static int
+_asyncio_TimerHandle___init___impl(TimerHandleObj *self, PyObject *when,
+                                   PyObject *callback, PyObject *args,
+                                   PyObject *loop, PyObject *context);
+
+static int
+_asyncio_TimerHandle___init__(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    static const char * const _keywords[] = {"when", "callback", "args", "loop", "context", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "TimerHandle", 0};
+    PyObject *argsbuf[5];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 4;
+    PyObject *when;
+    PyObject *callback;
+    PyObject *__clinic_args;
+    PyObject *loop;
+    PyObject *context = Py_None;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 4, 5, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    when = fastargs[0];
+    callback = fastargs[1];
+    __clinic_args = fastargs[2];
+    loop = fastargs[3];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    context = fastargs[4];
+skip_optional_pos:
+    return_value = _asyncio_TimerHandle___init___impl((TimerHandleObj *)self, when, callback, __clinic_args, loop, context);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle__repr_info__doc__,
+"_repr_info($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_TIMERHANDLE__REPR_INFO_METHODDEF    \
+    {"_repr_info", (PyCFunction)_asyncio_TimerHandle__repr_info, METH_NOARGS, _asyncio_TimerHandle__repr_info__doc__},
+
+static PyObject *
+_asyncio_TimerHandle__repr_info_impl(TimerHandleObj *self);
+
+static PyObject *
+_asyncio_TimerHandle__repr_info(TimerHandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerHandle__repr_info_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle_cancel__doc__,
+"cancel($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_TIMERHANDLE_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_asyncio_TimerHandle_cancel, METH_NOARGS, _asyncio_TimerHandle_cancel__doc__},
+
+static PyObject *
+_asyncio_TimerHandle_cancel_impl(TimerHandleObj *self);
+
+static PyObject *
+_asyncio_TimerHandle_cancel(TimerHandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerHandle_cancel_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle_when__doc__,
+"when($self, /)\n"
+"--\n"
+"\n"
+"Return a scheduled callback time.\n"
+"\n"
+"The time is an absolute timestamp, using the same time\n"
+"reference as loop.time().");
+
+#define _ASYNCIO_TIMERHANDLE_WHEN_METHODDEF    \
+    {"when", (PyCFunction)_asyncio_TimerHandle_when, METH_NOARGS, _asyncio_TimerHandle_when__doc__},
+
+static PyObject *
+_asyncio_TimerHandle_when_impl(TimerHandleObj *self);
+
+static PyObject *
+_asyncio_TimerHandle_when(TimerHandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerHandle_when_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle_reschedule__doc__,
+"reschedule($self, /, when)\n"
+"--\n"
+"\n"
+"Change the time at which the callback is scheduled.\n"
+"\n"
+"The time is an absolute timestamp, using the same time\n"
+"reference as loop.time().  If the callback has already been\n"
+"called, it is scheduled again.  If it is due but has not been\n"
+"called yet, it is only called at the new time.  The event loop\n"
+"must use a timer wheel, see loop.set_timer_resolution().");
+
+#define _ASYNCIO_TIMERHANDLE_RESCHEDULE_METHODDEF    \
+    {"reschedule", (PyCFunction)(void(*)(void))_asyncio_TimerHandle_reschedule, METH_FASTCALL|METH_KEYWORDS, _asyncio_TimerHandle_reschedule__doc__},
+
+static PyObject *
+_asyncio_TimerHandle_reschedule_impl(TimerHandleObj *self, PyObject *when);
+
+static PyObject *
+_asyncio_TimerHandle_reschedule(TimerHandleObj *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"when", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "reschedule", 0};
+    PyObject *argsbuf[1];
+    PyObject *when;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    when = args[0];
+    return_value = _asyncio_TimerHandle_reschedule_impl(self, when);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio__run_ready__doc__,
+"_run_ready($module, ready, ntodo, /)\n"
+"--\n"
+"\n"
+"Run the first ntodo handles of the ready deque.\n"
+"\n"
+"Cancelled handles are skipped.");
+
+#define _ASYNCIO__RUN_READY_METHODDEF    \
+    {"_run_ready", (PyCFunction)(void(*)(void))_asyncio__run_ready, METH_FASTCALL, _asyncio__run_ready__doc__},
+
+static PyObject *
+_asyncio__run_ready_impl(PyObject *module, PyObject *ready, Py_ssize_t ntodo);
+
+static PyObject *
+_asyncio__run_ready(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *ready;
+    Py_ssize_t ntodo;
+
+    if (!_PyArg_CheckPositional("_run_ready", nargs, 2, 2)) {
+        goto exit;
+    }
+    ready = args[0];
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[1]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        ntodo = ival;
+    }
+    return_value = _asyncio__run_ready_impl(module, ready, ntodo);
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=00162b8a5dbdb497 input=a9049054013a1b77]*/
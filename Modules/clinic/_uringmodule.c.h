@@ -0,0 +1,437 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+PyDoc_STRVAR(_uring_Ring__doc__,
+"Ring(entries=256)\n"
+"--\n"
+"\n"
+"Create an io_uring instance.\n"
+"\n"
+"  entries\n"
+"    Requested size of the submission queue.\n"
+"\n"
+"The size of the submission queue is rounded up to the next power of two,\n"
+"and clamped to the limit of the kernel.");
+
+static PyObject *
+_uring_Ring_impl(PyTypeObject *type, unsigned int entries);
+
+static PyObject *
+_uring_Ring(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"entries", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "Ring", 0};
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    unsigned int entries = 256;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 0, 1, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    entries = (unsigned int)PyLong_AsUnsignedLongMask(fastargs[0]);
+    if (entries == (unsigned int)-1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = _uring_Ring_impl(type, entries);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_close__doc__,
+"close($self, /)\n"
+"--\n"
+"\n"
+"Close the ring.\n"
+"\n"
+"Operations still in progress are cancelled by the kernel.  The buffers\n"
+"they use are not released, since they could still be written to.");
+
+#define _URING_RING_CLOSE_METHODDEF    \
+    {"close", (PyCFunction)_uring_Ring_close, METH_NOARGS, _uring_Ring_close__doc__},
+
+static PyObject *
+_uring_Ring_close_impl(RingObject *self);
+
+static PyObject *
+_uring_Ring_close(RingObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _uring_Ring_close_impl(self);
+}
+
+PyDoc_STRVAR(_uring_Ring_fileno__doc__,
+"fileno($self, /)\n"
+"--\n"
+"\n"
+"Return the file descriptor of the ring.");
+
+#define _URING_RING_FILENO_METHODDEF    \
+    {"fileno", (PyCFunction)_uring_Ring_fileno, METH_NOARGS, _uring_Ring_fileno__doc__},
+
+static PyObject *
+_uring_Ring_fileno_impl(RingObject *self);
+
+static PyObject *
+_uring_Ring_fileno(RingObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _uring_Ring_fileno_impl(self);
+}
+
+PyDoc_STRVAR(_uring_Ring_recv__doc__,
+"recv($self, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Receive data from the socket fd into the writable buffer.\n"
+"\n"
+"Return the key of the operation.  Its result is the number of bytes\n"
+"received.");
+
+#define _URING_RING_RECV_METHODDEF    \
+    {"recv", (PyCFunction)(void(*)(void))_uring_Ring_recv, METH_FASTCALL, _uring_Ring_recv__doc__},
+
+static PyObject *
+_uring_Ring_recv_impl(RingObject *self, int fd, PyObject *buffer, int flags);
+
+static PyObject *
+_uring_Ring_recv(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    PyObject *buffer;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("recv", nargs, 2, 3)) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    buffer = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    flags = _PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = _uring_Ring_recv_impl(self, fd, buffer, flags);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_send__doc__,
+"send($self, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Send data from the buffer to the socket fd.\n"
+"\n"
+"Return the key of the operation.  Its result is the number of bytes sent.");
+
+#define _URING_RING_SEND_METHODDEF    \
+    {"send", (PyCFunction)(void(*)(void))_uring_Ring_send, METH_FASTCALL, _uring_Ring_send__doc__},
+
+static PyObject *
+_uring_Ring_send_impl(RingObject *self, int fd, PyObject *buffer, int flags);
+
+static PyObject *
+_uring_Ring_send(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    PyObject *buffer;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("send", nargs, 2, 3)) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    buffer = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    flags = _PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = _uring_Ring_send_impl(self, fd, buffer, flags);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_read__doc__,
+"read($self, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Read from the file descriptor fd into the writable buffer.\n"
+"\n"
+"The data is read at the given offset, or at the current file position\n"
+"if offset is -1.  Return the key of the operation.  Its result is the\n"
+"number of bytes read.");
+
+#define _URING_RING_READ_METHODDEF    \
+    {"read", (PyCFunction)(void(*)(void))_uring_Ring_read, METH_FASTCALL, _uring_Ring_read__doc__},
+
+static PyObject *
+_uring_Ring_read_impl(RingObject *self, int fd, PyObject *buffer,
+                      long long offset);
+
+static PyObject *
+_uring_Ring_read(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    PyObject *buffer;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("read", nargs, 2, 3)) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    buffer = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[2]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = _uring_Ring_read_impl(self, fd, buffer, offset);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_write__doc__,
+"write($self, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Write the buffer to the file descriptor fd.\n"
+"\n"
+"The data is written at the given offset, or at the current file\n"
+"position if offset is -1.  Return the key of the operation.  Its result\n"
+"is the number of bytes written.");
+
+#define _URING_RING_WRITE_METHODDEF    \
+    {"write", (PyCFunction)(void(*)(void))_uring_Ring_write, METH_FASTCALL, _uring_Ring_write__doc__},
+
+static PyObject *
+_uring_Ring_write_impl(RingObject *self, int fd, PyObject *buffer,
+                       long long offset);
+
+static PyObject *
+_uring_Ring_write(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    PyObject *buffer;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("write", nargs, 2, 3)) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    buffer = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[2]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = _uring_Ring_write_impl(self, fd, buffer, offset);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_accept__doc__,
+"accept($self, fd, flags=0, /)\n"
+"--\n"
+"\n"
+"Accept a connection on the listening socket fd.\n"
+"\n"
+"flags is a combination of SOCK_NONBLOCK and SOCK_CLOEXEC.  Return the\n"
+"key of the operation.  Its result is the file descriptor of the accepted\n"
+"socket.");
+
+#define _URING_RING_ACCEPT_METHODDEF    \
+    {"accept", (PyCFunction)(void(*)(void))_uring_Ring_accept, METH_FASTCALL, _uring_Ring_accept__doc__},
+
+static PyObject *
+_uring_Ring_accept_impl(RingObject *self, int fd, int flags);
+
+static PyObject *
+_uring_Ring_accept(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("accept", nargs, 1, 2)) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    flags = _PyLong_AsInt(args[1]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = _uring_Ring_accept_impl(self, fd, flags);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_poll__doc__,
+"poll($self, fd, events, /)\n"
+"--\n"
+"\n"
+"Wait for the poll events to be signalled on the file descriptor fd.\n"
+"\n"
+"Return the key of the operation.  Its result is the mask of the events\n"
+"signalled.");
+
+#define _URING_RING_POLL_METHODDEF    \
+    {"poll", (PyCFunction)(void(*)(void))_uring_Ring_poll, METH_FASTCALL, _uring_Ring_poll__doc__},
+
+static PyObject *
+_uring_Ring_poll_impl(RingObject *self, int fd, unsigned int events);
+
+static PyObject *
+_uring_Ring_poll(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    unsigned int events;
+
+    if (!_PyArg_CheckPositional("poll", nargs, 2, 2)) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    events = (unsigned int)PyLong_AsUnsignedLongMask(args[1]);
+    if (events == (unsigned int)-1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = _uring_Ring_poll_impl(self, fd, events);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_timeout__doc__,
+"timeout($self, seconds, /)\n"
+"--\n"
+"\n"
+"Complete after the given number of seconds.\n"
+"\n"
+"Return the key of the operation.  Its result is -ETIME when the timeout\n"
+"expires.");
+
+#define _URING_RING_TIMEOUT_METHODDEF    \
+    {"timeout", (PyCFunction)_uring_Ring_timeout, METH_O, _uring_Ring_timeout__doc__},
+
+PyDoc_STRVAR(_uring_Ring_cancel__doc__,
+"cancel($self, key, /)\n"
+"--\n"
+"\n"
+"Request the cancellation of the operation identified by key.\n"
+"\n"
+"The cancelled operation completes with -ECANCELED if it was cancelled\n"
+"in time.  Return the key of the cancellation request.");
+
+#define _URING_RING_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_uring_Ring_cancel, METH_O, _uring_Ring_cancel__doc__},
+
+static PyObject *
+_uring_Ring_cancel_impl(RingObject *self, unsigned long long key);
+
+static PyObject *
+_uring_Ring_cancel(RingObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    unsigned long long key;
+
+    if (!PyLong_Check(arg)) {
+        _PyArg_BadArgument("cancel", "argument", "int", arg);
+        goto exit;
+    }
+    key = PyLong_AsUnsignedLongLongMask(arg);
+    return_value = _uring_Ring_cancel_impl(self, key);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_wait__doc__,
+"wait($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Submit the queued operations and wait for their completion.\n"
+"\n"
+"  timeout\n"
+"    The maximum number of seconds to wait, or None to wait until\n"
+"    an operation completes.\n"
+"\n"
+"Return a list of (key, result, flags) tuples of the operations which\n"
+"completed.  A negative result is the negated errno value of the error\n"
+"the operation failed with.  The list is empty if the timeout expired.");
+
+#define _URING_RING_WAIT_METHODDEF    \
+    {"wait", (PyCFunction)(void(*)(void))_uring_Ring_wait, METH_FASTCALL|METH_KEYWORDS, _uring_Ring_wait__doc__},
+
+static PyObject *
+_uring_Ring_wait_impl(RingObject *self, PyObject *timeout);
+
+static PyObject *
+_uring_Ring_wait(RingObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "wait", 0};
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout = args[0];
+skip_optional_pos:
+    return_value = _uring_Ring_wait_impl(self, timeout);
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=47fd9f0859f93733 input=a9049054013a1b77]*/
@@ -531,6 +531,12 @@ static int test_init_from_config(void)
     putenv("PYTHONNODEBUGRANGES=0");
     config.no_debug_ranges = 1;
 
+    putenv("PYTHONSPECIALIZATIONSTATS=0");
+    config.specialization_stats = 1;
+
+    putenv("PYTHONLAZYIMPORTS=0");
+    config.lazy_imports = 1;
+
     config.show_ref_count = 1;
     /* FIXME: test dump_refs: bpo-34223 */
 
@@ -690,6 +696,8 @@ static void set_most_env_vars(void)
     putenv("PYTHONTRACEMALLOC=2");
     putenv("PYTHONPROFILEIMPORTTIME=1");
     putenv("PYTHONNODEBUGRANGES=1");
+    putenv("PYTHONSPECIALIZATIONSTATS=1");
+    putenv("PYTHONLAZYIMPORTS=1");
     putenv("PYTHONMALLOCSTATS=1");
     putenv("PYTHONUTF8=1");
     putenv("PYTHONVERBOSE=1");
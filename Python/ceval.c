@@ -1797,6 +1797,8 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         }
 
         case TARGET(BINARY_MULTIPLY): {
+            PREDICTED(BINARY_MULTIPLY);
+            STAT_INC(BINARY_MULTIPLY, unquickened);
             PyObject *right = POP();
             PyObject *left = TOP();
             PyObject *res = PyNumber_Multiply(left, right);
@@ -1808,6 +1810,63 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        case TARGET(BINARY_MULTIPLY_ADAPTIVE): {
+            if (oparg == 0) {
+                PyObject *left = SECOND();
+                PyObject *right = TOP();
+                next_instr--;
+                if (_Py_Specialize_BinaryMultiply(left, right, next_instr) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(BINARY_MULTIPLY, deferred);
+                // oparg is the adaptive cache counter
+                UPDATE_PREV_INSTR_OPARG(next_instr, oparg - 1);
+                assert(_Py_OPCODE(next_instr[-1]) == BINARY_MULTIPLY_ADAPTIVE);
+                assert(_Py_OPARG(next_instr[-1]) == oparg - 1);
+                JUMP_TO_INSTRUCTION(BINARY_MULTIPLY);
+            }
+        }
+
+        case TARGET(BINARY_MULTIPLY_INT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyLong_CheckExact(left), BINARY_MULTIPLY);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), BINARY_MULTIPLY);
+            STAT_INC(BINARY_MULTIPLY, hit);
+            PyObject *res = _PyLong_Multiply((PyLongObject *)left, (PyLongObject *)right);
+            STACK_SHRINK(1);
+            SET_TOP(res);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
+        case TARGET(BINARY_MULTIPLY_FLOAT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyFloat_CheckExact(left), BINARY_MULTIPLY);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), BINARY_MULTIPLY);
+            STAT_INC(BINARY_MULTIPLY, hit);
+            double dres = PyFloat_AS_DOUBLE(left) * PyFloat_AS_DOUBLE(right);
+            PyObject *res = PyFloat_FromDouble(dres);
+            STACK_SHRINK(1);
+            SET_TOP(res);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
         case TARGET(BINARY_MATRIX_MULTIPLY): {
             PyObject *right = POP();
             PyObject *left = TOP();
@@ -1865,15 +1924,11 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         }
 
         case TARGET(BINARY_ADD): {
+            PREDICTED(BINARY_ADD);
+            STAT_INC(BINARY_ADD, unquickened);
             PyObject *right = POP();
             PyObject *left = TOP();
             PyObject *sum;
-            /* NOTE(vstinner): Please don't try to micro-optimize int+int on
-               CPython using bytecode, it is simply worthless.
-               See http://bugs.python.org/issue21955 and
-               http://bugs.python.org/issue10044 for the discussion. In short,
-               no patch shown any impact on a realistic benchmark, only a minor
-               speedup on microbenchmarks. */
             if (PyUnicode_CheckExact(left) &&
                      PyUnicode_CheckExact(right)) {
                 sum = unicode_concatenate(tstate, left, right, f, next_instr);
@@ -1890,6 +1945,83 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        case TARGET(BINARY_ADD_ADAPTIVE): {
+            if (oparg == 0) {
+                PyObject *left = SECOND();
+                PyObject *right = TOP();
+                next_instr--;
+                if (_Py_Specialize_BinaryAdd(left, right, next_instr) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(BINARY_ADD, deferred);
+                // oparg is the adaptive cache counter
+                UPDATE_PREV_INSTR_OPARG(next_instr, oparg - 1);
+                assert(_Py_OPCODE(next_instr[-1]) == BINARY_ADD_ADAPTIVE);
+                assert(_Py_OPARG(next_instr[-1]) == oparg - 1);
+                JUMP_TO_INSTRUCTION(BINARY_ADD);
+            }
+        }
+
+        case TARGET(BINARY_ADD_INT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyLong_CheckExact(left), BINARY_ADD);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), BINARY_ADD);
+            STAT_INC(BINARY_ADD, hit);
+            PyObject *res = _PyLong_Add((PyLongObject *)left, (PyLongObject *)right);
+            STACK_SHRINK(1);
+            SET_TOP(res);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
+        case TARGET(BINARY_ADD_FLOAT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyFloat_CheckExact(left), BINARY_ADD);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), BINARY_ADD);
+            STAT_INC(BINARY_ADD, hit);
+            double dres = PyFloat_AS_DOUBLE(left) + PyFloat_AS_DOUBLE(right);
+            PyObject *res = PyFloat_FromDouble(dres);
+            STACK_SHRINK(1);
+            SET_TOP(res);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
+        case TARGET(BINARY_ADD_UNICODE): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyUnicode_CheckExact(left), BINARY_ADD);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), BINARY_ADD);
+            STAT_INC(BINARY_ADD, hit);
+            STACK_SHRINK(1);
+            /* Appends in place when the left operand is only referenced
+               by the stack and the variable it is stored back to. */
+            PyObject *res = unicode_concatenate(tstate, left, right, f, next_instr);
+            /* unicode_concatenate consumed the ref to left */
+            SET_TOP(res);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
         case TARGET(BINARY_SUBTRACT): {
             PyObject *right = POP();
             PyObject *left = TOP();
@@ -2158,6 +2290,8 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         }
 
         case TARGET(INPLACE_ADD): {
+            PREDICTED(INPLACE_ADD);
+            STAT_INC(INPLACE_ADD, unquickened);
             PyObject *right = POP();
             PyObject *left = TOP();
             PyObject *sum;
@@ -2176,6 +2310,83 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        case TARGET(INPLACE_ADD_ADAPTIVE): {
+            if (oparg == 0) {
+                PyObject *left = SECOND();
+                PyObject *right = TOP();
+                next_instr--;
+                if (_Py_Specialize_InplaceAdd(left, right, next_instr) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(INPLACE_ADD, deferred);
+                // oparg is the adaptive cache counter
+                UPDATE_PREV_INSTR_OPARG(next_instr, oparg - 1);
+                assert(_Py_OPCODE(next_instr[-1]) == INPLACE_ADD_ADAPTIVE);
+                assert(_Py_OPARG(next_instr[-1]) == oparg - 1);
+                JUMP_TO_INSTRUCTION(INPLACE_ADD);
+            }
+        }
+
+        case TARGET(INPLACE_ADD_INT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyLong_CheckExact(left), INPLACE_ADD);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), INPLACE_ADD);
+            STAT_INC(INPLACE_ADD, hit);
+            PyObject *res = _PyLong_Add((PyLongObject *)left, (PyLongObject *)right);
+            STACK_SHRINK(1);
+            SET_TOP(res);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
+        case TARGET(INPLACE_ADD_FLOAT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyFloat_CheckExact(left), INPLACE_ADD);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), INPLACE_ADD);
+            STAT_INC(INPLACE_ADD, hit);
+            double dres = PyFloat_AS_DOUBLE(left) + PyFloat_AS_DOUBLE(right);
+            PyObject *res = PyFloat_FromDouble(dres);
+            STACK_SHRINK(1);
+            SET_TOP(res);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
+        case TARGET(INPLACE_ADD_UNICODE): {
+            assert(cframe.use_tracing == 0);
+            PyObject *left = SECOND();
+            PyObject *right = TOP();
+            DEOPT_IF(!PyUnicode_CheckExact(left), INPLACE_ADD);
+            DEOPT_IF(Py_TYPE(right) != Py_TYPE(left), INPLACE_ADD);
+            STAT_INC(INPLACE_ADD, hit);
+            STACK_SHRINK(1);
+            /* Appends in place when the left operand is only referenced
+               by the stack and the variable it is stored back to. */
+            PyObject *res = unicode_concatenate(tstate, left, right, f, next_instr);
+            /* unicode_concatenate consumed the ref to left */
+            SET_TOP(res);
+            Py_DECREF(right);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
         case TARGET(INPLACE_SUBTRACT): {
             PyObject *right = POP();
             PyObject *left = TOP();
@@ -2766,6 +2977,8 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         }
 
         case TARGET(STORE_ATTR): {
+            PREDICTED(STORE_ATTR);
+            STAT_INC(STORE_ATTR, unquickened);
             PyObject *name = GETITEM(names, oparg);
             PyObject *owner = TOP();
             PyObject *v = SECOND();
@@ -2779,6 +2992,120 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        case TARGET(STORE_ATTR_ADAPTIVE): {
+            assert(cframe.use_tracing == 0);
+            SpecializedCacheEntry *cache = GET_CACHE();
+            if (cache->adaptive.counter == 0) {
+                PyObject *owner = TOP();
+                PyObject *name = GETITEM(names, cache->adaptive.original_oparg);
+                next_instr--;
+                if (_Py_Specialize_StoreAttr(owner, next_instr, name, cache) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(STORE_ATTR, deferred);
+                cache->adaptive.counter--;
+                oparg = cache->adaptive.original_oparg;
+                JUMP_TO_INSTRUCTION(STORE_ATTR);
+            }
+        }
+
+        case TARGET(STORE_ATTR_SPLIT_KEYS): {
+            assert(cframe.use_tracing == 0);
+            PyObject *owner = TOP();
+            PyTypeObject *tp = Py_TYPE(owner);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyAttrCache *cache1 = &caches[-1].attr;
+            assert(cache1->tp_version != 0);
+            DEOPT_IF(tp->tp_version_tag != cache1->tp_version, STORE_ATTR);
+            assert(tp->tp_dictoffset > 0);
+            PyDictObject *dict = *(PyDictObject **)(((char *)owner) + tp->tp_dictoffset);
+            DEOPT_IF(dict == NULL, STORE_ATTR);
+            DEOPT_IF(!PyDict_CheckExact((PyObject *)dict), STORE_ATTR);
+            DEOPT_IF(dict->ma_keys->dk_version != cache1->dk_version_or_hint, STORE_ATTR);
+            assert(dict->ma_values != NULL);
+            Py_ssize_t index = cache0->index;
+            PyObject *old_value = dict->ma_values[index];
+            /* Split tables must be filled in key order */
+            DEOPT_IF(old_value == NULL && index != dict->ma_used, STORE_ATTR);
+            STAT_INC(STORE_ATTR, hit);
+            record_cache_hit(cache0);
+            STACK_SHRINK(1);
+            PyObject *value = POP();
+            dict->ma_values[index] = value;
+            if (old_value == NULL) {
+                dict->ma_used++;
+            }
+            if (!_PyObject_GC_IS_TRACKED(dict) && _PyObject_GC_MAY_BE_TRACKED(value)) {
+                _PyObject_GC_TRACK(dict);
+            }
+            /* PEP 509 */
+            dict->ma_version_tag = DICT_NEXT_VERSION();
+            Py_XDECREF(old_value);
+            Py_DECREF(owner);
+            DISPATCH();
+        }
+
+        case TARGET(STORE_ATTR_WITH_HINT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *owner = TOP();
+            PyTypeObject *tp = Py_TYPE(owner);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyAttrCache *cache1 = &caches[-1].attr;
+            assert(cache1->tp_version != 0);
+            DEOPT_IF(tp->tp_version_tag != cache1->tp_version, STORE_ATTR);
+            assert(tp->tp_dictoffset > 0);
+            PyDictObject *dict = *(PyDictObject **)(((char *)owner) + tp->tp_dictoffset);
+            DEOPT_IF(dict == NULL, STORE_ATTR);
+            DEOPT_IF(!PyDict_CheckExact((PyObject *)dict), STORE_ATTR);
+            PyObject *name = GETITEM(names, cache0->original_oparg);
+            uint32_t hint = cache1->dk_version_or_hint;
+            DEOPT_IF(hint >= dict->ma_keys->dk_nentries, STORE_ATTR);
+            PyDictKeyEntry *ep = DK_ENTRIES(dict->ma_keys) + hint;
+            DEOPT_IF(ep->me_key != name, STORE_ATTR);
+            /* Split tables keep their values outside the entries */
+            PyObject *old_value = ep->me_value;
+            DEOPT_IF(old_value == NULL, STORE_ATTR);
+            STAT_INC(STORE_ATTR, hit);
+            record_cache_hit(cache0);
+            STACK_SHRINK(1);
+            PyObject *value = POP();
+            ep->me_value = value;
+            if (!_PyObject_GC_IS_TRACKED(dict) && _PyObject_GC_MAY_BE_TRACKED(value)) {
+                _PyObject_GC_TRACK(dict);
+            }
+            /* PEP 509 */
+            dict->ma_version_tag = DICT_NEXT_VERSION();
+            Py_DECREF(old_value);
+            Py_DECREF(owner);
+            DISPATCH();
+        }
+
+        case TARGET(STORE_ATTR_SLOT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *owner = TOP();
+            PyTypeObject *tp = Py_TYPE(owner);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyAttrCache *cache1 = &caches[-1].attr;
+            assert(cache1->tp_version != 0);
+            DEOPT_IF(tp->tp_version_tag != cache1->tp_version, STORE_ATTR);
+            char *addr = (char *)owner + cache0->index;
+            STAT_INC(STORE_ATTR, hit);
+            record_cache_hit(cache0);
+            STACK_SHRINK(1);
+            PyObject *value = POP();
+            PyObject *old_value = *(PyObject **)addr;
+            *(PyObject **)addr = value;
+            Py_XDECREF(old_value);
+            Py_DECREF(owner);
+            DISPATCH();
+        }
+
         case TARGET(DELETE_ATTR): {
             PyObject *name = GETITEM(names, oparg);
             PyObject *owner = POP();
@@ -3392,7 +3719,7 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             PyTypeObject *tp = Py_TYPE(owner);
             SpecializedCacheEntry *caches = GET_CACHE();
             _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
-            _PyLoadAttrCache *cache1 = &caches[-1].load_attr;
+            _PyAttrCache *cache1 = &caches[-1].attr;
             assert(cache1->tp_version != 0);
             DEOPT_IF(tp->tp_version_tag != cache1->tp_version, LOAD_ATTR);
             assert(tp->tp_dictoffset > 0);
@@ -3416,7 +3743,7 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             PyObject *res;
             SpecializedCacheEntry *caches = GET_CACHE();
             _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
-            _PyLoadAttrCache *cache1 = &caches[-1].load_attr;
+            _PyAttrCache *cache1 = &caches[-1].attr;
             DEOPT_IF(!PyModule_CheckExact(owner), LOAD_ATTR);
             PyDictObject *dict = (PyDictObject *)((PyModuleObject *)owner)->md_dict;
             assert(dict != NULL);
@@ -3441,7 +3768,7 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             PyTypeObject *tp = Py_TYPE(owner);
             SpecializedCacheEntry *caches = GET_CACHE();
             _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
-            _PyLoadAttrCache *cache1 = &caches[-1].load_attr;
+            _PyAttrCache *cache1 = &caches[-1].attr;
             assert(cache1->tp_version != 0);
             DEOPT_IF(tp->tp_version_tag != cache1->tp_version, LOAD_ATTR);
             assert(tp->tp_dictoffset > 0);
@@ -3470,7 +3797,7 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             PyTypeObject *tp = Py_TYPE(owner);
             SpecializedCacheEntry *caches = GET_CACHE();
             _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
-            _PyLoadAttrCache *cache1 = &caches[-1].load_attr;
+            _PyAttrCache *cache1 = &caches[-1].attr;
             assert(cache1->tp_version != 0);
             DEOPT_IF(tp->tp_version_tag != cache1->tp_version, LOAD_ATTR);
             char *addr = (char *)owner + cache0->index;
@@ -3485,6 +3812,8 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         }
 
         case TARGET(COMPARE_OP): {
+            PREDICTED(COMPARE_OP);
+            STAT_INC(COMPARE_OP, unquickened);
             assert(oparg <= Py_GE);
             PyObject *right = POP();
             PyObject *left = TOP();
@@ -3499,6 +3828,107 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        case TARGET(COMPARE_OP_ADAPTIVE): {
+            assert(cframe.use_tracing == 0);
+            SpecializedCacheEntry *cache = GET_CACHE();
+            if (cache->adaptive.counter == 0) {
+                PyObject *right = TOP();
+                PyObject *left = SECOND();
+                next_instr--;
+                if (_Py_Specialize_CompareOp(left, right, next_instr, cache) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(COMPARE_OP, deferred);
+                cache->adaptive.counter--;
+                oparg = cache->adaptive.original_oparg;
+                JUMP_TO_INSTRUCTION(COMPARE_OP);
+            }
+        }
+
+        case TARGET(COMPARE_OP_INT_JUMP): {
+            assert(cframe.use_tracing == 0);
+            // Combined COMPARE_OP and POP_JUMP_IF_(TRUE|FALSE)
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()[0].adaptive;
+            int when_to_jump_mask = cache0->index;
+            PyObject *right = TOP();
+            PyObject *left = SECOND();
+            DEOPT_IF(!PyLong_CheckExact(left), COMPARE_OP);
+            DEOPT_IF(!PyLong_CheckExact(right), COMPARE_OP);
+            DEOPT_IF((size_t)(Py_SIZE(left) + 1) > 2, COMPARE_OP);
+            DEOPT_IF((size_t)(Py_SIZE(right) + 1) > 2, COMPARE_OP);
+            STAT_INC(COMPARE_OP, hit);
+            record_cache_hit(cache0);
+            assert(Py_ABS(Py_SIZE(left)) <= 1 && Py_ABS(Py_SIZE(right)) <= 1);
+            Py_ssize_t ileft = Py_SIZE(left) * ((PyLongObject *)left)->ob_digit[0];
+            Py_ssize_t iright = Py_SIZE(right) * ((PyLongObject *)right)->ob_digit[0];
+            int outcome = ileft < iright ? COMPARE_LT :
+                          ileft > iright ? COMPARE_GT : COMPARE_EQ;
+            NEXTOPARG();
+            assert(opcode == POP_JUMP_IF_FALSE || opcode == POP_JUMP_IF_TRUE);
+            STACK_SHRINK(2);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (outcome & when_to_jump_mask) {
+                JUMPTO(oparg);
+            }
+            DISPATCH();
+        }
+
+        case TARGET(COMPARE_OP_FLOAT_JUMP): {
+            assert(cframe.use_tracing == 0);
+            // Combined COMPARE_OP and POP_JUMP_IF_(TRUE|FALSE)
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()[0].adaptive;
+            int when_to_jump_mask = cache0->index;
+            PyObject *right = TOP();
+            PyObject *left = SECOND();
+            DEOPT_IF(!PyFloat_CheckExact(left), COMPARE_OP);
+            DEOPT_IF(!PyFloat_CheckExact(right), COMPARE_OP);
+            STAT_INC(COMPARE_OP, hit);
+            record_cache_hit(cache0);
+            double dleft = PyFloat_AS_DOUBLE(left);
+            double dright = PyFloat_AS_DOUBLE(right);
+            int outcome = dleft < dright ? COMPARE_LT :
+                          dleft > dright ? COMPARE_GT :
+                          dleft == dright ? COMPARE_EQ : COMPARE_UNORDERED;
+            NEXTOPARG();
+            assert(opcode == POP_JUMP_IF_FALSE || opcode == POP_JUMP_IF_TRUE);
+            STACK_SHRINK(2);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (outcome & when_to_jump_mask) {
+                JUMPTO(oparg);
+            }
+            DISPATCH();
+        }
+
+        case TARGET(COMPARE_OP_STR_JUMP): {
+            assert(cframe.use_tracing == 0);
+            // Combined COMPARE_OP and POP_JUMP_IF_(TRUE|FALSE)
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()[0].adaptive;
+            int when_to_jump_mask = cache0->index;
+            PyObject *right = TOP();
+            PyObject *left = SECOND();
+            DEOPT_IF(!PyUnicode_CheckExact(left), COMPARE_OP);
+            DEOPT_IF(!PyUnicode_CheckExact(right), COMPARE_OP);
+            STAT_INC(COMPARE_OP, hit);
+            record_cache_hit(cache0);
+            // Only specialized for == and !=, so ordering is irrelevant
+            int outcome = _PyUnicode_EQ(left, right) ?
+                          COMPARE_EQ : (COMPARE_LT | COMPARE_GT);
+            NEXTOPARG();
+            assert(opcode == POP_JUMP_IF_FALSE || opcode == POP_JUMP_IF_TRUE);
+            STACK_SHRINK(2);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            if (outcome & when_to_jump_mask) {
+                JUMPTO(oparg);
+            }
+            DISPATCH();
+        }
+
         case TARGET(IS_OP): {
             PyObject *right = POP();
             PyObject *left = TOP();
@@ -4062,6 +4492,8 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         }
 
         case TARGET(LOAD_METHOD): {
+            PREDICTED(LOAD_METHOD);
+            STAT_INC(LOAD_METHOD, unquickened);
             /* Designed to work in tandem with CALL_METHOD. */
             PyObject *name = GETITEM(names, oparg);
             PyObject *obj = TOP();
@@ -4098,7 +4530,105 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        case TARGET(LOAD_METHOD_ADAPTIVE): {
+            assert(cframe.use_tracing == 0);
+            SpecializedCacheEntry *cache = GET_CACHE();
+            if (cache->adaptive.counter == 0) {
+                PyObject *owner = TOP();
+                PyObject *name = GETITEM(names, cache->adaptive.original_oparg);
+                next_instr--;
+                if (_Py_Specialize_LoadMethod(owner, next_instr, name, cache) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(LOAD_METHOD, deferred);
+                cache->adaptive.counter--;
+                oparg = cache->adaptive.original_oparg;
+                JUMP_TO_INSTRUCTION(LOAD_METHOD);
+            }
+        }
+
+        case TARGET(LOAD_METHOD_CACHED): {
+            /* LOAD_METHOD, with cached method object */
+            assert(cframe.use_tracing == 0);
+            PyObject *self = TOP();
+            PyTypeObject *tp = Py_TYPE(self);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyAttrCache *cache1 = &caches[-1].attr;
+            _PyObjectCache *cache2 = &caches[-2].obj;
+            assert(cache1->tp_version != 0);
+            DEOPT_IF(tp->tp_version_tag != cache1->tp_version, LOAD_METHOD);
+            assert(tp->tp_dictoffset > 0);
+            PyDictObject *dict = *(PyDictObject **)(((char *)self) + tp->tp_dictoffset);
+            /* Ensure that the instance dict does not shadow the method */
+            DEOPT_IF(dict != NULL &&
+                     dict->ma_keys->dk_version != cache1->dk_version_or_hint,
+                     LOAD_METHOD);
+            STAT_INC(LOAD_METHOD, hit);
+            record_cache_hit(cache0);
+            PyObject *res = cache2->obj;
+            assert(res != NULL);
+            assert(_PyType_HasFeature(Py_TYPE(res), Py_TPFLAGS_METHOD_DESCRIPTOR));
+            Py_INCREF(res);
+            SET_TOP(res);
+            PUSH(self);
+            DISPATCH();
+        }
+
+        case TARGET(LOAD_METHOD_NO_DICT): {
+            assert(cframe.use_tracing == 0);
+            PyObject *self = TOP();
+            PyTypeObject *tp = Py_TYPE(self);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyAttrCache *cache1 = &caches[-1].attr;
+            _PyObjectCache *cache2 = &caches[-2].obj;
+            assert(cache1->tp_version != 0);
+            DEOPT_IF(tp->tp_version_tag != cache1->tp_version, LOAD_METHOD);
+            assert(tp->tp_dictoffset == 0);
+            STAT_INC(LOAD_METHOD, hit);
+            record_cache_hit(cache0);
+            PyObject *res = cache2->obj;
+            assert(res != NULL);
+            assert(_PyType_HasFeature(Py_TYPE(res), Py_TPFLAGS_METHOD_DESCRIPTOR));
+            Py_INCREF(res);
+            SET_TOP(res);
+            PUSH(self);
+            DISPATCH();
+        }
+
+        case TARGET(LOAD_METHOD_MODULE): {
+            assert(cframe.use_tracing == 0);
+            PyObject *owner = TOP();
+            PyObject *res;
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyAttrCache *cache1 = &caches[-1].attr;
+            DEOPT_IF(!PyModule_CheckExact(owner), LOAD_METHOD);
+            PyDictObject *dict = (PyDictObject *)((PyModuleObject *)owner)->md_dict;
+            assert(dict != NULL);
+            DEOPT_IF(dict->ma_keys->dk_version != cache1->dk_version_or_hint, LOAD_METHOD);
+            assert(dict->ma_keys->dk_kind == DICT_KEYS_UNICODE);
+            assert(cache0->index < dict->ma_keys->dk_nentries);
+            PyDictKeyEntry *ep = DK_ENTRIES(dict->ma_keys) + cache0->index;
+            res = ep->me_value;
+            DEOPT_IF(res == NULL, LOAD_METHOD);
+            STAT_INC(LOAD_METHOD, hit);
+            record_cache_hit(cache0);
+            /* Not a method call: NULL | attribute */
+            Py_INCREF(res);
+            SET_TOP(NULL);
+            Py_DECREF(owner);
+            PUSH(res);
+            DISPATCH();
+        }
+
         case TARGET(CALL_METHOD): {
+            PREDICTED(CALL_METHOD);
+            STAT_INC(CALL_METHOD, unquickened);
             /* Designed to work in tamdem with LOAD_METHOD. */
             PyObject **sp, *res;
             int meth_found;
@@ -4141,6 +4671,198 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             CHECK_EVAL_BREAKER();
             DISPATCH();
         }
+        case TARGET(CALL_METHOD_ADAPTIVE): {
+            SpecializedCacheEntry *cache = GET_CACHE();
+            if (cache->adaptive.counter == 0) {
+                int is_meth = PEEK(cache->adaptive.original_oparg + 2) != NULL;
+                int nargs = cache->adaptive.original_oparg + is_meth;
+                PyObject *callable = PEEK(nargs + 1);
+                PyObject *self = is_meth ? PEEK(nargs) : NULL;
+                next_instr--;
+                if (_Py_Specialize_CallMethod(callable, self, nargs, next_instr, cache) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(CALL_METHOD, deferred);
+                cache->adaptive.counter--;
+                oparg = cache->adaptive.original_oparg;
+                JUMP_TO_INSTRUCTION(CALL_METHOD);
+            }
+        }
+
+        case TARGET(CALL_METHOD_BUILTIN_O): {
+            assert(cframe.use_tracing == 0);
+            /* Builtin function found as a non-method attribute:
+               NULL | callable | arg */
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            assert(cache0->original_oparg == 1);
+            DEOPT_IF(THIRD() != NULL, CALL_METHOD);
+            PyObject *callable = SECOND();
+            DEOPT_IF(!PyCFunction_CheckExact(callable), CALL_METHOD);
+            DEOPT_IF(PyCFunction_GET_FLAGS(callable) != METH_O, CALL_METHOD);
+            STAT_INC(CALL_METHOD, hit);
+            record_cache_hit(cache0);
+            PyCFunction cfunc = PyCFunction_GET_FUNCTION(callable);
+            if (_Py_EnterRecursiveCall(tstate, " while calling a Python object")) {
+                goto error;
+            }
+            PyObject *arg = TOP();
+            PyObject *res = cfunc(PyCFunction_GET_SELF(callable), arg);
+            _Py_LeaveRecursiveCall(tstate);
+            res = _Py_CheckFunctionResult(tstate, callable, res, NULL);
+            STACK_SHRINK(2);
+            Py_DECREF(arg);
+            SET_TOP(res);
+            Py_DECREF(callable);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
+        case TARGET(CALL_METHOD_BUILTIN_FAST): {
+            assert(cframe.use_tracing == 0);
+            /* Builtin function found as a non-method attribute:
+               NULL | callable | arg1 | ... | argN */
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            int nargs = cache0->original_oparg;
+            DEOPT_IF(PEEK(nargs + 2) != NULL, CALL_METHOD);
+            PyObject **pfunc = &PEEK(nargs + 1);
+            PyObject *callable = *pfunc;
+            DEOPT_IF(!PyCFunction_CheckExact(callable), CALL_METHOD);
+            DEOPT_IF(PyCFunction_GET_FLAGS(callable) != METH_FASTCALL, CALL_METHOD);
+            STAT_INC(CALL_METHOD, hit);
+            record_cache_hit(cache0);
+            _PyCFunctionFast cfunc =
+                (_PyCFunctionFast)(void(*)(void))PyCFunction_GET_FUNCTION(callable);
+            if (_Py_EnterRecursiveCall(tstate, " while calling a Python object")) {
+                goto error;
+            }
+            PyObject *res = cfunc(PyCFunction_GET_SELF(callable),
+                                  stack_pointer - nargs, nargs);
+            _Py_LeaveRecursiveCall(tstate);
+            res = _Py_CheckFunctionResult(tstate, callable, res, NULL);
+            /* Clear the stack of the function object. */
+            while (stack_pointer > pfunc) {
+                PyObject *x = POP();
+                Py_DECREF(x);
+            }
+            SET_TOP(res);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
+        case TARGET(CALL_METHOD_DESCRIPTOR_O): {
+            assert(cframe.use_tracing == 0);
+            /* method | self | arg */
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            assert(cache0->original_oparg == 1);
+            PyObject *callable = THIRD();
+            DEOPT_IF(callable == NULL, CALL_METHOD);
+            DEOPT_IF(!Py_IS_TYPE(callable, &PyMethodDescr_Type), CALL_METHOD);
+            PyMethodDef *meth = ((PyMethodDescrObject *)callable)->d_method;
+            DEOPT_IF(meth->ml_flags != METH_O, CALL_METHOD);
+            PyObject *self = SECOND();
+            DEOPT_IF(!Py_IS_TYPE(self, ((PyDescrObject *)callable)->d_type),
+                     CALL_METHOD);
+            STAT_INC(CALL_METHOD, hit);
+            record_cache_hit(cache0);
+            PyCFunction cfunc = meth->ml_meth;
+            if (_Py_EnterRecursiveCall(tstate, " while calling a Python object")) {
+                goto error;
+            }
+            PyObject *arg = TOP();
+            PyObject *res = cfunc(self, arg);
+            _Py_LeaveRecursiveCall(tstate);
+            res = _Py_CheckFunctionResult(tstate, callable, res, NULL);
+            STACK_SHRINK(2);
+            Py_DECREF(arg);
+            Py_DECREF(self);
+            SET_TOP(res);
+            Py_DECREF(callable);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
+        case TARGET(CALL_METHOD_DESCRIPTOR_FAST): {
+            assert(cframe.use_tracing == 0);
+            /* method | self | arg1 | ... | argN */
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            int nargs = cache0->original_oparg + 1;
+            PyObject **pfunc = &PEEK(nargs + 1);
+            PyObject *callable = *pfunc;
+            DEOPT_IF(callable == NULL, CALL_METHOD);
+            DEOPT_IF(!Py_IS_TYPE(callable, &PyMethodDescr_Type), CALL_METHOD);
+            PyMethodDef *meth = ((PyMethodDescrObject *)callable)->d_method;
+            DEOPT_IF(meth->ml_flags != METH_FASTCALL, CALL_METHOD);
+            PyObject *self = PEEK(nargs);
+            DEOPT_IF(!Py_IS_TYPE(self, ((PyDescrObject *)callable)->d_type),
+                     CALL_METHOD);
+            STAT_INC(CALL_METHOD, hit);
+            record_cache_hit(cache0);
+            _PyCFunctionFast cfunc =
+                (_PyCFunctionFast)(void(*)(void))meth->ml_meth;
+            if (_Py_EnterRecursiveCall(tstate, " while calling a Python object")) {
+                goto error;
+            }
+            PyObject *res = cfunc(self, stack_pointer - nargs + 1, nargs - 1);
+            _Py_LeaveRecursiveCall(tstate);
+            res = _Py_CheckFunctionResult(tstate, callable, res, NULL);
+            /* Clear the stack of the function object. */
+            while (stack_pointer > pfunc) {
+                PyObject *x = POP();
+                Py_DECREF(x);
+            }
+            PUSH(res);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
+        case TARGET(CALL_METHOD_PY_EXACT_ARGS): {
+            assert(cframe.use_tracing == 0);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyCallCache *cache1 = &caches[-1].call;
+            int is_meth = PEEK(cache0->original_oparg + 2) != NULL;
+            int nargs = cache0->original_oparg + is_meth;
+            PyObject **pfunc = &PEEK(nargs + 1);
+            PyObject *callable = *pfunc;
+            DEOPT_IF(!PyFunction_Check(callable), CALL_METHOD);
+            PyFunctionObject *func = (PyFunctionObject *)callable;
+            DEOPT_IF(func->func_version != cache1->func_version, CALL_METHOD);
+            DEOPT_IF(((PyCodeObject *)func->func_code)->co_argcount != nargs,
+                     CALL_METHOD);
+            STAT_INC(CALL_METHOD, hit);
+            record_cache_hit(cache0);
+            PyObject *res = _PyEval_Vector(
+                tstate, PyFunction_AS_FRAME_CONSTRUCTOR(func), NULL,
+                stack_pointer - nargs, nargs, NULL);
+            /* Clear the stack of the function object. */
+            while (stack_pointer > pfunc) {
+                PyObject *x = POP();
+                Py_DECREF(x);
+            }
+            STACK_SHRINK(1 - is_meth);
+            PUSH(res);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
         case TARGET(CALL_METHOD_KW): {
             /* Designed to work in tandem with LOAD_METHOD. Same as CALL_METHOD
             but pops TOS to get a tuple of keyword names. */
@@ -4166,6 +4888,7 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         }
         case TARGET(CALL_FUNCTION): {
             PREDICTED(CALL_FUNCTION);
+            STAT_INC(CALL_FUNCTION, unquickened);
             PyObject **sp, *res;
             sp = stack_pointer;
             res = call_function(tstate, &sp, oparg, NULL, cframe.use_tracing);
@@ -4178,6 +4901,210 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        case TARGET(CALL_FUNCTION_ADAPTIVE): {
+            SpecializedCacheEntry *cache = GET_CACHE();
+            if (cache->adaptive.counter == 0) {
+                int nargs = cache->adaptive.original_oparg;
+                PyObject *callable = PEEK(nargs + 1);
+                next_instr--;
+                if (_Py_Specialize_CallFunction(callable, nargs, next_instr, cache) < 0) {
+                    goto error;
+                }
+                DISPATCH();
+            }
+            else {
+                STAT_INC(CALL_FUNCTION, deferred);
+                cache->adaptive.counter--;
+                oparg = cache->adaptive.original_oparg;
+                JUMP_TO_INSTRUCTION(CALL_FUNCTION);
+            }
+        }
+
+        case TARGET(CALL_FUNCTION_BUILTIN_O): {
+            assert(cframe.use_tracing == 0);
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            assert(cache0->original_oparg == 1);
+            PyObject *callable = SECOND();
+            DEOPT_IF(!PyCFunction_CheckExact(callable), CALL_FUNCTION);
+            DEOPT_IF(PyCFunction_GET_FLAGS(callable) != METH_O, CALL_FUNCTION);
+            STAT_INC(CALL_FUNCTION, hit);
+            record_cache_hit(cache0);
+            PyCFunction cfunc = PyCFunction_GET_FUNCTION(callable);
+            if (_Py_EnterRecursiveCall(tstate, " while calling a Python object")) {
+                goto error;
+            }
+            PyObject *arg = TOP();
+            PyObject *res = cfunc(PyCFunction_GET_SELF(callable), arg);
+            _Py_LeaveRecursiveCall(tstate);
+            res = _Py_CheckFunctionResult(tstate, callable, res, NULL);
+            STACK_SHRINK(1);
+            Py_DECREF(arg);
+            SET_TOP(res);
+            Py_DECREF(callable);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
+        case TARGET(CALL_FUNCTION_BUILTIN_FAST): {
+            assert(cframe.use_tracing == 0);
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            int nargs = cache0->original_oparg;
+            PyObject **pfunc = &PEEK(nargs + 1);
+            PyObject *callable = *pfunc;
+            DEOPT_IF(!PyCFunction_CheckExact(callable), CALL_FUNCTION);
+            DEOPT_IF(PyCFunction_GET_FLAGS(callable) != METH_FASTCALL, CALL_FUNCTION);
+            STAT_INC(CALL_FUNCTION, hit);
+            record_cache_hit(cache0);
+            _PyCFunctionFast cfunc =
+                (_PyCFunctionFast)(void(*)(void))PyCFunction_GET_FUNCTION(callable);
+            if (_Py_EnterRecursiveCall(tstate, " while calling a Python object")) {
+                goto error;
+            }
+            PyObject *res = cfunc(PyCFunction_GET_SELF(callable),
+                                  stack_pointer - nargs, nargs);
+            _Py_LeaveRecursiveCall(tstate);
+            res = _Py_CheckFunctionResult(tstate, callable, res, NULL);
+            /* Clear the stack of the function object. */
+            while (stack_pointer > pfunc) {
+                PyObject *x = POP();
+                Py_DECREF(x);
+            }
+            PUSH(res);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
+        case TARGET(CALL_FUNCTION_LEN): {
+            assert(cframe.use_tracing == 0);
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            assert(cache0->original_oparg == 1);
+            PyObject *callable = SECOND();
+            DEOPT_IF(callable != tstate->interp->callable_cache.len, CALL_FUNCTION);
+            STAT_INC(CALL_FUNCTION, hit);
+            record_cache_hit(cache0);
+            Py_ssize_t len_i = PyObject_Length(TOP());
+            if (len_i < 0) {
+                goto error;
+            }
+            PyObject *res = PyLong_FromSsize_t(len_i);
+            assert((res != NULL) ^ (_PyErr_Occurred(tstate) != NULL));
+            PyObject *arg = POP();
+            Py_DECREF(arg);
+            SET_TOP(res);
+            Py_DECREF(callable);
+            if (res == NULL) {
+                goto error;
+            }
+            DISPATCH();
+        }
+
+        case TARGET(CALL_FUNCTION_ISINSTANCE): {
+            assert(cframe.use_tracing == 0);
+            _PyAdaptiveEntry *cache0 = &GET_CACHE()->adaptive;
+            assert(cache0->original_oparg == 2);
+            PyObject *callable = THIRD();
+            DEOPT_IF(callable != tstate->interp->callable_cache.isinstance, CALL_FUNCTION);
+            STAT_INC(CALL_FUNCTION, hit);
+            record_cache_hit(cache0);
+            int retval = PyObject_IsInstance(SECOND(), TOP());
+            if (retval < 0) {
+                goto error;
+            }
+            PyObject *res = PyBool_FromLong(retval);
+            PyObject *cls = POP();
+            Py_DECREF(cls);
+            PyObject *inst = POP();
+            Py_DECREF(inst);
+            SET_TOP(res);
+            Py_DECREF(callable);
+            DISPATCH();
+        }
+
+        case TARGET(CALL_FUNCTION_PY_EXACT_ARGS): {
+            assert(cframe.use_tracing == 0);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyCallCache *cache1 = &caches[-1].call;
+            int nargs = cache0->original_oparg;
+            PyObject **pfunc = &PEEK(nargs + 1);
+            PyObject *callable = *pfunc;
+            DEOPT_IF(!PyFunction_Check(callable), CALL_FUNCTION);
+            PyFunctionObject *func = (PyFunctionObject *)callable;
+            DEOPT_IF(func->func_version != cache1->func_version, CALL_FUNCTION);
+            STAT_INC(CALL_FUNCTION, hit);
+            record_cache_hit(cache0);
+            PyObject *res = _PyEval_Vector(
+                tstate, PyFunction_AS_FRAME_CONSTRUCTOR(func), NULL,
+                stack_pointer - nargs, nargs, NULL);
+            /* Clear the stack of the function object. */
+            while (stack_pointer > pfunc) {
+                PyObject *x = POP();
+                Py_DECREF(x);
+            }
+            PUSH(res);
+            if (res == NULL) {
+                goto error;
+            }
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
+        case TARGET(CALL_FUNCTION_TYPE_PY_INIT): {
+            assert(cframe.use_tracing == 0);
+            _Py_IDENTIFIER(__init__);
+            SpecializedCacheEntry *caches = GET_CACHE();
+            _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+            _PyCallCache *cache1 = &caches[-1].call;
+            int nargs = cache0->original_oparg;
+            PyObject **pfunc = &PEEK(nargs + 1);
+            PyTypeObject *tp = (PyTypeObject *)*pfunc;
+            DEOPT_IF(!PyType_Check(tp), CALL_FUNCTION);
+            DEOPT_IF(tp->tp_version_tag != cache1->tp_version, CALL_FUNCTION);
+            /* The type version pins __init__, so it must be a function */
+            PyObject *init = _PyType_LookupId(tp, &PyId___init__);
+            assert(init != NULL && PyFunction_Check(init));
+            DEOPT_IF(((PyFunctionObject *)init)->func_version != cache1->func_version,
+                     CALL_FUNCTION);
+            STAT_INC(CALL_FUNCTION, hit);
+            record_cache_hit(cache0);
+            PyObject *self = tp->tp_alloc(tp, 0);
+            if (self == NULL) {
+                goto error;
+            }
+            /* Pass the new instance as the first argument to __init__,
+               in place of the type on the stack. */
+            *pfunc = self;
+            PyObject *res = _PyEval_Vector(
+                tstate, PyFunction_AS_FRAME_CONSTRUCTOR(init), NULL,
+                pfunc, nargs + 1, NULL);
+            while (stack_pointer > pfunc + 1) {
+                PyObject *x = POP();
+                Py_DECREF(x);
+            }
+            (void)POP();
+            Py_DECREF(tp);
+            if (res != Py_None) {
+                if (res != NULL) {
+                    _PyErr_Format(tstate, PyExc_TypeError,
+                                  "__init__() should return None, not '%.200s'",
+                                  Py_TYPE(res)->tp_name);
+                    Py_DECREF(res);
+                }
+                Py_DECREF(self);
+                goto error;
+            }
+            Py_DECREF(res);
+            PUSH(self);
+            CHECK_EVAL_BREAKER();
+            DISPATCH();
+        }
+
         case TARGET(CALL_FUNCTION_KW): {
             PyObject **sp, *res, *names;
 
@@ -4420,7 +5347,15 @@ opname ## _miss: \
     }
 
 MISS_WITH_CACHE(LOAD_ATTR)
+MISS_WITH_CACHE(STORE_ATTR)
+MISS_WITH_CACHE(LOAD_METHOD)
 MISS_WITH_CACHE(LOAD_GLOBAL)
+MISS_WITH_CACHE(CALL_FUNCTION)
+MISS_WITH_CACHE(CALL_METHOD)
+MISS_WITH_CACHE(COMPARE_OP)
+MISS_WITH_OPARG_COUNTER(BINARY_ADD)
+MISS_WITH_OPARG_COUNTER(INPLACE_ADD)
+MISS_WITH_OPARG_COUNTER(BINARY_MULTIPLY)
 MISS_WITH_OPARG_COUNTER(BINARY_SUBSCR)
 
 binary_subscr_dict_error:
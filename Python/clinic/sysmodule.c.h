@@ -281,6 +281,36 @@ sys_getprofile(PyObject *module, PyObject *Py_UNUSED(ignored))
     return sys_getprofile_impl(module);
 }
 
+PyDoc_STRVAR(sys_setimportprofile__doc__,
+"setimportprofile($module, function, /)\n"
+"--\n"
+"\n"
+"Set the import profiling function.\n"
+"\n"
+"It is called after each import of a module not yet in sys.modules, with\n"
+"a dict describing the import.  None removes the function.");
+
+#define SYS_SETIMPORTPROFILE_METHODDEF    \
+    {"setimportprofile", (PyCFunction)sys_setimportprofile, METH_O, sys_setimportprofile__doc__},
+
+PyDoc_STRVAR(sys_getimportprofile__doc__,
+"getimportprofile($module, /)\n"
+"--\n"
+"\n"
+"Return the import profiling function set with sys.setimportprofile.");
+
+#define SYS_GETIMPORTPROFILE_METHODDEF    \
+    {"getimportprofile", (PyCFunction)sys_getimportprofile, METH_NOARGS, sys_getimportprofile__doc__},
+
+static PyObject *
+sys_getimportprofile_impl(PyObject *module);
+
+static PyObject *
+sys_getimportprofile(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return sys_getimportprofile_impl(module);
+}
+
 PyDoc_STRVAR(sys_setswitchinterval__doc__,
 "setswitchinterval($module, interval, /)\n"
 "--\n"
@@ -737,6 +767,83 @@ sys__getquickenedcount(PyObject *module, PyObject *Py_UNUSED(ignored))
     return return_value;
 }
 
+PyDoc_STRVAR(sys__getspecializationstats__doc__,
+"_getspecializationstats($module, /)\n"
+"--\n"
+"\n"
+"Return statistics about the specializing adaptive interpreter.\n"
+"\n"
+"The result maps the name of each family of adaptive instructions to a\n"
+"dict of counters.  Return None unless statistics are being collected,\n"
+"see -X specialization_stats.");
+
+#define SYS__GETSPECIALIZATIONSTATS_METHODDEF    \
+    {"_getspecializationstats", (PyCFunction)sys__getspecializationstats, METH_NOARGS, sys__getspecializationstats__doc__},
+
+static PyObject *
+sys__getspecializationstats_impl(PyObject *module);
+
+static PyObject *
+sys__getspecializationstats(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return sys__getspecializationstats_impl(module);
+}
+
+PyDoc_STRVAR(sys__clearspecializationstats__doc__,
+"_clearspecializationstats($module, /)\n"
+"--\n"
+"\n"
+"Reset the statistics about the specializing adaptive interpreter.");
+
+#define SYS__CLEARSPECIALIZATIONSTATS_METHODDEF    \
+    {"_clearspecializationstats", (PyCFunction)sys__clearspecializationstats, METH_NOARGS, sys__clearspecializationstats__doc__},
+
+static PyObject *
+sys__clearspecializationstats_impl(PyObject *module);
+
+static PyObject *
+sys__clearspecializationstats(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return sys__clearspecializationstats_impl(module);
+}
+
+PyDoc_STRVAR(sys__getspecializationstate__doc__,
+"_getspecializationstate($module, code, /)\n"
+"--\n"
+"\n"
+"Return the state of the adaptive instructions of a code object.\n"
+"\n"
+"Return a list of (offset, opcode, counter, cache) tuples, one for each\n"
+"instruction that belongs to a family of adaptive instructions or was\n"
+"replaced when quickening, or None if the code object has not been\n"
+"quickened yet.  opcode is the current, possibly specialized, opcode.\n"
+"counter is None for instructions that have no adaptive counter or\n"
+"remain in their generic form.  cache is a dict of the fields of the\n"
+"inline cache entries of a specialized instruction, or None.");
+
+#define SYS__GETSPECIALIZATIONSTATE_METHODDEF    \
+    {"_getspecializationstate", (PyCFunction)sys__getspecializationstate, METH_O, sys__getspecializationstate__doc__},
+
+static PyObject *
+sys__getspecializationstate_impl(PyObject *module, PyCodeObject *code);
+
+static PyObject *
+sys__getspecializationstate(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyCodeObject *code;
+
+    if (!PyObject_TypeCheck(arg, &PyCode_Type)) {
+        _PyArg_BadArgument("_getspecializationstate", "argument", (&PyCode_Type)->tp_name, arg);
+        goto exit;
+    }
+    code = (PyCodeObject *)arg;
+    return_value = sys__getspecializationstate_impl(module, code);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(sys_getallocatedblocks__doc__,
 "getallocatedblocks($module, /)\n"
 "--\n"
@@ -992,4 +1099,4 @@ sys_getandroidapilevel(PyObject *module, PyObject *Py_UNUSED(ignored))
 #ifndef SYS_GETANDROIDAPILEVEL_METHODDEF
     #define SYS_GETANDROIDAPILEVEL_METHODDEF
 #endif /* !defined(SYS_GETANDROIDAPILEVEL_METHODDEF) */
-/*[clinic end generated code: output=855fc93b2347710b input=a9049054013a1b77]*/
+/*[clinic end generated code: output=d838f2f513e94ad2 input=a9049054013a1b77]*/
@@ -354,7 +354,17 @@ import_ensure_initialized(PyInterpreterState *interp, PyObject *mod, PyObject *n
        NOTE: because of this, initializing must be set *before*
        stuffing the new module in sys.modules.
     */
-    spec = _PyObject_GetAttrId(mod, &PyId___spec__);
+    if (PyModule_Check(mod)) {
+        /* Read __spec__ from the module dict, so that importing a module
+           again does not trigger the load of a lazily loaded module
+           (see importlib.util.LazyLoader). */
+        PyObject *dict = PyModule_GetDict(mod);
+        spec = _PyDict_GetItemIdWithError(dict, &PyId___spec__);
+        Py_XINCREF(spec);
+    }
+    else {
+        spec = _PyObject_GetAttrId(mod, &PyId___spec__);
+    }
     int busy = _PyModuleSpec_IsInitializing(spec);
     Py_XDECREF(spec);
     if (busy) {
@@ -1455,6 +1465,321 @@ resolve_name(PyThreadState *tstate, PyObject *name, PyObject *globals, int level
     return NULL;
 }
 
+/* Import time profiling: -X importtime and sys.setimportprofile() */
+
+#define IMPORT_TIME_TEXT 1
+#define IMPORT_TIME_JSON 2
+#define IMPORT_TIME_CSV 3
+
+/* Return the list of the names of the modules being imported by the
+   current thread, outermost first (borrowed reference). */
+static PyObject *
+import_profile_get_stack(void)
+{
+    _Py_IDENTIFIER(__import_profile_stack__);
+    PyObject *dict = PyThreadState_GetDict();
+    if (dict == NULL) {
+        return NULL;
+    }
+    PyObject *stack = _PyDict_GetItemIdWithError(dict,
+                                                 &PyId___import_profile_stack__);
+    if (stack == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        stack = PyList_New(0);
+        if (stack == NULL) {
+            return NULL;
+        }
+        int res = _PyDict_SetItemId(dict, &PyId___import_profile_stack__,
+                                    stack);
+        Py_DECREF(stack);
+        if (res < 0) {
+            return NULL;
+        }
+    }
+    return stack;
+}
+
+/* Return the size of the file *path*, or -1 if it cannot be stat'ed. */
+static long long
+import_profile_file_size(PyObject *path)
+{
+#ifdef MS_WINDOWS
+    PyObject *os = PyImport_ImportModule("nt");
+#else
+    PyObject *os = PyImport_ImportModule("posix");
+#endif
+    if (os == NULL) {
+        return -1;
+    }
+    _Py_IDENTIFIER(stat);
+    _Py_IDENTIFIER(st_size);
+    PyObject *st = _PyObject_CallMethodIdOneArg(os, &PyId_stat, path);
+    Py_DECREF(os);
+    if (st == NULL) {
+        return -1;
+    }
+    PyObject *size = _PyObject_GetAttrId(st, &PyId_st_size);
+    Py_DECREF(st);
+    if (size == NULL) {
+        return -1;
+    }
+    long long result = PyLong_AsLongLong(size);
+    Py_DECREF(size);
+    return result;
+}
+
+/* Get the loader type name, the origin and the size of the code loaded
+   for the module *mod* from its spec.  Values which cannot be determined
+   are left to NULL and -1. */
+static void
+import_profile_spec_info(PyObject *mod, PyObject **loader_name,
+                         PyObject **origin, long long *size)
+{
+    _Py_IDENTIFIER(__spec__);
+    _Py_IDENTIFIER(loader);
+    _Py_IDENTIFIER(origin);
+    _Py_IDENTIFIER(cached);
+    _Py_IDENTIFIER(has_location);
+    PyObject *spec = NULL, *value;
+
+    *loader_name = NULL;
+    *origin = NULL;
+    *size = -1;
+    if (mod == NULL) {
+        return;
+    }
+    /* Don't trigger the load of lazy modules */
+    if (PyModule_Check(mod)) {
+        spec = _PyDict_GetItemIdWithError(PyModule_GetDict(mod),
+                                          &PyId___spec__);
+        Py_XINCREF(spec);
+    }
+    else {
+        (void)_PyObject_LookupAttrId(mod, &PyId___spec__, &spec);
+    }
+    if (spec == NULL || spec == Py_None) {
+        goto done;
+    }
+
+    if (_PyObject_LookupAttrId(spec, &PyId_loader, &value) > 0) {
+        /* Some loaders, like BuiltinImporter, are classes */
+        if (PyType_Check(value)) {
+            *loader_name = PyUnicode_FromString(
+                _PyType_Name((PyTypeObject *)value));
+        }
+        else if (value != Py_None) {
+            *loader_name = PyUnicode_FromString(_PyType_Name(Py_TYPE(value)));
+        }
+        Py_DECREF(value);
+    }
+    if (_PyObject_LookupAttrId(spec, &PyId_origin, &value) > 0) {
+        if (PyUnicode_Check(value)) {
+            *origin = value;
+        }
+        else {
+            Py_DECREF(value);
+        }
+    }
+
+    /* The code loaded is the cached bytecode if there is some, otherwise
+       the file the module is loaded from. */
+    if (_PyObject_LookupAttrId(spec, &PyId_cached, &value) > 0) {
+        if (PyUnicode_Check(value)) {
+            *size = import_profile_file_size(value);
+        }
+        Py_DECREF(value);
+    }
+    if (*size < 0 && *origin != NULL
+        && _PyObject_LookupAttrId(spec, &PyId_has_location, &value) > 0)
+    {
+        if (PyObject_IsTrue(value) > 0) {
+            *size = import_profile_file_size(*origin);
+        }
+        Py_DECREF(value);
+    }
+
+done:
+    Py_XDECREF(spec);
+    /* The profile is best effort: ignore errors */
+    PyErr_Clear();
+}
+
+static void
+import_time_write_json_string(PyObject *str)
+{
+    const char *s = str != NULL ? PyUnicode_AsUTF8(str) : NULL;
+    if (s == NULL) {
+        PyErr_Clear();
+        fputs("null", stderr);
+        return;
+    }
+    fputc('"', stderr);
+    for (; *s != '\0'; s++) {
+        unsigned char c = (unsigned char)*s;
+        if (c == '"' || c == '\\') {
+            fprintf(stderr, "\\%c", c);
+        }
+        else if (c < 0x20) {
+            fprintf(stderr, "\\u%04x", c);
+        }
+        else {
+            fputc(c, stderr);
+        }
+    }
+    fputc('"', stderr);
+}
+
+static void
+import_time_write_csv_string(PyObject *str)
+{
+    const char *s = str != NULL ? PyUnicode_AsUTF8(str) : NULL;
+    if (s == NULL) {
+        PyErr_Clear();
+        return;
+    }
+    fputc('"', stderr);
+    for (; *s != '\0'; s++) {
+        if (*s == '"') {
+            fputc('"', stderr);
+        }
+        fputc(*s, stderr);
+    }
+    fputc('"', stderr);
+}
+
+/* Write a record of -X importtime=json or -X importtime=csv to stderr.
+   JSON records are written one per line. */
+static void
+import_time_write_record(int format, PyObject *record)
+{
+    PyObject *module = PyDict_GetItemString(record, "module");
+    PyObject *parents = PyDict_GetItemString(record, "parents");
+    PyObject *self_us = PyDict_GetItemString(record, "self_us");
+    PyObject *cumulative_us = PyDict_GetItemString(record, "cumulative_us");
+    PyObject *size = PyDict_GetItemString(record, "size");
+    PyObject *loader = PyDict_GetItemString(record, "loader");
+    PyObject *origin = PyDict_GetItemString(record, "origin");
+    int success = PyDict_GetItemString(record, "success") == Py_True;
+    Py_ssize_t nparents = PyTuple_GET_SIZE(parents);
+
+    if (format == IMPORT_TIME_JSON) {
+        fputs("{\"module\": ", stderr);
+        import_time_write_json_string(module);
+        fputs(", \"parents\": [", stderr);
+        for (Py_ssize_t i = 0; i < nparents; i++) {
+            if (i > 0) {
+                fputs(", ", stderr);
+            }
+            import_time_write_json_string(PyTuple_GET_ITEM(parents, i));
+        }
+        fprintf(stderr, "], \"self_us\": %lld, \"cumulative_us\": %lld",
+                PyLong_AsLongLong(self_us), PyLong_AsLongLong(cumulative_us));
+        if (size != Py_None) {
+            fprintf(stderr, ", \"size\": %lld", PyLong_AsLongLong(size));
+        }
+        else {
+            fputs(", \"size\": null", stderr);
+        }
+        fputs(", \"loader\": ", stderr);
+        import_time_write_json_string(loader != Py_None ? loader : NULL);
+        fputs(", \"origin\": ", stderr);
+        import_time_write_json_string(origin != Py_None ? origin : NULL);
+        fprintf(stderr, ", \"success\": %s}\n", success ? "true" : "false");
+    }
+    else {
+        static int header = 1;
+        if (header) {
+            fputs("module,parents,self_us,cumulative_us,size,loader,origin,"
+                  "success\n", stderr);
+            header = 0;
+        }
+        import_time_write_csv_string(module);
+        /* Parents are separated by spaces, outermost first */
+        fputs(",\"", stderr);
+        for (Py_ssize_t i = 0; i < nparents; i++) {
+            const char *parent = PyUnicode_AsUTF8(PyTuple_GET_ITEM(parents, i));
+            if (parent == NULL) {
+                PyErr_Clear();
+                continue;
+            }
+            fprintf(stderr, i > 0 ? " %s" : "%s", parent);
+        }
+        fprintf(stderr, "\",%lld,%lld,",
+                PyLong_AsLongLong(self_us), PyLong_AsLongLong(cumulative_us));
+        if (size != Py_None) {
+            fprintf(stderr, "%lld", PyLong_AsLongLong(size));
+        }
+        fputc(',', stderr);
+        import_time_write_csv_string(loader != Py_None ? loader : NULL);
+        fputc(',', stderr);
+        import_time_write_csv_string(origin != Py_None ? origin : NULL);
+        fprintf(stderr, ",%d\n", success);
+    }
+}
+
+/* Build the record of the import of *abs_name*, as passed to the function
+   set by sys.setimportprofile(). */
+static PyObject *
+import_profile_record(PyObject *abs_name, PyObject *parents, PyObject *mod,
+                      _PyTime_t self, _PyTime_t cumulative)
+{
+    PyObject *loader_name, *origin;
+    long long size;
+
+    import_profile_spec_info(mod, &loader_name, &origin, &size);
+    PyObject *record = Py_BuildValue(
+        "{sOsOsLsLsNsOsOsO}",
+        "module", abs_name,
+        "parents", parents,
+        "self_us",
+        (long long)_PyTime_AsMicroseconds(self, _PyTime_ROUND_CEILING),
+        "cumulative_us",
+        (long long)_PyTime_AsMicroseconds(cumulative, _PyTime_ROUND_CEILING),
+        "size", size >= 0 ? PyLong_FromLongLong(size) : Py_NewRef(Py_None),
+        "loader", loader_name != NULL ? loader_name : Py_None,
+        "origin", origin != NULL ? origin : Py_None,
+        "success", mod != NULL ? Py_True : Py_False);
+    Py_XDECREF(loader_name);
+    Py_XDECREF(origin);
+    return record;
+}
+
+/* Report the import of *abs_name*: write it to stderr for the JSON and CSV
+   formats of -X importtime and pass it to the import profile function.
+   The current exception, if any, is preserved. */
+static void
+import_profile_report(PyThreadState *tstate, int import_time,
+                      PyObject *profile, PyObject *abs_name,
+                      PyObject *parents, PyObject *mod,
+                      _PyTime_t self, _PyTime_t cumulative)
+{
+    PyObject *exc_type, *exc_value, *exc_tb;
+    _PyErr_Fetch(tstate, &exc_type, &exc_value, &exc_tb);
+
+    PyObject *record = import_profile_record(abs_name, parents, mod,
+                                             self, cumulative);
+    if (record == NULL) {
+        PyErr_WriteUnraisable(abs_name);
+        goto done;
+    }
+    if (import_time == IMPORT_TIME_JSON || import_time == IMPORT_TIME_CSV) {
+        import_time_write_record(import_time, record);
+    }
+    if (profile != NULL) {
+        PyObject *res = PyObject_CallOneArg(profile, record);
+        if (res == NULL) {
+            PyErr_WriteUnraisable(profile);
+        }
+        Py_XDECREF(res);
+    }
+    Py_DECREF(record);
+
+done:
+    _PyErr_Restore(tstate, exc_type, exc_value, exc_tb);
+}
+
 static PyObject *
 import_find_and_load(PyThreadState *tstate, PyObject *abs_name)
 {
@@ -1462,6 +1787,10 @@ import_find_and_load(PyThreadState *tstate, PyObject *abs_name)
     PyObject *mod = NULL;
     PyInterpreterState *interp = tstate->interp;
     int import_time = _PyInterpreterState_GetConfig(interp)->import_time;
+    PyObject *profile = interp->import_profile;
+    PyObject *stack = NULL, *parents = NULL;
+    /* Imports done by the import profile function are not reported */
+    static int in_import_profile;
     static int import_level;
     static _PyTime_t accumulated;
 
@@ -1483,12 +1812,35 @@ import_find_and_load(PyThreadState *tstate, PyObject *abs_name)
      * Anyway, importlib._find_and_load is much slower than
      * _PyDict_GetItemIdWithError().
      */
-    if (import_time) {
-        static int header = 1;
-        if (header) {
-            fputs("import time: self [us] | cumulative | imported package\n",
-                  stderr);
-            header = 0;
+    if (in_import_profile) {
+        profile = NULL;
+    }
+    if (import_time || profile != NULL) {
+        if (import_time == IMPORT_TIME_TEXT) {
+            static int header = 1;
+            if (header) {
+                fputs("import time: self [us] | cumulative | imported package\n",
+                      stderr);
+                header = 0;
+            }
+        }
+        if (import_time != IMPORT_TIME_TEXT || profile != NULL) {
+            stack = import_profile_get_stack();
+            if (stack == NULL) {
+                return NULL;
+            }
+            parents = PyList_AsTuple(stack);
+            if (parents == NULL) {
+                return NULL;
+            }
+            if (PyList_Append(stack, abs_name) < 0) {
+                Py_DECREF(parents);
+                return NULL;
+            }
+            /* The stack is owned by the thread state dict, which may be
+               cleared while importing */
+            Py_INCREF(stack);
+            Py_XINCREF(profile);
         }
 
         import_level++;
@@ -1507,16 +1859,43 @@ import_find_and_load(PyThreadState *tstate, PyObject *abs_name)
         PyDTrace_IMPORT_FIND_LOAD_DONE(PyUnicode_AsUTF8(abs_name),
                                        mod != NULL);
 
-    if (import_time) {
-        _PyTime_t cum = _PyTime_GetPerfCounter() - t1;
+    if (import_time || profile != NULL) {
+        _PyTime_t t2 = _PyTime_GetPerfCounter();
+        _PyTime_t cum = t2 - t1;
 
         import_level--;
-        fprintf(stderr, "import time: %9ld | %10ld | %*s%s\n",
-                (long)_PyTime_AsMicroseconds(cum - accumulated, _PyTime_ROUND_CEILING),
-                (long)_PyTime_AsMicroseconds(cum, _PyTime_ROUND_CEILING),
-                import_level*2, "", PyUnicode_AsUTF8(abs_name));
+        if (import_time == IMPORT_TIME_TEXT) {
+            fprintf(stderr, "import time: %9ld | %10ld | %*s%s\n",
+                    (long)_PyTime_AsMicroseconds(cum - accumulated, _PyTime_ROUND_CEILING),
+                    (long)_PyTime_AsMicroseconds(cum, _PyTime_ROUND_CEILING),
+                    import_level*2, "", PyUnicode_AsUTF8(abs_name));
+        }
+        if (stack != NULL) {
+            /* Threads importing concurrently may interleave their own
+               imports, remove the last occurrence of the name */
+            for (Py_ssize_t i = PyList_GET_SIZE(stack) - 1; i >= 0; i--) {
+                if (PyList_GET_ITEM(stack, i) == abs_name) {
+                    (void)PyList_SetSlice(stack, i, i + 1, NULL);
+                    break;
+                }
+            }
+            Py_DECREF(stack);
+        }
+        if (parents != NULL) {
+            int report = (import_time == IMPORT_TIME_JSON
+                          || import_time == IMPORT_TIME_CSV);
+            in_import_profile++;
+            import_profile_report(tstate, report ? import_time : 0,
+                                  profile, abs_name, parents, mod,
+                                  cum - accumulated, cum);
+            in_import_profile--;
+            Py_DECREF(parents);
+            Py_XDECREF(profile);
+        }
 
-        accumulated = accumulated_copy + cum;
+        /* The time spent reporting the import is not part of the self
+           time of the parent import either */
+        accumulated = accumulated_copy + cum + (_PyTime_GetPerfCounter() - t2);
     }
 
     return mod;
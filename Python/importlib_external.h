@@ -3038,572 +3038,588 @@ const unsigned char _Py_M__importlib_bootstrap_external[] = {
     45,5,27,5,27,5,27,5,27,6,18,5,70,5,70,5,
     70,5,70,5,70,5,70,114,10,0,0,0,114,99,1,0,
     0,99,0,0,0,0,0,0,0,0,0,0,0,0,2,0,
-    0,0,0,0,0,0,115,74,0,0,0,101,0,90,1,100,
-    0,90,2,100,1,90,3,100,2,132,0,90,4,100,3,132,
-    0,90,5,101,6,90,7,100,4,132,0,90,8,100,5,132,
-    0,90,9,100,11,100,7,132,1,90,10,100,8,132,0,90,
-    11,101,12,100,9,132,0,131,1,90,13,100,10,132,0,90,
-    14,100,6,83,0,41,12,218,10,70,105,108,101,70,105,110,
-    100,101,114,122,172,70,105,108,101,45,98,97,115,101,100,32,
-    102,105,110,100,101,114,46,10,10,32,32,32,32,73,110,116,
-    101,114,97,99,116,105,111,110,115,32,119,105,116,104,32,116,
-    104,101,32,102,105,108,101,32,115,121,115,116,101,109,32,97,
-    114,101,32,99,97,99,104,101,100,32,102,111,114,32,112,101,
-    114,102,111,114,109,97,110,99,101,44,32,98,101,105,110,103,
-    10,32,32,32,32,114,101,102,114,101,115,104,101,100,32,119,
-    104,101,110,32,116,104,101,32,100,105,114,101,99,116,111,114,
-    121,32,116,104,101,32,102,105,110,100,101,114,32,105,115,32,
-    104,97,110,100,108,105,110,103,32,104,97,115,32,98,101,101,
-    110,32,109,111,100,105,102,105,101,100,46,10,10,32,32,32,
-    32,99,2,0,0,0,0,0,0,0,0,0,0,0,5,0,
-    0,0,7,0,0,0,115,112,0,0,0,135,5,103,0,125,
-    3,124,2,68,0,93,15,92,2,138,5,125,4,124,3,160,
-    0,136,5,102,1,100,1,132,8,124,4,68,0,131,1,161,
-    1,1,0,113,5,124,3,124,0,95,1,124,1,112,27,100,
-    2,124,0,95,2,116,3,124,0,106,2,131,1,115,43,116,
-    4,116,5,106,6,131,0,124,0,106,2,131,2,124,0,95,
-    2,100,3,124,0,95,7,116,8,131,0,124,0,95,9,116,
-    8,131,0,124,0,95,10,100,4,83,0,41,5,122,154,73,
-    110,105,116,105,97,108,105,122,101,32,119,105,116,104,32,116,
-    104,101,32,112,97,116,104,32,116,111,32,115,101,97,114,99,
-    104,32,111,110,32,97,110,100,32,97,32,118,97,114,105,97,
-    98,108,101,32,110,117,109,98,101,114,32,111,102,10,32,32,
-    32,32,32,32,32,32,50,45,116,117,112,108,101,115,32,99,
-    111,110,116,97,105,110,105,110,103,32,116,104,101,32,108,111,
-    97,100,101,114,32,97,110,100,32,116,104,101,32,102,105,108,
-    101,32,115,117,102,102,105,120,101,115,32,116,104,101,32,108,
-    111,97,100,101,114,10,32,32,32,32,32,32,32,32,114,101,
-    99,111,103,110,105,122,101,115,46,99,1,0,0,0,0,0,
-    0,0,0,0,0,0,3,0,0,0,51,0,0,0,115,24,
-    0,0,0,129,0,124,0,93,7,125,1,124,1,137,2,102,
-    2,86,0,1,0,113,2,100,0,83,0,114,71,0,0,0,
-    114,13,0,0,0,41,3,114,5,0,0,0,114,61,1,0,
-    0,114,167,0,0,0,115,3,0,0,0,32,32,128,114,7,
-    0,0,0,114,8,0,0,0,122,38,70,105,108,101,70,105,
-    110,100,101,114,46,95,95,105,110,105,116,95,95,46,60,108,
-    111,99,97,108,115,62,46,60,103,101,110,101,120,112,114,62,
-    222,5,0,0,243,4,0,0,0,2,128,22,0,114,118,1,
-    0,0,115,24,0,0,0,0,0,27,68,27,68,49,55,29,
-    35,37,43,28,44,27,68,27,68,27,68,27,68,27,68,114,
-    10,0,0,0,114,101,0,0,0,114,134,0,0,0,78,41,
-    11,114,194,0,0,0,218,8,95,108,111,97,100,101,114,115,
-    114,67,0,0,0,114,90,0,0,0,114,69,0,0,0,114,
-    21,0,0,0,114,86,0,0,0,218,11,95,112,97,116,104,
-    95,109,116,105,109,101,218,3,115,101,116,218,11,95,112,97,
-    116,104,95,99,97,99,104,101,218,19,95,114,101,108,97,120,
-    101,100,95,112,97,116,104,95,99,97,99,104,101,41,6,114,
-    147,0,0,0,114,67,0,0,0,218,14,108,111,97,100,101,
-    114,95,100,101,116,97,105,108,115,90,7,108,111,97,100,101,
-    114,115,114,218,0,0,0,114,167,0,0,0,115,6,0,0,
-    0,32,32,32,32,32,64,114,7,0,0,0,114,242,0,0,
-    0,122,19,70,105,108,101,70,105,110,100,101,114,46,95,95,
-    105,110,105,116,95,95,216,5,0,0,115,22,0,0,0,2,
-    128,4,4,12,1,24,1,6,1,10,2,10,1,18,1,6,
-    1,8,1,12,1,115,26,0,0,0,2,128,4,4,2,1,
-    4,1,6,255,24,1,6,1,10,2,8,1,20,1,6,1,
-    8,1,12,1,115,112,0,0,0,0,0,19,21,9,16,33,
-    47,9,68,9,68,13,29,13,19,21,29,13,20,13,68,27,
-    68,27,68,27,68,27,68,59,67,27,68,27,68,13,68,13,
-    68,13,68,25,32,9,13,9,22,21,25,21,32,29,32,9,
-    13,9,18,16,27,28,32,28,37,16,38,9,60,25,35,36,
-    39,36,46,36,48,50,54,50,59,25,60,13,17,13,22,28,
-    30,9,13,9,25,28,31,28,33,9,13,9,25,36,39,36,
-    41,9,13,9,33,9,33,9,33,114,10,0,0,0,99,1,
-    0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,3,
-    0,0,0,115,10,0,0,0,100,1,124,0,95,0,100,2,
-    83,0,41,3,122,31,73,110,118,97,108,105,100,97,116,101,
-    32,116,104,101,32,100,105,114,101,99,116,111,114,121,32,109,
-    116,105,109,101,46,114,134,0,0,0,78,41,1,114,120,1,
-    0,0,114,35,1,0,0,115,1,0,0,0,32,114,7,0,
-    0,0,114,100,1,0,0,122,28,70,105,108,101,70,105,110,
-    100,101,114,46,105,110,118,97,108,105,100,97,116,101,95,99,
-    97,99,104,101,115,232,5,0,0,114,85,0,0,0,114,85,
-    0,0,0,115,10,0,0,0,28,30,9,13,9,25,9,25,
-    9,25,114,10,0,0,0,99,2,0,0,0,0,0,0,0,
-    0,0,0,0,3,0,0,0,3,0,0,0,115,54,0,0,
-    0,116,0,106,1,100,1,116,2,131,2,1,0,124,0,160,
-    3,124,1,161,1,125,2,124,2,100,2,117,0,114,19,100,
-    2,103,0,102,2,83,0,124,2,106,4,124,2,106,5,112,
-    25,103,0,102,2,83,0,41,3,122,197,84,114,121,32,116,
-    111,32,102,105,110,100,32,97,32,108,111,97,100,101,114,32,
-    102,111,114,32,116,104,101,32,115,112,101,99,105,102,105,101,
-    100,32,109,111,100,117,108,101,44,32,111,114,32,116,104,101,
-    32,110,97,109,101,115,112,97,99,101,10,32,32,32,32,32,
-    32,32,32,112,97,99,107,97,103,101,32,112,111,114,116,105,
-    111,110,115,46,32,82,101,116,117,114,110,115,32,40,108,111,
-    97,100,101,114,44,32,108,105,115,116,45,111,102,45,112,111,
-    114,116,105,111,110,115,41,46,10,10,32,32,32,32,32,32,
-    32,32,84,104,105,115,32,109,101,116,104,111,100,32,105,115,
-    32,100,101,112,114,101,99,97,116,101,100,46,32,32,85,115,
-    101,32,102,105,110,100,95,115,112,101,99,40,41,32,105,110,
-    115,116,101,97,100,46,10,10,32,32,32,32,32,32,32,32,
-    122,101,70,105,108,101,70,105,110,100,101,114,46,102,105,110,
-    100,95,108,111,97,100,101,114,40,41,32,105,115,32,100,101,
-    112,114,101,99,97,116,101,100,32,97,110,100,32,115,108,97,
-    116,101,100,32,102,111,114,32,114,101,109,111,118,97,108,32,
-    105,110,32,80,121,116,104,111,110,32,51,46,49,50,59,32,
-    117,115,101,32,102,105,110,100,95,115,112,101,99,40,41,32,
-    105,110,115,116,101,97,100,78,41,6,114,103,0,0,0,114,
-    104,0,0,0,114,105,0,0,0,114,232,0,0,0,114,167,
-    0,0,0,114,208,0,0,0,41,3,114,147,0,0,0,114,
-    166,0,0,0,114,216,0,0,0,115,3,0,0,0,32,32,
-    32,114,7,0,0,0,114,164,0,0,0,122,22,70,105,108,
+    0,0,0,0,0,0,115,78,0,0,0,101,0,90,1,100,
+    0,90,2,100,1,90,3,100,2,90,4,100,3,132,0,90,
+    5,100,4,132,0,90,6,101,7,90,8,100,5,132,0,90,
+    9,100,6,132,0,90,10,100,12,100,8,132,1,90,11,100,
+    9,132,0,90,12,101,13,100,10,132,0,131,1,90,14,100,
+    11,132,0,90,15,100,7,83,0,41,13,218,10,70,105,108,
+    101,70,105,110,100,101,114,97,95,1,0,0,70,105,108,101,
+    45,98,97,115,101,100,32,102,105,110,100,101,114,46,10,10,
+    32,32,32,32,73,110,116,101,114,97,99,116,105,111,110,115,
+    32,119,105,116,104,32,116,104,101,32,102,105,108,101,32,115,
+    121,115,116,101,109,32,97,114,101,32,99,97,99,104,101,100,
+    32,102,111,114,32,112,101,114,102,111,114,109,97,110,99,101,
+    44,32,98,101,105,110,103,10,32,32,32,32,114,101,102,114,
+    101,115,104,101,100,32,119,104,101,110,32,116,104,101,32,100,
+    105,114,101,99,116,111,114,121,32,116,104,101,32,102,105,110,
+    100,101,114,32,105,115,32,104,97,110,100,108,105,110,103,32,
+    104,97,115,32,98,101,101,110,32,109,111,100,105,102,105,101,
+    100,46,10,32,32,32,32,73,102,32,116,104,101,32,114,101,
+    118,97,108,105,100,97,116,101,32,97,116,116,114,105,98,117,
+    116,101,32,105,115,32,102,97,108,115,101,44,32,116,104,101,
+    32,109,111,100,105,102,105,99,97,116,105,111,110,32,116,105,
+    109,101,32,111,102,32,116,104,101,10,32,32,32,32,100,105,
+    114,101,99,116,111,114,121,32,105,115,32,110,111,116,32,99,
+    104,101,99,107,101,100,32,97,110,100,32,116,104,101,32,99,
+    97,99,104,101,32,105,115,32,111,110,108,121,32,114,101,102,
+    114,101,115,104,101,100,32,97,102,116,101,114,10,32,32,32,
+    32,105,110,118,97,108,105,100,97,116,101,95,99,97,99,104,
+    101,115,40,41,32,104,97,115,32,98,101,101,110,32,99,97,
+    108,108,101,100,46,10,10,32,32,32,32,84,99,2,0,0,
+    0,0,0,0,0,0,0,0,0,5,0,0,0,7,0,0,
+    0,115,112,0,0,0,135,5,103,0,125,3,124,2,68,0,
+    93,15,92,2,138,5,125,4,124,3,160,0,136,5,102,1,
+    100,1,132,8,124,4,68,0,131,1,161,1,1,0,113,5,
+    124,3,124,0,95,1,124,1,112,27,100,2,124,0,95,2,
+    116,3,124,0,106,2,131,1,115,43,116,4,116,5,106,6,
+    131,0,124,0,106,2,131,2,124,0,95,2,100,3,124,0,
+    95,7,116,8,131,0,124,0,95,9,116,8,131,0,124,0,
+    95,10,100,4,83,0,41,5,122,154,73,110,105,116,105,97,
+    108,105,122,101,32,119,105,116,104,32,116,104,101,32,112,97,
+    116,104,32,116,111,32,115,101,97,114,99,104,32,111,110,32,
+    97,110,100,32,97,32,118,97,114,105,97,98,108,101,32,110,
+    117,109,98,101,114,32,111,102,10,32,32,32,32,32,32,32,
+    32,50,45,116,117,112,108,101,115,32,99,111,110,116,97,105,
+    110,105,110,103,32,116,104,101,32,108,111,97,100,101,114,32,
+    97,110,100,32,116,104,101,32,102,105,108,101,32,115,117,102,
+    102,105,120,101,115,32,116,104,101,32,108,111,97,100,101,114,
+    10,32,32,32,32,32,32,32,32,114,101,99,111,103,110,105,
+    122,101,115,46,99,1,0,0,0,0,0,0,0,0,0,0,
+    0,3,0,0,0,51,0,0,0,115,24,0,0,0,129,0,
+    124,0,93,7,125,1,124,1,137,2,102,2,86,0,1,0,
+    113,2,100,0,83,0,114,71,0,0,0,114,13,0,0,0,
+    41,3,114,5,0,0,0,114,61,1,0,0,114,167,0,0,
+    0,115,3,0,0,0,32,32,128,114,7,0,0,0,114,8,
+    0,0,0,122,38,70,105,108,101,70,105,110,100,101,114,46,
+    95,95,105,110,105,116,95,95,46,60,108,111,99,97,108,115,
+    62,46,60,103,101,110,101,120,112,114,62,227,5,0,0,243,
+    4,0,0,0,2,128,22,0,114,118,1,0,0,115,24,0,
+    0,0,0,0,27,68,27,68,49,55,29,35,37,43,28,44,
+    27,68,27,68,27,68,27,68,27,68,114,10,0,0,0,114,
+    101,0,0,0,114,134,0,0,0,78,41,11,114,194,0,0,
+    0,218,8,95,108,111,97,100,101,114,115,114,67,0,0,0,
+    114,90,0,0,0,114,69,0,0,0,114,21,0,0,0,114,
+    86,0,0,0,218,11,95,112,97,116,104,95,109,116,105,109,
+    101,218,3,115,101,116,218,11,95,112,97,116,104,95,99,97,
+    99,104,101,218,19,95,114,101,108,97,120,101,100,95,112,97,
+    116,104,95,99,97,99,104,101,41,6,114,147,0,0,0,114,
+    67,0,0,0,218,14,108,111,97,100,101,114,95,100,101,116,
+    97,105,108,115,90,7,108,111,97,100,101,114,115,114,218,0,
+    0,0,114,167,0,0,0,115,6,0,0,0,32,32,32,32,
+    32,64,114,7,0,0,0,114,242,0,0,0,122,19,70,105,
+    108,101,70,105,110,100,101,114,46,95,95,105,110,105,116,95,
+    95,221,5,0,0,115,22,0,0,0,2,128,4,4,12,1,
+    24,1,6,1,10,2,10,1,18,1,6,1,8,1,12,1,
+    115,26,0,0,0,2,128,4,4,2,1,4,1,6,255,24,
+    1,6,1,10,2,8,1,20,1,6,1,8,1,12,1,115,
+    112,0,0,0,0,0,19,21,9,16,33,47,9,68,9,68,
+    13,29,13,19,21,29,13,20,13,68,27,68,27,68,27,68,
+    27,68,59,67,27,68,27,68,13,68,13,68,13,68,25,32,
+    9,13,9,22,21,25,21,32,29,32,9,13,9,18,16,27,
+    28,32,28,37,16,38,9,60,25,35,36,39,36,46,36,48,
+    50,54,50,59,25,60,13,17,13,22,28,30,9,13,9,25,
+    28,31,28,33,9,13,9,25,36,39,36,41,9,13,9,33,
+    9,33,9,33,114,10,0,0,0,99,1,0,0,0,0,0,
+    0,0,0,0,0,0,2,0,0,0,3,0,0,0,115,10,
+    0,0,0,100,1,124,0,95,0,100,2,83,0,41,3,122,
+    31,73,110,118,97,108,105,100,97,116,101,32,116,104,101,32,
+    100,105,114,101,99,116,111,114,121,32,109,116,105,109,101,46,
+    114,134,0,0,0,78,41,1,114,120,1,0,0,114,35,1,
+    0,0,115,1,0,0,0,32,114,7,0,0,0,114,100,1,
+    0,0,122,28,70,105,108,101,70,105,110,100,101,114,46,105,
+    110,118,97,108,105,100,97,116,101,95,99,97,99,104,101,115,
+    237,5,0,0,114,85,0,0,0,114,85,0,0,0,115,10,
+    0,0,0,28,30,9,13,9,25,9,25,9,25,114,10,0,
+    0,0,99,2,0,0,0,0,0,0,0,0,0,0,0,3,
+    0,0,0,3,0,0,0,115,54,0,0,0,116,0,106,1,
+    100,1,116,2,131,2,1,0,124,0,160,3,124,1,161,1,
+    125,2,124,2,100,2,117,0,114,19,100,2,103,0,102,2,
+    83,0,124,2,106,4,124,2,106,5,112,25,103,0,102,2,
+    83,0,41,3,122,197,84,114,121,32,116,111,32,102,105,110,
+    100,32,97,32,108,111,97,100,101,114,32,102,111,114,32,116,
+    104,101,32,115,112,101,99,105,102,105,101,100,32,109,111,100,
+    117,108,101,44,32,111,114,32,116,104,101,32,110,97,109,101,
+    115,112,97,99,101,10,32,32,32,32,32,32,32,32,112,97,
+    99,107,97,103,101,32,112,111,114,116,105,111,110,115,46,32,
+    82,101,116,117,114,110,115,32,40,108,111,97,100,101,114,44,
+    32,108,105,115,116,45,111,102,45,112,111,114,116,105,111,110,
+    115,41,46,10,10,32,32,32,32,32,32,32,32,84,104,105,
+    115,32,109,101,116,104,111,100,32,105,115,32,100,101,112,114,
+    101,99,97,116,101,100,46,32,32,85,115,101,32,102,105,110,
+    100,95,115,112,101,99,40,41,32,105,110,115,116,101,97,100,
+    46,10,10,32,32,32,32,32,32,32,32,122,101,70,105,108,
     101,70,105,110,100,101,114,46,102,105,110,100,95,108,111,97,
-    100,101,114,238,5,0,0,115,14,0,0,0,6,7,2,2,
-    4,254,10,3,8,1,8,1,16,1,115,14,0,0,0,4,
-    7,2,1,6,1,10,1,6,1,10,1,16,1,115,54,0,
-    0,0,9,18,9,23,24,84,24,42,9,43,9,43,16,20,
-    16,40,31,39,16,40,9,13,12,16,20,24,12,24,9,28,
-    20,24,26,28,20,28,13,28,16,20,16,27,29,33,29,60,
-    29,66,64,66,16,66,9,66,114,10,0,0,0,99,6,0,
-    0,0,0,0,0,0,0,0,0,0,6,0,0,0,3,0,
-    0,0,115,26,0,0,0,124,1,124,2,124,3,131,2,125,
-    6,116,0,124,2,124,3,124,6,124,4,100,1,141,4,83,
-    0,41,2,78,114,207,0,0,0,41,1,114,219,0,0,0,
-    41,7,114,147,0,0,0,114,217,0,0,0,114,166,0,0,
-    0,114,67,0,0,0,90,4,115,109,115,108,114,231,0,0,
-    0,114,167,0,0,0,115,7,0,0,0,32,32,32,32,32,
-    32,32,114,7,0,0,0,114,113,1,0,0,122,20,70,105,
-    108,101,70,105,110,100,101,114,46,95,103,101,116,95,115,112,
-    101,99,253,5,0,0,115,8,0,0,0,10,1,8,1,2,
-    1,6,255,115,6,0,0,0,10,1,8,1,8,1,115,26,
-    0,0,0,18,30,31,39,41,45,18,46,9,15,16,39,40,
-    48,50,54,63,69,67,71,16,72,16,72,9,72,114,10,0,
-    0,0,78,99,3,0,0,0,0,0,0,0,0,0,0,0,
-    9,0,0,0,3,0,0,0,115,126,1,0,0,100,1,125,
-    3,124,1,160,0,100,2,161,1,100,3,25,0,125,4,9,
-    0,116,1,124,0,106,2,112,17,116,3,106,4,131,0,131,
-    1,106,5,125,5,110,12,35,0,4,0,116,6,121,190,1,
-    0,1,0,1,0,100,4,125,5,89,0,110,1,37,0,124,
-    5,124,0,106,7,107,3,114,45,124,0,160,8,161,0,1,
-    0,124,5,124,0,95,7,116,9,131,0,114,56,124,0,106,
-    10,125,6,124,4,160,11,161,0,125,7,110,5,124,0,106,
-    12,125,6,124,4,125,7,124,7,124,6,118,0,114,108,116,
-    13,124,0,106,2,124,4,131,2,125,8,124,0,106,14,68,
-    0,93,29,92,2,125,9,125,10,100,5,124,9,23,0,125,
-    11,116,13,124,8,124,11,131,2,125,12,116,15,124,12,131,
-    1,114,103,124,0,160,16,124,10,124,1,124,12,124,8,103,
-    1,124,2,161,5,2,0,1,0,83,0,113,74,116,17,124,
-    8,131,1,125,3,124,0,106,14,68,0,93,55,92,2,125,
-    9,125,10,9,0,116,13,124,0,106,2,124,4,124,9,23,
-    0,131,2,125,12,110,12,35,0,4,0,116,18,121,189,1,
-    0,1,0,1,0,89,0,1,0,100,6,83,0,37,0,116,
-    19,160,20,100,7,124,12,100,3,100,8,166,3,1,0,124,
-    7,124,9,23,0,124,6,118,0,114,166,116,15,124,12,131,
-    1,114,166,124,0,160,16,124,10,124,1,124,12,100,6,124,
-    2,161,5,2,0,1,0,83,0,113,111,124,3,114,187,116,
-    19,160,20,100,9,124,8,161,2,1,0,116,19,160,21,124,
-    1,100,6,161,2,125,13,124,8,103,1,124,13,95,22,124,
-    13,83,0,100,6,83,0,119,0,119,0,41,10,122,111,84,
-    114,121,32,116,111,32,102,105,110,100,32,97,32,115,112,101,
-    99,32,102,111,114,32,116,104,101,32,115,112,101,99,105,102,
-    105,101,100,32,109,111,100,117,108,101,46,10,10,32,32,32,
-    32,32,32,32,32,82,101,116,117,114,110,115,32,116,104,101,
-    32,109,97,116,99,104,105,110,103,32,115,112,101,99,44,32,
-    111,114,32,78,111,110,101,32,105,102,32,110,111,116,32,102,
-    111,117,110,100,46,10,32,32,32,32,32,32,32,32,70,114,
-    101,0,0,0,114,47,0,0,0,114,134,0,0,0,114,242,
-    0,0,0,78,122,9,116,114,121,105,110,103,32,123,125,41,
-    1,90,9,118,101,114,98,111,115,105,116,121,122,25,112,111,
-    115,115,105,98,108,101,32,110,97,109,101,115,112,97,99,101,
-    32,102,111,114,32,123,125,41,23,114,108,0,0,0,114,78,
-    0,0,0,114,67,0,0,0,114,21,0,0,0,114,86,0,
-    0,0,114,50,1,0,0,114,80,0,0,0,114,120,1,0,
-    0,218,11,95,102,105,108,108,95,99,97,99,104,101,114,24,
-    0,0,0,114,123,1,0,0,114,135,0,0,0,114,122,1,
-    0,0,114,69,0,0,0,114,119,1,0,0,114,84,0,0,
-    0,114,113,1,0,0,114,87,0,0,0,114,115,0,0,0,
-    114,162,0,0,0,114,176,0,0,0,114,213,0,0,0,114,
-    208,0,0,0,41,14,114,147,0,0,0,114,166,0,0,0,
-    114,231,0,0,0,90,12,105,115,95,110,97,109,101,115,112,
-    97,99,101,90,11,116,97,105,108,95,109,111,100,117,108,101,
-    114,196,0,0,0,90,5,99,97,99,104,101,90,12,99,97,
-    99,104,101,95,109,111,100,117,108,101,90,9,98,97,115,101,
-    95,112,97,116,104,114,61,1,0,0,114,217,0,0,0,90,
-    13,105,110,105,116,95,102,105,108,101,110,97,109,101,90,9,
-    102,117,108,108,95,112,97,116,104,114,216,0,0,0,115,14,
-    0,0,0,32,32,32,32,32,32,32,32,32,32,32,32,32,
-    32,114,7,0,0,0,114,232,0,0,0,122,20,70,105,108,
-    101,70,105,110,100,101,114,46,102,105,110,100,95,115,112,101,
-    99,2,6,0,0,115,94,0,0,0,4,5,14,1,2,1,
-    22,1,2,128,12,1,8,1,2,128,10,1,8,1,6,1,
-    6,2,6,1,10,1,6,2,4,1,8,2,12,1,14,1,
-    8,1,10,1,8,1,24,1,2,255,8,5,14,2,2,1,
-    18,1,2,128,12,1,8,1,2,128,16,1,12,1,8,1,
-    10,1,4,1,8,255,2,128,4,2,12,1,12,1,8,1,
-    4,1,4,1,2,244,2,228,115,118,0,0,0,4,5,14,
-    1,2,4,22,254,2,128,2,2,2,255,16,1,2,128,8,
-    1,2,2,8,255,6,1,4,2,2,5,6,252,10,1,6,
-    2,4,1,6,2,2,10,12,247,4,1,4,8,6,248,8,
-    1,10,1,6,1,28,1,8,4,4,2,4,9,6,247,2,
-    4,18,254,2,128,2,2,2,255,16,1,2,128,16,1,10,
-    1,2,3,6,254,2,2,2,255,2,1,6,255,12,1,2,
-    128,2,1,2,4,12,253,12,1,8,1,4,1,4,1,2,
-    245,2,228,115,126,1,0,0,24,29,9,21,23,31,23,47,
-    43,46,23,47,48,49,23,50,9,20,9,23,21,31,32,36,
-    32,41,32,57,45,48,45,55,45,57,21,58,21,67,13,18,
-    13,18,0,0,9,23,16,23,9,23,9,23,9,23,9,23,
-    21,23,13,18,13,18,13,18,0,0,12,17,21,25,21,37,
-    12,37,9,37,13,17,13,31,13,31,13,31,32,37,13,17,
-    13,29,12,23,12,25,9,39,21,25,21,45,13,18,28,39,
-    28,47,28,47,13,25,13,25,21,25,21,37,13,18,28,39,
-    13,25,12,24,28,33,12,33,9,54,25,35,36,40,36,45,
-    47,58,25,59,13,22,41,45,41,54,13,54,13,54,17,37,
-    17,23,25,37,33,43,46,52,33,52,17,30,29,39,40,49,
-    51,64,29,65,17,26,20,32,33,42,20,43,17,98,28,32,
-    28,98,43,55,57,65,67,76,79,88,78,89,91,97,28,98,
-    21,98,21,98,21,98,17,98,32,43,44,53,32,54,17,29,
-    37,41,37,50,9,56,9,56,13,33,13,19,21,33,13,28,
-    29,39,40,44,40,49,51,62,65,71,51,71,29,72,17,26,
-    17,26,0,0,13,28,20,30,13,28,13,28,13,28,13,28,
-    24,28,24,28,24,28,24,28,0,0,13,23,13,77,41,52,
-    54,63,75,76,13,77,13,77,13,77,16,28,31,37,16,37,
-    41,46,16,46,13,56,20,32,33,42,20,43,17,56,28,32,
-    28,56,43,55,57,65,67,76,43,47,49,55,28,56,21,56,
-    21,56,21,56,0,0,12,24,9,24,13,23,13,80,41,68,
-    70,79,13,80,13,80,20,30,20,57,42,50,52,56,20,57,
-    13,17,48,57,47,58,13,17,13,44,20,24,13,24,16,20,
-    16,20,13,28,9,23,115,31,0,0,0,138,10,21,0,149,
-    9,32,7,193,52,8,65,61,2,193,61,7,66,8,9,194,
-    61,1,66,8,9,194,62,1,32,7,99,1,0,0,0,0,
-    0,0,0,0,0,0,0,10,0,0,0,3,0,0,0,115,
-    192,0,0,0,124,0,106,0,125,1,9,0,116,1,106,2,
-    124,1,112,11,116,1,106,3,131,0,131,1,125,2,110,15,
-    35,0,4,0,116,4,116,5,116,6,102,3,121,95,1,0,
-    1,0,1,0,103,0,125,2,89,0,110,1,37,0,116,7,
-    106,8,160,9,100,1,161,1,115,41,116,10,124,2,131,1,
-    124,0,95,11,110,37,116,10,131,0,125,3,124,2,68,0,
-    93,28,125,4,124,4,160,12,100,2,161,1,92,3,125,5,
-    125,6,125,7,124,6,114,67,100,3,160,13,124,5,124,7,
-    160,14,161,0,161,2,125,8,110,2,124,5,125,8,124,3,
-    160,15,124,8,161,1,1,0,113,46,124,3,124,0,95,11,
-    116,7,106,8,160,9,116,16,161,1,114,93,100,4,132,0,
-    124,2,68,0,131,1,124,0,95,17,100,5,83,0,100,5,
-    83,0,119,0,41,6,122,68,70,105,108,108,32,116,104,101,
-    32,99,97,99,104,101,32,111,102,32,112,111,116,101,110,116,
-    105,97,108,32,109,111,100,117,108,101,115,32,97,110,100,32,
-    112,97,99,107,97,103,101,115,32,102,111,114,32,116,104,105,
-    115,32,100,105,114,101,99,116,111,114,121,46,114,17,0,0,
-    0,114,101,0,0,0,114,92,0,0,0,99,1,0,0,0,
-    0,0,0,0,0,0,0,0,4,0,0,0,19,0,0,0,
-    115,20,0,0,0,104,0,124,0,93,6,125,1,124,1,160,
-    0,161,0,146,2,113,2,83,0,114,13,0,0,0,41,1,
-    114,135,0,0,0,41,2,114,5,0,0,0,90,2,102,110,
-    115,2,0,0,0,32,32,114,7,0,0,0,114,15,0,0,
-    0,122,41,70,105,108,101,70,105,110,100,101,114,46,95,102,
-    105,108,108,95,99,97,99,104,101,46,60,108,111,99,97,108,
-    115,62,46,60,115,101,116,99,111,109,112,62,82,6,0,0,
-    243,2,0,0,0,20,0,114,126,1,0,0,115,20,0,0,
-    0,40,71,40,71,40,71,56,58,41,43,41,51,41,51,40,
-    71,40,71,40,71,114,10,0,0,0,78,41,18,114,67,0,
-    0,0,114,21,0,0,0,90,7,108,105,115,116,100,105,114,
-    114,86,0,0,0,114,107,1,0,0,218,15,80,101,114,109,
-    105,115,115,105,111,110,69,114,114,111,114,218,18,78,111,116,
-    65,68,105,114,101,99,116,111,114,121,69,114,114,111,114,114,
-    18,0,0,0,114,28,0,0,0,114,29,0,0,0,114,121,
-    1,0,0,114,122,1,0,0,114,130,0,0,0,114,93,0,
-    0,0,114,135,0,0,0,218,3,97,100,100,114,30,0,0,
-    0,114,123,1,0,0,41,9,114,147,0,0,0,114,67,0,
-    0,0,90,8,99,111,110,116,101,110,116,115,90,21,108,111,
-    119,101,114,95,115,117,102,102,105,120,95,99,111,110,116,101,
-    110,116,115,114,90,1,0,0,114,145,0,0,0,114,72,1,
-    0,0,114,61,1,0,0,90,8,110,101,119,95,110,97,109,
-    101,115,9,0,0,0,32,32,32,32,32,32,32,32,32,114,
-    7,0,0,0,114,125,1,0,0,122,22,70,105,108,101,70,
-    105,110,100,101,114,46,95,102,105,108,108,95,99,97,99,104,
-    101,53,6,0,0,115,42,0,0,0,6,2,2,1,20,1,
-    2,128,18,1,8,3,2,128,12,3,12,1,6,7,8,1,
-    16,1,4,1,18,1,4,2,12,1,6,1,12,1,18,1,
-    4,255,2,233,115,50,0,0,0,6,2,2,6,20,252,2,
-    128,2,4,8,253,16,3,2,128,10,3,2,16,12,241,6,
-    7,2,1,4,6,2,250,16,1,2,1,2,3,18,254,4,
-    2,12,1,6,1,10,1,24,1,2,235,115,192,0,0,0,
-    16,20,16,25,9,13,9,26,24,27,24,35,36,40,36,56,
-    44,47,44,54,44,56,24,57,13,21,13,21,0,0,9,26,
-    17,34,36,51,53,71,16,72,9,26,9,26,9,26,9,26,
-    24,26,13,21,13,21,13,21,0,0,16,19,16,28,16,46,
-    40,45,16,46,9,53,32,35,36,44,32,45,13,17,13,29,
-    13,29,37,40,37,42,13,34,25,33,13,52,13,52,17,21,
-    37,41,37,56,52,55,37,56,17,34,17,21,23,26,28,34,
-    20,23,17,36,32,39,32,68,47,51,53,59,53,67,53,67,
-    32,68,21,29,21,29,32,36,21,29,17,38,17,52,43,51,
-    17,52,17,52,17,52,32,53,13,17,13,29,12,15,12,24,
-    12,64,36,63,12,64,9,71,40,71,40,71,62,70,40,71,
-    40,71,13,17,13,37,13,37,13,37,9,71,9,71,9,26,
-    115,13,0,0,0,132,9,14,0,142,12,28,7,193,31,1,
-    28,7,99,1,0,0,0,0,0,0,0,0,0,0,0,2,
-    0,0,0,7,0,0,0,115,20,0,0,0,135,0,135,1,
-    136,0,136,1,102,2,100,1,132,8,125,2,124,2,83,0,
-    41,3,97,20,1,0,0,65,32,99,108,97,115,115,32,109,
-    101,116,104,111,100,32,119,104,105,99,104,32,114,101,116,117,
-    114,110,115,32,97,32,99,108,111,115,117,114,101,32,116,111,
-    32,117,115,101,32,111,110,32,115,121,115,46,112,97,116,104,
-    95,104,111,111,107,10,32,32,32,32,32,32,32,32,119,104,
-    105,99,104,32,119,105,108,108,32,114,101,116,117,114,110,32,
-    97,110,32,105,110,115,116,97,110,99,101,32,117,115,105,110,
-    103,32,116,104,101,32,115,112,101,99,105,102,105,101,100,32,
-    108,111,97,100,101,114,115,32,97,110,100,32,116,104,101,32,
-    112,97,116,104,10,32,32,32,32,32,32,32,32,99,97,108,
-    108,101,100,32,111,110,32,116,104,101,32,99,108,111,115,117,
-    114,101,46,10,10,32,32,32,32,32,32,32,32,73,102,32,
-    116,104,101,32,112,97,116,104,32,99,97,108,108,101,100,32,
-    111,110,32,116,104,101,32,99,108,111,115,117,114,101,32,105,
-    115,32,110,111,116,32,97,32,100,105,114,101,99,116,111,114,
-    121,44,32,73,109,112,111,114,116,69,114,114,111,114,32,105,
-    115,10,32,32,32,32,32,32,32,32,114,97,105,115,101,100,
-    46,10,10,32,32,32,32,32,32,32,32,99,1,0,0,0,
-    0,0,0,0,0,0,0,0,4,0,0,0,19,0,0,0,
-    115,36,0,0,0,116,0,124,0,131,1,115,10,116,1,100,
-    1,124,0,100,2,141,2,130,1,137,1,124,0,103,1,137,
-    2,162,1,82,0,142,0,83,0,41,4,122,45,80,97,116,
-    104,32,104,111,111,107,32,102,111,114,32,105,109,112,111,114,
-    116,108,105,98,46,109,97,99,104,105,110,101,114,121,46,70,
-    105,108,101,70,105,110,100,101,114,46,122,30,111,110,108,121,
-    32,100,105,114,101,99,116,111,114,105,101,115,32,97,114,101,
-    32,115,117,112,112,111,114,116,101,100,114,77,0,0,0,78,
-    41,2,114,87,0,0,0,114,146,0,0,0,41,3,114,67,
-    0,0,0,114,227,0,0,0,114,124,1,0,0,115,3,0,
-    0,0,32,128,128,114,7,0,0,0,218,24,112,97,116,104,
-    95,104,111,111,107,95,102,111,114,95,70,105,108,101,70,105,
-    110,100,101,114,122,54,70,105,108,101,70,105,110,100,101,114,
-    46,112,97,116,104,95,104,111,111,107,46,60,108,111,99,97,
-    108,115,62,46,112,97,116,104,95,104,111,111,107,95,102,111,
-    114,95,70,105,108,101,70,105,110,100,101,114,94,6,0,0,
-    115,6,0,0,0,8,2,12,1,16,1,115,6,0,0,0,
-    6,2,14,1,16,1,115,36,0,0,0,20,31,32,36,20,
-    37,13,79,23,34,35,67,74,78,23,79,23,79,17,79,20,
-    23,24,28,20,46,31,45,20,46,20,46,20,46,13,46,114,
-    10,0,0,0,78,114,13,0,0,0,41,3,114,227,0,0,
-    0,114,124,1,0,0,114,130,1,0,0,115,3,0,0,0,
-    96,96,32,114,7,0,0,0,218,9,112,97,116,104,95,104,
-    111,111,107,122,20,70,105,108,101,70,105,110,100,101,114,46,
-    112,97,116,104,95,104,111,111,107,84,6,0,0,115,6,0,
-    0,0,4,128,12,10,4,6,115,6,0,0,0,4,128,12,
-    14,4,2,115,20,0,0,0,0,0,0,0,9,46,9,46,
-    9,46,9,46,9,46,9,46,16,40,9,40,114,10,0,0,
-    0,99,1,0,0,0,0,0,0,0,0,0,0,0,3,0,
-    0,0,3,0,0,0,114,87,1,0,0,41,2,78,122,16,
-    70,105,108,101,70,105,110,100,101,114,40,123,33,114,125,41,
-    41,2,114,93,0,0,0,114,67,0,0,0,114,35,1,0,
-    0,115,1,0,0,0,32,114,7,0,0,0,114,88,1,0,
-    0,122,19,70,105,108,101,70,105,110,100,101,114,46,95,95,
-    114,101,112,114,95,95,102,6,0,0,114,80,1,0,0,114,
-    80,1,0,0,115,12,0,0,0,16,34,16,52,42,46,42,
-    51,16,52,9,52,114,10,0,0,0,114,71,0,0,0,41,
-    15,114,153,0,0,0,114,152,0,0,0,114,154,0,0,0,
-    114,155,0,0,0,114,242,0,0,0,114,100,1,0,0,114,
-    170,0,0,0,114,235,0,0,0,114,164,0,0,0,114,113,
-    1,0,0,114,232,0,0,0,114,125,1,0,0,114,240,0,
-    0,0,114,131,1,0,0,114,88,1,0,0,114,13,0,0,
-    0,114,10,0,0,0,114,7,0,0,0,114,117,1,0,0,
-    114,117,1,0,0,207,5,0,0,115,24,0,0,0,8,0,
-    4,2,6,7,6,16,4,4,6,2,6,15,8,5,6,51,
-    2,31,8,1,10,17,115,116,0,0,0,0,129,0,129,0,
-    129,0,129,0,129,0,129,0,129,0,129,0,129,0,129,0,
-    129,8,166,0,127,0,127,0,127,0,127,0,127,0,127,0,
-    127,0,127,0,127,0,127,0,127,2,97,0,129,0,129,0,
-    129,0,129,0,129,0,129,0,129,0,129,0,129,0,129,0,
-    129,2,159,0,127,0,127,0,127,0,127,0,127,0,127,0,
-    127,0,127,0,127,0,127,0,127,6,113,6,4,4,2,6,
-    15,6,5,2,2,6,49,6,31,2,2,8,16,10,3,115,
-    74,0,0,0,1,1,1,1,1,1,1,1,5,8,1,1,
-    5,41,5,41,5,41,5,30,5,30,5,30,19,36,5,16,
-    5,66,5,66,5,66,5,72,5,72,5,72,42,46,5,20,
-    5,20,5,20,5,71,5,71,5,71,6,17,5,40,5,40,
-    5,40,5,40,5,52,5,52,5,52,5,52,5,52,114,10,
-    0,0,0,114,117,1,0,0,99,4,0,0,0,0,0,0,
-    0,0,0,0,0,8,0,0,0,3,0,0,0,115,146,0,
-    0,0,124,0,160,0,100,1,161,1,125,4,124,0,160,0,
-    100,2,161,1,125,5,124,4,115,33,124,5,114,18,124,5,
-    106,1,125,4,110,15,124,2,124,3,107,2,114,28,116,2,
-    124,1,124,2,131,2,125,4,110,5,116,3,124,1,124,2,
-    131,2,125,4,124,5,115,42,116,4,124,1,124,2,124,4,
-    100,3,141,3,125,5,9,0,124,5,124,0,100,2,60,0,
-    124,4,124,0,100,1,60,0,124,2,124,0,100,4,60,0,
-    124,3,124,0,100,5,60,0,100,0,83,0,35,0,4,0,
-    116,5,121,72,1,0,1,0,1,0,89,0,100,0,83,0,
-    37,0,119,0,41,6,78,218,10,95,95,108,111,97,100,101,
-    114,95,95,218,8,95,95,115,112,101,99,95,95,41,1,114,
-    167,0,0,0,90,8,95,95,102,105,108,101,95,95,90,10,
-    95,95,99,97,99,104,101,100,95,95,41,6,218,3,103,101,
-    116,114,167,0,0,0,114,58,1,0,0,114,49,1,0,0,
-    114,219,0,0,0,218,9,69,120,99,101,112,116,105,111,110,
-    41,6,90,2,110,115,114,145,0,0,0,90,8,112,97,116,
-    104,110,97,109,101,90,9,99,112,97,116,104,110,97,109,101,
-    114,167,0,0,0,114,216,0,0,0,115,6,0,0,0,32,
-    32,32,32,32,32,114,7,0,0,0,218,14,95,102,105,120,
-    95,117,112,95,109,111,100,117,108,101,114,136,1,0,0,108,
-    6,0,0,115,40,0,0,0,10,2,10,1,4,1,4,1,
-    8,1,8,1,12,1,10,2,4,1,14,1,2,1,8,1,
-    8,1,8,1,12,1,2,128,12,1,6,2,2,128,2,254,
-    115,48,0,0,0,10,2,10,1,2,1,2,6,2,251,2,
-    5,8,252,6,1,2,3,12,254,10,2,2,1,16,1,2,
-    8,8,250,8,1,8,1,12,1,2,128,2,3,2,254,14,
-    2,2,128,2,0,115,146,0,0,0,14,16,14,34,21,33,
-    14,34,5,11,12,14,12,30,19,29,12,30,5,9,12,18,
-    5,54,12,16,9,54,22,26,22,33,13,19,13,19,14,22,
-    26,35,14,35,9,54,22,42,43,47,49,57,22,58,13,19,
-    13,19,22,38,39,43,45,53,22,54,13,19,12,16,5,70,
-    16,39,40,44,46,54,63,69,16,70,16,70,9,13,5,13,
-    26,30,9,11,12,22,9,23,28,34,9,11,12,24,9,25,
-    26,34,9,11,12,22,9,23,28,37,9,11,12,24,9,25,
-    9,25,9,25,0,0,5,13,12,21,5,13,5,13,5,13,
-    5,13,9,13,9,13,9,13,0,0,5,13,115,15,0,0,
-    0,171,16,61,0,189,7,65,7,7,193,8,1,65,7,7,
-    99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,
-    0,3,0,0,0,115,38,0,0,0,116,0,116,1,106,2,
-    131,0,102,2,125,0,116,3,116,4,102,2,125,1,116,5,
-    116,6,102,2,125,2,124,0,124,1,124,2,103,3,83,0,
-    41,2,122,95,82,101,116,117,114,110,115,32,97,32,108,105,
-    115,116,32,111,102,32,102,105,108,101,45,98,97,115,101,100,
-    32,109,111,100,117,108,101,32,108,111,97,100,101,114,115,46,
-    10,10,32,32,32,32,69,97,99,104,32,105,116,101,109,32,
-    105,115,32,97,32,116,117,112,108,101,32,40,108,111,97,100,
-    101,114,44,32,115,117,102,102,105,120,101,115,41,46,10,32,
-    32,32,32,78,41,7,114,44,1,0,0,114,190,0,0,0,
-    218,18,101,120,116,101,110,115,105,111,110,95,115,117,102,102,
-    105,120,101,115,114,49,1,0,0,114,131,0,0,0,114,58,
-    1,0,0,114,117,0,0,0,41,3,90,10,101,120,116,101,
-    110,115,105,111,110,115,90,6,115,111,117,114,99,101,90,8,
-    98,121,116,101,99,111,100,101,115,3,0,0,0,32,32,32,
-    114,7,0,0,0,114,214,0,0,0,114,214,0,0,0,131,
-    6,0,0,243,8,0,0,0,12,5,8,1,8,1,10,1,
-    114,138,1,0,0,115,38,0,0,0,18,37,39,43,39,62,
-    39,64,18,64,5,15,14,30,32,47,14,47,5,11,16,36,
-    38,55,16,55,5,13,13,23,25,31,33,41,12,42,5,42,
-    114,10,0,0,0,99,1,0,0,0,0,0,0,0,0,0,
-    0,0,1,0,0,0,3,0,0,0,115,8,0,0,0,124,
-    0,97,0,100,0,83,0,114,71,0,0,0,41,1,114,162,
-    0,0,0,41,1,218,17,95,98,111,111,116,115,116,114,97,
-    112,95,109,111,100,117,108,101,115,1,0,0,0,32,114,7,
-    0,0,0,218,21,95,115,101,116,95,98,111,111,116,115,116,
-    114,97,112,95,109,111,100,117,108,101,114,140,1,0,0,142,
-    6,0,0,243,2,0,0,0,8,2,114,141,1,0,0,115,
-    8,0,0,0,18,35,5,15,5,15,5,15,114,10,0,0,
-    0,99,1,0,0,0,0,0,0,0,0,0,0,0,4,0,
-    0,0,3,0,0,0,115,50,0,0,0,116,0,124,0,131,
-    1,1,0,116,1,131,0,125,1,116,2,106,3,160,4,116,
-    5,106,6,124,1,142,0,103,1,161,1,1,0,116,2,106,
-    7,160,8,116,9,161,1,1,0,100,1,83,0,41,2,122,
-    41,73,110,115,116,97,108,108,32,116,104,101,32,112,97,116,
-    104,45,98,97,115,101,100,32,105,109,112,111,114,116,32,99,
-    111,109,112,111,110,101,110,116,115,46,78,41,10,114,140,1,
-    0,0,114,214,0,0,0,114,18,0,0,0,114,105,1,0,
-    0,114,194,0,0,0,114,117,1,0,0,114,131,1,0,0,
-    218,9,109,101,116,97,95,112,97,116,104,114,63,0,0,0,
-    114,99,1,0,0,41,2,114,139,1,0,0,90,17,115,117,
-    112,112,111,114,116,101,100,95,108,111,97,100,101,114,115,115,
-    2,0,0,0,32,32,114,7,0,0,0,218,8,95,105,110,
-    115,116,97,108,108,114,143,1,0,0,147,6,0,0,243,8,
-    0,0,0,8,2,6,1,20,1,16,1,114,144,1,0,0,
-    115,50,0,0,0,5,26,27,44,5,45,5,45,25,52,25,
-    54,5,22,5,8,5,19,5,70,28,38,28,48,50,67,28,
-    68,27,69,5,70,5,70,5,8,5,18,5,37,26,36,5,
-    37,5,37,5,37,5,37,114,10,0,0,0,41,1,114,91,
-    0,0,0,114,71,0,0,0,41,3,78,78,78,41,2,114,
-    0,0,0,0,114,0,0,0,0,41,1,84,41,85,114,155,
-    0,0,0,114,162,0,0,0,114,190,0,0,0,114,95,0,
-    0,0,114,18,0,0,0,114,103,0,0,0,114,187,0,0,
-    0,114,28,0,0,0,114,237,0,0,0,90,2,110,116,114,
-    21,0,0,0,114,221,0,0,0,90,5,112,111,115,105,120,
-    114,53,0,0,0,218,3,97,108,108,114,61,0,0,0,114,
-    140,0,0,0,114,59,0,0,0,114,64,0,0,0,90,20,
-    95,112,97,116,104,115,101,112,115,95,119,105,116,104,95,99,
-    111,108,111,110,114,31,0,0,0,90,37,95,67,65,83,69,
-    95,73,78,83,69,78,83,73,84,73,86,69,95,80,76,65,
-    84,70,79,82,77,83,95,66,89,84,69,83,95,75,69,89,
-    114,30,0,0,0,114,32,0,0,0,114,24,0,0,0,114,
-    39,0,0,0,114,45,0,0,0,114,48,0,0,0,114,69,
-    0,0,0,114,76,0,0,0,114,78,0,0,0,114,83,0,
-    0,0,114,84,0,0,0,114,87,0,0,0,114,90,0,0,
-    0,114,99,0,0,0,218,4,116,121,112,101,218,8,95,95,
-    99,111,100,101,95,95,114,189,0,0,0,114,37,0,0,0,
-    114,175,0,0,0,114,36,0,0,0,114,42,0,0,0,114,
-    20,1,0,0,114,120,0,0,0,114,116,0,0,0,114,131,
-    0,0,0,114,63,0,0,0,114,137,1,0,0,114,238,0,
-    0,0,114,117,0,0,0,90,23,68,69,66,85,71,95,66,
-    89,84,69,67,79,68,69,95,83,85,70,70,73,88,69,83,
-    90,27,79,80,84,73,77,73,90,69,68,95,66,89,84,69,
-    67,79,68,69,95,83,85,70,70,73,88,69,83,114,125,0,
-    0,0,114,132,0,0,0,114,139,0,0,0,114,141,0,0,
-    0,114,143,0,0,0,114,163,0,0,0,114,170,0,0,0,
-    114,179,0,0,0,114,183,0,0,0,114,185,0,0,0,114,
-    192,0,0,0,114,197,0,0,0,114,199,0,0,0,114,205,
-    0,0,0,218,6,111,98,106,101,99,116,114,215,0,0,0,
-    114,219,0,0,0,114,220,0,0,0,114,241,0,0,0,114,
-    2,1,0,0,114,23,1,0,0,114,49,1,0,0,114,58,
-    1,0,0,114,44,1,0,0,114,64,1,0,0,114,93,1,
-    0,0,114,99,1,0,0,114,117,1,0,0,114,136,1,0,
-    0,114,214,0,0,0,114,140,1,0,0,114,143,1,0,0,
-    114,13,0,0,0,114,10,0,0,0,114,7,0,0,0,218,
-    8,60,109,111,100,117,108,101,62,114,149,1,0,0,1,0,
-    0,0,115,180,0,0,0,4,0,4,22,8,3,8,1,8,
-    1,8,1,8,1,10,3,4,1,8,1,10,1,8,2,4,
-    3,10,1,6,2,20,2,8,1,8,1,10,1,12,1,4,
-    4,4,1,2,1,2,1,4,255,6,4,6,16,6,3,6,
-    5,6,5,4,6,8,1,6,30,6,6,6,8,6,10,6,
-    9,6,5,4,7,8,1,6,8,8,5,10,22,0,127,16,
-    41,12,1,4,2,4,1,6,2,4,1,10,1,8,2,6,
-    2,8,2,14,2,6,71,6,40,6,19,6,12,6,12,6,
-    31,6,20,6,33,6,28,8,24,8,13,8,10,6,11,6,
-    14,4,3,2,1,10,255,12,73,12,67,14,30,0,127,12,
-    17,16,50,16,45,16,25,12,53,12,63,12,49,0,127,12,
-    29,0,127,8,30,6,23,6,11,10,5,115,220,0,0,0,
-    4,7,4,15,8,3,8,1,8,1,8,1,8,1,10,3,
-    2,1,2,4,8,253,10,1,8,2,2,3,2,3,10,254,
-    6,2,20,2,8,1,8,1,10,1,12,1,4,4,4,1,
-    2,1,4,1,2,255,6,18,6,2,6,5,6,6,6,5,
-    2,3,2,34,8,250,6,6,6,8,6,10,6,9,6,5,
-    6,7,2,3,2,11,8,251,6,5,2,3,6,19,10,3,
-    0,127,16,41,12,1,4,2,4,1,6,2,2,1,12,1,
-    8,2,6,2,8,2,4,2,10,68,6,40,6,19,6,12,
-    6,12,6,31,6,20,6,33,6,28,6,24,2,3,6,10,
-    2,3,6,7,2,3,6,8,6,12,6,5,4,3,2,1,
-    10,67,12,69,12,30,0,127,8,17,0,129,2,242,0,127,
-    4,14,12,50,8,45,4,214,4,42,8,25,4,234,4,22,
-    8,53,4,206,4,50,12,62,12,48,0,127,12,31,0,127,
-    12,28,2,5,6,20,6,11,6,5,10,8,115,158,2,0,
-    0,1,4,1,4,14,18,1,11,1,12,1,12,1,12,1,
-    12,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,
-    11,1,17,1,17,1,17,1,17,1,15,1,15,1,15,1,
-    15,16,19,16,28,32,39,16,39,1,12,4,15,1,24,5,
-    21,5,21,5,21,5,21,5,18,5,18,5,18,5,18,5,
-    18,5,24,5,24,5,24,5,24,4,15,1,28,24,28,30,
-    33,23,34,5,20,5,20,24,27,23,28,5,20,8,11,11,
-    53,11,53,37,52,11,53,11,53,8,53,1,53,1,53,1,
-    53,12,27,28,29,12,30,1,9,18,23,24,39,18,40,1,
-    15,19,21,19,43,27,42,19,43,1,16,24,58,24,58,42,
-    57,24,58,24,58,1,21,39,45,1,36,41,59,1,38,33,
-    70,35,70,33,70,1,28,1,23,1,23,1,23,15,31,15,
-    33,1,12,1,55,1,55,1,55,1,42,1,42,1,42,1,
-    42,1,42,1,42,4,15,1,63,5,42,5,42,5,42,5,
-    42,5,63,5,63,5,63,1,34,1,34,1,34,1,26,1,
-    26,1,26,1,50,1,50,1,50,1,46,1,46,1,46,1,
-    46,1,46,1,46,4,15,1,48,5,82,5,82,5,82,5,
-    82,5,48,5,48,5,48,36,41,1,14,1,14,1,14,14,
-    18,19,32,19,41,14,42,1,11,17,21,16,44,32,33,35,
-    43,16,44,47,54,16,54,1,13,21,24,21,59,36,48,50,
-    58,21,59,1,18,12,25,1,9,8,14,1,5,20,25,19,
-    26,1,16,4,15,1,35,5,20,5,35,28,34,5,35,5,
-    35,22,26,22,45,22,47,1,19,22,28,21,29,1,18,57,
-    74,1,74,1,24,27,54,44,48,66,70,1,48,1,48,1,
-    48,1,48,1,48,1,64,1,64,1,64,1,71,1,71,1,
-    71,1,20,1,20,1,20,1,16,1,16,1,16,1,31,1,
-    31,1,31,1,18,1,18,1,18,1,17,1,17,1,17,1,
-    76,1,76,1,76,1,10,1,10,1,10,34,38,1,57,1,
-    57,1,57,40,41,1,16,1,16,1,16,50,54,1,16,1,
-    16,1,16,1,68,1,68,1,68,13,19,13,21,1,10,44,
-    48,60,64,56,65,1,16,1,16,1,16,1,16,1,16,1,
-    24,1,24,1,24,1,24,1,24,1,24,1,60,1,60,1,
-    60,1,60,1,60,1,60,1,27,1,27,1,27,1,27,20,
-    33,1,27,1,27,1,32,1,32,1,32,1,32,1,32,1,
-    32,1,45,1,45,1,45,1,45,24,34,36,48,1,45,1,
-    45,1,20,1,20,1,20,1,20,28,38,40,53,1,20,1,
-    20,1,25,1,25,1,25,1,25,27,37,39,52,1,25,1,
-    25,1,32,1,32,1,32,1,32,1,32,1,32,1,43,1,
-    43,1,43,1,43,1,43,1,43,1,70,1,70,1,70,1,
-    70,1,70,1,70,1,52,1,52,1,52,1,52,1,52,1,
-    52,50,54,1,13,1,13,1,13,1,42,1,42,1,42,1,
-    35,1,35,1,35,1,37,1,37,1,37,1,37,1,37,114,
-    10,0,0,0,
+    100,101,114,40,41,32,105,115,32,100,101,112,114,101,99,97,
+    116,101,100,32,97,110,100,32,115,108,97,116,101,100,32,102,
+    111,114,32,114,101,109,111,118,97,108,32,105,110,32,80,121,
+    116,104,111,110,32,51,46,49,50,59,32,117,115,101,32,102,
+    105,110,100,95,115,112,101,99,40,41,32,105,110,115,116,101,
+    97,100,78,41,6,114,103,0,0,0,114,104,0,0,0,114,
+    105,0,0,0,114,232,0,0,0,114,167,0,0,0,114,208,
+    0,0,0,41,3,114,147,0,0,0,114,166,0,0,0,114,
+    216,0,0,0,115,3,0,0,0,32,32,32,114,7,0,0,
+    0,114,164,0,0,0,122,22,70,105,108,101,70,105,110,100,
+    101,114,46,102,105,110,100,95,108,111,97,100,101,114,243,5,
+    0,0,115,14,0,0,0,6,7,2,2,4,254,10,3,8,
+    1,8,1,16,1,115,14,0,0,0,4,7,2,1,6,1,
+    10,1,6,1,10,1,16,1,115,54,0,0,0,9,18,9,
+    23,24,84,24,42,9,43,9,43,16,20,16,40,31,39,16,
+    40,9,13,12,16,20,24,12,24,9,28,20,24,26,28,20,
+    28,13,28,16,20,16,27,29,33,29,60,29,66,64,66,16,
+    66,9,66,114,10,0,0,0,99,6,0,0,0,0,0,0,
+    0,0,0,0,0,6,0,0,0,3,0,0,0,115,26,0,
+    0,0,124,1,124,2,124,3,131,2,125,6,116,0,124,2,
+    124,3,124,6,124,4,100,1,141,4,83,0,41,2,78,114,
+    207,0,0,0,41,1,114,219,0,0,0,41,7,114,147,0,
+    0,0,114,217,0,0,0,114,166,0,0,0,114,67,0,0,
+    0,90,4,115,109,115,108,114,231,0,0,0,114,167,0,0,
+    0,115,7,0,0,0,32,32,32,32,32,32,32,114,7,0,
+    0,0,114,113,1,0,0,122,20,70,105,108,101,70,105,110,
+    100,101,114,46,95,103,101,116,95,115,112,101,99,2,6,0,
+    0,115,8,0,0,0,10,1,8,1,2,1,6,255,115,6,
+    0,0,0,10,1,8,1,8,1,115,26,0,0,0,18,30,
+    31,39,41,45,18,46,9,15,16,39,40,48,50,54,63,69,
+    67,71,16,72,16,72,9,72,114,10,0,0,0,78,99,3,
+    0,0,0,0,0,0,0,0,0,0,0,9,0,0,0,3,
+    0,0,0,115,142,1,0,0,100,1,125,3,124,1,160,0,
+    100,2,161,1,100,3,25,0,125,4,124,0,106,1,115,17,
+    124,0,106,2,100,4,107,2,114,53,9,0,116,3,124,0,
+    106,4,112,25,116,5,106,6,131,0,131,1,106,7,125,5,
+    110,12,35,0,4,0,116,8,121,198,1,0,1,0,1,0,
+    100,4,125,5,89,0,110,1,37,0,124,5,124,0,106,2,
+    107,3,114,53,124,0,160,9,161,0,1,0,124,5,124,0,
+    95,2,116,10,131,0,114,64,124,0,106,11,125,6,124,4,
+    160,12,161,0,125,7,110,5,124,0,106,13,125,6,124,4,
+    125,7,124,7,124,6,118,0,114,116,116,14,124,0,106,4,
+    124,4,131,2,125,8,124,0,106,15,68,0,93,29,92,2,
+    125,9,125,10,100,5,124,9,23,0,125,11,116,14,124,8,
+    124,11,131,2,125,12,116,16,124,12,131,1,114,111,124,0,
+    160,17,124,10,124,1,124,12,124,8,103,1,124,2,161,5,
+    2,0,1,0,83,0,113,82,116,18,124,8,131,1,125,3,
+    124,0,106,15,68,0,93,55,92,2,125,9,125,10,9,0,
+    116,14,124,0,106,4,124,4,124,9,23,0,131,2,125,12,
+    110,12,35,0,4,0,116,19,121,197,1,0,1,0,1,0,
+    89,0,1,0,100,6,83,0,37,0,116,20,160,21,100,7,
+    124,12,100,3,100,8,166,3,1,0,124,7,124,9,23,0,
+    124,6,118,0,114,174,116,16,124,12,131,1,114,174,124,0,
+    160,17,124,10,124,1,124,12,100,6,124,2,161,5,2,0,
+    1,0,83,0,113,119,124,3,114,195,116,20,160,21,100,9,
+    124,8,161,2,1,0,116,20,160,22,124,1,100,6,161,2,
+    125,13,124,8,103,1,124,13,95,23,124,13,83,0,100,6,
+    83,0,119,0,119,0,41,10,122,111,84,114,121,32,116,111,
+    32,102,105,110,100,32,97,32,115,112,101,99,32,102,111,114,
+    32,116,104,101,32,115,112,101,99,105,102,105,101,100,32,109,
+    111,100,117,108,101,46,10,10,32,32,32,32,32,32,32,32,
+    82,101,116,117,114,110,115,32,116,104,101,32,109,97,116,99,
+    104,105,110,103,32,115,112,101,99,44,32,111,114,32,78,111,
+    110,101,32,105,102,32,110,111,116,32,102,111,117,110,100,46,
+    10,32,32,32,32,32,32,32,32,70,114,101,0,0,0,114,
+    47,0,0,0,114,134,0,0,0,114,242,0,0,0,78,122,
+    9,116,114,121,105,110,103,32,123,125,41,1,90,9,118,101,
+    114,98,111,115,105,116,121,122,25,112,111,115,115,105,98,108,
+    101,32,110,97,109,101,115,112,97,99,101,32,102,111,114,32,
+    123,125,41,24,114,108,0,0,0,218,10,114,101,118,97,108,
+    105,100,97,116,101,114,120,1,0,0,114,78,0,0,0,114,
+    67,0,0,0,114,21,0,0,0,114,86,0,0,0,114,50,
+    1,0,0,114,80,0,0,0,218,11,95,102,105,108,108,95,
+    99,97,99,104,101,114,24,0,0,0,114,123,1,0,0,114,
+    135,0,0,0,114,122,1,0,0,114,69,0,0,0,114,119,
+    1,0,0,114,84,0,0,0,114,113,1,0,0,114,87,0,
+    0,0,114,115,0,0,0,114,162,0,0,0,114,176,0,0,
+    0,114,213,0,0,0,114,208,0,0,0,41,14,114,147,0,
+    0,0,114,166,0,0,0,114,231,0,0,0,90,12,105,115,
+    95,110,97,109,101,115,112,97,99,101,90,11,116,97,105,108,
+    95,109,111,100,117,108,101,114,196,0,0,0,90,5,99,97,
+    99,104,101,90,12,99,97,99,104,101,95,109,111,100,117,108,
+    101,90,9,98,97,115,101,95,112,97,116,104,114,61,1,0,
+    0,114,217,0,0,0,90,13,105,110,105,116,95,102,105,108,
+    101,110,97,109,101,90,9,102,117,108,108,95,112,97,116,104,
+    114,216,0,0,0,115,14,0,0,0,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,114,7,0,0,0,114,232,0,
+    0,0,122,20,70,105,108,101,70,105,110,100,101,114,46,102,
+    105,110,100,95,115,112,101,99,7,6,0,0,115,96,0,0,
+    0,4,5,14,1,16,1,2,1,22,1,2,128,12,1,8,
+    1,2,128,10,1,8,1,6,1,6,2,6,1,10,1,6,
+    2,4,1,8,2,12,1,14,1,8,1,10,1,8,1,24,
+    1,2,255,8,5,14,2,2,1,18,1,2,128,12,1,8,
+    1,2,128,16,1,12,1,8,1,10,1,4,1,8,255,2,
+    128,4,2,12,1,12,1,8,1,4,1,4,1,2,244,2,
+    228,115,126,0,0,0,4,5,14,1,4,1,2,7,8,249,
+    2,7,2,253,22,254,2,128,2,2,2,255,16,1,2,128,
+    8,1,2,2,8,255,6,1,4,2,2,5,6,252,10,1,
+    6,2,4,1,6,2,2,10,12,247,4,1,4,8,6,248,
+    8,1,10,1,6,1,28,1,8,4,4,2,4,9,6,247,
+    2,4,18,254,2,128,2,2,2,255,16,1,2,128,16,1,
+    10,1,2,3,6,254,2,2,2,255,2,1,6,255,12,1,
+    2,128,2,1,2,4,12,253,12,1,8,1,4,1,4,1,
+    2,245,2,228,115,142,1,0,0,24,29,9,21,23,31,23,
+    47,43,46,23,47,48,49,23,50,9,20,12,16,12,27,9,
+    41,31,35,31,47,51,53,31,53,9,41,13,27,25,35,36,
+    40,36,45,36,61,49,52,49,59,49,61,25,62,25,71,17,
+    22,17,22,0,0,13,27,20,27,13,27,13,27,13,27,13,
+    27,25,27,17,22,17,22,17,22,0,0,16,21,25,29,25,
+    41,16,41,13,41,17,21,17,35,17,35,17,35,36,41,17,
+    21,17,33,12,23,12,25,9,39,21,25,21,45,13,18,28,
+    39,28,47,28,47,13,25,13,25,21,25,21,37,13,18,28,
+    39,13,25,12,24,28,33,12,33,9,54,25,35,36,40,36,
+    45,47,58,25,59,13,22,41,45,41,54,13,54,13,54,17,
+    37,17,23,25,37,33,43,46,52,33,52,17,30,29,39,40,
+    49,51,64,29,65,17,26,20,32,33,42,20,43,17,98,28,
+    32,28,98,43,55,57,65,67,76,79,88,78,89,91,97,28,
+    98,21,98,21,98,21,98,17,98,32,43,44,53,32,54,17,
+    29,37,41,37,50,9,56,9,56,13,33,13,19,21,33,13,
+    28,29,39,40,44,40,49,51,62,65,71,51,71,29,72,17,
+    26,17,26,0,0,13,28,20,30,13,28,13,28,13,28,13,
+    28,24,28,24,28,24,28,24,28,0,0,13,23,13,77,41,
+    52,54,63,75,76,13,77,13,77,13,77,16,28,31,37,16,
+    37,41,46,16,46,13,56,20,32,33,42,20,43,17,56,28,
+    32,28,56,43,55,57,65,67,76,43,47,49,55,28,56,21,
+    56,21,56,21,56,0,0,12,24,9,24,13,23,13,80,41,
+    68,70,79,13,80,13,80,20,30,20,57,42,50,52,56,20,
+    57,13,17,48,57,47,58,13,17,13,44,20,24,13,24,16,
+    20,16,20,13,28,13,27,115,31,0,0,0,146,10,29,0,
+    157,9,40,7,193,60,8,66,5,2,194,5,7,66,16,9,
+    195,5,1,66,16,9,195,6,1,40,7,99,1,0,0,0,
+    0,0,0,0,0,0,0,0,10,0,0,0,3,0,0,0,
+    115,192,0,0,0,124,0,106,0,125,1,9,0,116,1,106,
+    2,124,1,112,11,116,1,106,3,131,0,131,1,125,2,110,
+    15,35,0,4,0,116,4,116,5,116,6,102,3,121,95,1,
+    0,1,0,1,0,103,0,125,2,89,0,110,1,37,0,116,
+    7,106,8,160,9,100,1,161,1,115,41,116,10,124,2,131,
+    1,124,0,95,11,110,37,116,10,131,0,125,3,124,2,68,
+    0,93,28,125,4,124,4,160,12,100,2,161,1,92,3,125,
+    5,125,6,125,7,124,6,114,67,100,3,160,13,124,5,124,
+    7,160,14,161,0,161,2,125,8,110,2,124,5,125,8,124,
+    3,160,15,124,8,161,1,1,0,113,46,124,3,124,0,95,
+    11,116,7,106,8,160,9,116,16,161,1,114,93,100,4,132,
+    0,124,2,68,0,131,1,124,0,95,17,100,5,83,0,100,
+    5,83,0,119,0,41,6,122,68,70,105,108,108,32,116,104,
+    101,32,99,97,99,104,101,32,111,102,32,112,111,116,101,110,
+    116,105,97,108,32,109,111,100,117,108,101,115,32,97,110,100,
+    32,112,97,99,107,97,103,101,115,32,102,111,114,32,116,104,
+    105,115,32,100,105,114,101,99,116,111,114,121,46,114,17,0,
+    0,0,114,101,0,0,0,114,92,0,0,0,99,1,0,0,
+    0,0,0,0,0,0,0,0,0,4,0,0,0,19,0,0,
+    0,115,20,0,0,0,104,0,124,0,93,6,125,1,124,1,
+    160,0,161,0,146,2,113,2,83,0,114,13,0,0,0,41,
+    1,114,135,0,0,0,41,2,114,5,0,0,0,90,2,102,
+    110,115,2,0,0,0,32,32,114,7,0,0,0,114,15,0,
+    0,0,122,41,70,105,108,101,70,105,110,100,101,114,46,95,
+    102,105,108,108,95,99,97,99,104,101,46,60,108,111,99,97,
+    108,115,62,46,60,115,101,116,99,111,109,112,62,88,6,0,
+    0,243,2,0,0,0,20,0,114,127,1,0,0,115,20,0,
+    0,0,40,71,40,71,40,71,56,58,41,43,41,51,41,51,
+    40,71,40,71,40,71,114,10,0,0,0,78,41,18,114,67,
+    0,0,0,114,21,0,0,0,90,7,108,105,115,116,100,105,
+    114,114,86,0,0,0,114,107,1,0,0,218,15,80,101,114,
+    109,105,115,115,105,111,110,69,114,114,111,114,218,18,78,111,
+    116,65,68,105,114,101,99,116,111,114,121,69,114,114,111,114,
+    114,18,0,0,0,114,28,0,0,0,114,29,0,0,0,114,
+    121,1,0,0,114,122,1,0,0,114,130,0,0,0,114,93,
+    0,0,0,114,135,0,0,0,218,3,97,100,100,114,30,0,
+    0,0,114,123,1,0,0,41,9,114,147,0,0,0,114,67,
+    0,0,0,90,8,99,111,110,116,101,110,116,115,90,21,108,
+    111,119,101,114,95,115,117,102,102,105,120,95,99,111,110,116,
+    101,110,116,115,114,90,1,0,0,114,145,0,0,0,114,72,
+    1,0,0,114,61,1,0,0,90,8,110,101,119,95,110,97,
+    109,101,115,9,0,0,0,32,32,32,32,32,32,32,32,32,
+    114,7,0,0,0,114,126,1,0,0,122,22,70,105,108,101,
+    70,105,110,100,101,114,46,95,102,105,108,108,95,99,97,99,
+    104,101,59,6,0,0,115,42,0,0,0,6,2,2,1,20,
+    1,2,128,18,1,8,3,2,128,12,3,12,1,6,7,8,
+    1,16,1,4,1,18,1,4,2,12,1,6,1,12,1,18,
+    1,4,255,2,233,115,50,0,0,0,6,2,2,6,20,252,
+    2,128,2,4,8,253,16,3,2,128,10,3,2,16,12,241,
+    6,7,2,1,4,6,2,250,16,1,2,1,2,3,18,254,
+    4,2,12,1,6,1,10,1,24,1,2,235,115,192,0,0,
+    0,16,20,16,25,9,13,9,26,24,27,24,35,36,40,36,
+    56,44,47,44,54,44,56,24,57,13,21,13,21,0,0,9,
+    26,17,34,36,51,53,71,16,72,9,26,9,26,9,26,9,
+    26,24,26,13,21,13,21,13,21,0,0,16,19,16,28,16,
+    46,40,45,16,46,9,53,32,35,36,44,32,45,13,17,13,
+    29,13,29,37,40,37,42,13,34,25,33,13,52,13,52,17,
+    21,37,41,37,56,52,55,37,56,17,34,17,21,23,26,28,
+    34,20,23,17,36,32,39,32,68,47,51,53,59,53,67,53,
+    67,32,68,21,29,21,29,32,36,21,29,17,38,17,52,43,
+    51,17,52,17,52,17,52,32,53,13,17,13,29,12,15,12,
+    24,12,64,36,63,12,64,9,71,40,71,40,71,62,70,40,
+    71,40,71,13,17,13,37,13,37,13,37,9,71,9,71,9,
+    26,115,13,0,0,0,132,9,14,0,142,12,28,7,193,31,
+    1,28,7,99,1,0,0,0,0,0,0,0,0,0,0,0,
+    2,0,0,0,7,0,0,0,115,20,0,0,0,135,0,135,
+    1,136,0,136,1,102,2,100,1,132,8,125,2,124,2,83,
+    0,41,3,97,20,1,0,0,65,32,99,108,97,115,115,32,
+    109,101,116,104,111,100,32,119,104,105,99,104,32,114,101,116,
+    117,114,110,115,32,97,32,99,108,111,115,117,114,101,32,116,
+    111,32,117,115,101,32,111,110,32,115,121,115,46,112,97,116,
+    104,95,104,111,111,107,10,32,32,32,32,32,32,32,32,119,
+    104,105,99,104,32,119,105,108,108,32,114,101,116,117,114,110,
+    32,97,110,32,105,110,115,116,97,110,99,101,32,117,115,105,
+    110,103,32,116,104,101,32,115,112,101,99,105,102,105,101,100,
+    32,108,111,97,100,101,114,115,32,97,110,100,32,116,104,101,
+    32,112,97,116,104,10,32,32,32,32,32,32,32,32,99,97,
+    108,108,101,100,32,111,110,32,116,104,101,32,99,108,111,115,
+    117,114,101,46,10,10,32,32,32,32,32,32,32,32,73,102,
+    32,116,104,101,32,112,97,116,104,32,99,97,108,108,101,100,
+    32,111,110,32,116,104,101,32,99,108,111,115,117,114,101,32,
+    105,115,32,110,111,116,32,97,32,100,105,114,101,99,116,111,
+    114,121,44,32,73,109,112,111,114,116,69,114,114,111,114,32,
+    105,115,10,32,32,32,32,32,32,32,32,114,97,105,115,101,
+    100,46,10,10,32,32,32,32,32,32,32,32,99,1,0,0,
+    0,0,0,0,0,0,0,0,0,4,0,0,0,19,0,0,
+    0,115,36,0,0,0,116,0,124,0,131,1,115,10,116,1,
+    100,1,124,0,100,2,141,2,130,1,137,1,124,0,103,1,
+    137,2,162,1,82,0,142,0,83,0,41,4,122,45,80,97,
+    116,104,32,104,111,111,107,32,102,111,114,32,105,109,112,111,
+    114,116,108,105,98,46,109,97,99,104,105,110,101,114,121,46,
+    70,105,108,101,70,105,110,100,101,114,46,122,30,111,110,108,
+    121,32,100,105,114,101,99,116,111,114,105,101,115,32,97,114,
+    101,32,115,117,112,112,111,114,116,101,100,114,77,0,0,0,
+    78,41,2,114,87,0,0,0,114,146,0,0,0,41,3,114,
+    67,0,0,0,114,227,0,0,0,114,124,1,0,0,115,3,
+    0,0,0,32,128,128,114,7,0,0,0,218,24,112,97,116,
+    104,95,104,111,111,107,95,102,111,114,95,70,105,108,101,70,
+    105,110,100,101,114,122,54,70,105,108,101,70,105,110,100,101,
+    114,46,112,97,116,104,95,104,111,111,107,46,60,108,111,99,
+    97,108,115,62,46,112,97,116,104,95,104,111,111,107,95,102,
+    111,114,95,70,105,108,101,70,105,110,100,101,114,100,6,0,
+    0,115,6,0,0,0,8,2,12,1,16,1,115,6,0,0,
+    0,6,2,14,1,16,1,115,36,0,0,0,20,31,32,36,
+    20,37,13,79,23,34,35,67,74,78,23,79,23,79,17,79,
+    20,23,24,28,20,46,31,45,20,46,20,46,20,46,13,46,
+    114,10,0,0,0,78,114,13,0,0,0,41,3,114,227,0,
+    0,0,114,124,1,0,0,114,131,1,0,0,115,3,0,0,
+    0,96,96,32,114,7,0,0,0,218,9,112,97,116,104,95,
+    104,111,111,107,122,20,70,105,108,101,70,105,110,100,101,114,
+    46,112,97,116,104,95,104,111,111,107,90,6,0,0,115,6,
+    0,0,0,4,128,12,10,4,6,115,6,0,0,0,4,128,
+    12,14,4,2,115,20,0,0,0,0,0,0,0,9,46,9,
+    46,9,46,9,46,9,46,9,46,16,40,9,40,114,10,0,
+    0,0,99,1,0,0,0,0,0,0,0,0,0,0,0,3,
+    0,0,0,3,0,0,0,114,87,1,0,0,41,2,78,122,
+    16,70,105,108,101,70,105,110,100,101,114,40,123,33,114,125,
+    41,41,2,114,93,0,0,0,114,67,0,0,0,114,35,1,
+    0,0,115,1,0,0,0,32,114,7,0,0,0,114,88,1,
+    0,0,122,19,70,105,108,101,70,105,110,100,101,114,46,95,
+    95,114,101,112,114,95,95,108,6,0,0,114,80,1,0,0,
+    114,80,1,0,0,115,12,0,0,0,16,34,16,52,42,46,
+    42,51,16,52,9,52,114,10,0,0,0,114,71,0,0,0,
+    41,16,114,153,0,0,0,114,152,0,0,0,114,154,0,0,
+    0,114,155,0,0,0,114,125,1,0,0,114,242,0,0,0,
+    114,100,1,0,0,114,170,0,0,0,114,235,0,0,0,114,
+    164,0,0,0,114,113,1,0,0,114,232,0,0,0,114,126,
+    1,0,0,114,240,0,0,0,114,132,1,0,0,114,88,1,
+    0,0,114,13,0,0,0,114,10,0,0,0,114,7,0,0,
+    0,114,117,1,0,0,114,117,1,0,0,207,5,0,0,115,
+    26,0,0,0,8,0,4,2,4,10,6,2,6,16,4,4,
+    6,2,6,15,8,5,6,52,2,31,8,1,10,17,115,118,
+    0,0,0,0,129,0,129,0,129,0,129,0,129,0,129,0,
+    129,0,129,0,129,0,129,0,129,8,166,0,127,0,127,0,
+    127,0,127,0,127,0,127,0,127,0,127,0,127,0,127,0,
+    127,2,100,0,129,0,129,0,129,0,129,0,129,0,129,0,
+    129,0,129,0,129,0,129,0,129,2,156,0,127,0,127,0,
+    127,0,127,0,127,0,127,0,127,0,127,0,127,0,127,0,
+    127,4,102,6,16,6,4,4,2,6,15,6,5,2,2,6,
+    50,6,31,2,2,8,16,10,3,115,78,0,0,0,1,1,
+    1,1,1,1,1,1,5,8,1,1,18,22,5,15,5,41,
+    5,41,5,41,5,30,5,30,5,30,19,36,5,16,5,66,
+    5,66,5,66,5,72,5,72,5,72,42,46,5,20,5,20,
+    5,20,5,71,5,71,5,71,6,17,5,40,5,40,5,40,
+    5,40,5,52,5,52,5,52,5,52,5,52,114,10,0,0,
+    0,114,117,1,0,0,99,4,0,0,0,0,0,0,0,0,
+    0,0,0,8,0,0,0,3,0,0,0,115,146,0,0,0,
+    124,0,160,0,100,1,161,1,125,4,124,0,160,0,100,2,
+    161,1,125,5,124,4,115,33,124,5,114,18,124,5,106,1,
+    125,4,110,15,124,2,124,3,107,2,114,28,116,2,124,1,
+    124,2,131,2,125,4,110,5,116,3,124,1,124,2,131,2,
+    125,4,124,5,115,42,116,4,124,1,124,2,124,4,100,3,
+    141,3,125,5,9,0,124,5,124,0,100,2,60,0,124,4,
+    124,0,100,1,60,0,124,2,124,0,100,4,60,0,124,3,
+    124,0,100,5,60,0,100,0,83,0,35,0,4,0,116,5,
+    121,72,1,0,1,0,1,0,89,0,100,0,83,0,37,0,
+    119,0,41,6,78,218,10,95,95,108,111,97,100,101,114,95,
+    95,218,8,95,95,115,112,101,99,95,95,41,1,114,167,0,
+    0,0,90,8,95,95,102,105,108,101,95,95,90,10,95,95,
+    99,97,99,104,101,100,95,95,41,6,218,3,103,101,116,114,
+    167,0,0,0,114,58,1,0,0,114,49,1,0,0,114,219,
+    0,0,0,218,9,69,120,99,101,112,116,105,111,110,41,6,
+    90,2,110,115,114,145,0,0,0,90,8,112,97,116,104,110,
+    97,109,101,90,9,99,112,97,116,104,110,97,109,101,114,167,
+    0,0,0,114,216,0,0,0,115,6,0,0,0,32,32,32,
+    32,32,32,114,7,0,0,0,218,14,95,102,105,120,95,117,
+    112,95,109,111,100,117,108,101,114,137,1,0,0,114,6,0,
+    0,115,40,0,0,0,10,2,10,1,4,1,4,1,8,1,
+    8,1,12,1,10,2,4,1,14,1,2,1,8,1,8,1,
+    8,1,12,1,2,128,12,1,6,2,2,128,2,254,115,48,
+    0,0,0,10,2,10,1,2,1,2,6,2,251,2,5,8,
+    252,6,1,2,3,12,254,10,2,2,1,16,1,2,8,8,
+    250,8,1,8,1,12,1,2,128,2,3,2,254,14,2,2,
+    128,2,0,115,146,0,0,0,14,16,14,34,21,33,14,34,
+    5,11,12,14,12,30,19,29,12,30,5,9,12,18,5,54,
+    12,16,9,54,22,26,22,33,13,19,13,19,14,22,26,35,
+    14,35,9,54,22,42,43,47,49,57,22,58,13,19,13,19,
+    22,38,39,43,45,53,22,54,13,19,12,16,5,70,16,39,
+    40,44,46,54,63,69,16,70,16,70,9,13,5,13,26,30,
+    9,11,12,22,9,23,28,34,9,11,12,24,9,25,26,34,
+    9,11,12,22,9,23,28,37,9,11,12,24,9,25,9,25,
+    9,25,0,0,5,13,12,21,5,13,5,13,5,13,5,13,
+    9,13,9,13,9,13,0,0,5,13,115,15,0,0,0,171,
+    16,61,0,189,7,65,7,7,193,8,1,65,7,7,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,3,0,0,0,3,
+    0,0,0,115,38,0,0,0,116,0,116,1,106,2,131,0,
+    102,2,125,0,116,3,116,4,102,2,125,1,116,5,116,6,
+    102,2,125,2,124,0,124,1,124,2,103,3,83,0,41,2,
+    122,95,82,101,116,117,114,110,115,32,97,32,108,105,115,116,
+    32,111,102,32,102,105,108,101,45,98,97,115,101,100,32,109,
+    111,100,117,108,101,32,108,111,97,100,101,114,115,46,10,10,
+    32,32,32,32,69,97,99,104,32,105,116,101,109,32,105,115,
+    32,97,32,116,117,112,108,101,32,40,108,111,97,100,101,114,
+    44,32,115,117,102,102,105,120,101,115,41,46,10,32,32,32,
+    32,78,41,7,114,44,1,0,0,114,190,0,0,0,218,18,
+    101,120,116,101,110,115,105,111,110,95,115,117,102,102,105,120,
+    101,115,114,49,1,0,0,114,131,0,0,0,114,58,1,0,
+    0,114,117,0,0,0,41,3,90,10,101,120,116,101,110,115,
+    105,111,110,115,90,6,115,111,117,114,99,101,90,8,98,121,
+    116,101,99,111,100,101,115,3,0,0,0,32,32,32,114,7,
+    0,0,0,114,214,0,0,0,114,214,0,0,0,137,6,0,
+    0,243,8,0,0,0,12,5,8,1,8,1,10,1,114,139,
+    1,0,0,115,38,0,0,0,18,37,39,43,39,62,39,64,
+    18,64,5,15,14,30,32,47,14,47,5,11,16,36,38,55,
+    16,55,5,13,13,23,25,31,33,41,12,42,5,42,114,10,
+    0,0,0,99,1,0,0,0,0,0,0,0,0,0,0,0,
+    1,0,0,0,3,0,0,0,115,8,0,0,0,124,0,97,
+    0,100,0,83,0,114,71,0,0,0,41,1,114,162,0,0,
+    0,41,1,218,17,95,98,111,111,116,115,116,114,97,112,95,
+    109,111,100,117,108,101,115,1,0,0,0,32,114,7,0,0,
+    0,218,21,95,115,101,116,95,98,111,111,116,115,116,114,97,
+    112,95,109,111,100,117,108,101,114,141,1,0,0,148,6,0,
+    0,243,2,0,0,0,8,2,114,142,1,0,0,115,8,0,
+    0,0,18,35,5,15,5,15,5,15,114,10,0,0,0,99,
+    1,0,0,0,0,0,0,0,0,0,0,0,4,0,0,0,
+    3,0,0,0,115,50,0,0,0,116,0,124,0,131,1,1,
+    0,116,1,131,0,125,1,116,2,106,3,160,4,116,5,106,
+    6,124,1,142,0,103,1,161,1,1,0,116,2,106,7,160,
+    8,116,9,161,1,1,0,100,1,83,0,41,2,122,41,73,
+    110,115,116,97,108,108,32,116,104,101,32,112,97,116,104,45,
+    98,97,115,101,100,32,105,109,112,111,114,116,32,99,111,109,
+    112,111,110,101,110,116,115,46,78,41,10,114,141,1,0,0,
+    114,214,0,0,0,114,18,0,0,0,114,105,1,0,0,114,
+    194,0,0,0,114,117,1,0,0,114,132,1,0,0,218,9,
+    109,101,116,97,95,112,97,116,104,114,63,0,0,0,114,99,
+    1,0,0,41,2,114,140,1,0,0,90,17,115,117,112,112,
+    111,114,116,101,100,95,108,111,97,100,101,114,115,115,2,0,
+    0,0,32,32,114,7,0,0,0,218,8,95,105,110,115,116,
+    97,108,108,114,144,1,0,0,153,6,0,0,243,8,0,0,
+    0,8,2,6,1,20,1,16,1,114,145,1,0,0,115,50,
+    0,0,0,5,26,27,44,5,45,5,45,25,52,25,54,5,
+    22,5,8,5,19,5,70,28,38,28,48,50,67,28,68,27,
+    69,5,70,5,70,5,8,5,18,5,37,26,36,5,37,5,
+    37,5,37,5,37,114,10,0,0,0,41,1,114,91,0,0,
+    0,114,71,0,0,0,41,3,78,78,78,41,2,114,0,0,
+    0,0,114,0,0,0,0,41,1,84,41,85,114,155,0,0,
+    0,114,162,0,0,0,114,190,0,0,0,114,95,0,0,0,
+    114,18,0,0,0,114,103,0,0,0,114,187,0,0,0,114,
+    28,0,0,0,114,237,0,0,0,90,2,110,116,114,21,0,
+    0,0,114,221,0,0,0,90,5,112,111,115,105,120,114,53,
+    0,0,0,218,3,97,108,108,114,61,0,0,0,114,140,0,
+    0,0,114,59,0,0,0,114,64,0,0,0,90,20,95,112,
+    97,116,104,115,101,112,115,95,119,105,116,104,95,99,111,108,
+    111,110,114,31,0,0,0,90,37,95,67,65,83,69,95,73,
+    78,83,69,78,83,73,84,73,86,69,95,80,76,65,84,70,
+    79,82,77,83,95,66,89,84,69,83,95,75,69,89,114,30,
+    0,0,0,114,32,0,0,0,114,24,0,0,0,114,39,0,
+    0,0,114,45,0,0,0,114,48,0,0,0,114,69,0,0,
+    0,114,76,0,0,0,114,78,0,0,0,114,83,0,0,0,
+    114,84,0,0,0,114,87,0,0,0,114,90,0,0,0,114,
+    99,0,0,0,218,4,116,121,112,101,218,8,95,95,99,111,
+    100,101,95,95,114,189,0,0,0,114,37,0,0,0,114,175,
+    0,0,0,114,36,0,0,0,114,42,0,0,0,114,20,1,
+    0,0,114,120,0,0,0,114,116,0,0,0,114,131,0,0,
+    0,114,63,0,0,0,114,138,1,0,0,114,238,0,0,0,
+    114,117,0,0,0,90,23,68,69,66,85,71,95,66,89,84,
+    69,67,79,68,69,95,83,85,70,70,73,88,69,83,90,27,
+    79,80,84,73,77,73,90,69,68,95,66,89,84,69,67,79,
+    68,69,95,83,85,70,70,73,88,69,83,114,125,0,0,0,
+    114,132,0,0,0,114,139,0,0,0,114,141,0,0,0,114,
+    143,0,0,0,114,163,0,0,0,114,170,0,0,0,114,179,
+    0,0,0,114,183,0,0,0,114,185,0,0,0,114,192,0,
+    0,0,114,197,0,0,0,114,199,0,0,0,114,205,0,0,
+    0,218,6,111,98,106,101,99,116,114,215,0,0,0,114,219,
+    0,0,0,114,220,0,0,0,114,241,0,0,0,114,2,1,
+    0,0,114,23,1,0,0,114,49,1,0,0,114,58,1,0,
+    0,114,44,1,0,0,114,64,1,0,0,114,93,1,0,0,
+    114,99,1,0,0,114,117,1,0,0,114,137,1,0,0,114,
+    214,0,0,0,114,141,1,0,0,114,144,1,0,0,114,13,
+    0,0,0,114,10,0,0,0,114,7,0,0,0,218,8,60,
+    109,111,100,117,108,101,62,114,150,1,0,0,1,0,0,0,
+    115,180,0,0,0,4,0,4,22,8,3,8,1,8,1,8,
+    1,8,1,10,3,4,1,8,1,10,1,8,2,4,3,10,
+    1,6,2,20,2,8,1,8,1,10,1,12,1,4,4,4,
+    1,2,1,2,1,4,255,6,4,6,16,6,3,6,5,6,
+    5,4,6,8,1,6,30,6,6,6,8,6,10,6,9,6,
+    5,4,7,8,1,6,8,8,5,10,22,0,127,16,41,12,
+    1,4,2,4,1,6,2,4,1,10,1,8,2,6,2,8,
+    2,14,2,6,71,6,40,6,19,6,12,6,12,6,31,6,
+    20,6,33,6,28,8,24,8,13,8,10,6,11,6,14,4,
+    3,2,1,10,255,12,73,12,67,14,30,0,127,12,17,16,
+    50,16,45,16,25,12,53,12,63,12,49,0,127,12,29,0,
+    127,8,36,6,23,6,11,10,5,115,220,0,0,0,4,7,
+    4,15,8,3,8,1,8,1,8,1,8,1,10,3,2,1,
+    2,4,8,253,10,1,8,2,2,3,2,3,10,254,6,2,
+    20,2,8,1,8,1,10,1,12,1,4,4,4,1,2,1,
+    4,1,2,255,6,18,6,2,6,5,6,6,6,5,2,3,
+    2,34,8,250,6,6,6,8,6,10,6,9,6,5,6,7,
+    2,3,2,11,8,251,6,5,2,3,6,19,10,3,0,127,
+    16,41,12,1,4,2,4,1,6,2,2,1,12,1,8,2,
+    6,2,8,2,4,2,10,68,6,40,6,19,6,12,6,12,
+    6,31,6,20,6,33,6,28,6,24,2,3,6,10,2,3,
+    6,7,2,3,6,8,6,12,6,5,4,3,2,1,10,67,
+    12,69,12,30,0,127,8,17,0,129,2,242,0,127,4,14,
+    12,50,8,45,4,214,4,42,8,25,4,234,4,22,8,53,
+    4,206,4,50,12,62,12,48,0,127,12,31,0,127,12,34,
+    2,5,6,20,6,11,6,5,10,8,115,158,2,0,0,1,
+    4,1,4,14,18,1,11,1,12,1,12,1,12,1,12,1,
+    11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,
+    17,1,17,1,17,1,17,1,15,1,15,1,15,1,15,16,
+    19,16,28,32,39,16,39,1,12,4,15,1,24,5,21,5,
+    21,5,21,5,21,5,18,5,18,5,18,5,18,5,18,5,
+    24,5,24,5,24,5,24,4,15,1,28,24,28,30,33,23,
+    34,5,20,5,20,24,27,23,28,5,20,8,11,11,53,11,
+    53,37,52,11,53,11,53,8,53,1,53,1,53,1,53,12,
+    27,28,29,12,30,1,9,18,23,24,39,18,40,1,15,19,
+    21,19,43,27,42,19,43,1,16,24,58,24,58,42,57,24,
+    58,24,58,1,21,39,45,1,36,41,59,1,38,33,70,35,
+    70,33,70,1,28,1,23,1,23,1,23,15,31,15,33,1,
+    12,1,55,1,55,1,55,1,42,1,42,1,42,1,42,1,
+    42,1,42,4,15,1,63,5,42,5,42,5,42,5,42,5,
+    63,5,63,5,63,1,34,1,34,1,34,1,26,1,26,1,
+    26,1,50,1,50,1,50,1,46,1,46,1,46,1,46,1,
+    46,1,46,4,15,1,48,5,82,5,82,5,82,5,82,5,
+    48,5,48,5,48,36,41,1,14,1,14,1,14,14,18,19,
+    32,19,41,14,42,1,11,17,21,16,44,32,33,35,43,16,
+    44,47,54,16,54,1,13,21,24,21,59,36,48,50,58,21,
+    59,1,18,12,25,1,9,8,14,1,5,20,25,19,26,1,
+    16,4,15,1,35,5,20,5,35,28,34,5,35,5,35,22,
+    26,22,45,22,47,1,19,22,28,21,29,1,18,57,74,1,
+    74,1,24,27,54,44,48,66,70,1,48,1,48,1,48,1,
+    48,1,48,1,64,1,64,1,64,1,71,1,71,1,71,1,
+    20,1,20,1,20,1,16,1,16,1,16,1,31,1,31,1,
+    31,1,18,1,18,1,18,1,17,1,17,1,17,1,76,1,
+    76,1,76,1,10,1,10,1,10,34,38,1,57,1,57,1,
+    57,40,41,1,16,1,16,1,16,50,54,1,16,1,16,1,
+    16,1,68,1,68,1,68,13,19,13,21,1,10,44,48,60,
+    64,56,65,1,16,1,16,1,16,1,16,1,16,1,24,1,
+    24,1,24,1,24,1,24,1,24,1,60,1,60,1,60,1,
+    60,1,60,1,60,1,27,1,27,1,27,1,27,20,33,1,
+    27,1,27,1,32,1,32,1,32,1,32,1,32,1,32,1,
+    45,1,45,1,45,1,45,24,34,36,48,1,45,1,45,1,
+    20,1,20,1,20,1,20,28,38,40,53,1,20,1,20,1,
+    25,1,25,1,25,1,25,27,37,39,52,1,25,1,25,1,
+    32,1,32,1,32,1,32,1,32,1,32,1,43,1,43,1,
+    43,1,43,1,43,1,43,1,70,1,70,1,70,1,70,1,
+    70,1,70,1,52,1,52,1,52,1,52,1,52,1,52,50,
+    54,1,13,1,13,1,13,1,42,1,42,1,42,1,35,1,
+    35,1,35,1,37,1,37,1,37,1,37,1,37,114,10,0,
+    0,0,
 };
@@ -79,7 +79,8 @@ static const char usage_3[] = "\
          -X importtime: show how long each import takes. It shows module name,\n\
              cumulative time (including nested imports) and self time (excluding\n\
              nested imports). Note that its output may be broken in multi-threaded\n\
-             application. Typical usage is python3 -X importtime -c 'import asyncio'\n\
+             application. Typical usage is python3 -X importtime -c 'import asyncio'.\n\
+             Use -X importtime=json or -X importtime=csv for machine-readable output\n\
          -X dev: enable CPython's \"development mode\", introducing additional runtime\n\
              checks which are too expensive to be enabled by default. Effect of the\n\
              developer mode:\n\
@@ -100,6 +101,10 @@ static const char usage_3[] = "\
             instruction in code objects. This is useful when smaller code objects and pyc \n\
             files are desired as well as supressing the extra visual location indicators \n\
             when the interpreter displays tracebacks.\n\
+         -X specialization_stats: collect statistics about the specializing\n\
+            adaptive interpreter. They can be read with sys._getspecializationstats()\n\
+         -X lazy_imports: load the modules imported after the site module lazily,\n\
+            as importlib.util.enable_lazy_imports() does\n\
 \n\
 --check-hash-based-pycs always|default|never:\n\
     control how Python invalidates hash-based .pyc files\n\
@@ -141,7 +146,10 @@ static const char usage_6[] =
 "   tables mapping extra location information (end line, start column offset \n"
 "   and end column offset) to every instruction in code objects. This is useful \n"
 "   when smaller cothe de objects and pyc files are desired as well as supressing the \n"
-"   extra visual location indicators when the interpreter displays tracebacks.\n";
+"   extra visual location indicators when the interpreter displays tracebacks.\n"
+"PYTHONSPECIALIZATIONSTATS: collect statistics about the specializing adaptive\n"
+"   interpreter, as -X specialization_stats.\n"
+"PYTHONLAZYIMPORTS: load imported modules lazily, as -X lazy_imports.\n";
 
 #if defined(MS_WINDOWS)
 #  define PYTHONHOMEHELP "<prefix>\\python{major}{minor}"
@@ -608,6 +616,8 @@ config_check_consistency(const PyConfig *config)
     assert(config->tracemalloc >= 0);
     assert(config->import_time >= 0);
     assert(config->no_debug_ranges >= 0);
+    assert(config->specialization_stats >= 0);
+    assert(config->lazy_imports >= 0);
     assert(config->show_ref_count >= 0);
     assert(config->dump_refs >= 0);
     assert(config->malloc_stats >= 0);
@@ -896,6 +906,8 @@ _PyConfig_Copy(PyConfig *config, const PyConfig *config2)
     COPY_ATTR(tracemalloc);
     COPY_ATTR(import_time);
     COPY_ATTR(no_debug_ranges);
+    COPY_ATTR(specialization_stats);
+    COPY_ATTR(lazy_imports);
     COPY_ATTR(show_ref_count);
     COPY_ATTR(dump_refs);
     COPY_ATTR(malloc_stats);
@@ -1001,6 +1013,8 @@ _PyConfig_AsDict(const PyConfig *config)
     SET_ITEM_INT(tracemalloc);
     SET_ITEM_INT(import_time);
     SET_ITEM_INT(no_debug_ranges);
+    SET_ITEM_INT(specialization_stats);
+    SET_ITEM_INT(lazy_imports);
     SET_ITEM_INT(show_ref_count);
     SET_ITEM_INT(dump_refs);
     SET_ITEM_INT(malloc_stats);
@@ -1278,6 +1292,8 @@ _PyConfig_FromDict(PyConfig *config, PyObject *dict)
     GET_UINT(tracemalloc);
     GET_UINT(import_time);
     GET_UINT(no_debug_ranges);
+    GET_UINT(specialization_stats);
+    GET_UINT(lazy_imports);
     GET_UINT(show_ref_count);
     GET_UINT(dump_refs);
     GET_UINT(malloc_stats);
@@ -1773,6 +1789,59 @@ config_init_tracemalloc(PyConfig *config)
 }
 
 
+static int
+config_import_time_format(const wchar_t *format)
+{
+    if (wcscmp(format, L"text") == 0) {
+        return 1;
+    }
+    if (wcscmp(format, L"json") == 0) {
+        return 2;
+    }
+    if (wcscmp(format, L"csv") == 0) {
+        return 3;
+    }
+    return -1;
+}
+
+
+static PyStatus
+config_init_import_time(PyConfig *config)
+{
+    const char *env = config_get_env(config, "PYTHONPROFILEIMPORTTIME");
+    if (env) {
+        /* Values other than "json" and "csv" select the text format */
+        if (strcmp(env, "json") == 0) {
+            config->import_time = 2;
+        }
+        else if (strcmp(env, "csv") == 0) {
+            config->import_time = 3;
+        }
+        else {
+            config->import_time = 1;
+        }
+    }
+
+    const wchar_t *xoption = config_get_xoption(config, L"importtime");
+    if (xoption) {
+        const wchar_t *sep = wcschr(xoption, L'=');
+        if (sep) {
+            int format = config_import_time_format(sep + 1);
+            if (format < 0) {
+                return _PyStatus_ERR("-X importtime=FORMAT: format must be "
+                                     "text, json or csv");
+            }
+            config->import_time = format;
+        }
+        else {
+            /* -X importtime behaves as -X importtime=text */
+            config->import_time = 1;
+        }
+    }
+    return _PyStatus_OK();
+}
+
+
 static PyStatus
 config_init_pycache_prefix(PyConfig *config)
 {
@@ -1811,9 +1880,10 @@ config_read_complex_options(PyConfig *config)
             config->faulthandler = 1;
         }
     }
-    if (config_get_env(config, "PYTHONPROFILEIMPORTTIME")
-       || config_get_xoption(config, L"importtime")) {
-        config->import_time = 1;
+    PyStatus status;
+    status = config_init_import_time(config);
+    if (_PyStatus_EXCEPTION(status)) {
+        return status;
     }
 
     if (config_get_env(config, "PYTHONNODEBUGRANGES")
@@ -1821,7 +1891,16 @@ config_read_complex_options(PyConfig *config)
         config->no_debug_ranges = 1;
     }
 
-    PyStatus status;
+    if (config_get_env(config, "PYTHONSPECIALIZATIONSTATS")
+       || config_get_xoption(config, L"specialization_stats")) {
+        config->specialization_stats = 1;
+    }
+
+    if (config_get_env(config, "PYTHONLAZYIMPORTS")
+       || config_get_xoption(config, L"lazy_imports")) {
+        config->lazy_imports = 1;
+    }
+
     if (config->tracemalloc < 0) {
         status = config_init_tracemalloc(config);
         if (_PyStatus_EXCEPTION(status)) {
@@ -3,6 +3,7 @@
 #include "Python.h"
 
 #include "pycore_ceval.h"         // _PyEval_FiniGIL()
+#include "pycore_code.h"          // _Py_SpecializationStatsEnabled
 #include "pycore_context.h"       // _PyContext_Init()
 #include "pycore_fileutils.h"     // _Py_ResetForceASCII()
 #include "pycore_import.h"        // _PyImport_BootstrapImp()
@@ -56,6 +57,7 @@ extern "C" {
 /* Forward declarations */
 static PyStatus add_main_module(PyInterpreterState *interp);
 static PyStatus init_import_site(void);
+static PyStatus init_lazy_imports(void);
 static PyStatus init_set_builtins_open(void);
 static PyStatus init_sys_streams(PyThreadState *tstate);
 static void wait_for_thread_shutdown(PyThreadState *tstate);
@@ -566,6 +568,10 @@ pycore_init_runtime(_PyRuntimeState *runtime,
         return status;
     }
 
+    if (config->specialization_stats) {
+        _Py_SpecializationStatsEnabled = 1;
+    }
+
     /* Py_Finalize leaves _Py_Finalizing set in order to help daemon
      * threads behave a little more gracefully at interpreter shutdown.
      * We clobber it here so the new interpreter can start with a clean
@@ -777,6 +783,19 @@ pycore_init_builtins(PyThreadState *tstate)
     }
     interp->import_func = Py_NewRef(import_func);
 
+    // Builtins recognized by the specializing interpreter
+    PyObject *isinstance = _PyDict_GetItemStringWithError(interp->builtins,
+                                                          "isinstance");
+    if (isinstance == NULL) {
+        goto error;
+    }
+    interp->callable_cache.isinstance = Py_NewRef(isinstance);
+    PyObject *len = _PyDict_GetItemStringWithError(interp->builtins, "len");
+    if (len == NULL) {
+        goto error;
+    }
+    interp->callable_cache.len = Py_NewRef(len);
+
     assert(!_PyErr_Occurred(tstate));
     return _PyStatus_OK();
 
@@ -1152,6 +1171,13 @@ init_interp_main(PyThreadState *tstate)
         }
     }
 
+    if (config->lazy_imports) {
+        status = init_lazy_imports();
+        if (_PyStatus_EXCEPTION(status)) {
+            return status;
+        }
+    }
+
     if (is_main_interp) {
 #ifndef MS_WINDOWS
         emit_stderr_warning_for_legacy_locale(interp->runtime);
@@ -2093,6 +2119,26 @@ init_import_site(void)
     return _PyStatus_OK();
 }
 
+/* Make the modules imported from now on load lazily (-X lazy_imports) */
+
+static PyStatus
+init_lazy_imports(void)
+{
+    _Py_IDENTIFIER(enable_lazy_imports);
+    PyObject *util = PyImport_ImportModule("importlib.util");
+    if (util == NULL) {
+        return _PyStatus_ERR("Failed to import importlib.util");
+    }
+    PyObject *res = _PyObject_CallMethodIdNoArgs(util,
+                                                 &PyId_enable_lazy_imports);
+    Py_DECREF(util);
+    if (res == NULL) {
+        return _PyStatus_ERR("Failed to enable lazy imports");
+    }
+    Py_DECREF(res);
+    return _PyStatus_OK();
+}
+
 /* Check if a file descriptor is valid or not.
    Return 0 if the file descriptor is invalid, return non-zero otherwise. */
 static int
@@ -37,8 +37,108 @@
 */
 
 Py_ssize_t _Py_QuickenedCount = 0;
-#if SPECIALIZATION_STATS
 SpecializationStats _specialization_stats[256] = { 0 };
+int _Py_SpecializationStatsEnabled = SPECIALIZATION_STATS;
+
+/* The families of adaptive instructions, as reported by
+ * sys._getspecializationstats() */
+static const struct {
+    int opcode;
+    const char *name;
+} stats_families[] = {
+    {LOAD_ATTR, "load_attr"},
+    {STORE_ATTR, "store_attr"},
+    {LOAD_METHOD, "load_method"},
+    {LOAD_GLOBAL, "load_global"},
+    {BINARY_ADD, "binary_add"},
+    {INPLACE_ADD, "inplace_add"},
+    {BINARY_MULTIPLY, "binary_multiply"},
+    {BINARY_SUBSCR, "binary_subscr"},
+    {COMPARE_OP, "compare_op"},
+    {CALL_FUNCTION, "call_function"},
+    {CALL_METHOD, "call_method"},
+};
+
+#define ADD_STAT(dict, stats, field) \
+    do { \
+        PyObject *value = PyLong_FromUnsignedLongLong((stats)->field); \
+        if (value == NULL) { \
+            goto error; \
+        } \
+        int err = PyDict_SetItemString((dict), #field, value); \
+        Py_DECREF(value); \
+        if (err < 0) { \
+            goto error; \
+        } \
+    } while (0)
+
+static PyObject *
+stats_to_dict(SpecializationStats *stats)
+{
+    PyObject *res = PyDict_New();
+    if (res == NULL) {
+        return NULL;
+    }
+    ADD_STAT(res, stats, specialization_success);
+    ADD_STAT(res, stats, specialization_failure);
+    ADD_STAT(res, stats, hit);
+    ADD_STAT(res, stats, deferred);
+    ADD_STAT(res, stats, miss);
+    ADD_STAT(res, stats, deopt);
+    ADD_STAT(res, stats, unquickened);
+    return res;
+error:
+    Py_DECREF(res);
+    return NULL;
+}
+
+#undef ADD_STAT
+
+/* Return a dict mapping each family name to a dict of its counters,
+ * or None if statistics are not being collected. */
+PyObject *
+_Py_GetSpecializationStats(void)
+{
+    if (!_Py_SpecializationStatsEnabled) {
+        Py_RETURN_NONE;
+    }
+    PyObject *res = PyDict_New();
+    if (res == NULL) {
+        return NULL;
+    }
+    for (size_t i = 0; i < Py_ARRAY_LENGTH(stats_families); i++) {
+        PyObject *stats = stats_to_dict(
+            &_specialization_stats[stats_families[i].opcode]);
+        if (stats == NULL) {
+            Py_DECREF(res);
+            return NULL;
+        }
+        int err = PyDict_SetItemString(res, stats_families[i].name, stats);
+        Py_DECREF(stats);
+        if (err < 0) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    return res;
+}
+
+void
+_Py_ClearSpecializationStats(void)
+{
+    for (int i = 0; i < 256; i++) {
+        SpecializationStats *stats = &_specialization_stats[i];
+        stats->specialization_success = 0;
+        stats->specialization_failure = 0;
+        stats->hit = 0;
+        stats->deferred = 0;
+        stats->miss = 0;
+        stats->deopt = 0;
+        stats->unquickened = 0;
+    }
+}
+
+#if SPECIALIZATION_STATS
 
 #define PRINT_STAT(name, field) fprintf(stderr, "    %s." #field " : %" PRIu64 "\n", name, stats->field);
 
@@ -76,9 +176,10 @@ void
 _Py_PrintSpecializationStats(void)
 {
     printf("Specialization stats:\n");
-    print_stats(&_specialization_stats[LOAD_ATTR], "load_attr");
-    print_stats(&_specialization_stats[LOAD_GLOBAL], "load_global");
-    print_stats(&_specialization_stats[BINARY_SUBSCR], "binary_subscr");
+    for (size_t i = 0; i < Py_ARRAY_LENGTH(stats_families); i++) {
+        print_stats(&_specialization_stats[stats_families[i].opcode],
+                    stats_families[i].name);
+    }
 }
 
 #if SPECIALIZATION_STATS_DETAILED
@@ -162,15 +263,31 @@ get_cache_count(SpecializedCacheOrInstruction *quickened) {
   Values of zero are ignored. */
 static uint8_t adaptive_opcodes[256] = {
     [LOAD_ATTR] = LOAD_ATTR_ADAPTIVE,
+    [STORE_ATTR] = STORE_ATTR_ADAPTIVE,
+    [LOAD_METHOD] = LOAD_METHOD_ADAPTIVE,
     [LOAD_GLOBAL] = LOAD_GLOBAL_ADAPTIVE,
+    [BINARY_ADD] = BINARY_ADD_ADAPTIVE,
+    [INPLACE_ADD] = INPLACE_ADD_ADAPTIVE,
+    [BINARY_MULTIPLY] = BINARY_MULTIPLY_ADAPTIVE,
     [BINARY_SUBSCR] = BINARY_SUBSCR_ADAPTIVE,
+    [COMPARE_OP] = COMPARE_OP_ADAPTIVE,
+    [CALL_FUNCTION] = CALL_FUNCTION_ADAPTIVE,
+    [CALL_METHOD] = CALL_METHOD_ADAPTIVE,
 };
 
 /* The number of cache entries required for a "family" of instructions. */
 static uint8_t cache_requirements[256] = {
-    [LOAD_ATTR] = 2, /* _PyAdaptiveEntry and _PyLoadAttrCache */
+    [LOAD_ATTR] = 2, /* _PyAdaptiveEntry and _PyAttrCache */
+    [STORE_ATTR] = 2, /* _PyAdaptiveEntry and _PyAttrCache */
+    [LOAD_METHOD] = 3, /* _PyAdaptiveEntry, _PyAttrCache and _PyObjectCache */
     [LOAD_GLOBAL] = 2, /* _PyAdaptiveEntry and _PyLoadGlobalCache */
+    [BINARY_ADD] = 0,
+    [INPLACE_ADD] = 0,
+    [BINARY_MULTIPLY] = 0,
     [BINARY_SUBSCR] = 0,
+    [COMPARE_OP] = 1, /* _PyAdaptiveEntry */
+    [CALL_FUNCTION] = 2, /* _PyAdaptiveEntry and _PyCallCache */
+    [CALL_METHOD] = 2, /* _PyAdaptiveEntry and _PyCallCache */
 };
 
 /* Return the oparg for the cache_offset and instruction index.
@@ -263,6 +380,14 @@ optimize(SpecializedCacheOrInstruction *quickened, int len)
                     _GetSpecializedCacheEntry(instructions, cache0_offset);
                 cache->adaptive.original_oparg = oparg;
                 cache->adaptive.counter = 0;
+                cache->adaptive.index = 0;
+                /* Specializations only set the fields they use: clear the
+                 * others, which _Py_GetSpecializationState() reports. */
+                for (int j = 1; j < entries_needed; j++) {
+                    memset(_GetSpecializedCacheEntry(instructions,
+                                                     cache0_offset + j),
+                           0, sizeof(SpecializedCacheEntry));
+                }
             } else {
                 // oparg is the adaptive cache counter
                 new_oparg = 0;
@@ -313,12 +438,135 @@ _Py_Quicken(PyCodeObject *code) {
     return 0;
 }
 
+/* Return a dict of the fields of the cache entries of a specialized
+ * instruction of the given family, caches pointing to its first entry. */
+static PyObject *
+cache_entries_as_dict(int base_opcode, SpecializedCacheEntry *caches)
+{
+    _PyAdaptiveEntry *cache0 = &caches[0].adaptive;
+    switch (base_opcode) {
+        case LOAD_ATTR:
+        case STORE_ATTR:
+            return Py_BuildValue("{s:i,s:i,s:I,s:I}",
+                "original_oparg", cache0->original_oparg,
+                "index", cache0->index,
+                "tp_version", caches[-1].attr.tp_version,
+                "dk_version_or_hint", caches[-1].attr.dk_version_or_hint);
+        case LOAD_METHOD:
+            return Py_BuildValue("{s:i,s:i,s:I,s:I,s:K}",
+                "original_oparg", cache0->original_oparg,
+                "index", cache0->index,
+                "tp_version", caches[-1].attr.tp_version,
+                "dk_version_or_hint", caches[-1].attr.dk_version_or_hint,
+                "obj", (unsigned long long)(uintptr_t)caches[-2].obj.obj);
+        case LOAD_GLOBAL: {
+            _PyLoadGlobalCache *cache1 = &caches[-1].load_global;
+            return Py_BuildValue("{s:i,s:i,s:I,s:I}",
+                "original_oparg", cache0->original_oparg,
+                "index", cache0->index,
+                "module_keys_version", cache1->module_keys_version,
+                "builtin_keys_version", cache1->builtin_keys_version);
+        }
+        case CALL_FUNCTION:
+        case CALL_METHOD:
+            return Py_BuildValue("{s:i,s:I,s:I}",
+                "original_oparg", cache0->original_oparg,
+                "func_version", caches[-1].call.func_version,
+                "tp_version", caches[-1].call.tp_version);
+        default:
+            return Py_BuildValue("{s:i,s:i}",
+                "original_oparg", cache0->original_oparg,
+                "index", cache0->index);
+    }
+}
+
+/* Return a list of (offset, opcode, counter, cache) tuples describing the
+ * current state of each instruction of an adaptive family in code, and of
+ * each other instruction replaced by quickening, or None if code has not
+ * been quickened yet.  offset is in bytes, as in the dis module.
+ * counter is the adaptive counter, or None for instructions that have no
+ * counter or were left in their generic form, either because no cache could
+ * be allocated for them or because they can never be specialized.
+ * cache is a dict of the fields of the cache entries of a specialized
+ * instruction, or None for instructions that are not specialized or have
+ * no cache entries. */
+PyObject *
+_Py_GetSpecializationState(PyCodeObject *code)
+{
+    if (code->co_quickened == NULL) {
+        Py_RETURN_NONE;
+    }
+    const _Py_CODEUNIT *original = (const _Py_CODEUNIT *)PyBytes_AS_STRING(code->co_code);
+    const _Py_CODEUNIT *instructions = code->co_firstinstr;
+    int instr_count = (int)(PyBytes_GET_SIZE(code->co_code)/sizeof(_Py_CODEUNIT));
+    PyObject *res = PyList_New(0);
+    if (res == NULL) {
+        return NULL;
+    }
+    int previous_opcode = -1;
+    for (int i = 0; i < instr_count; i++) {
+        int base_opcode = _Py_OPCODE(original[i]);
+        int opcode = _Py_OPCODE(instructions[i]);
+        int oparg = _Py_OPARG(instructions[i]);
+        int extended = (previous_opcode == EXTENDED_ARG);
+        previous_opcode = base_opcode;
+        if ((adaptive_opcodes[base_opcode] == 0 || extended) &&
+            opcode == base_opcode) {
+            continue;
+        }
+        PyObject *item;
+        if (opcode == base_opcode || adaptive_opcodes[base_opcode] == 0 ||
+            extended) {
+            item = Py_BuildValue("iiOO", i*(int)sizeof(_Py_CODEUNIT), opcode,
+                                 Py_None, Py_None);
+        }
+        else {
+            int counter;
+            PyObject *cache_dict = Py_None;
+            if (cache_requirements[base_opcode]) {
+                SpecializedCacheEntry *cache =
+                    _GetSpecializedCacheEntryForInstruction(instructions, i+1, oparg);
+                counter = cache->adaptive.counter;
+                if (opcode != adaptive_opcodes[base_opcode]) {
+                    cache_dict = cache_entries_as_dict(base_opcode, cache);
+                    if (cache_dict == NULL) {
+                        Py_DECREF(res);
+                        return NULL;
+                    }
+                }
+                else {
+                    Py_INCREF(cache_dict);
+                }
+            }
+            else {
+                // oparg is the adaptive cache counter
+                counter = oparg;
+                Py_INCREF(cache_dict);
+            }
+            item = Py_BuildValue("iiiN", i*(int)sizeof(_Py_CODEUNIT), opcode,
+                                 counter, cache_dict);
+        }
+        if (item == NULL) {
+            Py_DECREF(res);
+            return NULL;
+        }
+        int err = PyList_Append(res, item);
+        Py_DECREF(item);
+        if (err < 0) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    return res;
+}
+
 
 
 static int
 specialize_module_load_attr(
     PyObject *owner, _Py_CODEUNIT *instr, PyObject *name,
-    _PyAdaptiveEntry *cache0, _PyLoadAttrCache *cache1)
+    _PyAdaptiveEntry *cache0, _PyAttrCache *cache1, int opcode,
+    int opcode_module)
 {
     PyModuleObject *m = (PyModuleObject *)owner;
     PyObject *value = NULL;
@@ -326,39 +574,39 @@ specialize_module_load_attr(
     _Py_IDENTIFIER(__getattr__);
     PyDictObject *dict = (PyDictObject *)m->md_dict;
     if (dict == NULL) {
-        SPECIALIZATION_FAIL(LOAD_ATTR, Py_TYPE(owner), name, "no __dict__");
+        SPECIALIZATION_FAIL(opcode, Py_TYPE(owner), name, "no __dict__");
         return -1;
     }
     if (dict->ma_keys->dk_kind != DICT_KEYS_UNICODE) {
-        SPECIALIZATION_FAIL(LOAD_ATTR, Py_TYPE(owner), name, "non-string keys (or split)");
+        SPECIALIZATION_FAIL(opcode, Py_TYPE(owner), name, "non-string keys (or split)");
         return -1;
     }
     getattr = _PyUnicode_FromId(&PyId___getattr__); /* borrowed */
     if (getattr == NULL) {
-        SPECIALIZATION_FAIL(LOAD_ATTR, Py_TYPE(owner), name, "module.__getattr__ overridden");
+        SPECIALIZATION_FAIL(opcode, Py_TYPE(owner), name, "module.__getattr__ overridden");
         PyErr_Clear();
         return -1;
     }
     Py_ssize_t index = _PyDict_GetItemHint(dict, getattr, -1,  &value);
     assert(index != DKIX_ERROR);
     if (index != DKIX_EMPTY) {
-        SPECIALIZATION_FAIL(LOAD_ATTR, Py_TYPE(owner), name, "module attribute not found");
+        SPECIALIZATION_FAIL(opcode, Py_TYPE(owner), name, "module attribute not found");
         return -1;
     }
     index = _PyDict_GetItemHint(dict, name, -1, &value);
     assert (index != DKIX_ERROR);
     if (index != (uint16_t)index) {
-        SPECIALIZATION_FAIL(LOAD_ATTR, Py_TYPE(owner), name, "index out of range");
+        SPECIALIZATION_FAIL(opcode, Py_TYPE(owner), name, "index out of range");
         return -1;
     }
     uint32_t keys_version = _PyDictKeys_GetVersionForCurrentState(dict);
     if (keys_version == 0) {
-        SPECIALIZATION_FAIL(LOAD_ATTR, Py_TYPE(owner), name, "no more key versions");
+        SPECIALIZATION_FAIL(opcode, Py_TYPE(owner), name, "no more key versions");
         return -1;
     }
     cache1->dk_version_or_hint = keys_version;
     cache0->index = (uint16_t)index;
-    *instr = _Py_MAKECODEUNIT(LOAD_ATTR_MODULE, _Py_OPARG(*instr));
+    *instr = _Py_MAKECODEUNIT(opcode_module, _Py_OPARG(*instr));
     return 0;
 }
 
@@ -377,15 +625,23 @@ typedef enum {
     MUTABLE,   /* Instance of a mutable class; might, or might not, be a descriptor */
     ABSENT, /* Attribute is not present on the class */
     DUNDER_CLASS, /* __class__ attribute */
-    GETATTRIBUTE_OVERRIDDEN /* __getattribute__ has been overridden */
+    GETSET_OVERRIDDEN /* __getattribute__ or __setattr__ has been overridden */
 } DesciptorClassification;
 
 static DesciptorClassification
-analyze_descriptor(PyTypeObject *type, PyObject *name, PyObject **descr)
+analyze_descriptor(PyTypeObject *type, PyObject *name, PyObject **descr, int store)
 {
-    if (type->tp_getattro != PyObject_GenericGetAttr) {
-        *descr = NULL;
-        return GETATTRIBUTE_OVERRIDDEN;
+    if (store) {
+        if (type->tp_setattro != PyObject_GenericSetAttr) {
+            *descr = NULL;
+            return GETSET_OVERRIDDEN;
+        }
+    }
+    else {
+        if (type->tp_getattro != PyObject_GenericGetAttr) {
+            *descr = NULL;
+            return GETSET_OVERRIDDEN;
+        }
     }
     PyObject *descriptor = _PyType_Lookup(type, name);
     *descr = descriptor;
@@ -424,13 +680,83 @@ analyze_descriptor(PyTypeObject *type, PyObject *name, PyObject **descr)
     return NON_DESCRIPTOR;
 }
 
+/* Specialize access to the instance dictionary, for LOAD_ATTR and STORE_ATTR.
+ * Returns 1 if specialized, 0 if not, -1 on error. */
+static int
+specialize_dict_access(
+    PyObject *owner, _Py_CODEUNIT *instr, PyTypeObject *type,
+    DesciptorClassification kind, PyObject *name,
+    _PyAdaptiveEntry *cache0, _PyAttrCache *cache1,
+    int base_op, int split_op, int hint_op)
+{
+    assert(kind == NON_OVERRIDING || kind == NON_DESCRIPTOR || kind == ABSENT);
+    // No descriptor, or non overriding.
+    if (type->tp_dictoffset < 0) {
+        SPECIALIZATION_FAIL(base_op, type, name, "negative offset");
+        return 0;
+    }
+    if (type->tp_dictoffset == 0) {
+        SPECIALIZATION_FAIL(base_op, type, name, "no dict");
+        return 0;
+    }
+    PyObject **dictptr = (PyObject **) ((char *)owner + type->tp_dictoffset);
+    if (*dictptr == NULL || !PyDict_CheckExact(*dictptr)) {
+        SPECIALIZATION_FAIL(base_op, type, name, "no dict or not a dict");
+        return 0;
+    }
+    // We found an instance with a __dict__.
+    PyDictObject *dict = (PyDictObject *)*dictptr;
+    if ((type->tp_flags & Py_TPFLAGS_HEAPTYPE)
+        && dict->ma_keys == ((PyHeapTypeObject*)type)->ht_cached_keys
+    ) {
+        // Keys are shared
+        assert(PyUnicode_CheckExact(name));
+        Py_hash_t hash = PyObject_Hash(name);
+        if (hash == -1) {
+            return -1;
+        }
+        PyObject *value;
+        Py_ssize_t index = _Py_dict_lookup(dict, name, hash, &value);
+        assert (index != DKIX_ERROR);
+        if (index != (uint16_t)index) {
+            SPECIALIZATION_FAIL(base_op, type, name,
+                                index < 0 ? "attribute not in dict" : "index out of range");
+            return 0;
+        }
+        uint32_t keys_version = _PyDictKeys_GetVersionForCurrentState(dict);
+        if (keys_version == 0) {
+            SPECIALIZATION_FAIL(base_op, type, name, "no more key versions");
+            return 0;
+        }
+        cache1->dk_version_or_hint = keys_version;
+        cache1->tp_version = type->tp_version_tag;
+        cache0->index = (uint16_t)index;
+        *instr = _Py_MAKECODEUNIT(split_op, _Py_OPARG(*instr));
+        return 1;
+    }
+    else {
+        PyObject *value = NULL;
+        Py_ssize_t hint =
+            _PyDict_GetItemHint(dict, name, -1, &value);
+        if (hint != (uint32_t)hint) {
+            SPECIALIZATION_FAIL(base_op, type, name, "hint out of range");
+            return 0;
+        }
+        cache1->dk_version_or_hint = (uint32_t)hint;
+        cache1->tp_version = type->tp_version_tag;
+        *instr = _Py_MAKECODEUNIT(hint_op, _Py_OPARG(*instr));
+        return 1;
+    }
+}
+
 int
 _Py_Specialize_LoadAttr(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, SpecializedCacheEntry *cache)
 {
     _PyAdaptiveEntry *cache0 = &cache->adaptive;
-    _PyLoadAttrCache *cache1 = &cache[-1].load_attr;
+    _PyAttrCache *cache1 = &cache[-1].attr;
     if (PyModule_CheckExact(owner)) {
-        int err = specialize_module_load_attr(owner, instr, name, cache0, cache1);
+        int err = specialize_module_load_attr(owner, instr, name, cache0, cache1,
+                                             LOAD_ATTR, LOAD_ATTR_MODULE);
         if (err) {
             goto fail;
         }
@@ -443,7 +769,7 @@ _Py_Specialize_LoadAttr(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, Sp
         }
     }
     PyObject *descr;
-    DesciptorClassification kind = analyze_descriptor(type, name, &descr);
+    DesciptorClassification kind = analyze_descriptor(type, name, &descr, 0);
     switch(kind) {
         case OVERRIDING:
             SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "overriding descriptor");
@@ -485,7 +811,7 @@ _Py_Specialize_LoadAttr(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, Sp
         case MUTABLE:
             SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "mutable class attribute");
             goto fail;
-        case GETATTRIBUTE_OVERRIDDEN:
+        case GETSET_OVERRIDDEN:
             SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "__getattribute__ overridden");
             goto fail;
         case NON_OVERRIDING:
@@ -494,84 +820,203 @@ _Py_Specialize_LoadAttr(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, Sp
             break;
     }
     assert(kind == NON_OVERRIDING || kind == NON_DESCRIPTOR || kind == ABSENT);
-    // No desciptor, or non overriding.
-    if (type->tp_dictoffset < 0) {
-        SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "negative offset");
+    if (type->tp_dictoffset == 0) {
+        /* No attribute in instance dictionary */
+        switch(kind) {
+            case NON_OVERRIDING:
+                SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "non-overriding descriptor");
+                goto fail;
+            case NON_DESCRIPTOR:
+                /* To do -- Optimize this case */
+                SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "non descriptor");
+                goto fail;
+            case ABSENT:
+                SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "no attribute");
+                goto fail;
+            default:
+                Py_UNREACHABLE();
+        }
+    }
+    int err = specialize_dict_access(
+        owner, instr, type, kind, name, cache0, cache1,
+        LOAD_ATTR, LOAD_ATTR_SPLIT_KEYS, LOAD_ATTR_WITH_HINT
+    );
+    if (err < 0) {
+        return -1;
+    }
+    if (err) {
+        goto success;
+    }
+fail:
+    STAT_INC(LOAD_ATTR, specialization_failure);
+    assert(!PyErr_Occurred());
+    cache_backoff(cache0);
+    return 0;
+success:
+    STAT_INC(LOAD_ATTR, specialization_success);
+    assert(!PyErr_Occurred());
+    cache0->counter = saturating_start();
+    return 0;
+}
+
+int
+_Py_Specialize_StoreAttr(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, SpecializedCacheEntry *cache)
+{
+    _PyAdaptiveEntry *cache0 = &cache->adaptive;
+    _PyAttrCache *cache1 = &cache[-1].attr;
+    PyTypeObject *type = Py_TYPE(owner);
+    if (PyModule_CheckExact(owner)) {
+        SPECIALIZATION_FAIL(STORE_ATTR, type, name, "module attribute");
         goto fail;
     }
-    if (type->tp_dictoffset > 0) {
-        PyObject **dictptr = (PyObject **) ((char *)owner + type->tp_dictoffset);
-        if (*dictptr == NULL || !PyDict_CheckExact(*dictptr)) {
-            SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "no dict or not a dict");
-            goto fail;
+    if (type->tp_dict == NULL) {
+        if (PyType_Ready(type) < 0) {
+            return -1;
         }
-        // We found an instance with a __dict__.
-        PyDictObject *dict = (PyDictObject *)*dictptr;
-        if ((type->tp_flags & Py_TPFLAGS_HEAPTYPE)
-            && dict->ma_keys == ((PyHeapTypeObject*)type)->ht_cached_keys
-        ) {
-            // Keys are shared
-            assert(PyUnicode_CheckExact(name));
-            Py_hash_t hash = PyObject_Hash(name);
-            if (hash == -1) {
-                return -1;
-            }
-            PyObject *value;
-            Py_ssize_t index = _Py_dict_lookup(dict, name, hash, &value);
-            assert (index != DKIX_ERROR);
-            if (index != (uint16_t)index) {
-                SPECIALIZATION_FAIL(LOAD_ATTR, type, name,
-                                    index < 0 ? "attribute not in dict" : "index out of range");
-                goto fail;
-            }
-            uint32_t keys_version = _PyDictKeys_GetVersionForCurrentState(dict);
-            if (keys_version == 0) {
-                SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "no more key versions");
+    }
+    PyObject *descr;
+    DesciptorClassification kind = analyze_descriptor(type, name, &descr, 1);
+    switch(kind) {
+        case OVERRIDING:
+            SPECIALIZATION_FAIL(STORE_ATTR, type, name, "overriding descriptor");
+            goto fail;
+        case METHOD:
+            SPECIALIZATION_FAIL(STORE_ATTR, type, name, "method");
+            goto fail;
+        case PROPERTY:
+            SPECIALIZATION_FAIL(STORE_ATTR, type, name, "property");
+            goto fail;
+        case OBJECT_SLOT:
+        {
+            PyMemberDescrObject *member = (PyMemberDescrObject *)descr;
+            struct PyMemberDef *dmem = member->d_member;
+            Py_ssize_t offset = dmem->offset;
+            if (dmem->flags & READONLY) {
+                SPECIALIZATION_FAIL(STORE_ATTR, type, name, "read-only slot");
                 goto fail;
             }
-            cache1->dk_version_or_hint = keys_version;
-            cache1->tp_version = type->tp_version_tag;
-            cache0->index = (uint16_t)index;
-            *instr = _Py_MAKECODEUNIT(LOAD_ATTR_SPLIT_KEYS, _Py_OPARG(*instr));
-            goto success;
-        }
-        else {
-            PyObject *value = NULL;
-            Py_ssize_t hint =
-                _PyDict_GetItemHint(dict, name, -1, &value);
-            if (hint != (uint32_t)hint) {
-                SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "hint out of range");
+            if (offset != (uint16_t)offset) {
+                SPECIALIZATION_FAIL(STORE_ATTR, type, name, "offset out of range");
                 goto fail;
             }
-            cache1->dk_version_or_hint = (uint32_t)hint;
+            assert(dmem->type == T_OBJECT_EX);
+            assert(offset > 0);
+            cache0->index = (uint16_t)offset;
             cache1->tp_version = type->tp_version_tag;
-            *instr = _Py_MAKECODEUNIT(LOAD_ATTR_WITH_HINT, _Py_OPARG(*instr));
+            *instr = _Py_MAKECODEUNIT(STORE_ATTR_SLOT, _Py_OPARG(*instr));
             goto success;
         }
-    }
-    assert(type->tp_dictoffset == 0);
-    /* No attribute in instance dictionary */
-    switch(kind) {
-        case NON_OVERRIDING:
-            SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "non-overriding descriptor");
+        case DUNDER_CLASS:
+        case OTHER_SLOT:
+            SPECIALIZATION_FAIL(STORE_ATTR, type, name, "non-object slot");
             goto fail;
-        case NON_DESCRIPTOR:
-            /* To do -- Optimize this case */
-            SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "non descriptor");
+        case MUTABLE:
+            SPECIALIZATION_FAIL(STORE_ATTR, type, name, "mutable class attribute");
+            goto fail;
+        case GETSET_OVERRIDDEN:
+            SPECIALIZATION_FAIL(STORE_ATTR, type, name, "__setattr__ overridden");
             goto fail;
+        case NON_OVERRIDING:
+        case NON_DESCRIPTOR:
         case ABSENT:
-            SPECIALIZATION_FAIL(LOAD_ATTR, type, name, "no attribute");
+            break;
+    }
+    int err = specialize_dict_access(
+        owner, instr, type, kind, name, cache0, cache1,
+        STORE_ATTR, STORE_ATTR_SPLIT_KEYS, STORE_ATTR_WITH_HINT
+    );
+    if (err < 0) {
+        return -1;
+    }
+    if (err) {
+        goto success;
+    }
+fail:
+    STAT_INC(STORE_ATTR, specialization_failure);
+    assert(!PyErr_Occurred());
+    cache_backoff(cache0);
+    return 0;
+success:
+    STAT_INC(STORE_ATTR, specialization_success);
+    assert(!PyErr_Occurred());
+    cache0->counter = saturating_start();
+    return 0;
+}
+
+int
+_Py_Specialize_LoadMethod(PyObject *owner, _Py_CODEUNIT *instr, PyObject *name, SpecializedCacheEntry *cache)
+{
+    _PyAdaptiveEntry *cache0 = &cache->adaptive;
+    _PyAttrCache *cache1 = &cache[-1].attr;
+    _PyObjectCache *cache2 = &cache[-2].obj;
+    PyTypeObject *type = Py_TYPE(owner);
+    if (PyModule_CheckExact(owner)) {
+        int err = specialize_module_load_attr(owner, instr, name, cache0, cache1,
+                                             LOAD_METHOD, LOAD_METHOD_MODULE);
+        if (err) {
             goto fail;
-        default:
-            Py_UNREACHABLE();
+        }
+        goto success;
+    }
+    if (type->tp_dict == NULL) {
+        if (PyType_Ready(type) < 0) {
+            return -1;
+        }
+    }
+    PyObject *descr;
+    DesciptorClassification kind = analyze_descriptor(type, name, &descr, 0);
+    if (kind != METHOD) {
+        SPECIALIZATION_FAIL(LOAD_METHOD, type, name, "not a method");
+        goto fail;
+    }
+    /* The type version guards the identity of the method,
+     * so the cache can hold a borrowed reference to it. */
+    if (!(type->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG)) {
+        SPECIALIZATION_FAIL(LOAD_METHOD, type, name, "no type version");
+        goto fail;
+    }
+    if (type->tp_dictoffset < 0) {
+        SPECIALIZATION_FAIL(LOAD_METHOD, type, name, "negative offset");
+        goto fail;
+    }
+    if (type->tp_dictoffset == 0) {
+        cache1->tp_version = type->tp_version_tag;
+        cache2->obj = descr;
+        *instr = _Py_MAKECODEUNIT(LOAD_METHOD_NO_DICT, _Py_OPARG(*instr));
+        goto success;
+    }
+    PyObject **dictptr = (PyObject **) ((char *)owner + type->tp_dictoffset);
+    if (*dictptr == NULL || !PyDict_CheckExact(*dictptr)) {
+        SPECIALIZATION_FAIL(LOAD_METHOD, type, name, "no dict or not a dict");
+        goto fail;
     }
+    /* The keys version guarantees that the method is not shadowed
+     * by an instance attribute. */
+    PyDictObject *dict = (PyDictObject *)*dictptr;
+    PyObject *value = NULL;
+    Py_ssize_t index = _PyDict_GetItemHint(dict, name, -1, &value);
+    assert(index != DKIX_ERROR);
+    if (index != DKIX_EMPTY) {
+        SPECIALIZATION_FAIL(LOAD_METHOD, type, name, "shadowed by instance attribute");
+        goto fail;
+    }
+    uint32_t keys_version = _PyDictKeys_GetVersionForCurrentState(dict);
+    if (keys_version == 0) {
+        SPECIALIZATION_FAIL(LOAD_METHOD, type, name, "no more key versions");
+        goto fail;
+    }
+    cache1->tp_version = type->tp_version_tag;
+    cache1->dk_version_or_hint = keys_version;
+    cache2->obj = descr;
+    *instr = _Py_MAKECODEUNIT(LOAD_METHOD_CACHED, _Py_OPARG(*instr));
+    goto success;
 fail:
-    STAT_INC(LOAD_ATTR, specialization_failure);
+    STAT_INC(LOAD_METHOD, specialization_failure);
     assert(!PyErr_Occurred());
     cache_backoff(cache0);
     return 0;
 success:
-    STAT_INC(LOAD_ATTR, specialization_success);
+    STAT_INC(LOAD_METHOD, specialization_success);
     assert(!PyErr_Occurred());
     cache0->counter = saturating_start();
     return 0;
@@ -683,3 +1128,363 @@ _Py_Specialize_BinarySubscr(
     return 0;
 }
 
+
+
+/* Arithmetic and comparison specialization */
+
+static int
+specialize_add(PyObject *left, PyObject *right, _Py_CODEUNIT *instr,
+               int base_op, int int_op, int float_op, int unicode_op)
+{
+    if (!Py_IS_TYPE(left, Py_TYPE(right))) {
+        SPECIALIZATION_FAIL(base_op, Py_TYPE(left), Py_None, "different types");
+        goto fail;
+    }
+    if (PyLong_CheckExact(left)) {
+        *instr = _Py_MAKECODEUNIT(int_op, saturating_start());
+        goto success;
+    }
+    if (PyFloat_CheckExact(left)) {
+        *instr = _Py_MAKECODEUNIT(float_op, saturating_start());
+        goto success;
+    }
+    if (PyUnicode_CheckExact(left)) {
+        *instr = _Py_MAKECODEUNIT(unicode_op, saturating_start());
+        goto success;
+    }
+    SPECIALIZATION_FAIL(base_op, Py_TYPE(left), Py_None, "not int|float|str");
+fail:
+    STAT_INC(base_op, specialization_failure);
+    assert(!PyErr_Occurred());
+    *instr = _Py_MAKECODEUNIT(_Py_OPCODE(*instr), ADAPTIVE_CACHE_BACKOFF);
+    return 0;
+success:
+    STAT_INC(base_op, specialization_success);
+    assert(!PyErr_Occurred());
+    return 0;
+}
+
+int
+_Py_Specialize_BinaryAdd(PyObject *left, PyObject *right, _Py_CODEUNIT *instr)
+{
+    return specialize_add(left, right, instr, BINARY_ADD,
+                          BINARY_ADD_INT, BINARY_ADD_FLOAT,
+                          BINARY_ADD_UNICODE);
+}
+
+int
+_Py_Specialize_InplaceAdd(PyObject *left, PyObject *right, _Py_CODEUNIT *instr)
+{
+    return specialize_add(left, right, instr, INPLACE_ADD,
+                          INPLACE_ADD_INT, INPLACE_ADD_FLOAT,
+                          INPLACE_ADD_UNICODE);
+}
+
+int
+_Py_Specialize_BinaryMultiply(PyObject *left, PyObject *right, _Py_CODEUNIT *instr)
+{
+    if (!Py_IS_TYPE(left, Py_TYPE(right))) {
+        SPECIALIZATION_FAIL(BINARY_MULTIPLY, Py_TYPE(left), Py_None, "different types");
+        goto fail;
+    }
+    if (PyLong_CheckExact(left)) {
+        *instr = _Py_MAKECODEUNIT(BINARY_MULTIPLY_INT, saturating_start());
+        goto success;
+    }
+    if (PyFloat_CheckExact(left)) {
+        *instr = _Py_MAKECODEUNIT(BINARY_MULTIPLY_FLOAT, saturating_start());
+        goto success;
+    }
+    SPECIALIZATION_FAIL(BINARY_MULTIPLY, Py_TYPE(left), Py_None, "not int|float");
+fail:
+    STAT_INC(BINARY_MULTIPLY, specialization_failure);
+    assert(!PyErr_Occurred());
+    *instr = _Py_MAKECODEUNIT(_Py_OPCODE(*instr), ADAPTIVE_CACHE_BACKOFF);
+    return 0;
+success:
+    STAT_INC(BINARY_MULTIPLY, specialization_success);
+    assert(!PyErr_Occurred());
+    return 0;
+}
+
+/* Map from rich comparison operator to the outcomes for which it is true.
+ * The specialized form stores the mask of outcomes for which the fused
+ * jump is taken, which is the inverse for POP_JUMP_IF_FALSE. */
+static const uint8_t compare_masks[] = {
+    [Py_LT] = COMPARE_LT,
+    [Py_LE] = COMPARE_LT | COMPARE_EQ,
+    [Py_EQ] = COMPARE_EQ,
+    [Py_NE] = COMPARE_LT | COMPARE_GT | COMPARE_UNORDERED,
+    [Py_GT] = COMPARE_GT,
+    [Py_GE] = COMPARE_GT | COMPARE_EQ,
+};
+
+int
+_Py_Specialize_CompareOp(PyObject *left, PyObject *right,
+                         _Py_CODEUNIT *instr, SpecializedCacheEntry *cache)
+{
+    _PyAdaptiveEntry *cache0 = &cache->adaptive;
+    int op = cache0->original_oparg;
+    assert(op <= Py_GE);
+    int next_opcode = _Py_OPCODE(instr[1]);
+    if (next_opcode != POP_JUMP_IF_FALSE && next_opcode != POP_JUMP_IF_TRUE) {
+        /* This can never be combined with a jump, so stop being adaptive. */
+        SPECIALIZATION_FAIL(COMPARE_OP, Py_TYPE(left), Py_None, "not followed by conditional jump");
+        STAT_INC(COMPARE_OP, specialization_failure);
+        *instr = _Py_MAKECODEUNIT(COMPARE_OP, op);
+        return 0;
+    }
+    int when_to_jump_mask = compare_masks[op];
+    if (next_opcode == POP_JUMP_IF_FALSE) {
+        when_to_jump_mask ^= COMPARE_LT | COMPARE_EQ | COMPARE_GT | COMPARE_UNORDERED;
+    }
+    if (!Py_IS_TYPE(left, Py_TYPE(right))) {
+        SPECIALIZATION_FAIL(COMPARE_OP, Py_TYPE(left), Py_None, "different types");
+        goto fail;
+    }
+    if (PyLong_CheckExact(left)) {
+        if (Py_ABS(Py_SIZE(left)) > 1 || Py_ABS(Py_SIZE(right)) > 1) {
+            SPECIALIZATION_FAIL(COMPARE_OP, Py_TYPE(left), Py_None, "big int");
+            goto fail;
+        }
+        *instr = _Py_MAKECODEUNIT(COMPARE_OP_INT_JUMP, _Py_OPARG(*instr));
+        cache0->index = when_to_jump_mask;
+        goto success;
+    }
+    if (PyFloat_CheckExact(left)) {
+        *instr = _Py_MAKECODEUNIT(COMPARE_OP_FLOAT_JUMP, _Py_OPARG(*instr));
+        cache0->index = when_to_jump_mask;
+        goto success;
+    }
+    if (PyUnicode_CheckExact(left)) {
+        if (op != Py_EQ && op != Py_NE) {
+            SPECIALIZATION_FAIL(COMPARE_OP, Py_TYPE(left), Py_None, "str ordering");
+            goto fail;
+        }
+        *instr = _Py_MAKECODEUNIT(COMPARE_OP_STR_JUMP, _Py_OPARG(*instr));
+        cache0->index = when_to_jump_mask;
+        goto success;
+    }
+    SPECIALIZATION_FAIL(COMPARE_OP, Py_TYPE(left), Py_None, "not int|float|str");
+fail:
+    STAT_INC(COMPARE_OP, specialization_failure);
+    assert(!PyErr_Occurred());
+    cache_backoff(cache0);
+    return 0;
+success:
+    STAT_INC(COMPARE_OP, specialization_success);
+    assert(!PyErr_Occurred());
+    cache0->counter = saturating_start();
+    return 0;
+}
+
+
+/* Call specialization */
+
+static int
+specialize_py_call(
+    PyFunctionObject *func, int nargs,
+    _PyCallCache *cache1, const char **fail_kind)
+{
+    PyCodeObject *code = (PyCodeObject *)func->func_code;
+    int flags = code->co_flags;
+    if ((flags & CO_OPTIMIZED) == 0) {
+        *fail_kind = "not optimized";
+        return -1;
+    }
+    if (flags & (CO_VARARGS | CO_VARKEYWORDS)) {
+        *fail_kind = "complex parameters";
+        return -1;
+    }
+    if (code->co_kwonlyargcount) {
+        *fail_kind = "keyword only args";
+        return -1;
+    }
+    if (flags & (CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR)) {
+        *fail_kind = "generator or coroutine";
+        return -1;
+    }
+    if (code->co_argcount != nargs) {
+        *fail_kind = "wrong number of arguments";
+        return -1;
+    }
+    uint32_t version = _PyFunction_GetVersionForCurrentState(func);
+    if (version == 0) {
+        *fail_kind = "no more function versions";
+        return -1;
+    }
+    cache1->func_version = version;
+    return 0;
+}
+
+static int
+specialize_type_call(
+    PyTypeObject *type, int nargs, _PyCallCache *cache1,
+    const char **fail_kind)
+{
+    _Py_IDENTIFIER(__init__);
+    if (Py_TYPE(type) != &PyType_Type) {
+        *fail_kind = "metaclass";
+        return -1;
+    }
+    if (!(type->tp_flags & Py_TPFLAGS_HEAPTYPE) ||
+        (type->tp_flags & Py_TPFLAGS_IS_ABSTRACT))
+    {
+        *fail_kind = "not a heap type, or abstract";
+        return -1;
+    }
+    if (type->tp_new != PyBaseObject_Type.tp_new ||
+        type->tp_alloc != PyType_GenericAlloc)
+    {
+        *fail_kind = "__new__ overridden";
+        return -1;
+    }
+    PyObject *init = _PyType_LookupId(type, &PyId___init__);
+    if (init == NULL || !PyFunction_Check(init)) {
+        *fail_kind = "__init__ not a Python function";
+        return -1;
+    }
+    if (!(type->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG)) {
+        *fail_kind = "no type version";
+        return -1;
+    }
+    /* The type version guards the identity of __init__, the function
+     * version guards its code and defaults. */
+    if (specialize_py_call((PyFunctionObject *)init, nargs + 1,
+                           cache1, fail_kind)) {
+        return -1;
+    }
+    cache1->tp_version = type->tp_version_tag;
+    return 0;
+}
+
+static int
+builtin_call_opcode(PyObject *callable, int nargs, int base_opcode)
+{
+    int flags = PyCFunction_GET_FLAGS(callable);
+    if (flags == METH_O && nargs == 1) {
+        return base_opcode == CALL_FUNCTION ?
+            CALL_FUNCTION_BUILTIN_O : CALL_METHOD_BUILTIN_O;
+    }
+    if (flags == METH_FASTCALL) {
+        return base_opcode == CALL_FUNCTION ?
+            CALL_FUNCTION_BUILTIN_FAST : CALL_METHOD_BUILTIN_FAST;
+    }
+    return -1;
+}
+
+int
+_Py_Specialize_CallFunction(
+    PyObject *callable, int nargs,
+    _Py_CODEUNIT *instr, SpecializedCacheEntry *cache)
+{
+    _PyAdaptiveEntry *cache0 = &cache->adaptive;
+    _PyCallCache *cache1 = &cache[-1].call;
+    const char *fail_kind = "other callable";
+    if (PyFunction_Check(callable)) {
+        if (specialize_py_call((PyFunctionObject *)callable, nargs,
+                               cache1, &fail_kind)) {
+            goto fail;
+        }
+        *instr = _Py_MAKECODEUNIT(CALL_FUNCTION_PY_EXACT_ARGS, _Py_OPARG(*instr));
+        goto success;
+    }
+    if (PyCFunction_CheckExact(callable)) {
+        PyInterpreterState *interp = _PyInterpreterState_GET();
+        if (callable == interp->callable_cache.len && nargs == 1) {
+            *instr = _Py_MAKECODEUNIT(CALL_FUNCTION_LEN, _Py_OPARG(*instr));
+            goto success;
+        }
+        if (callable == interp->callable_cache.isinstance && nargs == 2) {
+            *instr = _Py_MAKECODEUNIT(CALL_FUNCTION_ISINSTANCE, _Py_OPARG(*instr));
+            goto success;
+        }
+        int opcode = builtin_call_opcode(callable, nargs, CALL_FUNCTION);
+        if (opcode < 0) {
+            fail_kind = "builtin with unsupported calling convention";
+            goto fail;
+        }
+        *instr = _Py_MAKECODEUNIT(opcode, _Py_OPARG(*instr));
+        goto success;
+    }
+    if (PyType_Check(callable)) {
+        if (specialize_type_call((PyTypeObject *)callable, nargs, cache1,
+                                 &fail_kind)) {
+            goto fail;
+        }
+        *instr = _Py_MAKECODEUNIT(CALL_FUNCTION_TYPE_PY_INIT, _Py_OPARG(*instr));
+        goto success;
+    }
+fail:
+    SPECIALIZATION_FAIL(CALL_FUNCTION, Py_TYPE(callable), Py_None, fail_kind);
+    STAT_INC(CALL_FUNCTION, specialization_failure);
+    assert(!PyErr_Occurred());
+    cache_backoff(cache0);
+    return 0;
+success:
+    STAT_INC(CALL_FUNCTION, specialization_success);
+    assert(!PyErr_Occurred());
+    cache0->counter = saturating_start();
+    return 0;
+}
+
+/* self is NULL if LOAD_METHOD did not find a method,
+ * otherwise it is the first of the nargs arguments. */
+int
+_Py_Specialize_CallMethod(
+    PyObject *callable, PyObject *self, int nargs,
+    _Py_CODEUNIT *instr, SpecializedCacheEntry *cache)
+{
+    _PyAdaptiveEntry *cache0 = &cache->adaptive;
+    _PyCallCache *cache1 = &cache[-1].call;
+    const char *fail_kind = "other callable";
+    if (PyFunction_Check(callable)) {
+        if (specialize_py_call((PyFunctionObject *)callable, nargs,
+                               cache1, &fail_kind)) {
+            goto fail;
+        }
+        *instr = _Py_MAKECODEUNIT(CALL_METHOD_PY_EXACT_ARGS, _Py_OPARG(*instr));
+        goto success;
+    }
+    if (PyCFunction_CheckExact(callable) && self == NULL) {
+        int opcode = builtin_call_opcode(callable, nargs, CALL_METHOD);
+        if (opcode < 0) {
+            fail_kind = "builtin with unsupported calling convention";
+            goto fail;
+        }
+        *instr = _Py_MAKECODEUNIT(opcode, _Py_OPARG(*instr));
+        goto success;
+    }
+    if (Py_IS_TYPE(callable, &PyMethodDescr_Type) && self != NULL) {
+        PyMethodDescrObject *descr = (PyMethodDescrObject *)callable;
+        if (!Py_IS_TYPE(self, descr->d_common.d_type)) {
+            fail_kind = "method descriptor of a base class";
+            goto fail;
+        }
+        switch (descr->d_method->ml_flags) {
+            case METH_O:
+                if (nargs != 2) {
+                    fail_kind = "wrong number of arguments";
+                    goto fail;
+                }
+                *instr = _Py_MAKECODEUNIT(CALL_METHOD_DESCRIPTOR_O, _Py_OPARG(*instr));
+                goto success;
+            case METH_FASTCALL:
+                *instr = _Py_MAKECODEUNIT(CALL_METHOD_DESCRIPTOR_FAST, _Py_OPARG(*instr));
+                goto success;
+        }
+        fail_kind = "method descriptor with unsupported calling convention";
+        goto fail;
+    }
+fail:
+    SPECIALIZATION_FAIL(CALL_METHOD, Py_TYPE(callable), Py_None, fail_kind);
+    STAT_INC(CALL_METHOD, specialization_failure);
+    assert(!PyErr_Occurred());
+    cache_backoff(cache0);
+    return 0;
+success:
+    STAT_INC(CALL_METHOD, specialization_success);
+    assert(!PyErr_Occurred());
+    cache0->counter = saturating_start();
+    return 0;
+}
@@ -1120,6 +1120,62 @@ sys_getprofile_impl(PyObject *module)
 }
 
 
+/*[clinic input]
+sys.setimportprofile
+
+    function: object
+    /
+
+Set the import profiling function.
+
+It is called after each import of a module not yet in sys.modules, with
+a dict describing the import.  None removes the function.
+[clinic start generated code]*/
+
+static PyObject *
+sys_setimportprofile(PyObject *module, PyObject *function)
+/*[clinic end generated code: output=0aa136da19dcab70 input=e4449dc8d5de4e2d]*/
+{
+    PyThreadState *tstate = _PyThreadState_GET();
+    if (_PySys_Audit(tstate, "sys.setimportprofile", NULL) < 0) {
+        return NULL;
+    }
+
+    if (function == Py_None) {
+        function = NULL;
+    }
+    else if (!PyCallable_Check(function)) {
+        _PyErr_SetString(tstate, PyExc_TypeError,
+                         "import profiling function must be callable or None");
+        return NULL;
+    }
+    Py_XINCREF(function);
+    Py_XSETREF(tstate->interp->import_profile, function);
+    Py_RETURN_NONE;
+}
+
+
+/*[clinic input]
+sys.getimportprofile
+
+Return the import profiling function set with sys.setimportprofile.
+[clinic start generated code]*/
+
+static PyObject *
+sys_getimportprofile_impl(PyObject *module)
+/*[clinic end generated code: output=83e3b1f328c0b941 input=97282f5b3d94ca52]*/
+{
+    PyThreadState *tstate = _PyThreadState_GET();
+    PyObject *function = tstate->interp->import_profile;
+
+    if (function == NULL) {
+        function = Py_None;
+    }
+    Py_INCREF(function);
+    return function;
+}
+
+
 /*[clinic input]
 sys.setswitchinterval
 
@@ -1778,6 +1834,61 @@ sys__getquickenedcount_impl(PyObject *module)
     return _Py_QuickenedCount;
 }
 
+/*[clinic input]
+sys._getspecializationstats
+
+Return statistics about the specializing adaptive interpreter.
+
+The result maps the name of each family of adaptive instructions to a
+dict of counters.  Return None unless statistics are being collected,
+see -X specialization_stats.
+[clinic start generated code]*/
+
+static PyObject *
+sys__getspecializationstats_impl(PyObject *module)
+/*[clinic end generated code: output=18db43ddec86bc8e input=67afdfbb7ea2aa15]*/
+{
+    return _Py_GetSpecializationStats();
+}
+
+/*[clinic input]
+sys._clearspecializationstats
+
+Reset the statistics about the specializing adaptive interpreter.
+[clinic start generated code]*/
+
+static PyObject *
+sys__clearspecializationstats_impl(PyObject *module)
+/*[clinic end generated code: output=045219c01e180e4c input=ebc13da186c4ddeb]*/
+{
+    _Py_ClearSpecializationStats();
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+sys._getspecializationstate
+
+    code: object(type="PyCodeObject *", subclass_of="&PyCode_Type")
+    /
+
+Return the state of the adaptive instructions of a code object.
+
+Return a list of (offset, opcode, counter, cache) tuples, one for each
+instruction that belongs to a family of adaptive instructions or was
+replaced when quickening, or None if the code object has not been
+quickened yet.  opcode is the current, possibly specialized, opcode.
+counter is None for instructions that have no adaptive counter or
+remain in their generic form.  cache is a dict of the fields of the
+inline cache entries of a specialized instruction, or None.
+[clinic start generated code]*/
+
+static PyObject *
+sys__getspecializationstate_impl(PyObject *module, PyCodeObject *code)
+/*[clinic end generated code: output=b54708ac4f89e9bc input=a07ad8802dba8d2a]*/
+{
+    return _Py_GetSpecializationState(code);
+}
+
 /*[clinic input]
 sys.getallocatedblocks -> Py_ssize_t
 
@@ -1993,6 +2104,9 @@ static PyMethodDef sys_methods[] = {
     SYS_GETFILESYSTEMENCODING_METHODDEF
     SYS_GETFILESYSTEMENCODEERRORS_METHODDEF
     SYS__GETQUICKENEDCOUNT_METHODDEF
+    SYS__GETSPECIALIZATIONSTATS_METHODDEF
+    SYS__CLEARSPECIALIZATIONSTATS_METHODDEF
+    SYS__GETSPECIALIZATIONSTATE_METHODDEF
 #ifdef Py_TRACE_REFS
     {"getobjects",      _Py_GetObjects, METH_VARARGS},
 #endif
@@ -2012,6 +2126,8 @@ static PyMethodDef sys_methods[] = {
     SYS_SETDLOPENFLAGS_METHODDEF
     {"setprofile",      sys_setprofile, METH_O, setprofile_doc},
     SYS_GETPROFILE_METHODDEF
+    SYS_SETIMPORTPROFILE_METHODDEF
+    SYS_GETIMPORTPROFILE_METHODDEF
     SYS_SETRECURSIONLIMIT_METHODDEF
     {"settrace",        sys_settrace, METH_O, settrace_doc},
     SYS_GETTRACE_METHODDEF
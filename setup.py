@@ -1646,6 +1646,13 @@ def detect_platform_specific_exts(self):
         elif not AIX:
             self.missing.append('ossaudiodev')
 
+        # io_uring(7), used by asyncio.uring_events
+        if HOST_PLATFORM.startswith('linux'):
+            if find_file('linux/io_uring.h', self.inc_dirs, []) is not None:
+                self.add(Extension('_uring', ['_uringmodule.c']))
+            else:
+                self.missing.append('_uring')
+
         if MACOS:
             self.add(Extension('_scproxy', ['_scproxy.c'],
                                extra_link_args=[